@@ -6,8 +6,6 @@ import sys
 
 from prowler.lib.banner import print_banner
 from prowler.lib.check.check import (
-    bulk_load_checks_metadata,
-    bulk_load_compliance_frameworks,
     exclude_checks_to_run,
     exclude_services_to_run,
     execute_checks,
@@ -23,25 +21,15 @@ from prowler.lib.check.check import (
     remove_custom_checks_module,
 )
 from prowler.lib.check.checks_loader import load_checks_to_execute
-from prowler.lib.check.compliance import update_checks_metadata_with_compliance
+from prowler.lib.check.deadlines import Execution_Deadlines
+from prowler.lib.check.metadata_pack import load_metadata_pack
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
-from prowler.lib.outputs.compliance import display_compliance_table
-from prowler.lib.outputs.html import add_html_footer, fill_html_overview_statistics
-from prowler.lib.outputs.json import close_json
-from prowler.lib.outputs.outputs import extract_findings_statistics, send_to_s3_bucket
-from prowler.lib.outputs.slack import send_slack_message
-from prowler.lib.outputs.summary_table import display_summary_table
-from prowler.providers.aws.lib.security_hub.security_hub import (
-    resolve_security_hub_previous_findings,
+from prowler.lib.scan_metrics.scan_metrics import (
+    Scan_Metrics,
+    display_scan_metrics_table,
 )
-from prowler.providers.common.allowlist import set_provider_allowlist
-from prowler.providers.common.audit_info import (
-    set_provider_audit_info,
-    set_provider_execution_parameters,
-)
-from prowler.providers.common.outputs import set_provider_output_options
-from prowler.providers.common.quick_inventory import run_provider_quick_inventory
+from prowler.lib.worker_pool.worker_pool import worker_pool
 
 
 def prowler():
@@ -75,23 +63,15 @@ def prowler():
         print_services(list_services(provider))
         sys.exit()
 
-    # Load checks metadata
-    logger.debug("Loading checks metadata from .metadata.json files")
-    bulk_checks_metadata = bulk_load_checks_metadata(provider)
+    # Load checks metadata, already completed with the compliance framework specification,
+    # and compliance frameworks from the metadata pack
+    logger.debug("Loading checks metadata and compliance frameworks")
+    bulk_checks_metadata, bulk_compliance_frameworks = load_metadata_pack(provider)
 
     if args.list_categories:
         print_categories(list_categories(bulk_checks_metadata))
         sys.exit()
 
-    bulk_compliance_frameworks = {}
-    # Load compliance frameworks
-    logger.debug("Loading compliance frameworks from .json files")
-
-    bulk_compliance_frameworks = bulk_load_compliance_frameworks(provider)
-    # Complete checks metadata with the compliance framework specification
-    update_checks_metadata_with_compliance(
-        bulk_compliance_frameworks, bulk_checks_metadata
-    )
     if args.list_compliance:
         print_compliance_frameworks(bulk_compliance_frameworks)
         sys.exit()
@@ -106,9 +86,78 @@ def prowler():
         print_checks(provider, list_checks(provider), bulk_checks_metadata)
         sys.exit()
 
+    # The providers and the outputs are only imported to scan, so the listing options above do not load them
+    from prowler.lib.check.checkpoint import (
+        Checkpoint_Journal,
+        get_checkpoint_journal_path,
+        read_checkpoint_journal,
+        replay_completed_checks,
+        restore_output_files,
+    )
+    from prowler.lib.outputs.outputs import Findings_Aggregator, send_to_s3_bucket
+    from prowler.providers.common.allowlist import set_provider_allowlist
+    from prowler.providers.common.audit_info import (
+        set_provider_audit_info,
+        set_provider_execution_parameters,
+    )
+    from prowler.providers.common.outputs import set_provider_output_options
+
+    # The resumed scan keeps appending to the output files of the interrupted one
+    completed_checks = {}
+    if args.resume:
+        checkpoint, completed_checks, output_offsets = read_checkpoint_journal(
+            args.resume
+        )
+        args.output_directory = checkpoint["output_directory"]
+        args.output_filename = checkpoint["output_filename"]
+
     # Set the audit info based on the selected provider
     audit_info = set_provider_audit_info(provider, args.__dict__)
 
+    # Record the AWS API calls of the clients created from the audit session
+    api_metrics = None
+    if provider == "aws" and args.aws_api_metrics:
+        from prowler.providers.aws.lib.api_metrics.api_metrics import API_Metrics
+
+        api_metrics = API_Metrics()
+
+    def register_session_handlers(audit_session):
+        if api_metrics:
+            api_metrics.register(audit_session)
+        # Pace the AWS API calls of the clients created from the audit session
+        if not args.no_aws_rate_limiter:
+            from prowler.config.config import get_config_var
+            from prowler.providers.aws.lib.rate_limiter.rate_limiter import (
+                Rate_Limiter,
+            )
+
+            Rate_Limiter(get_config_var("aws_api_rate_limits")).register(audit_session)
+
+    if provider == "aws":
+        register_session_handlers(audit_info.audit_session)
+
+    # Scan the accounts of the AWS Organization in this process
+    organization_scan = None
+    if provider == "aws" and args.organization_accounts:
+        from prowler.providers.aws.lib.organization_scan.organization_scan import (
+            Organization_Scan,
+        )
+
+        organization_scan = Organization_Scan(
+            audit_info,
+            args.organization_accounts,
+            args.role,
+            args.session_duration,
+            args.external_id,
+            args.organization_concurrency,
+            register_session_handlers,
+        )
+        if not organization_scan.accounts:
+            logger.critical(
+                f"There are no active accounts in the AWS Organization for {', '.join(args.organization_accounts)}"
+            )
+            sys.exit(1)
+
     # Import custom checks from folder
     if checks_folder:
         parse_checks_from_folder(audit_info, checks_folder, provider)
@@ -144,6 +193,12 @@ def prowler():
     if audit_info.audit_resources:
         checks_to_execute = set_provider_execution_parameters(provider, audit_info)
 
+    # Skip the checks completed before the scan was interrupted
+    if completed_checks:
+        checks_to_execute = [
+            check for check in checks_to_execute if check not in completed_checks
+        ]
+
     # Parse Allowlist
     allowlist_file = set_provider_allowlist(provider, audit_info, args)
 
@@ -154,25 +209,87 @@ def prowler():
 
     # Run the quick inventory for the provider if available
     if hasattr(args, "quick_inventory") and args.quick_inventory:
+        from prowler.providers.common.quick_inventory import (
+            run_provider_quick_inventory,
+        )
+
         run_provider_quick_inventory(provider, audit_info, args)
         sys.exit()
 
+    # The statistics and the summary tables are aggregated from the findings
+    findings_aggregator = Findings_Aggregator(
+        bulk_checks_metadata, compliance_framework
+    )
+
+    # Record every completed check to be able to resume the scan if it is interrupted
+    if args.resume:
+        restore_output_files(output_offsets)
+        replay_completed_checks(
+            completed_checks, bulk_checks_metadata, findings_aggregator
+        )
+    # The checks are executed once per account when scanning an organization, so they are not recorded
+    checkpoint_journal = None
+    if not organization_scan:
+        checkpoint_journal = Checkpoint_Journal(
+            args.resume
+            or get_checkpoint_journal_path(
+                audit_output_options.output_directory,
+                audit_output_options.output_filename,
+            ),
+            audit_output_options.output_modes,
+            audit_output_options.output_directory,
+            audit_output_options.output_filename,
+            resume=bool(args.resume),
+        )
+
+    # Record the resources used by the checks and the service collectors
+    scan_metrics = Scan_Metrics() if args.scan_metrics else None
+
+    # Threads shared by all the services to make their API calls concurrently
+    if args.max_workers:
+        worker_pool.set_max_workers(args.max_workers)
+
+    def scan_checks() -> list:
+        # Wall-clock budgets of the checks and the services
+        deadlines = None
+        if args.check_timeout or args.service_timeout:
+            deadlines = Execution_Deadlines(args.check_timeout, args.service_timeout)
+
+        return execute_checks(
+            checks_to_execute,
+            provider,
+            audit_info,
+            audit_output_options,
+            args.parallel_checks,
+            args.warm_up_services,
+            # With --stream-findings the findings are aggregated while the checks are executed
+            findings_aggregator if args.stream_findings else None,
+            scan_metrics,
+            deadlines,
+            checkpoint_journal,
+        )
+
     # Execute checks
     findings = []
     if len(checks_to_execute):
-        findings = execute_checks(
-            checks_to_execute, provider, audit_info, audit_output_options
-        )
-    else:
+        if organization_scan:
+            findings = organization_scan.scan(scan_checks, not args.only_logs)
+        else:
+            findings = scan_checks()
+    elif not completed_checks:
         logger.error(
             "There are no checks to execute. Please, check your input arguments"
         )
 
+    findings_aggregator.add_findings(findings)
+
     # Extract findings stats
-    stats = extract_findings_statistics(findings)
+    stats = findings_aggregator.statistics.get_statistics()
 
     if args.slack:
         if "SLACK_API_TOKEN" in os.environ and "SLACK_CHANNEL_ID" in os.environ:
+            from prowler.lib.outputs.slack import send_slack_message
+
             _ = send_slack_message(
                 os.environ["SLACK_API_TOKEN"],
                 os.environ["SLACK_CHANNEL_ID"],
@@ -190,10 +307,17 @@ def prowler():
         for mode in args.output_modes:
             # Close json file if exists
             if "json" in mode:
+                from prowler.lib.outputs.json import close_json
+
                 close_json(
                     audit_output_options.output_filename, args.output_directory, mode
                 )
             if mode == "html":
+                from prowler.lib.outputs.html import (
+                    add_html_footer,
+                    fill_html_overview_statistics,
+                )
+
                 add_html_footer(
                     audit_output_options.output_filename, args.output_directory
                 )
@@ -216,32 +340,63 @@ def prowler():
                     mode,
                     output_bucket,
                     bucket_session,
+                    audit_info.session_config,
                 )
 
+    # The scan is completed so it is not resumed anymore
+    if checkpoint_journal:
+        checkpoint_journal.remove()
+
     # Resolve previous fails of Security Hub
     if provider == "aws" and args.security_hub and not args.skip_sh_update:
-        resolve_security_hub_previous_findings(args.output_directory, audit_info)
+        if organization_scan:
+            logger.warning(
+                "The previous findings in Security Hub are not archived when scanning the accounts of an AWS Organization"
+            )
+        else:
+            from prowler.providers.aws.lib.security_hub.security_hub import (
+                resolve_security_hub_previous_findings,
+            )
+
+            resolve_security_hub_previous_findings(args.output_directory, audit_info)
 
     # Display summary table
     if not args.only_logs:
-        display_summary_table(
-            findings,
+        from prowler.lib.outputs.compliance import display_compliance_summary_table
+        from prowler.lib.outputs.summary_table import display_findings_summary_table
+
+        display_findings_summary_table(
+            findings_aggregator.summary,
             audit_info,
             audit_output_options,
             provider,
         )
 
-        if compliance_framework and findings:
+        if compliance_framework and findings_aggregator.summary.findings_count:
             for compliance in compliance_framework:
                 # Display compliance table
-                display_compliance_table(
-                    findings,
-                    bulk_checks_metadata,
-                    compliance,
+                display_compliance_summary_table(
+                    findings_aggregator.compliance_summaries[compliance],
                     audit_output_options.output_filename,
                     audit_output_options.output_directory,
                 )
 
+    if scan_metrics:
+        scan_metrics.write(args.scan_metrics)
+        if not args.only_logs:
+            display_scan_metrics_table(scan_metrics)
+            print(f"\nScan metrics are in: {args.scan_metrics}")
+
+    if api_metrics:
+        api_metrics_files = api_metrics.write(
+            audit_output_options.output_directory,
+            audit_output_options.output_filename,
+        )
+        if not args.only_logs:
+            print("\nAWS API metrics are in:")
+            for api_metrics_file in api_metrics_files:
+                print(f" - {api_metrics_file}")
+
     # If custom checks were passed, remove the modules
     if checks_folder:
         remove_custom_checks_module(checks_folder, provider)
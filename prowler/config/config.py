@@ -3,7 +3,6 @@ import pathlib
 from datetime import datetime, timezone
 from os import getcwd
 
-import requests
 import yaml
 
 from prowler.lib.logger import logger
@@ -42,6 +41,19 @@ aws_services_json_file = "aws_regions_by_service.json"
 
 default_output_directory = getcwd() + "/output"
 
+# Accounts whose role is assumed ahead of the account being scanned with --organization-accounts
+default_organization_concurrency = 4
+
+# Seconds to establish a connection to the AWS API and to wait for its response, the failed attempts are retried
+default_aws_connect_timeout = 10
+default_aws_read_timeout = 60
+
+# Cache directory, PROWLER_CACHE_DIR takes precedence over the user cache directory
+default_cache_directory = os.environ.get(
+    "PROWLER_CACHE_DIR",
+    f"{os.environ.get('XDG_CACHE_HOME', pathlib.Path.home() / '.cache')}/prowler",
+)
+
 output_file_timestamp = timestamp.strftime("%Y%m%d%H%M%S")
 timestamp_iso = timestamp.isoformat(sep=" ", timespec="seconds")
 csv_file_suffix = ".csv"
@@ -55,6 +67,9 @@ config_yaml = f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/conf
 def check_current_version():
     try:
         prowler_version_string = f"Prowler {prowler_version}"
+        # requests is only needed to check the latest version
+        import requests
+
         release_response = requests.get(
             "https://api.github.com/repos/prowler-cloud/prowler/tags"
         )
@@ -1,36 +1,69 @@
+import ast
 import functools
 import importlib
 import os
 import re
 import shutil
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pkgutil import walk_packages
+from time import perf_counter
 from types import ModuleType
 from typing import Any
 
-from alive_progress import alive_bar
 from colorama import Fore, Style
 
+import prowler
 from prowler.config.config import orange_color
 from prowler.lib.check.compliance_models import load_compliance_framework
+from prowler.lib.check.deadlines import (
+    Execution_Deadlines,
+    generate_timeout_finding,
+    run_with_deadline,
+)
+from prowler.lib.check.manifest import get_services_path, load_checks_manifest
 from prowler.lib.check.models import Check, load_check_metadata
 from prowler.lib.logger import logger
-
-try:
-    lib = os.environ["PROWLER_REPORT_LIB_PATH"]
-    outputs_module = importlib.import_module(lib)
-    report = getattr(outputs_module, "report")
-except KeyError:
-    from prowler.lib.outputs.outputs import report
-except Exception:
-    sys.exit(1)
-
-import prowler
+from prowler.lib.scan_metrics.scan_metrics import (
+    Resource_Usage,
+    Scan_Metrics,
+    instrument_service_clients,
+    restore_service_clients,
+)
 from prowler.lib.utils.utils import open_file, parse_json_file
 from prowler.providers.common.models import Audit_Metadata
 from prowler.providers.common.outputs import Provider_Output_Options
 
+# Lock to serialise the report of the findings and the Audit Metadata updates
+# since checks can be executed concurrently with --parallel-checks
+report_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def load_report_function():
+    """
+    load_report_function returns the function that writes the findings to the outputs, from the module of
+    PROWLER_REPORT_LIB_PATH if set. The outputs are imported the first time a check is reported, so the
+    commands that do not execute checks do not load them.
+    """
+    try:
+        lib = os.environ["PROWLER_REPORT_LIB_PATH"]
+        outputs_module = importlib.import_module(lib)
+        return getattr(outputs_module, "report")
+    except KeyError:
+        from prowler.lib.outputs.outputs import report
+
+        return report
+    except Exception:
+        sys.exit(1)
+
+
+def report(check_findings, output_options, audit_info):
+    """report writes the findings of a check to the outputs"""
+    load_report_function()(check_findings, output_options, audit_info)
+
 
 # Load all checks metadata
 def bulk_load_checks_metadata(provider: str) -> dict:
@@ -150,6 +183,8 @@ def parse_checks_from_folder(audit_info, input_folder: str, provider: str) -> in
                         shutil.rmtree(prowler_module)
                     shutil.copytree(check_module, prowler_module)
                     imported_checks += 1
+        # The checks manifest is loaded again with the custom checks
+        load_checks_manifest.cache_clear()
         return imported_checks
     except Exception as error:
         logger.critical(
@@ -178,6 +213,26 @@ def remove_custom_checks_module(input_folder: str, provider: str):
                 # If S3 URI, remove the downloaded folders
                 if s3_uri and os.path.exists(input_folder):
                     shutil.rmtree(input_folder)
+    load_checks_manifest.cache_clear()
+
+
+def remove_service_clients_modules(provider: str):
+    """
+    remove_service_clients_modules removes the imported service clients and checks of the provider, so the service
+    clients are built again with the current audit info the next time they are imported, e.g. to scan another account.
+    The service modules are kept since they do not depend on the audit info.
+    """
+    services_package = f"prowler.providers.{provider}.services."
+    for module_name in list(sys.modules):
+        if module_name.startswith(services_package):
+            # Format: "{service}.{service}_client" or "{service}.{check_name}.{check_name}"
+            service, _, submodule = module_name[len(services_package) :].partition(".")
+            submodule = submodule.split(".")[0]
+            if (
+                submodule.startswith(f"{service}_")
+                and submodule != f"{service}_service"
+            ):
+                del sys.modules[module_name]
 
 
 def list_services(provider: str) -> set():
@@ -336,15 +391,19 @@ def recover_checks_from_provider(provider: str, service: str = None) -> list[tup
     """
     try:
         checks = []
-        modules = list_modules(provider, service)
-        for module_name in modules:
-            # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
-            check_module_name = module_name.name
-            # We need to exclude common shared libraries in services
-            if check_module_name.count(".") == 6 and "lib" not in check_module_name:
-                check_path = module_name.module_finder.path
-                # Check name is the last part of the check_module_name
-                check_name = check_module_name.split(".")[-1]
+        services_path = get_services_path(provider)
+        # The checks are recovered from the checks manifest instead of importing the services packages
+        checks_manifest = load_checks_manifest(provider)
+        if service:
+            if service not in checks_manifest:
+                raise ModuleNotFoundError(f"No module named '{service}'")
+            services = [service]
+        else:
+            services = checks_manifest.keys()
+        for service_name in services:
+            for check_name in checks_manifest[service_name]:
+                # Format: /absolute_path/prowler/providers/{provider}/services/{service_name}/{check_name}
+                check_path = os.path.join(services_path, service_name, check_name)
                 check_info = (check_name, check_path)
                 checks.append(check_info)
     except ModuleNotFoundError:
@@ -413,7 +472,22 @@ def execute_checks(
     provider: str,
     audit_info: Any,
     audit_output_options: Provider_Output_Options,
+    parallel_checks: int = None,
+    warm_up_concurrency: int = None,
+    findings_aggregator: Any = None,
+    scan_metrics: Scan_Metrics = None,
+    deadlines: Execution_Deadlines = None,
+    checkpoint_journal: Any = None,
 ) -> list:
+    """
+    execute_checks runs the checks to execute, reporting their findings, and returns all the findings
+
+    If a findings_aggregator is passed the findings of every check are added to it once reported and they
+    are not returned, so the memory needed does not grow with the number of findings.
+    If scan_metrics is passed the resources used by every check and service collector are recorded in it.
+    If deadlines are passed the checks and the service clients they need are not waited for beyond their budgets.
+    If a checkpoint_journal is passed every check is recorded in it once its findings are reported.
+    """
     # List to store all the check's findings
     all_findings = []
     # Services and checks executed for the Audit Status
@@ -444,11 +518,328 @@ def execute_checks(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    # Execution with the --only-logs flag
+    # The service collectors are instrumented before the service clients are built
+    instrumented_methods = []
+    if scan_metrics:
+        instrumented_methods = instrument_service_clients(
+            recover_service_clients_from_checks(checks_to_execute, provider),
+            scan_metrics,
+        )
+
+    try:
+        # Build the service clients concurrently before running the checks
+        if warm_up_concurrency:
+            warm_up_services(
+                checks_to_execute, provider, warm_up_concurrency, audit_output_options
+            )
+
+        # Execution with the --only-logs flag
+        if audit_output_options.only_logs:
+            if parallel_checks:
+                all_findings = execute_checks_in_parallel(
+                    checks_to_execute,
+                    provider,
+                    audit_info,
+                    audit_output_options,
+                    services_executed,
+                    checks_executed,
+                    parallel_checks,
+                    findings_aggregator=findings_aggregator,
+                    scan_metrics=scan_metrics,
+                    deadlines=deadlines,
+                    checkpoint_journal=checkpoint_journal,
+                )
+            else:
+                for check_name in checks_to_execute:
+                    # Recover service from check name
+                    service = check_name.split("_")[0]
+                    try:
+                        check_findings = execute(
+                            service,
+                            check_name,
+                            provider,
+                            audit_output_options,
+                            audit_info,
+                            services_executed,
+                            checks_executed,
+                            findings_aggregator,
+                            scan_metrics,
+                            deadlines,
+                            checkpoint_journal,
+                        )
+                        all_findings.extend(check_findings)
+
+                    # If check does not exists in the provider or is from another provider
+                    except ModuleNotFoundError:
+                        logger.critical(
+                            f"Check '{check_name}' was not found for the {provider.upper()} provider"
+                        )
+                        sys.exit(1)
+                    except Exception as error:
+                        logger.error(
+                            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+        else:
+            # Default execution
+            checks_num = len(checks_to_execute)
+            plural_string = "checks"
+            singular_string = "check"
+
+            check_noun = plural_string if checks_num > 1 else singular_string
+            # The progress bar is only imported when it is displayed
+            from alive_progress import alive_bar
+
+            print(
+                f"{Style.BRIGHT}Executing {checks_num} {check_noun}, please wait...{Style.RESET_ALL}\n"
+            )
+            with alive_bar(
+                total=len(checks_to_execute),
+                ctrl_c=False,
+                bar="blocks",
+                spinner="classic",
+                stats=False,
+                enrich_print=False,
+            ) as bar:
+                if parallel_checks:
+                    all_findings = execute_checks_in_parallel(
+                        checks_to_execute,
+                        provider,
+                        audit_info,
+                        audit_output_options,
+                        services_executed,
+                        checks_executed,
+                        parallel_checks,
+                        bar,
+                        findings_aggregator,
+                        scan_metrics,
+                        deadlines,
+                        checkpoint_journal,
+                    )
+                else:
+                    for check_name in checks_to_execute:
+                        # Recover service from check name
+                        service = check_name.split("_")[0]
+                        bar.title = f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
+                        try:
+                            check_findings = execute(
+                                service,
+                                check_name,
+                                provider,
+                                audit_output_options,
+                                audit_info,
+                                services_executed,
+                                checks_executed,
+                                findings_aggregator,
+                                scan_metrics,
+                                deadlines,
+                                checkpoint_journal,
+                            )
+                            all_findings.extend(check_findings)
+                            bar()
+
+                        # If check does not exists in the provider or is from another provider
+                        except ModuleNotFoundError:
+                            logger.critical(
+                                f"Check '{check_name}' was not found for the {provider.upper()} provider"
+                            )
+                            bar.title = (
+                                f"-> {Fore.RED}Scan was aborted!{Style.RESET_ALL}"
+                            )
+                            sys.exit(1)
+                        except Exception as error:
+                            logger.error(
+                                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                            )
+                bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
+    finally:
+        # The original collectors are restored, so they are not instrumented by the next scans
+        restore_service_clients(instrumented_methods)
+    return all_findings
+
+
+def recover_service_clients_from_checks(checks_to_execute: list, provider: str) -> dict:
+    """
+    recover_service_clients_from_checks returns the service client modules imported by the checks to execute
+    along with the attributes of the service clients read by them, which are the data the checks depend on.
+
+    The check's source code is parsed instead of imported since importing it builds its service clients.
+    """
+    service_clients = {}
+    for check_name in checks_to_execute:
+        # Recover service from check name
+        service = check_name.split("_")[0]
+        prowler_dir = prowler.__path__
+        check_file = f"{prowler_dir[0]}/providers/{provider}/services/{service}/{check_name}/{check_name}.py"
+        try:
+            with open(check_file) as f:
+                check_source = ast.parse(f.read())
+            imported_clients = {}
+            for node in ast.walk(check_source):
+                # Format: "from prowler.providers.{provider}.services.{service}.{service}_client import {service}_client"
+                if (
+                    isinstance(node, ast.ImportFrom)
+                    and node.module
+                    and node.module.endswith("_client")
+                ):
+                    service_clients.setdefault(node.module, set())
+                    for name in node.names:
+                        imported_clients[name.asname or name.name] = node.module
+            for node in ast.walk(check_source):
+                # Format: "{service}_client.{attribute}"
+                if (
+                    isinstance(node, ast.Attribute)
+                    and isinstance(node.value, ast.Name)
+                    and node.value.id in imported_clients
+                ):
+                    service_clients[imported_clients[node.value.id]].add(node.attr)
+        # If the check does not exist it will be reported when executed
+        except FileNotFoundError:
+            pass
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+    return {
+        service_client: sorted(service_clients[service_client])
+        for service_client in sorted(service_clients)
+    }
+
+
+def build_service_client(service_client: str, attributes: list):
+    """build_service_client imports the service client module, building the service, and retrieves the given attributes"""
+    service_client_module = importlib.import_module(service_client)
+    client = getattr(service_client_module, service_client.split(".")[-1])
+    # The attributes AWS takes long to generate are started first, in the background
+    start_collecting = getattr(client, "__start_collecting__", None)
+    if start_collecting:
+        start_collecting(attributes)
+    # The attributes retrieved lazily are retrieved now
+    for attribute in attributes:
+        getattr(client, attribute, None)
+
+
+def warm_up_services(
+    checks_to_execute: list,
+    provider: str,
+    warm_up_concurrency: int,
+    audit_output_options: Provider_Output_Options,
+) -> dict:
+    """
+    warm_up_services builds concurrently, in a pool of warm_up_concurrency workers, the service clients needed
+    by the checks to execute, retrieves the attributes read by the checks and returns the seconds spent on
+    each service client.
+
+    Once built, the checks only evaluate the data already retrieved by the service clients.
+    """
+    service_clients = recover_service_clients_from_checks(checks_to_execute, provider)
+    services_timing = {}
+
+    def warm_up_service_client(service_client: str) -> float:
+        start_time = perf_counter()
+        try:
+            build_service_client(service_client, service_clients[service_client])
+        except Exception as error:
+            logger.error(
+                f"{service_client} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return perf_counter() - start_time
+
+    def warm_up_service_clients(bar=None):
+        with ThreadPoolExecutor(max_workers=warm_up_concurrency) as executor:
+            futures = {
+                executor.submit(warm_up_service_client, service_client): service_client
+                for service_client in service_clients
+            }
+            for future in as_completed(futures):
+                # Format: "prowler.providers.{provider}.services.{service}.{service}_client"
+                service_client = futures[future].split(".")[-1]
+                services_timing[service_client] = future.result()
+                logger.info(
+                    f"{service_client} built in {services_timing[service_client]:.2f} seconds"
+                )
+                if bar:
+                    bar.title = (
+                        f"-> {orange_color}{service_client}{Style.RESET_ALL} built"
+                    )
+                    bar()
+
     if audit_output_options.only_logs:
-        for check_name in checks_to_execute:
-            # Recover service from check name
-            service = check_name.split("_")[0]
+        warm_up_service_clients()
+    else:
+        from alive_progress import alive_bar
+
+        print(
+            f"{Style.BRIGHT}Retrieving data of {len(service_clients)} services, please wait...{Style.RESET_ALL}\n"
+        )
+        with alive_bar(
+            total=len(service_clients),
+            ctrl_c=False,
+            bar="blocks",
+            spinner="classic",
+            stats=False,
+            enrich_print=False,
+        ) as bar:
+            warm_up_service_clients(bar)
+            bar.title = f"-> {Fore.GREEN}Services data retrieved!{Style.RESET_ALL}"
+        services_table = {
+            "Service": [],
+            "Time (seconds)": [],
+        }
+        for service_client, elapsed_time in sorted(
+            services_timing.items(), key=lambda item: item[1], reverse=True
+        ):
+            services_table["Service"].append(service_client.removesuffix("_client"))
+            services_table["Time (seconds)"].append(round(elapsed_time, 2))
+        from tabulate import tabulate
+
+        print(tabulate(services_table, headers="keys", tablefmt="rounded_grid"))
+        print()
+
+    return services_timing
+
+
+def group_checks_by_service(checks_to_execute: list) -> dict:
+    """group_checks_by_service returns a dict with the service name as key and the list of its checks, keeping the input order, as value"""
+    checks_by_service = {}
+    for check_name in checks_to_execute:
+        # Recover service from check name
+        service = check_name.split("_")[0]
+        checks_by_service.setdefault(service, []).append(check_name)
+    return checks_by_service
+
+
+def execute_checks_in_parallel(
+    checks_to_execute: list,
+    provider: str,
+    audit_info: Any,
+    audit_output_options: Provider_Output_Options,
+    services_executed: set,
+    checks_executed: set,
+    parallel_checks: int,
+    bar=None,
+    findings_aggregator: Any = None,
+    scan_metrics: Scan_Metrics = None,
+    deadlines: Execution_Deadlines = None,
+    checkpoint_journal: Any = None,
+) -> list:
+    """
+    execute_checks_in_parallel runs the checks in a pool of parallel_checks workers and returns all the findings.
+
+    The checks are grouped by service and every group is executed sequentially by the same worker, so
+    each service client is built once and the independent services are scanned at the same time.
+    The findings are returned in the same order as the sequential execution.
+    """
+    checks_by_service = group_checks_by_service(checks_to_execute)
+    findings_by_service = {}
+
+    def execute_service_checks(service: str, service_checks: list) -> list:
+        service_findings = []
+        for check_name in service_checks:
+            if bar:
+                with report_lock:
+                    bar.title = (
+                        f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
+                    )
             try:
                 check_findings = execute(
                     service,
@@ -458,68 +849,46 @@ def execute_checks(
                     audit_info,
                     services_executed,
                     checks_executed,
+                    findings_aggregator,
+                    scan_metrics,
+                    deadlines,
+                    checkpoint_journal,
                 )
-                all_findings.extend(check_findings)
+                service_findings.extend(check_findings)
+                if bar:
+                    with report_lock:
+                        bar()
 
             # If check does not exists in the provider or is from another provider
             except ModuleNotFoundError:
                 logger.critical(
                     f"Check '{check_name}' was not found for the {provider.upper()} provider"
                 )
-                sys.exit(1)
+                raise
             except Exception as error:
                 logger.error(
                     f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
-    else:
-        # Default execution
-        checks_num = len(checks_to_execute)
-        plural_string = "checks"
-        singular_string = "check"
+        return service_findings
 
-        check_noun = plural_string if checks_num > 1 else singular_string
-        print(
-            f"{Style.BRIGHT}Executing {checks_num} {check_noun}, please wait...{Style.RESET_ALL}\n"
-        )
-        with alive_bar(
-            total=len(checks_to_execute),
-            ctrl_c=False,
-            bar="blocks",
-            spinner="classic",
-            stats=False,
-            enrich_print=False,
-        ) as bar:
-            for check_name in checks_to_execute:
-                # Recover service from check name
-                service = check_name.split("_")[0]
-                bar.title = (
-                    f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
-                )
-                try:
-                    check_findings = execute(
-                        service,
-                        check_name,
-                        provider,
-                        audit_output_options,
-                        audit_info,
-                        services_executed,
-                        checks_executed,
-                    )
-                    all_findings.extend(check_findings)
-                    bar()
+    executor = ThreadPoolExecutor(max_workers=parallel_checks)
+    try:
+        futures = {
+            executor.submit(execute_service_checks, service, service_checks): service
+            for service, service_checks in checks_by_service.items()
+        }
+        for future in as_completed(futures):
+            findings_by_service[futures[future]] = future.result()
+    except ModuleNotFoundError:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if bar:
+            bar.title = f"-> {Fore.RED}Scan was aborted!{Style.RESET_ALL}"
+        sys.exit(1)
+    executor.shutdown()
 
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    logger.critical(
-                        f"Check '{check_name}' was not found for the {provider.upper()} provider"
-                    )
-                    bar.title = f"-> {Fore.RED}Scan was aborted!{Style.RESET_ALL}"
-                    sys.exit(1)
-                except Exception as error:
-                    logger.error(
-                        f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-            bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
+    all_findings = []
+    for service in checks_by_service:
+        all_findings.extend(findings_by_service[service])
     return all_findings
 
 
@@ -531,29 +900,133 @@ def execute(
     audit_info: Any,
     services_executed: set,
     checks_executed: set,
+    findings_aggregator: Any = None,
+    scan_metrics: Scan_Metrics = None,
+    deadlines: Execution_Deadlines = None,
+    checkpoint_journal: Any = None,
 ):
-    # Import check module
+    # Run check
+    if deadlines:
+        check_findings = run_check_with_deadlines(
+            service,
+            check_name,
+            provider,
+            audit_output_options,
+            audit_info,
+            deadlines,
+            scan_metrics,
+        )
+    else:
+        c = load_check(service, check_name, provider)
+        usage = Resource_Usage()
+        check_findings = run_check(c, audit_output_options)
+        if scan_metrics:
+            scan_metrics.record_check(service, check_name, usage.stop(), check_findings)
+
+    # The Audit Status and the outputs are shared among the parallel checks
+    with report_lock:
+        # Update Audit Status
+        services_executed.add(service)
+        checks_executed.add(check_name)
+        audit_info.audit_metadata = update_audit_metadata(
+            audit_info.audit_metadata, services_executed, checks_executed
+        )
+
+        # Report the check's findings
+        report(check_findings, audit_output_options, audit_info)
+
+        # Once reported the check is not executed again if the scan is resumed
+        if checkpoint_journal:
+            checkpoint_journal.add_check(check_name, check_findings)
+
+        # Once reported the findings are only needed for the statistics and the summary tables
+        if findings_aggregator:
+            findings_aggregator.add_findings(check_findings)
+            check_findings = []
+
+    return check_findings
+
+
+def load_check(service: str, check_name: str, provider: str) -> Check:
+    """load_check imports the check module and returns the check"""
     check_module_path = (
         f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
     )
     lib = import_check(check_module_path)
     # Recover functions from check
     check_to_execute = getattr(lib, check_name)
-    c = check_to_execute()
+    return check_to_execute()
 
-    # Run check
-    check_findings = run_check(c, audit_output_options)
 
-    # Update Audit Status
-    services_executed.add(service)
-    checks_executed.add(check_name)
-    audit_info.audit_metadata = update_audit_metadata(
-        audit_info.audit_metadata, services_executed, checks_executed
-    )
-
-    # Report the check's findings
-    report(check_findings, audit_output_options, audit_info)
+def run_check_with_deadlines(
+    service: str,
+    check_name: str,
+    provider: str,
+    audit_output_options: Provider_Output_Options,
+    audit_info: Any,
+    deadlines: Execution_Deadlines,
+    scan_metrics: Scan_Metrics = None,
+) -> list:
+    """
+    run_check_with_deadlines builds the service clients needed by the check and runs it within their
+    wall-clock budgets. If any of them is exceeded it is not waited for and an INFO finding is returned
+    instead of the check's findings.
 
+    If scan_metrics is passed the resources used by the check are recorded in it, measured in the thread
+    running it. The checks exceeding a budget are recorded with the time waited for them.
+    """
+    usage = Resource_Usage()
+    status_extended = None
+    if deadlines.service_timeout:
+        service_clients = recover_service_clients_from_checks([check_name], provider)
+        for service_client, attributes in service_clients.items():
+            if not deadlines.is_service_client_timed_out(service_client):
+                try:
+                    built, _ = run_with_deadline(
+                        build_service_client,
+                        deadlines.service_timeout,
+                        service_client,
+                        attributes,
+                    )
+                # The errors building the service client are reported when executing the check
+                except Exception:
+                    built = True
+                if built:
+                    continue
+                deadlines.add_timed_out_service_client(service_client)
+            status_extended = f"Check not executed because the service client {service_client.split('.')[-1]} exceeded its budget of {deadlines.service_timeout} seconds."
+            break
+
+    if not status_extended:
+
+        def load_and_run_check() -> tuple:
+            c = load_check(service, check_name, provider)
+            # The usage is measured in the thread running the check, as without deadlines
+            check_usage = Resource_Usage()
+            check_findings = run_check(c, audit_output_options)
+            return check_findings, check_usage.stop()
+
+        executed, outcome = run_with_deadline(
+            load_and_run_check, deadlines.check_timeout
+        )
+        if executed:
+            check_findings, check_usage = outcome
+            if scan_metrics:
+                scan_metrics.record_check(
+                    service, check_name, check_usage, check_findings
+                )
+            return check_findings
+        status_extended = f"Check not completed because it exceeded its budget of {deadlines.check_timeout} seconds."
+
+    logger.error(f"{check_name} -- {status_extended}")
+    check_findings = []
+    check_metadata = audit_output_options.bulk_checks_metadata.get(check_name)
+    if check_metadata:
+        check_findings = [
+            generate_timeout_finding(check_metadata, audit_info, status_extended)
+        ]
+    if scan_metrics:
+        scan_metrics.record_check(service, check_name, usage.stop(), check_findings)
     return check_findings
 
 
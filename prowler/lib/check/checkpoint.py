@@ -0,0 +1,150 @@
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+from prowler.config.config import prowler_version
+from prowler.lib.logger import logger
+from prowler.lib.outputs.file_descriptors import get_output_file_path
+
+
+def get_checkpoint_journal_path(output_directory: str, output_filename: str) -> str:
+    """get_checkpoint_journal_path returns the default path of the checkpoint journal of the scan"""
+    return f"{output_directory}/{output_filename}_checkpoint.jsonl"
+
+
+def get_output_offsets(output_files: list) -> dict:
+    """get_output_offsets returns the size of every output file, 0 if it does not exist yet"""
+    return {
+        output_file: os.path.getsize(output_file) if os.path.isfile(output_file) else 0
+        for output_file in output_files
+    }
+
+
+class Checkpoint_Journal:
+    """
+    Checkpoint_Journal records in a JSON Lines file the scan being executed and, after every check is
+    reported, its findings (status and resource) and the size of the output files, so an interrupted scan
+    can be resumed from the last completed check.
+    """
+
+    def __init__(
+        self,
+        journal_file_path: str,
+        output_modes: list,
+        output_directory: str,
+        output_filename: str,
+        resume: bool = False,
+    ):
+        self.journal_file_path = journal_file_path
+        self.output_files = [
+            get_output_file_path(output_mode, output_directory, output_filename)
+            for output_mode in output_modes or []
+        ]
+        # The completed checks are appended to the journal of the resumed scan
+        self.journal_file = open(journal_file_path, "a" if resume else "w")
+        if not resume:
+            self.write_entry(
+                {
+                    "prowler_version": prowler_version,
+                    "output_directory": output_directory,
+                    "output_filename": output_filename,
+                    "offsets": get_output_offsets(self.output_files),
+                }
+            )
+
+    def write_entry(self, entry: dict):
+        self.journal_file.write(json.dumps(entry) + "\n")
+        # The entry must survive the interruption of the scan
+        self.journal_file.flush()
+        os.fsync(self.journal_file.fileno())
+
+    def add_check(self, check_name: str, findings: list):
+        """add_check records the check as completed once its findings are written in the output files"""
+        self.write_entry(
+            {
+                "check": check_name,
+                "findings": [
+                    [finding.status, finding.resource_id] for finding in findings
+                ],
+                "offsets": get_output_offsets(self.output_files),
+            }
+        )
+
+    def close(self):
+        self.journal_file.close()
+
+    def remove(self):
+        """remove deletes the journal once the scan is completed"""
+        self.close()
+        os.remove(self.journal_file_path)
+
+
+def read_checkpoint_journal(journal_file_path: str) -> tuple[dict, dict, dict]:
+    """
+    read_checkpoint_journal returns the header of the scan, the entries of the completed checks, with the
+    check name as key, and the size of the output files after the last completed check.
+    An incomplete last line, written while the scan was being interrupted, is removed from the journal.
+    """
+    try:
+        with open(journal_file_path) as journal_file:
+            lines = journal_file.readlines()
+        header = json.loads(lines[0])
+        offsets = header["offsets"]
+        completed_checks = {}
+        journal_size = len(lines[0])
+        for line in lines[1:]:
+            try:
+                if not line.endswith("\n"):
+                    raise json.JSONDecodeError("Unterminated entry", line, len(line))
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(
+                    f"Removing the incomplete last entry of the checkpoint journal {journal_file_path}"
+                )
+                with open(journal_file_path, "r+") as journal_file:
+                    journal_file.truncate(journal_size)
+                break
+            journal_size += len(line)
+            completed_checks[entry["check"]] = entry
+            offsets = entry["offsets"]
+        return header, completed_checks, offsets
+    except Exception as error:
+        logger.critical(
+            f"Checkpoint journal {journal_file_path} could not be read -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        sys.exit(1)
+
+
+def restore_output_files(offsets: dict):
+    """
+    restore_output_files truncates the output files to their size after the last completed check, removing
+    what the interrupted check or the closing of the outputs wrote, so the findings of the resumed scan are
+    appended to valid files. The output files that were not created yet are removed to be created again.
+    """
+    for output_file, offset in offsets.items():
+        if os.path.isfile(output_file):
+            if offset == 0:
+                os.remove(output_file)
+            elif os.path.getsize(output_file) > offset:
+                with open(output_file, "r+") as file_descriptor:
+                    file_descriptor.truncate(offset)
+
+
+def replay_completed_checks(
+    completed_checks: dict, bulk_checks_metadata: dict, findings_aggregator
+):
+    """replay_completed_checks adds the findings of the completed checks to the statistics and summary tables"""
+    for check_name, entry in completed_checks.items():
+        check_metadata = bulk_checks_metadata.get(check_name)
+        if check_metadata:
+            findings_aggregator.add_findings(
+                [
+                    SimpleNamespace(
+                        check_metadata=check_metadata,
+                        status=status,
+                        resource_id=resource_id,
+                    )
+                    for status, resource_id in entry["findings"]
+                ]
+            )
@@ -0,0 +1,77 @@
+import threading
+from typing import Any, Callable
+
+from prowler.lib.check.models import (
+    Check_Metadata_Model,
+    Check_Report_AWS,
+    Check_Report_Azure,
+    Check_Report_GCP,
+)
+
+
+class Execution_Deadlines:
+    """Execution_Deadlines holds the wall-clock budgets, in seconds, of every check and every service client built for the checks"""
+
+    def __init__(self, check_timeout: int = None, service_timeout: int = None):
+        self.check_timeout = check_timeout
+        self.service_timeout = service_timeout
+        self.lock = threading.Lock()
+        # Service clients that exceeded their budget, they are not built again
+        self.timed_out_service_clients = set()
+
+    def add_timed_out_service_client(self, service_client: str):
+        with self.lock:
+            self.timed_out_service_clients.add(service_client)
+
+    def is_service_client_timed_out(self, service_client: str) -> bool:
+        with self.lock:
+            return service_client in self.timed_out_service_clients
+
+
+def run_with_deadline(function: Callable, timeout: int, *args) -> tuple[bool, Any]:
+    """
+    run_with_deadline runs the function and returns (True, result) if it finishes within timeout seconds or
+    (False, None) if it does not, without waiting for it. The exceptions raised by the function are raised.
+
+    The function runs in a daemon thread, since it cannot be stopped, so it does not block Prowler from exiting.
+    """
+    if not timeout:
+        return True, function(*args)
+    outcome = {}
+
+    def run_function():
+        try:
+            outcome["result"] = function(*args)
+        except BaseException as error:
+            outcome["error"] = error
+
+    thread = threading.Thread(target=run_function, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        return False, None
+    if "error" in outcome:
+        raise outcome["error"]
+    return True, outcome["result"]
+
+
+def generate_timeout_finding(
+    check_metadata: Check_Metadata_Model, audit_info: Any, status_extended: str
+):
+    """generate_timeout_finding returns the INFO finding reported instead of the findings of a check that exceeded its budget"""
+    if check_metadata.Provider == "aws":
+        finding = Check_Report_AWS(check_metadata)
+        finding.region = audit_info.profile_region or ""
+        finding.resource_arn = audit_info.audited_account_arn or ""
+    elif check_metadata.Provider == "azure":
+        finding = Check_Report_Azure(check_metadata)
+        finding.resource_name = check_metadata.ServiceName
+    elif check_metadata.Provider == "gcp":
+        finding = Check_Report_GCP(check_metadata)
+        finding.resource_name = check_metadata.ServiceName
+        finding.project_id = audit_info.default_project_id
+        finding.location = "global"
+    finding.resource_id = check_metadata.ServiceName
+    finding.status = "INFO"
+    finding.status_extended = status_extended
+    return finding
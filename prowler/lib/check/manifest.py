@@ -0,0 +1,197 @@
+import json
+import os
+import tempfile
+from functools import lru_cache
+from hashlib import sha256
+
+import prowler
+from prowler.config.config import default_cache_directory, prowler_version
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import create_private_directory, open_private_file
+
+checks_manifest_file_name = "checks_manifest.json"
+
+
+def get_services_path(provider: str) -> str:
+    """get_services_path returns the path of the services of the provider"""
+    return os.path.join(prowler.__path__[0], "providers", provider, "services")
+
+
+def get_checks_manifest_path(provider: str) -> str:
+    """get_checks_manifest_path returns the path of the checks manifest of the provider shipped with Prowler"""
+    return os.path.join(
+        prowler.__path__[0], "providers", provider, checks_manifest_file_name
+    )
+
+
+def get_cached_checks_manifest_path(provider: str) -> str:
+    """get_cached_checks_manifest_path returns the path of the checks manifest of the provider generated at runtime"""
+    return os.path.join(default_cache_directory, f"checks_manifest_{provider}.json")
+
+
+def get_folder_key(folder_path: str) -> str:
+    """
+    get_folder_key returns the key of the folder contents, based on the names of its subfolders, so it changes
+    when a service or a check is added or removed, e.g. with custom checks, but not when the package is installed
+    """
+    with os.scandir(folder_path) as entries:
+        subfolders = sorted(
+            entry.name
+            for entry in entries
+            if entry.is_dir() and entry.name != "__pycache__"
+        )
+    return sha256("\n".join(subfolders).encode("utf-8")).hexdigest()
+
+
+def discover_services(provider: str) -> list:
+    """discover_services returns the services of the provider found in the filesystem, without importing them"""
+    services_path = get_services_path(provider)
+    services = []
+    with os.scandir(services_path) as entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.isfile(
+                os.path.join(entry.path, "__init__.py")
+            ):
+                services.append(entry.name)
+    return sorted(services)
+
+
+def discover_service_checks(provider: str, service: str) -> dict:
+    """
+    discover_service_checks returns the checks of the service found in the filesystem, without importing them
+
+    Returns a dict with the following format {check_name: {"module": check_module, "metadata": metadata_path}},
+    being the metadata path relative to the services folder.
+    """
+    service_path = os.path.join(get_services_path(provider), service)
+    checks = {}
+    with os.scandir(service_path) as entries:
+        for entry in sorted(entries, key=lambda entry: entry.name):
+            # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+            check_module = f"prowler.providers.{provider}.services.{service}.{entry.name}.{entry.name}"
+            # We need to exclude common shared libraries in services
+            if (
+                entry.is_dir()
+                and "lib" not in check_module
+                and os.path.isfile(os.path.join(entry.path, "__init__.py"))
+                and os.path.isfile(os.path.join(entry.path, f"{entry.name}.py"))
+            ):
+                checks[entry.name] = {
+                    "module": check_module,
+                    "metadata": f"{service}/{entry.name}/{entry.name}.metadata.json",
+                }
+    return checks
+
+
+def generate_checks_manifest(provider: str, checks_manifest: dict = None) -> dict:
+    """
+    generate_checks_manifest returns the checks manifest of the provider, reusing the services of the input
+    checks_manifest of the same Prowler version whose folder contents have not changed since it was generated
+
+    The manifest has the following format:
+        {
+            "version": prowler_version,
+            "key": services_folder_key,
+            "services": {service: {"key": service_folder_key, "checks": {check_name: check_info}}},
+        }
+    """
+    services_path = get_services_path(provider)
+    previous_services = {}
+    services_key = get_folder_key(services_path)
+    if checks_manifest and checks_manifest.get("version") == prowler_version:
+        previous_services = checks_manifest.get("services", {})
+        if checks_manifest.get("key") == services_key:
+            services = list(previous_services.keys())
+        else:
+            services = discover_services(provider)
+    else:
+        services = discover_services(provider)
+
+    generated_checks_manifest = {
+        "version": prowler_version,
+        "key": services_key,
+        "services": {},
+    }
+    for service in services:
+        service_key = get_folder_key(os.path.join(services_path, service))
+        if previous_services.get(service, {}).get("key") == service_key:
+            generated_checks_manifest["services"][service] = previous_services[service]
+        else:
+            generated_checks_manifest["services"][service] = {
+                "key": service_key,
+                "checks": discover_service_checks(provider, service),
+            }
+    return generated_checks_manifest
+
+
+def write_checks_manifest(checks_manifest_path: str, checks_manifest: dict):
+    """write_checks_manifest stores the checks manifest in the given path, replacing the previous one atomically"""
+    manifest_file = tempfile.NamedTemporaryFile(
+        mode="w",
+        dir=os.path.dirname(checks_manifest_path),
+        prefix=f".{os.path.basename(checks_manifest_path)}.",
+        delete=False,
+    )
+    try:
+        with manifest_file:
+            json.dump(checks_manifest, manifest_file, indent=2, sort_keys=True)
+        os.replace(manifest_file.name, checks_manifest_path)
+    except Exception:
+        os.remove(manifest_file.name)
+        raise
+
+
+def read_checks_manifest(checks_manifest_file) -> dict:
+    """read_checks_manifest returns the checks manifest stored in the file, or None if it cannot be read"""
+    try:
+        with checks_manifest_file() as manifest_file:
+            return json.load(manifest_file)
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.warning(
+            f"Checks manifest could not be loaded -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return None
+
+
+@lru_cache(maxsize=None)
+def load_checks_manifest(provider: str) -> dict:
+    """
+    load_checks_manifest returns the checks of the provider grouped by service, with the following format
+    {service: {check_name: {"module": check_module, "metadata": metadata_path}}}
+
+    The manifest generated when Prowler is built is shipped with it. If the services folders have changed since
+    then (e.g. with custom checks), the services modified are discovered again from the filesystem and the
+    manifest is stored in the Prowler cache directory for the next executions, never within the package.
+
+    It is loaded once per provider, so it must not be modified, and load_checks_manifest.cache_clear() has to
+    be called when the checks of the services folders are changed, e.g. when the custom checks are imported.
+    """
+    cached_checks_manifest_path = get_cached_checks_manifest_path(provider)
+    checks_manifest = read_checks_manifest(
+        lambda: open_private_file(cached_checks_manifest_path)
+    )
+    # The manifest cached by a previous version of Prowler is not reused
+    if not checks_manifest or checks_manifest.get("version") != prowler_version:
+        checks_manifest = read_checks_manifest(
+            lambda: open(get_checks_manifest_path(provider))
+        )
+
+    generated_checks_manifest = generate_checks_manifest(provider, checks_manifest)
+    if generated_checks_manifest != checks_manifest:
+        # If it cannot be stored the next execution discovers the modified services again
+        try:
+            create_private_directory(os.path.dirname(cached_checks_manifest_path))
+            write_checks_manifest(
+                cached_checks_manifest_path, generated_checks_manifest
+            )
+        except Exception as error:
+            logger.debug(
+                f"{provider} checks manifest could not be stored -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    return {
+        service: service_info["checks"]
+        for service, service_info in generated_checks_manifest["services"].items()
+    }
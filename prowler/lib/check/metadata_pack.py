@@ -0,0 +1,169 @@
+import os
+import pickle
+import tempfile
+from collections.abc import Mapping
+from hashlib import sha256
+
+import prowler
+from prowler.config.config import default_cache_directory, prowler_version
+from prowler.lib.check.check import (
+    bulk_load_checks_metadata,
+    bulk_load_compliance_frameworks,
+)
+from prowler.lib.check.compliance import update_checks_metadata_with_compliance
+from prowler.lib.check.manifest import get_services_path, load_checks_manifest
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import create_private_directory, open_private_file
+
+# Increase it when the format of the metadata pack changes
+metadata_pack_format_version = 1
+
+
+class Compliance_Frameworks(Mapping):
+    """Compliance_Frameworks holds the serialized compliance frameworks, deserializing each of them the first time it is accessed"""
+
+    def __init__(self, serialized_frameworks: dict):
+        self.serialized_frameworks = serialized_frameworks
+        self.frameworks = {}
+
+    def __getitem__(self, framework_name: str):
+        if framework_name not in self.frameworks:
+            self.frameworks[framework_name] = pickle.loads(
+                self.serialized_frameworks[framework_name]
+            )
+        return self.frameworks[framework_name]
+
+    def __contains__(self, framework_name) -> bool:
+        return framework_name in self.serialized_frameworks
+
+    def __iter__(self):
+        return iter(self.serialized_frameworks)
+
+    def __len__(self):
+        return len(self.serialized_frameworks)
+
+
+def get_metadata_pack_path(provider: str) -> str:
+    """get_metadata_pack_path returns the path of the cached metadata pack of the provider"""
+    return os.path.join(default_cache_directory, f"metadata_pack_{provider}.pickle")
+
+
+def get_metadata_pack_fingerprint(provider: str) -> str:
+    """
+    get_metadata_pack_fingerprint returns the fingerprint of the checks metadata and compliance frameworks
+    files of the provider, based on the Prowler version and the path, size and mtime of every file
+    """
+    fingerprint = sha256(
+        f"{prowler_version}:{metadata_pack_format_version}".encode("utf-8")
+    )
+    services_path = get_services_path(provider)
+    metadata_files = [
+        os.path.join(services_path, *check_info["metadata"].split("/"))
+        for service_checks in load_checks_manifest(provider).values()
+        for check_info in service_checks.values()
+    ]
+    compliance_path = os.path.join(prowler.__path__[0], "compliance", provider)
+    compliance_files = []
+    if os.path.isdir(compliance_path):
+        with os.scandir(compliance_path) as entries:
+            compliance_files = sorted(
+                entry.path for entry in entries if entry.name.endswith(".json")
+            )
+    for file_path in metadata_files + compliance_files:
+        file_stat = os.stat(file_path)
+        fingerprint.update(
+            f"{file_path}:{file_stat.st_size}:{file_stat.st_mtime_ns}\n".encode("utf-8")
+        )
+    return fingerprint.hexdigest()
+
+
+def build_metadata_pack(provider: str) -> tuple[dict, dict]:
+    """build_metadata_pack parses the checks metadata and compliance frameworks of the provider and links them"""
+    bulk_checks_metadata = bulk_load_checks_metadata(provider)
+    bulk_compliance_frameworks = bulk_load_compliance_frameworks(provider)
+    # Complete checks metadata with the compliance framework specification
+    update_checks_metadata_with_compliance(
+        bulk_compliance_frameworks, bulk_checks_metadata
+    )
+    return bulk_checks_metadata, bulk_compliance_frameworks
+
+
+def write_metadata_pack(provider: str, metadata_pack: dict):
+    """write_metadata_pack stores the metadata pack of the provider, only readable by the current user"""
+    metadata_pack_path = get_metadata_pack_path(provider)
+    create_private_directory(os.path.dirname(metadata_pack_path))
+    # The temporary file is created with 0600 permissions and then replaced atomically
+    pack_file = tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(metadata_pack_path),
+        prefix=f".metadata_pack_{provider}.",
+        delete=False,
+    )
+    try:
+        with pack_file:
+            pickle.dump(metadata_pack, pack_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(pack_file.name, metadata_pack_path)
+    except Exception:
+        os.remove(pack_file.name)
+        raise
+
+
+def load_metadata_pack(provider: str) -> tuple[dict, Mapping]:
+    """
+    load_metadata_pack returns the checks metadata, already completed with the compliance frameworks, and the
+    compliance frameworks of the provider.
+
+    They are loaded in one read from the metadata pack cached in the Prowler cache directory, which is built
+    again when the Prowler version or any of the metadata or compliance files change, or when the pack or the
+    cache directory are not owned by the current user or other users can write to them. The compliance
+    frameworks are deserialized the first time each of them is accessed.
+    """
+    try:
+        fingerprint = get_metadata_pack_fingerprint(provider)
+    except Exception as error:
+        logger.warning(
+            f"{provider} metadata pack fingerprint could not be generated -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return build_metadata_pack(provider)
+
+    try:
+        # The metadata pack is unpickled, so it is only loaded if no other user could have written it
+        with open_private_file(get_metadata_pack_path(provider), "rb") as pack_file:
+            metadata_pack = pickle.load(pack_file)
+        if metadata_pack["fingerprint"] == fingerprint:
+            logger.debug(f"{provider} metadata pack loaded from cache")
+            bulk_checks_metadata = pickle.loads(metadata_pack["checks_metadata"])
+            bulk_compliance_frameworks = Compliance_Frameworks(
+                metadata_pack["compliance_frameworks"]
+            )
+            return bulk_checks_metadata, bulk_compliance_frameworks
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.warning(
+            f"{provider} metadata pack could not be loaded -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    logger.debug(f"Building {provider} metadata pack")
+    bulk_checks_metadata, bulk_compliance_frameworks = build_metadata_pack(provider)
+    try:
+        write_metadata_pack(
+            provider,
+            {
+                "fingerprint": fingerprint,
+                "checks_metadata": pickle.dumps(
+                    bulk_checks_metadata, protocol=pickle.HIGHEST_PROTOCOL
+                ),
+                "compliance_frameworks": {
+                    framework_name: pickle.dumps(
+                        framework, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                    for framework_name, framework in bulk_compliance_frameworks.items()
+                },
+            },
+        )
+    except Exception as error:
+        # If the cache directory is not writable the metadata pack is built in every execution
+        logger.warning(
+            f"{provider} metadata pack could not be stored -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return bulk_checks_metadata, bulk_compliance_frameworks
@@ -2,8 +2,9 @@ import os
 import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, PrivateAttr, ValidationError
 
 from prowler.lib.logger import logger
 
@@ -56,9 +57,44 @@ class Check_Metadata_Model(BaseModel):
     Compliance: list = None
 
 
+class Shared_Code(Code):
+    """Check's remediation Code shared by all the findings of the check, so it cannot be modified"""
+
+    class Config:
+        allow_mutation = False
+
+
+class Shared_Recommendation(Recommendation):
+    """Check's Recommendation shared by all the findings of the check, so it cannot be modified"""
+
+    class Config:
+        allow_mutation = False
+
+
+class Shared_Remediation(Remediation):
+    """Check's Remediation shared by all the findings of the check, so it cannot be modified"""
+
+    Code: Shared_Code
+    Recommendation: Shared_Recommendation
+
+    class Config:
+        allow_mutation = False
+
+
+class Shared_Check_Metadata_Model(Check_Metadata_Model):
+    """Check Metadata Model shared by reference by all the findings of the check, so it cannot be modified"""
+
+    Remediation: Shared_Remediation
+
+    class Config:
+        allow_mutation = False
+
+
 class Check(ABC, Check_Metadata_Model):
     """Prowler Check"""
 
+    _shared_metadata: Shared_Check_Metadata_Model = PrivateAttr()
+
     def __init__(self, **data):
         """Check's init function. Calls the CheckMetadataModel init."""
         # Parse the Check's metadata file
@@ -67,23 +103,39 @@ class Check(ABC, Check_Metadata_Model):
             + ".metadata.json"
         )
         # Store it to validate them with Pydantic
-        data = Check_Metadata_Model.parse_file(metadata_file).dict()
+        shared_metadata = Shared_Check_Metadata_Model.parse_file(metadata_file)
         # Calls parents init function
-        super().__init__(**data)
+        super().__init__(**shared_metadata.dict())
+        self._shared_metadata = shared_metadata
 
-    def metadata(self) -> dict:
-        """Return the JSON representation of the check's metadata"""
-        return self.json()
+    def metadata(self) -> Shared_Check_Metadata_Model:
+        """Return the check's metadata, the same object for all the check's findings"""
+        return self._shared_metadata
 
     @abstractmethod
     def execute(self):
         """Execute the check's logic"""
 
 
+@lru_cache(maxsize=1024)
+def parse_check_metadata(metadata: str) -> Shared_Check_Metadata_Model:
+    """parse_check_metadata parses the JSON representation of a check's metadata, once per different metadata"""
+    return Shared_Check_Metadata_Model.parse_raw(metadata)
+
+
 @dataclass
 class Check_Report:
     """Contains the Check's finding information."""
 
+    # Findings only hold their own attributes, the check's metadata is referenced
+    __slots__ = (
+        "status",
+        "status_extended",
+        "check_metadata",
+        "resource_details",
+        "resource_tags",
+    )
+
     status: str
     status_extended: str
     check_metadata: Check_Metadata_Model
@@ -92,7 +144,11 @@ class Check_Report:
 
     def __init__(self, metadata):
         self.status = ""
-        self.check_metadata = Check_Metadata_Model.parse_raw(metadata)
+        if isinstance(metadata, Check_Metadata_Model):
+            self.check_metadata = metadata
+        else:
+            # Its JSON representation is still supported
+            self.check_metadata = parse_check_metadata(metadata)
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = []
@@ -102,6 +158,8 @@ class Check_Report:
 class Check_Report_AWS(Check_Report):
     """Contains the AWS Check's finding information."""
 
+    __slots__ = ("resource_id", "resource_arn", "region")
+
     resource_id: str
     resource_arn: str
     region: str
@@ -117,6 +175,8 @@ class Check_Report_AWS(Check_Report):
 class Check_Report_Azure(Check_Report):
     """Contains the Azure Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "subscription")
+
     resource_name: str
     resource_id: str
     subscription: str
@@ -132,6 +192,8 @@ class Check_Report_Azure(Check_Report):
 class Check_Report_GCP(Check_Report):
     """Contains the GCP Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "project_id", "location")
+
     resource_name: str
     resource_id: str
     project_id: str
@@ -5,10 +5,14 @@ from argparse import RawTextHelpFormatter
 from prowler.config.config import (
     available_compliance_frameworks,
     check_current_version,
+    default_aws_connect_timeout,
+    default_aws_read_timeout,
+    default_organization_concurrency,
     default_output_directory,
 )
-from prowler.providers.aws.aws_provider import get_aws_available_regions
+from prowler.lib.worker_pool.worker_pool import default_max_workers
 from prowler.providers.aws.lib.arn.arn import is_valid_arn
+from prowler.providers.aws.lib.regions.regions import get_aws_available_regions
 
 
 def arn_type(arn: str) -> bool:
@@ -18,6 +22,17 @@ def arn_type(arn: str) -> bool:
     return arn
 
 
+def positive_int_type(value: str) -> int:
+    """positive_int_type returns the value as an int if it is greater than 0 and raises an argparse.ArgumentTypeError if not."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not a valid integer")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} must be greater than 0")
+    return number
+
+
 class ProwlerArgumentParser:
     # Set the default parser
     def __init__(self):
@@ -52,6 +67,7 @@ Detailed documentation at https://docs.prowler.cloud
         self.__init_checks_parser__()
         self.__init_exclude_checks_parser__()
         self.__init_list_checks_parser__()
+        self.__init_execution_parser__()
 
         # Init Providers Arguments
         self.__init_aws_parser__()
@@ -98,6 +114,17 @@ Detailed documentation at https://docs.prowler.cloud
         if args.only_logs:
             args.no_banner = True
 
+        # The role is assumed in every account of the organization
+        if getattr(args, "organization_accounts", None):
+            if not args.role:
+                self.parser.error(
+                    "--organization-accounts requires -R/--role with the role to assume in every account"
+                )
+            if args.mfa or args.resume or args.quick_inventory:
+                self.parser.error(
+                    "--organization-accounts cannot be used with --mfa, --resume or -i/--quick-inventory"
+                )
+
         return args
 
     def __set_default_provider__(self, args: list) -> list:
@@ -267,6 +294,59 @@ Detailed documentation at https://docs.prowler.cloud
             help="List the available check's categories",
         )
 
+    def __init_execution_parser__(self):
+        # Checks execution options
+        execution_parser = self.common_providers_parser.add_argument_group(
+            "Checks execution"
+        )
+        execution_parser.add_argument(
+            "--parallel-checks",
+            default=None,
+            type=positive_int_type,
+            help="Execute the checks concurrently in a pool of N workers, running the checks of the same service in the same worker. By default the checks are executed sequentially",
+        )
+        execution_parser.add_argument(
+            "--warm-up-services",
+            nargs="?",
+            const=10,
+            default=None,
+            type=positive_int_type,
+            help="Retrieve the data of all the services needed by the checks before executing them, building N services concurrently (Default: 10)",
+        )
+        execution_parser.add_argument(
+            "--max-workers",
+            default=None,
+            type=positive_int_type,
+            help=f"Maximum number of threads shared by all the services to make their API calls per region or per resource concurrently (Default: {default_max_workers})",
+        )
+        execution_parser.add_argument(
+            "--stream-findings",
+            action="store_true",
+            help="Aggregate the findings of every check once they are written to the outputs and release them, keeping the memory usage flat in large environments",
+        )
+        execution_parser.add_argument(
+            "--scan-metrics",
+            default=None,
+            help="Record the time, CPU, peak memory and findings of every check and service collector, per region, in the given JSON file and display the 20 slowest",
+        )
+        execution_parser.add_argument(
+            "--check-timeout",
+            default=None,
+            type=positive_int_type,
+            help="Wall-clock budget in seconds for every check. If it is exceeded an INFO finding is reported instead of its findings and the scan continues",
+        )
+        execution_parser.add_argument(
+            "--service-timeout",
+            default=None,
+            type=positive_int_type,
+            help="Wall-clock budget in seconds to retrieve the data of every service. If it is exceeded an INFO finding is reported for the checks of the service and the scan continues",
+        )
+        execution_parser.add_argument(
+            "--resume",
+            default=None,
+            help="Resume the interrupted scan of the given checkpoint journal, skipping the completed checks and appending the findings to the same output files",
+        )
+
     def __init_aws_parser__(self):
         """Init the AWS Provider CLI parser"""
         aws_parser = self.subparsers.add_parser(
@@ -286,7 +366,7 @@ Detailed documentation at https://docs.prowler.cloud
             "--role",
             nargs="?",
             default=None,
-            help="ARN of the role to be assumed",
+            help="ARN of the role to be assumed, or its name to be assumed in every account with --organization-accounts",
             # Pending ARN validation
         )
         aws_auth_subparser.add_argument(
@@ -310,6 +390,16 @@ Detailed documentation at https://docs.prowler.cloud
             default=None,
             help="External ID to be passed when assuming role",
         )
+        aws_auth_subparser.add_argument(
+            "--aws-credentials-cache",
+            action="store_true",
+            help="Store the credentials of the assumed roles in the Prowler cache directory, only readable by the current user, and reuse them in the next executions until they are about to expire. The credentials of the roles assumed with --mfa are never stored",
+        )
+        aws_auth_subparser.add_argument(
+            "--aws-credential-report-cache",
+            action="store_true",
+            help="Store the IAM credential report in the Prowler cache directory, only readable by the current user, and reuse it in the next executions in the same account while AWS would return the same report, up to four hours",
+        )
         # AWS Regions
         aws_regions_subparser = aws_parser.add_argument_group("AWS Regions")
         aws_regions_subparser.add_argument(
@@ -328,6 +418,18 @@ Detailed documentation at https://docs.prowler.cloud
             nargs="?",
             help="Specify AWS Organizations management role ARN to be assumed, to get Organization metadata",
         )
+        aws_orgs_subparser.add_argument(
+            "--organization-accounts",
+            nargs="+",
+            default=None,
+            help="Scan in the same execution the accounts of the AWS Organization: all of them, the ones in the given root or organizational units (e.g. ou-ab12-cdefgh34) or the given account IDs, assuming in every account the role given with -R/--role, by its name or ARN. The accounts are listed with the input credentials, which must be of the management account or a delegated administrator",
+        )
+        aws_orgs_subparser.add_argument(
+            "--organization-concurrency",
+            default=default_organization_concurrency,
+            type=positive_int_type,
+            help=f"Number of accounts whose role is assumed concurrently ahead of the account being scanned with --organization-accounts (Default: {default_organization_concurrency})",
+        )
         # AWS Security Hub
         aws_security_hub_subparser = aws_parser.add_argument_group("AWS Security Hub")
         aws_security_hub_subparser.add_argument(
@@ -413,6 +515,34 @@ Detailed documentation at https://docs.prowler.cloud
             type=int,
             help="Set the maximum attemps for the Boto3 standard retrier config (Default: 3)",
         )
+        boto3_config_subparser.add_argument(
+            "--aws-max-pool-connections",
+            default=None,
+            type=positive_int_type,
+            help="Maximum number of connections kept in the pool of every Boto3 client (Default: the number of threads making API calls concurrently, --max-workers plus the threads executing the checks)",
+        )
+        boto3_config_subparser.add_argument(
+            "--aws-connect-timeout",
+            default=None,
+            type=positive_int_type,
+            help=f"Seconds to establish a connection to the AWS API before retrying (Default: {default_aws_connect_timeout})",
+        )
+        boto3_config_subparser.add_argument(
+            "--aws-read-timeout",
+            default=None,
+            type=positive_int_type,
+            help=f"Seconds to wait for a response of the AWS API before retrying (Default: {default_aws_read_timeout})",
+        )
+        boto3_config_subparser.add_argument(
+            "--aws-api-metrics",
+            action="store_true",
+            help="Record the calls, latency, retries, throttles and bytes received of every AWS API operation per service and region, and the connections opened, reused and discarded by the clients, stored in JSON and Prometheus format in the output directory",
+        )
+        boto3_config_subparser.add_argument(
+            "--no-aws-rate-limiter",
+            action="store_true",
+            help="Do not pace the AWS API calls per service, region and operation family to the quotas of the configuration file, slowing down the throttled ones",
+        )
 
     def __init_azure_parser__(self):
         """Init the Azure Provider CLI parser"""
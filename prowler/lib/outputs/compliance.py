@@ -5,7 +5,7 @@ from colorama import Fore, Style
 from tabulate import tabulate
 
 from prowler.config.config import orange_color, timestamp
-from prowler.lib.check.models import Check_Report
+from prowler.lib.check.models import Check_Report_AWS
 from prowler.lib.logger import logger
 from prowler.lib.outputs.models import (
     Check_Output_CSV_AWS_Well_Architected,
@@ -20,8 +20,8 @@ def add_manual_controls(output_options, audit_info, file_descriptors):
     try:
         # Check if MANUAL control was already added to output
         if "manual_check" in output_options.bulk_checks_metadata:
-            manual_finding = Check_Report(
-                output_options.bulk_checks_metadata["manual_check"].json()
+            manual_finding = Check_Report_AWS(
+                output_options.bulk_checks_metadata["manual_check"]
             )
             manual_finding.status = "INFO"
             manual_finding.status_extended = "Manual check"
@@ -208,6 +208,99 @@ def fill_compliance(output_options, finding, audit_info, file_descriptors):
         )
 
 
+class Compliance_Summary:
+    """Compliance_Summary aggregates incrementally the findings of the compliance table of the framework"""
+
+    def __init__(self, compliance_framework: str, bulk_checks_metadata: dict):
+        self.compliance_framework = compliance_framework
+        self.bulk_checks_metadata = bulk_checks_metadata
+        self.pass_count = 0
+        self.fail_count = 0
+        # Marco/Categoria for ENS and Section for CIS
+        self.requirements = {}
+        self.compliance_fm = None
+        self.compliance_version = None
+        self.compliance_provider = None
+
+    def add(self, finding):
+        if "ens_rd2022_aws" == self.compliance_framework:
+            self.add_ens_finding(finding)
+        elif "cis_1." in self.compliance_framework:
+            self.add_cis_finding(finding)
+
+    def add_ens_finding(self, finding):
+        check = self.bulk_checks_metadata[finding.check_metadata.CheckID]
+        for compliance in check.Compliance:
+            if (
+                compliance.Framework == "ENS"
+                and compliance.Provider == "AWS"
+                and compliance.Version == "RD2022"
+            ):
+                self.compliance_version = compliance.Version
+                self.compliance_fm = compliance.Framework
+                self.compliance_provider = compliance.Provider
+                for requirement in compliance.Requirements:
+                    for attribute in requirement.Attributes:
+                        marco_categoria = f"{attribute.Marco}/{attribute.Categoria}"
+                        # Check if Marco/Categoria exists
+                        if marco_categoria not in self.requirements:
+                            self.requirements[marco_categoria] = {
+                                "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
+                                "Opcional": 0,
+                                "Alto": 0,
+                                "Medio": 0,
+                                "Bajo": 0,
+                            }
+                        marco = self.requirements[marco_categoria]
+                        if finding.status == "FAIL":
+                            self.fail_count += 1
+                            marco["Estado"] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
+                        elif finding.status == "PASS":
+                            self.pass_count += 1
+                        if attribute.Nivel == "opcional":
+                            marco["Opcional"] += 1
+                        elif attribute.Nivel == "alto":
+                            marco["Alto"] += 1
+                        elif attribute.Nivel == "medio":
+                            marco["Medio"] += 1
+                        elif attribute.Nivel == "bajo":
+                            marco["Bajo"] += 1
+
+    def add_cis_finding(self, finding):
+        check = self.bulk_checks_metadata[finding.check_metadata.CheckID]
+        for compliance in check.Compliance:
+            if (
+                compliance.Framework == "CIS"
+                and compliance.Version in self.compliance_framework
+            ):
+                self.compliance_version = compliance.Version
+                self.compliance_fm = compliance.Framework
+                for requirement in compliance.Requirements:
+                    for attribute in requirement.Attributes:
+                        section = attribute.Section
+                        # Check if Section exists
+                        if section not in self.requirements:
+                            self.requirements[section] = {
+                                "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
+                                "Level 1": {"FAIL": 0, "PASS": 0},
+                                "Level 2": {"FAIL": 0, "PASS": 0},
+                            }
+                        if finding.status == "FAIL":
+                            self.fail_count += 1
+                        elif finding.status == "PASS":
+                            self.pass_count += 1
+                        if attribute.Profile == "Level 1":
+                            if finding.status == "FAIL":
+                                self.requirements[section]["Level 1"]["FAIL"] += 1
+                            else:
+                                self.requirements[section]["Level 1"]["PASS"] += 1
+                        elif attribute.Profile == "Level 2":
+                            if finding.status == "FAIL":
+                                self.requirements[section]["Level 2"]["FAIL"] += 1
+                            else:
+                                self.requirements[section]["Level 2"]["PASS"] += 1
+
+
 def display_compliance_table(
     findings: list,
     bulk_checks_metadata: dict,
@@ -215,9 +308,28 @@ def display_compliance_table(
     output_filename: str,
     output_directory: str,
 ):
+    compliance_summary = Compliance_Summary(compliance_framework, bulk_checks_metadata)
+    for finding in findings:
+        compliance_summary.add(finding)
+    display_compliance_summary_table(
+        compliance_summary, output_filename, output_directory
+    )
+
+
+def display_compliance_summary_table(
+    compliance_summary: Compliance_Summary,
+    output_filename: str,
+    output_directory: str,
+):
+    compliance_framework = compliance_summary.compliance_framework
+    compliance_fm = compliance_summary.compliance_fm
+    compliance_version = compliance_summary.compliance_version
+    compliance_provider = compliance_summary.compliance_provider
+    pass_count = compliance_summary.pass_count
+    fail_count = compliance_summary.fail_count
     try:
         if "ens_rd2022_aws" == compliance_framework:
-            marcos = {}
+            marcos = compliance_summary.requirements
             ens_compliance_table = {
                 "Proveedor": [],
                 "Marco/Categoria": [],
@@ -227,49 +339,6 @@ def display_compliance_table(
                 "Bajo": [],
                 "Opcional": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
-                check_compliances = check.Compliance
-                for compliance in check_compliances:
-                    if (
-                        compliance.Framework == "ENS"
-                        and compliance.Provider == "AWS"
-                        and compliance.Version == "RD2022"
-                    ):
-                        compliance_version = compliance.Version
-                        compliance_fm = compliance.Framework
-                        compliance_provider = compliance.Provider
-                        for requirement in compliance.Requirements:
-                            for attribute in requirement.Attributes:
-                                marco_categoria = (
-                                    f"{attribute.Marco}/{attribute.Categoria}"
-                                )
-                                # Check if Marco/Categoria exists
-                                if marco_categoria not in marcos:
-                                    marcos[marco_categoria] = {
-                                        "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
-                                        "Opcional": 0,
-                                        "Alto": 0,
-                                        "Medio": 0,
-                                        "Bajo": 0,
-                                    }
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                    marcos[marco_categoria][
-                                        "Estado"
-                                    ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
-                                elif finding.status == "PASS":
-                                    pass_count += 1
-                                if attribute.Nivel == "opcional":
-                                    marcos[marco_categoria]["Opcional"] += 1
-                                elif attribute.Nivel == "alto":
-                                    marcos[marco_categoria]["Alto"] += 1
-                                elif attribute.Nivel == "medio":
-                                    marcos[marco_categoria]["Medio"] += 1
-                                elif attribute.Nivel == "bajo":
-                                    marcos[marco_categoria]["Bajo"] += 1
-
             # Add results to table
             for marco in marcos:
                 ens_compliance_table["Proveedor"].append("aws")
@@ -318,51 +387,14 @@ def display_compliance_table(
                     f" - CSV: {output_directory}/{output_filename}_{compliance_framework}.csv\n"
                 )
         elif "cis_1." in compliance_framework:
-            sections = {}
             cis_compliance_table = {
                 "Provider": [],
                 "Section": [],
                 "Level 1": [],
                 "Level 2": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
-                check_compliances = check.Compliance
-                for compliance in check_compliances:
-                    if (
-                        compliance.Framework == "CIS"
-                        and compliance.Version in compliance_framework
-                    ):
-                        compliance_version = compliance.Version
-                        compliance_fm = compliance.Framework
-                        for requirement in compliance.Requirements:
-                            for attribute in requirement.Attributes:
-                                section = attribute.Section
-                                # Check if Section exists
-                                if section not in sections:
-                                    sections[section] = {
-                                        "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
-                                        "Level 1": {"FAIL": 0, "PASS": 0},
-                                        "Level 2": {"FAIL": 0, "PASS": 0},
-                                    }
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                elif finding.status == "PASS":
-                                    pass_count += 1
-                                if attribute.Profile == "Level 1":
-                                    if finding.status == "FAIL":
-                                        sections[section]["Level 1"]["FAIL"] += 1
-                                    else:
-                                        sections[section]["Level 1"]["PASS"] += 1
-                                elif attribute.Profile == "Level 2":
-                                    if finding.status == "FAIL":
-                                        sections[section]["Level 2"]["FAIL"] += 1
-                                    else:
-                                        sections[section]["Level 2"]["PASS"] += 1
-
             # Add results to table
-            sections = dict(sorted(sections.items()))
+            sections = dict(sorted(compliance_summary.requirements.items()))
             for section in sections:
                 cis_compliance_table["Provider"].append("aws")
                 cis_compliance_table["Section"].append(section)
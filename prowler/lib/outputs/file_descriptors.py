@@ -65,13 +65,34 @@ def initialize_file_descriptor(
     return file_descriptor
 
 
+def get_output_file_path(
+    output_mode: str, output_directory: str, output_filename: str
+) -> str:
+    """get_output_file_path returns the path of the output file of the output mode"""
+    if output_mode == "csv":
+        return f"{output_directory}/{output_filename}{csv_file_suffix}"
+    elif output_mode == "json":
+        return f"{output_directory}/{output_filename}{json_file_suffix}"
+    elif output_mode == "json-ocsf":
+        return f"{output_directory}/{output_filename}{json_ocsf_file_suffix}"
+    elif output_mode == "json-asff":
+        return f"{output_directory}/{output_filename}{json_asff_file_suffix}"
+    elif output_mode == "html":
+        return f"{output_directory}/{output_filename}{html_file_suffix}"
+    else:
+        # Compliance frameworks
+        return f"{output_directory}/{output_filename}_{output_mode}{csv_file_suffix}"
+
+
 def fill_file_descriptors(output_modes, output_directory, output_filename, audit_info):
     try:
         file_descriptors = {}
         if output_modes:
             for output_mode in output_modes:
                 if output_mode == "csv":
-                    filename = f"{output_directory}/{output_filename}{csv_file_suffix}"
+                    filename = get_output_file_path(
+                        output_mode, output_directory, output_filename
+                    )
                     if isinstance(audit_info, AWS_Audit_Info):
                         file_descriptor = initialize_file_descriptor(
                             filename,
@@ -96,15 +117,17 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                     file_descriptors.update({output_mode: file_descriptor})
 
                 elif output_mode == "json":
-                    filename = f"{output_directory}/{output_filename}{json_file_suffix}"
+                    filename = get_output_file_path(
+                        output_mode, output_directory, output_filename
+                    )
                     file_descriptor = initialize_file_descriptor(
                         filename, output_mode, audit_info
                     )
                     file_descriptors.update({output_mode: file_descriptor})
 
                 elif output_mode == "json-ocsf":
-                    filename = (
-                        f"{output_directory}/{output_filename}{json_ocsf_file_suffix}"
+                    filename = get_output_file_path(
+                        output_mode, output_directory, output_filename
                     )
                     file_descriptor = initialize_file_descriptor(
                         filename, output_mode, audit_info
@@ -112,7 +135,9 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                     file_descriptors.update({output_mode: file_descriptor})
 
                 elif output_mode == "html":
-                    filename = f"{output_directory}/{output_filename}{html_file_suffix}"
+                    filename = get_output_file_path(
+                        output_mode, output_directory, output_filename
+                    )
                     file_descriptor = initialize_file_descriptor(
                         filename, output_mode, audit_info
                     )
@@ -120,14 +145,18 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
 
                 elif isinstance(audit_info, AWS_Audit_Info):
                     if output_mode == "json-asff":
-                        filename = f"{output_directory}/{output_filename}{json_asff_file_suffix}"
+                        filename = get_output_file_path(
+                            output_mode, output_directory, output_filename
+                        )
                         file_descriptor = initialize_file_descriptor(
                             filename, output_mode, audit_info
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
                     elif output_mode == "ens_rd2022_aws":
-                        filename = f"{output_directory}/{output_filename}_ens_rd2022_aws{csv_file_suffix}"
+                        filename = get_output_file_path(
+                            output_mode, output_directory, output_filename
+                        )
                         file_descriptor = initialize_file_descriptor(
                             filename,
                             output_mode,
@@ -137,14 +166,18 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                         file_descriptors.update({output_mode: file_descriptor})
 
                     elif output_mode == "cis_1.5_aws":
-                        filename = f"{output_directory}/{output_filename}_cis_1.5_aws{csv_file_suffix}"
+                        filename = get_output_file_path(
+                            output_mode, output_directory, output_filename
+                        )
                         file_descriptor = initialize_file_descriptor(
                             filename, output_mode, audit_info, Check_Output_CSV_CIS
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
                     elif output_mode == "cis_1.4_aws":
-                        filename = f"{output_directory}/{output_filename}_cis_1.4_aws{csv_file_suffix}"
+                        filename = get_output_file_path(
+                            output_mode, output_directory, output_filename
+                        )
                         file_descriptor = initialize_file_descriptor(
                             filename, output_mode, audit_info, Check_Output_CSV_CIS
                         )
@@ -154,7 +187,9 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                         output_mode
                         == "aws_well_architected_framework_security_pillar_aws"
                     ):
-                        filename = f"{output_directory}/{output_filename}_aws_well_architected_framework_security_pillar_aws{csv_file_suffix}"
+                        filename = get_output_file_path(
+                            output_mode, output_directory, output_filename
+                        )
                         file_descriptor = initialize_file_descriptor(
                             filename,
                             output_mode,
@@ -165,7 +200,9 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
 
                     else:
                         # Generic Compliance framework
-                        filename = f"{output_directory}/{output_filename}_{output_mode}{csv_file_suffix}"
+                        filename = get_output_file_path(
+                            output_mode, output_directory, output_filename
+                        )
                         file_descriptor = initialize_file_descriptor(
                             filename,
                             output_mode,
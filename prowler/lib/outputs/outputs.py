@@ -13,7 +13,11 @@ from prowler.config.config import (
     orange_color,
 )
 from prowler.lib.logger import logger
-from prowler.lib.outputs.compliance import add_manual_controls, fill_compliance
+from prowler.lib.outputs.compliance import (
+    Compliance_Summary,
+    add_manual_controls,
+    fill_compliance,
+)
 from prowler.lib.outputs.file_descriptors import fill_file_descriptors
 from prowler.lib.outputs.html import fill_html
 from prowler.lib.outputs.json import fill_json_asff, fill_json_ocsf
@@ -24,8 +28,10 @@ from prowler.lib.outputs.models import (
     generate_provider_output_json,
     unroll_tags,
 )
+from prowler.lib.outputs.summary_table import Findings_Summary
 from prowler.providers.aws.lib.allowlist.allowlist import is_allowlisted
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.clients.clients import get_client
 from prowler.providers.aws.lib.security_hub.security_hub import send_to_security_hub
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
 
@@ -212,7 +218,12 @@ def set_report_color(status: str) -> str:
 
 
 def send_to_s3_bucket(
-    output_filename, output_directory, output_mode, output_bucket, audit_session
+    output_filename,
+    output_directory,
+    output_mode,
+    output_bucket,
+    audit_session,
+    session_config=None,
 ):
     try:
         filename = ""
@@ -236,7 +247,7 @@ def send_to_s3_bucket(
         file_name = output_directory + "/" + filename
         bucket_name = output_bucket
         object_name = bucket_remote_dir + "/" + output_mode + "/" + filename
-        s3_client = audit_session.client("s3")
+        s3_client = get_client(audit_session, "s3", config=session_config)
         s3_client.upload_file(file_name, bucket_name, object_name)
 
     except Exception as error:
@@ -246,6 +257,35 @@ def send_to_s3_bucket(
         sys.exit(1)
 
 
+class Findings_Statistics:
+    """Findings_Statistics aggregates incrementally the statistics of the findings"""
+
+    def __init__(self):
+        self.total_pass = 0
+        self.total_fail = 0
+        self.resources = set()
+        self.findings_count = 0
+
+    def add(self, finding):
+        # Save the resource_id
+        self.resources.add(finding.resource_id)
+        if finding.status == "PASS":
+            self.total_pass += 1
+            self.findings_count += 1
+        if finding.status == "FAIL":
+            self.total_fail += 1
+            self.findings_count += 1
+
+    def get_statistics(self) -> dict:
+        """get_statistics returns the aggregated statistics with the format of extract_findings_statistics"""
+        return {
+            "total_pass": self.total_pass,
+            "total_fail": self.total_fail,
+            "resources_count": len(self.resources),
+            "findings_count": self.findings_count,
+        }
+
+
 def extract_findings_statistics(findings: list) -> dict:
     """
     extract_findings_statistics takes a list of findings and returns the following dict with the aggregated statistics
@@ -257,25 +297,32 @@ def extract_findings_statistics(findings: list) -> dict:
     }
     """
     logger.info("Extracting audit statistics...")
-    stats = {}
-    total_pass = 0
-    total_fail = 0
-    resources = set()
-    findings_count = 0
-
+    findings_statistics = Findings_Statistics()
     for finding in findings:
-        # Save the resource_id
-        resources.add(finding.resource_id)
-        if finding.status == "PASS":
-            total_pass += 1
-            findings_count += 1
-        if finding.status == "FAIL":
-            total_fail += 1
-            findings_count += 1
+        findings_statistics.add(finding)
+
+    return findings_statistics.get_statistics()
+
 
-    stats["total_pass"] = total_pass
-    stats["total_fail"] = total_fail
-    stats["resources_count"] = len(resources)
-    stats["findings_count"] = findings_count
+class Findings_Aggregator:
+    """
+    Findings_Aggregator computes incrementally the statistics, the summary table and the compliance tables
+    of the findings, so each finding can be dropped once it is reported
+    """
+
+    def __init__(self, bulk_checks_metadata: dict, compliance_frameworks: list = None):
+        self.statistics = Findings_Statistics()
+        self.summary = Findings_Summary()
+        self.compliance_summaries = {
+            compliance_framework: Compliance_Summary(
+                compliance_framework, bulk_checks_metadata
+            )
+            for compliance_framework in compliance_frameworks or []
+        }
 
-    return stats
+    def add_findings(self, findings):
+        for finding in findings:
+            self.statistics.add(finding)
+            self.summary.add(finding)
+            for compliance_summary in self.compliance_summaries.values():
+                compliance_summary.add(finding)
@@ -14,11 +14,65 @@ from prowler.lib.logger import logger
 from prowler.providers.common.outputs import Provider_Output_Options
 
 
+class Findings_Summary:
+    """Findings_Summary aggregates incrementally the findings of the summary table per service"""
+
+    def __init__(self):
+        self.services = {}
+        self.findings_count = 0
+        self.pass_count = 0
+        self.fail_count = 0
+
+    def add(self, finding):
+        service = finding.check_metadata.ServiceName
+        if service not in self.services:
+            self.services[service] = {
+                "Service": service,
+                "Provider": "",
+                "Total": 0,
+                "Critical": 0,
+                "High": 0,
+                "Medium": 0,
+                "Low": 0,
+            }
+        current = self.services[service]
+        current["Provider"] = finding.check_metadata.Provider
+
+        self.findings_count += 1
+        current["Total"] += 1
+        if finding.status == "PASS":
+            self.pass_count += 1
+        elif finding.status == "FAIL":
+            self.fail_count += 1
+            if finding.check_metadata.Severity == "critical":
+                current["Critical"] += 1
+            elif finding.check_metadata.Severity == "high":
+                current["High"] += 1
+            elif finding.check_metadata.Severity == "medium":
+                current["Medium"] += 1
+            elif finding.check_metadata.Severity == "low":
+                current["Low"] += 1
+
+
 def display_summary_table(
     findings: list,
     audit_info,
     output_options: Provider_Output_Options,
     provider: str,
+):
+    findings_summary = Findings_Summary()
+    for finding in findings:
+        findings_summary.add(finding)
+    display_findings_summary_table(
+        findings_summary, audit_info, output_options, provider
+    )
+
+
+def display_findings_summary_table(
+    findings_summary: Findings_Summary,
+    audit_info,
+    output_options: Provider_Output_Options,
+    provider: str,
 ):
     output_directory = output_options.output_directory
     output_filename = output_options.output_filename
@@ -40,16 +94,7 @@ def display_summary_table(
             entity_type = "Project ID/s"
             audited_entities = ", ".join(audit_info.project_ids)
 
-        if findings:
-            current = {
-                "Service": "",
-                "Provider": "",
-                "Total": 0,
-                "Critical": 0,
-                "High": 0,
-                "Medium": 0,
-                "Low": 0,
-            }
+        if findings_summary.findings_count:
             findings_table = {
                 "Provider": [],
                 "Service": [],
@@ -59,45 +104,17 @@ def display_summary_table(
                 "Medium": [],
                 "Low": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                # If new service and not first, add previous row
-                if (
-                    current["Service"] != finding.check_metadata.ServiceName
-                    and current["Service"]
-                ):
-                    add_service_to_table(findings_table, current)
-
-                    current["Total"] = current["Critical"] = current["High"] = current[
-                        "Medium"
-                    ] = current["Low"] = 0
-
-                current["Service"] = finding.check_metadata.ServiceName
-                current["Provider"] = finding.check_metadata.Provider
-
-                current["Total"] += 1
-                if finding.status == "PASS":
-                    pass_count += 1
-                elif finding.status == "FAIL":
-                    fail_count += 1
-                    if finding.check_metadata.Severity == "critical":
-                        current["Critical"] += 1
-                    elif finding.check_metadata.Severity == "high":
-                        current["High"] += 1
-                    elif finding.check_metadata.Severity == "medium":
-                        current["Medium"] += 1
-                    elif finding.check_metadata.Severity == "low":
-                        current["Low"] += 1
-
-            # Add final service
-
-            add_service_to_table(findings_table, current)
+            pass_count = findings_summary.pass_count
+            fail_count = findings_summary.fail_count
+            findings_count = findings_summary.findings_count
+            for current in findings_summary.services.values():
+                add_service_to_table(findings_table, current)
 
             print("\nOverview Results:")
             overview_table = [
                 [
-                    f"{Fore.RED}{round(fail_count/len(findings)*100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
-                    f"{Fore.GREEN}{round(pass_count/len(findings)*100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
+                    f"{Fore.RED}{round(fail_count/findings_count*100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
+                    f"{Fore.GREEN}{round(pass_count/findings_count*100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
                 ]
             ]
             print(tabulate(overview_table, tablefmt="rounded_grid"))
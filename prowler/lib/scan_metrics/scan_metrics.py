@@ -0,0 +1,305 @@
+import ast
+import importlib
+import importlib.util
+import json
+import sys
+import threading
+from functools import wraps
+from time import perf_counter, thread_time
+
+from prowler.lib.logger import logger
+
+# Methods of the services which are not collectors
+non_collector_methods = {
+    "__get_session__",
+    "__start_collecting__",
+    "__threading_call__",
+    "__collecting_call__",
+}
+
+
+def get_max_rss() -> int:
+    """get_max_rss returns the peak resident memory of the process in bytes, or 0 if it is not available"""
+    try:
+        from resource import RUSAGE_SELF, getrusage
+    except ImportError:
+        return 0
+    max_rss = getrusage(RUSAGE_SELF).ru_maxrss
+    # It is returned in bytes in macOS and in kilobytes in Linux
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class Resource_Usage:
+    """
+    Resource_Usage measures, since it is created, the wall-clock time, the CPU time of the current thread
+    and how much the peak memory of the process increases
+    """
+
+    def __init__(self):
+        self.start_wall_time = perf_counter()
+        self.start_cpu_time = thread_time()
+        self.start_max_rss = get_max_rss()
+
+    def stop(self) -> dict:
+        return {
+            "wall_time": perf_counter() - self.start_wall_time,
+            "cpu_time": thread_time() - self.start_cpu_time,
+            "max_rss_increase": max(get_max_rss() - self.start_max_rss, 0),
+        }
+
+
+def get_finding_region(finding) -> str:
+    """get_finding_region returns the region of the AWS findings, the location of the GCP ones and the subscription of the Azure ones"""
+    for attribute in ("region", "location", "subscription"):
+        region = getattr(finding, attribute, None)
+        if isinstance(region, str) and region:
+            return region
+    return "global"
+
+
+def get_collector_region(service, args: tuple) -> str:
+    """get_collector_region returns the region of the regional client or resource passed to the collector"""
+    for region_holder in (*args[:1], service):
+        region = getattr(region_holder, "region", None)
+        if isinstance(region, str) and region:
+            return region
+    return "global"
+
+
+class Scan_Metrics:
+    """Scan_Metrics stores the resources used by every check and service collector of the scan"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.checks = {}
+        self.collectors = {}
+
+    def record_check(self, service: str, check_name: str, usage: dict, findings: list):
+        findings_by_region = {}
+        for finding in findings:
+            region = get_finding_region(finding)
+            findings_by_region[region] = findings_by_region.get(region, 0) + 1
+        with self.lock:
+            self.checks[check_name] = {
+                "check": check_name,
+                "service": service,
+                **usage,
+                "findings": len(findings),
+                "findings_by_region": findings_by_region,
+            }
+
+    def record_collector(self, service: str, collector: str, region: str, usage: dict):
+        with self.lock:
+            metrics = self.collectors.setdefault(
+                (service, collector, region),
+                {
+                    "service": service,
+                    "collector": collector,
+                    "region": region,
+                    "calls": 0,
+                    "wall_time": 0,
+                    "cpu_time": 0,
+                    "max_rss_increase": 0,
+                },
+            )
+            metrics["calls"] += 1
+            metrics["wall_time"] += usage["wall_time"]
+            metrics["cpu_time"] += usage["cpu_time"]
+            metrics["max_rss_increase"] = max(
+                metrics["max_rss_increase"], usage["max_rss_increase"]
+            )
+
+    def get_metrics(self) -> dict:
+        """
+        get_metrics returns the metrics of the checks and the collectors, and their totals per service and
+        per region. The time is in seconds and the memory in bytes.
+        """
+        with self.lock:
+            checks = sorted(
+                self.checks.values(), key=lambda check: check["wall_time"], reverse=True
+            )
+            collectors = sorted(
+                self.collectors.values(),
+                key=lambda collector: collector["wall_time"],
+                reverse=True,
+            )
+        services = {}
+        regions = {}
+
+        def get_service_totals(service: str) -> dict:
+            return services.setdefault(
+                service,
+                {
+                    "build_wall_time": 0,
+                    "collectors_wall_time": 0,
+                    "checks_wall_time": 0,
+                    "findings": 0,
+                },
+            )
+
+        def get_region_totals(region: str) -> dict:
+            return regions.setdefault(
+                region, {"collectors_wall_time": 0, "findings": 0}
+            )
+
+        for check in checks:
+            service_totals = get_service_totals(check["service"])
+            service_totals["checks_wall_time"] += check["wall_time"]
+            service_totals["findings"] += check["findings"]
+            for region, findings in check["findings_by_region"].items():
+                get_region_totals(region)["findings"] += findings
+        for collector in collectors:
+            service_totals = get_service_totals(collector["service"])
+            # The service constructor time includes the collectors called while building it
+            if collector["collector"] == "__init__":
+                service_totals["build_wall_time"] += collector["wall_time"]
+            else:
+                service_totals["collectors_wall_time"] += collector["wall_time"]
+                region_totals = get_region_totals(collector["region"])
+                region_totals["collectors_wall_time"] += collector["wall_time"]
+        return {
+            "checks": checks,
+            "collectors": collectors,
+            "services": services,
+            "regions": regions,
+        }
+
+    def get_slowest(self, number: int = 20) -> list:
+        """get_slowest returns the number slowest checks and service collectors per region"""
+        metrics = self.get_metrics()
+        slowest = [
+            {"type": "Check", "name": check["check"], "region": "-", **check}
+            for check in metrics["checks"]
+        ] + [
+            {
+                "type": "Collector",
+                "name": f"{collector['service']}.{collector['collector']}",
+                "findings": "-",
+                **collector,
+            }
+            for collector in metrics["collectors"]
+        ]
+        slowest.sort(key=lambda metric: metric["wall_time"], reverse=True)
+        return slowest[:number]
+
+    def write(self, file_path: str):
+        with open(file_path, "w") as metrics_file:
+            json.dump(self.get_metrics(), metrics_file, indent=4)
+
+
+def instrument_collector(service: str, collector, scan_metrics: Scan_Metrics):
+    """instrument_collector returns the collector recording its resources usage in the scan_metrics"""
+
+    @wraps(collector)
+    def instrumented_collector(service_instance, *args, **kwargs):
+        usage = Resource_Usage()
+        try:
+            return collector(service_instance, *args, **kwargs)
+        finally:
+            scan_metrics.record_collector(
+                service,
+                collector.__name__,
+                get_collector_region(service_instance, args),
+                usage.stop(),
+            )
+
+    instrumented_collector.__instrumented__ = True
+    return instrumented_collector
+
+
+def recover_service_classes(service_client: str) -> list:
+    """recover_service_classes returns the (module, class name) of the services built in the service client module, without importing it"""
+    service_classes = []
+    client_spec = importlib.util.find_spec(service_client)
+    with open(client_spec.origin) as client_file:
+        client_tree = ast.parse(client_file.read())
+    imported_classes = {}
+    for node in client_tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module:
+            for alias in node.names:
+                imported_classes[alias.asname or alias.name] = node.module
+        elif (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Name)
+            and node.value.func.id in imported_classes
+        ):
+            service_classes.append(
+                (imported_classes[node.value.func.id], node.value.func.id)
+            )
+    return service_classes
+
+
+def instrument_service_clients(
+    service_clients: list, scan_metrics: Scan_Metrics
+) -> list:
+    """
+    instrument_service_clients wraps the constructor and the collectors (e.g. __describe_instances__) of the
+    services built in the service_clients modules, so every call records its resources usage in the
+    scan_metrics. It has to be called before the service clients are imported.
+
+    It returns the (class, name, method) of the original methods, which have to be restored with
+    restore_service_clients once the checks are executed.
+    """
+    instrumented_methods = []
+    for service_client in service_clients:
+        try:
+            # Format: "prowler.providers.{provider}.services.{service}.{service}_client"
+            service = service_client.split(".")[-2]
+            for service_module, class_name in recover_service_classes(service_client):
+                service_class = getattr(
+                    importlib.import_module(service_module), class_name
+                )
+                for name, method in list(vars(service_class).items()):
+                    if (
+                        callable(method)
+                        and name.startswith("__")
+                        and name.endswith("__")
+                        and name not in non_collector_methods
+                        and (name == "__init__" or name not in dir(object))
+                        and not getattr(method, "__instrumented__", False)
+                    ):
+                        setattr(
+                            service_class,
+                            name,
+                            instrument_collector(service, method, scan_metrics),
+                        )
+                        instrumented_methods.append((service_class, name, method))
+        except Exception as error:
+            logger.error(
+                f"{service_client} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+    return instrumented_methods
+
+
+def restore_service_clients(instrumented_methods: list):
+    """restore_service_clients restores the original methods of the services instrumented by instrument_service_clients"""
+    for service_class, name, method in reversed(instrumented_methods):
+        setattr(service_class, name, method)
+
+
+def display_scan_metrics_table(scan_metrics: Scan_Metrics, number: int = 20):
+    """display_scan_metrics_table prints the number slowest checks and service collectors"""
+    metrics_table = {
+        "Type": [],
+        "Name": [],
+        "Region": [],
+        "Time (seconds)": [],
+        "CPU (seconds)": [],
+        "Peak memory increase (MiB)": [],
+        "Findings": [],
+    }
+    for metric in scan_metrics.get_slowest(number):
+        metrics_table["Type"].append(metric["type"])
+        metrics_table["Name"].append(metric["name"])
+        metrics_table["Region"].append(metric["region"])
+        metrics_table["Time (seconds)"].append(round(metric["wall_time"], 2))
+        metrics_table["CPU (seconds)"].append(round(metric["cpu_time"], 2))
+        metrics_table["Peak memory increase (MiB)"].append(
+            round(metric["max_rss_increase"] / 1024 / 1024, 1)
+        )
+        metrics_table["Findings"].append(metric["findings"])
+    from tabulate import tabulate
+
+    print(f"\nTop {number} slowest checks and service collectors:")
+    print(tabulate(metrics_table, headers="keys", tablefmt="rounded_grid"))
@@ -1,5 +1,6 @@
 import json
 import os
+import stat
 import sys
 import tempfile
 from hashlib import sha512
@@ -8,9 +9,6 @@ from ipaddress import ip_address
 from os.path import exists
 from typing import Any
 
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.logger import logger
 
 
@@ -66,6 +64,10 @@ def hash_sha512(string: str) -> str:
 
 
 def detect_secrets_scan(data):
+    # detect-secrets loads all its plugins, so it is only imported by the checks that need it
+    from detect_secrets import SecretsCollection
+    from detect_secrets.settings import default_settings
+
     temp_data_file = tempfile.NamedTemporaryFile(delete=False)
     temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
     temp_data_file.close()
@@ -88,3 +90,42 @@ def validate_ip_address(ip_string):
         return True
     except ValueError:
         return False
+
+
+def check_private_path(path: str, file_stat: os.stat_result):
+    """check_private_path raises PermissionError if the file or directory is not owned by the current user or other users can write to it"""
+    # There are no user IDs on Windows
+    if hasattr(os, "getuid") and file_stat.st_uid != os.getuid():
+        raise PermissionError(f"{path} is not owned by the current user")
+    if file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{path} is writable by other users")
+
+
+def create_private_directory(directory: str):
+    """
+    create_private_directory creates the directory, only accessible by the current user, if it does not exist.
+    It raises PermissionError if it already exists and it is a symlink, it is owned by another user or other users
+    can write to it, since they could replace the files stored in it, e.g. with PROWLER_CACHE_DIR=/tmp/prowler
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    directory_stat = os.lstat(directory)
+    if not stat.S_ISDIR(directory_stat.st_mode):
+        raise PermissionError(f"{directory} is not a directory")
+    check_private_path(directory, directory_stat)
+
+
+def open_private_file(file_path: str, mode: str = "r"):
+    """
+    open_private_file opens for reading a file stored by create_private_directory's owner, raising PermissionError
+    if the file or its directory could have been written by another user, and OSError if the file is a symlink
+    """
+    directory = os.path.dirname(file_path)
+    check_private_path(directory, os.lstat(directory))
+    # The symlinks are not followed, so another file cannot be planted through them
+    file_descriptor = os.open(file_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    try:
+        check_private_path(file_path, os.fstat(file_descriptor))
+        return os.fdopen(file_descriptor, mode)
+    except Exception:
+        os.close(file_descriptor)
+        raise
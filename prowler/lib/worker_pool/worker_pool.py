@@ -0,0 +1,155 @@
+import contextvars
+import queue
+import threading
+import traceback
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable
+
+from prowler.lib.logger import logger
+
+# Maximum number of threads making calls at the same time, shared by all the services
+default_max_workers = 32
+
+
+class Background_Call:
+    """
+    Background_Call is a call running in the worker pool while its caller goes on, e.g. the generation of the
+    IAM credential report, returned by Worker_Pool.submit
+    """
+
+    def __init__(self, call: Callable):
+        self.call = call
+        self.future = Future()
+        # The context variables of the caller are visible to the call
+        self.context = contextvars.copy_context()
+        # The call is run once, either by a worker or by the first thread waiting for it
+        self.start_lock = threading.Lock()
+        self.started = False
+
+    def __run__(self):
+        with self.start_lock:
+            if self.started:
+                return
+            self.started = True
+        self.future.set_running_or_notify_cancel()
+        try:
+            self.future.set_result(self.context.run(self.call))
+        except BaseException as error:
+            self.future.set_exception(error)
+
+    def result(self) -> Any:
+        """
+        result waits until the call is finished and returns its result. If the call has not been started yet,
+        e.g. because all the workers are busy, it is run by the calling thread instead of waiting for a worker.
+        """
+        self.__run__()
+        return self.future.result()
+
+
+class Worker_Pool:
+    """
+    Worker_Pool runs the calls fanned out by the services, per region or per resource, in a process-wide pool
+    of at most max_workers threads, which are started when needed and reused afterwards.
+
+    The thread fanning out the calls runs them too, so the calls are never left waiting for a free worker,
+    e.g. when a call fans out again or when all the workers are busy with other services.
+    The workers are daemon threads, so the calls of a service which exceeded its budget do not block
+    Prowler from exiting.
+    """
+
+    def __init__(self, max_workers: int = default_max_workers):
+        self.max_workers = max_workers
+        self.tasks = queue.SimpleQueue()
+        self.lock = threading.Lock()
+        self.workers = 0
+        self.idle_workers = 0
+
+    def set_max_workers(self, max_workers: int):
+        """set_max_workers sets the maximum number of workers, it has to be called before the services are built"""
+        with self.lock:
+            self.max_workers = max_workers
+
+    def __submit__(self, task: Callable):
+        self.tasks.put(task)
+        with self.lock:
+            # A new worker is started if there are more queued tasks than idle workers
+            start_worker = (
+                self.tasks.qsize() > self.idle_workers
+                and self.workers < self.max_workers
+            )
+            if start_worker:
+                self.workers += 1
+                worker_number = self.workers
+        if start_worker:
+            threading.Thread(
+                target=self.__work__,
+                name=f"prowler-worker-{worker_number}",
+                daemon=True,
+            ).start()
+
+    def __work__(self):
+        while True:
+            with self.lock:
+                self.idle_workers += 1
+            task = self.tasks.get()
+            with self.lock:
+                self.idle_workers -= 1
+            task()
+
+    def submit(self, call: Callable) -> Background_Call:
+        """submit runs call in the pool without waiting for it, its result is returned by the Background_Call"""
+        background_call = Background_Call(call)
+        self.__submit__(background_call.__run__)
+        return background_call
+
+    def map(self, call: Callable, items: Iterable) -> list:
+        """
+        map runs call(item) for every item in the pool, waits until all of them are finished and returns
+        their results in the same order. If any call raises an exception, it is logged along with the
+        region of its item and the first one is raised once all the calls are finished.
+        """
+        items = list(items)
+        results = [None] * len(items)
+        errors = {}
+        pending_items = iter(enumerate(items))
+        unfinished_items = len(items)
+        items_condition = threading.Condition()
+        # The context variables of the caller are visible to the calls
+        context = contextvars.copy_context()
+
+        def run_items():
+            nonlocal unfinished_items
+            item_context = context.copy()
+            while True:
+                with items_condition:
+                    index, item = next(pending_items, (None, None))
+                if index is None:
+                    return
+                try:
+                    results[index] = item_context.run(call, item)
+                # Raised in the caller, e.g. to exit Prowler
+                except BaseException as error:
+                    errors[index] = error
+                finally:
+                    with items_condition:
+                        unfinished_items -= 1
+                        items_condition.notify_all()
+
+        for _ in range(min(len(items) - 1, self.max_workers)):
+            self.__submit__(run_items)
+        run_items()
+        with items_condition:
+            items_condition.wait_for(lambda: unfinished_items == 0)
+
+        for index in sorted(errors):
+            error = errors[index]
+            logger.error(
+                f"{getattr(items[index], 'region', 'global')} -- {error.__class__.__name__}[{traceback.extract_tb(error.__traceback__)[-1].lineno}]: {error}"
+            )
+        if errors:
+            raise errors[min(errors)]
+        return results
+
+
+# Process-wide pool shared by all the services
+worker_pool = Worker_Pool()
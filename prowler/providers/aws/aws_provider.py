@@ -1,16 +1,24 @@
-import os
-import pathlib
 import sys
 
 from boto3 import client, session
+from botocore.config import Config
 from botocore.credentials import RefreshableCredentials
 from botocore.session import get_session
 
-from prowler.config.config import aws_services_json_file
-from prowler.lib.check.check import list_modules, recover_checks_from_service
+from prowler.config.config import (
+    default_aws_connect_timeout,
+    default_aws_read_timeout,
+)
+from prowler.lib.check.check import recover_checks_from_service
+from prowler.lib.check.manifest import load_checks_manifest
 from prowler.lib.logger import logger
-from prowler.lib.utils.utils import open_file, parse_json_file
 from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
+from prowler.providers.aws.lib.clients.clients import get_client
+from prowler.providers.aws.lib.credentials_cache.credentials_cache import (
+    load_cached_credentials,
+    store_cached_credentials,
+)
+from prowler.providers.aws.lib.regions.regions import get_service_regions
 
 
 ################## AWS PROVIDER
@@ -107,6 +115,11 @@ class AWS_Provider:
 
 def assume_role(session: session.Session, assumed_role_info: AWS_Assume_Role) -> dict:
     try:
+        # The credentials cached by a previous execution are reused if they are not about to expire
+        cached_credentials = load_cached_credentials(assumed_role_info)
+        if cached_credentials:
+            return cached_credentials
+
         assume_role_arguments = {
             "RoleArn": assumed_role_info.role_arn,
             "RoleSessionName": "ProwlerAsessmentSession",
@@ -122,8 +135,9 @@ def assume_role(session: session.Session, assumed_role_info: AWS_Assume_Role) ->
             assume_role_arguments["TokenCode"] = mfa_TOTP
 
         # set the info to assume the role from the partition, account and role name
-        sts_client = session.client("sts")
+        sts_client = get_client(session, "sts")
         assumed_credentials = sts_client.assume_role(**assume_role_arguments)
+        store_cached_credentials(assumed_role_info, assumed_credentials)
     except Exception as error:
         logger.critical(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
@@ -134,6 +148,68 @@ def assume_role(session: session.Session, assumed_role_info: AWS_Assume_Role) ->
         return assumed_credentials
 
 
+def get_assumed_role_session(
+    original_session: session.Session,
+    assumed_role_info: AWS_Assume_Role,
+    region: str,
+) -> session.Session:
+    """
+    get_assumed_role_session assumes the role from the original session and returns a session with its credentials,
+    which are refreshed assuming the role again before they expire. Unlike assume_role, the errors are raised.
+    """
+    assume_role_arguments = {
+        "RoleArn": assumed_role_info.role_arn,
+        "RoleSessionName": "ProwlerAsessmentSession",
+        "DurationSeconds": assumed_role_info.session_duration,
+    }
+    if assumed_role_info.external_id:
+        assume_role_arguments["ExternalId"] = assumed_role_info.external_id
+    sts_client = get_client(original_session, "sts")
+
+    def refresh_credentials() -> dict:
+        response = load_cached_credentials(assumed_role_info)
+        if not response:
+            logger.info(f"Assuming role {assumed_role_info.role_arn}")
+            response = sts_client.assume_role(**assume_role_arguments)
+            store_cached_credentials(assumed_role_info, response)
+        return dict(
+            access_key=response["Credentials"]["AccessKeyId"],
+            secret_key=response["Credentials"]["SecretAccessKey"],
+            token=response["Credentials"]["SessionToken"],
+            expiry_time=response["Credentials"]["Expiration"].isoformat(),
+        )
+
+    assumed_refreshable_credentials = RefreshableCredentials.create_from_metadata(
+        metadata=refresh_credentials(),
+        refresh_using=refresh_credentials,
+        method="sts-assume-role",
+    )
+    assumed_botocore_session = get_session()
+    assumed_botocore_session._credentials = assumed_refreshable_credentials
+    assumed_botocore_session.set_config_variable("region", region)
+    return session.Session(botocore_session=assumed_botocore_session)
+
+
+def get_connection_config(
+    concurrency: int,
+    max_pool_connections: int = None,
+    connect_timeout: int = None,
+    read_timeout: int = None,
+) -> Config:
+    """
+    get_connection_config returns the boto3 config of the connections of the clients. Every client is shared by all
+    the threads making calls concurrently, so its pool keeps a connection per thread, concurrency by default, and the
+    connections are reused instead of being discarded and opened again with a new TLS handshake. The idle
+    connections are kept alive with TCP keep-alive.
+    """
+    return Config(
+        max_pool_connections=max_pool_connections or concurrency,
+        tcp_keepalive=True,
+        connect_timeout=connect_timeout or default_aws_connect_timeout,
+        read_timeout=read_timeout or default_aws_read_timeout,
+    )
+
+
 def input_role_mfa_token_and_code() -> tuple[str]:
     """input_role_mfa_token_and_code ask for the AWS MFA ARN and TOTP and returns it."""
     mfa_ARN = input("Enter ARN of MFA: ")
@@ -146,18 +222,18 @@ def generate_regional_clients(
 ) -> dict:
     try:
         regional_clients = {}
-        # Get json locally
-        actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
-        with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
-            data = parse_json_file(f)
-        # Check if it is a subservice
-        json_regions = data["services"][service]["regions"][
-            audit_info.audited_partition
-        ]
+        # The regions of the service are read from the matrix loaded once
+        json_regions = get_service_regions(service, audit_info.audited_partition)
         if audit_info.audited_regions:  # Check for input aws audit_info.audited_regions
             regions = list(
                 set(json_regions).intersection(audit_info.audited_regions)
             )  # Get common regions between input and json
+        elif audit_info.enabled_regions:  # Skip the opt-in regions not enabled
+            regions = [
+                region
+                for region in json_regions
+                if region in audit_info.enabled_regions
+            ]
         else:  # Get all regions from json of the service and partition
             regions = json_regions
         # Check if it is global service to gather only one region
@@ -167,8 +243,9 @@ def generate_regional_clients(
                     regions = [audit_info.profile_region]
                 regions = regions[:1]
         for region in regions:
-            regional_client = audit_info.audit_session.client(
-                service, region_name=region, config=audit_info.session_config
+            # The clients are shared by all the services using the same service and region
+            regional_client = get_client(
+                audit_info.audit_session, service, region, audit_info.session_config
             )
             regional_client.region = region
             regional_clients[region] = regional_client
@@ -179,23 +256,6 @@ def generate_regional_clients(
         )
 
 
-def get_aws_available_regions():
-    try:
-        actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
-        with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
-            data = parse_json_file(f)
-
-        regions = set()
-        for service in data["services"].values():
-            for partition in service["regions"]:
-                for item in service["regions"][partition]:
-                    regions.add(item)
-        return list(regions)
-    except Exception as error:
-        logger.error(f"{error.__class__.__name__}: {error}")
-        return []
-
-
 def get_checks_from_input_arn(audit_resources: list, provider: str) -> set:
     """get_checks_from_input_arn gets the list of checks from the input arns"""
     checks_from_arn = set()
@@ -204,6 +264,7 @@ def get_checks_from_input_arn(audit_resources: list, provider: str) -> set:
         services_without_subservices = ["guardduty", "kms", "s3", "elb", "efs"]
         service_list = set()
         sub_service_list = set()
+        checks_manifest = load_checks_manifest(provider)
         for resource in audit_resources:
             service = resource.split(":")[2]
             sub_service = resource.split(":")[5].split("/")[0].replace("-", "_")
@@ -219,12 +280,7 @@ def get_checks_from_input_arn(audit_resources: list, provider: str) -> set:
                 elif service == "logs":
                     service = "cloudwatch"
                 # Check if Prowler has checks in service
-                try:
-                    list_modules(provider, service)
-                except ModuleNotFoundError:
-                    # Service is not supported
-                    pass
-                else:
+                if service in checks_manifest:
                     service_list.add(service)
 
                 # Get subservices to execute only applicable checks
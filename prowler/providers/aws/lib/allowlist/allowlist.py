@@ -6,6 +6,7 @@ from boto3.dynamodb.conditions import Attr
 from schema import Optional, Schema
 
 from prowler.lib.logger import logger
+from prowler.providers.aws.lib.clients.clients import get_client
 
 allowlist_schema = Schema(
     {
@@ -26,15 +27,20 @@ def parse_allowlist_file(audit_info, allowlist_file):
         if re.search("^s3://([^/]+)/(.*?([^/]+))$", allowlist_file):
             bucket = allowlist_file.split("/")[2]
             key = ("/").join(allowlist_file.split("/")[3:])
-            s3_client = audit_info.audit_session.client("s3")
+            s3_client = get_client(
+                audit_info.audit_session, "s3", config=audit_info.session_config
+            )
             allowlist = yaml.safe_load(
                 s3_client.get_object(Bucket=bucket, Key=key)["Body"]
             )["Allowlist"]
         # Check if file is a Lambda Function ARN
         elif re.search(r"^arn:(\w+):lambda:", allowlist_file):
             lambda_region = allowlist_file.split(":")[3]
-            lambda_client = audit_info.audit_session.client(
-                "lambda", region_name=lambda_region
+            lambda_client = get_client(
+                audit_info.audit_session,
+                "lambda",
+                lambda_region,
+                audit_info.session_config,
             )
             lambda_response = lambda_client.invoke(
                 FunctionName=allowlist_file, InvocationType="RequestResponse"
@@ -49,7 +55,7 @@ def parse_allowlist_file(audit_info, allowlist_file):
             allowlist = {"Accounts": {}}
             table_region = allowlist_file.split(":")[3]
             dynamodb_resource = audit_info.audit_session.resource(
-                "dynamodb", region_name=table_region
+                "dynamodb", region_name=table_region, config=audit_info.session_config
             )
             dynamo_table = dynamodb_resource.Table(allowlist_file.split("/")[1])
             response = dynamo_table.scan(
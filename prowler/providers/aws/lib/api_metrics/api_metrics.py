@@ -0,0 +1,348 @@
+import json
+import threading
+from time import perf_counter
+
+from boto3 import session
+
+from prowler.lib.logger import logger
+from prowler.providers.aws.lib.clients.clients import remove_session_clients
+
+# Upper bounds, in seconds, of the latency histogram buckets
+latency_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Error codes of the throttled requests, the same retried by the botocore standard retrier
+throttling_error_codes = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "PriorRequestNotComplete",
+    "EC2ThrottledException",
+}
+
+# Keys stored in the botocore request context
+start_time_context_key = "prowler_api_metrics_start_time"
+region_context_key = "prowler_api_metrics_region"
+attempts_context_key = "prowler_api_metrics_attempts"
+
+
+def get_operation(event_name: str) -> tuple:
+    """get_operation returns the service and operation of the botocore event name, e.g. after-call.ec2.DescribeInstances"""
+    _, service, operation = event_name.split(".", 2)
+    return service, operation
+
+
+def get_instrumented_pool_class(pool_class: type, connection_metrics: dict, lock):
+    """
+    get_instrumented_pool_class returns a subclass of the urllib3 connection pool class of a client recording in
+    connection_metrics the time waited for a connection of the pool, the connections opened, with the time of their
+    TCP and TLS handshakes, and the connections discarded because the pool was full
+    """
+
+    class Instrumented_Connection_Pool(pool_class):
+        def _get_conn(self, timeout=None):
+            start_time = perf_counter()
+            try:
+                return super()._get_conn(timeout)
+            finally:
+                with lock:
+                    connection_metrics["connection_requests"] += 1
+                    connection_metrics["pool_wait_seconds"] += (
+                        perf_counter() - start_time
+                    )
+
+        def _validate_conn(self, conn):
+            # The HTTPS connections are opened here, if they are not reused
+            if getattr(conn, "sock", None) is not None:
+                return super()._validate_conn(conn)
+            start_time = perf_counter()
+            try:
+                return super()._validate_conn(conn)
+            finally:
+                with lock:
+                    connection_metrics["connections_opened"] += 1
+                    connection_metrics["connection_setup_seconds"] += (
+                        perf_counter() - start_time
+                    )
+
+        def _put_conn(self, conn):
+            # urllib3 closes the connection if the pool is full
+            if self.pool is not None and self.pool.full():
+                with lock:
+                    connection_metrics["connections_discarded"] += 1
+            return super()._put_conn(conn)
+
+    return Instrumented_Connection_Pool
+
+
+class API_Metrics:
+    """
+    API_Metrics records, per service, region and operation, the AWS API calls made by the clients of the
+    sessions where it is registered: calls, latency histogram, retries, throttled and failed attempts
+    and bytes received. It also records the connections of the clients per service and region: time waited
+    for a connection of the pool, connections opened and the time of their handshakes, and connections discarded.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.operations = {}
+        self.connections = {}
+
+    def register(self, audit_session: session.Session):
+        """register adds the handlers to the session events, so they are inherited by the clients created from then on"""
+        audit_session.events.register("before-call", self.before_call)
+        audit_session.events.register("response-received", self.response_received)
+        audit_session.events.register("after-call", self.after_call)
+        audit_session.events.register("after-call-error", self.after_call)
+        audit_session.events.register(
+            "creating-client-class", self.creating_client_class
+        )
+        # The clients already created, e.g. to set up the audit info, are created again with the handlers
+        remove_session_clients(audit_session)
+
+    def get_connection_metrics(self, service: str, region: str) -> dict:
+        with self.lock:
+            return self.connections.setdefault(
+                (service, region),
+                {
+                    "service": service,
+                    "region": region,
+                    "connection_requests": 0,
+                    "pool_wait_seconds": 0,
+                    "connections_opened": 0,
+                    "connection_setup_seconds": 0,
+                    "connections_discarded": 0,
+                },
+            )
+
+    def creating_client_class(self, base_classes=None, **_):
+        """creating_client_class makes the clients instrument their connection pools once they are created"""
+        api_metrics = self
+
+        class Connection_Metrics_Client:
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                api_metrics.instrument_connections(self)
+
+        base_classes.insert(0, Connection_Metrics_Client)
+
+    def instrument_connections(self, client):
+        try:
+            connection_metrics = self.get_connection_metrics(
+                client.meta.service_model.service_id.hyphenize(),
+                client.meta.region_name or "global",
+            )
+            http_session = client._endpoint.http_session
+            pool_classes = {
+                scheme: get_instrumented_pool_class(
+                    pool_class, connection_metrics, self.lock
+                )
+                for scheme, pool_class in http_session._pool_classes_by_scheme.items()
+            }
+            # The pools are created when the first request to every endpoint is sent, also through proxies
+            http_session._pool_classes_by_scheme = pool_classes
+            http_session._manager.pool_classes_by_scheme = pool_classes
+        except Exception as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def get_operation_metrics(self, service: str, region: str, operation: str):
+        return self.operations.setdefault(
+            (service, region, operation),
+            {
+                "service": service,
+                "region": region,
+                "operation": operation,
+                "calls": 0,
+                "errors": 0,
+                "retries": 0,
+                "throttles": 0,
+                "received_bytes": 0,
+                "latency_sum": 0,
+                "latency_buckets": [0] * len(latency_buckets),
+            },
+        )
+
+    def before_call(self, request_signer=None, context=None, **_):
+        # The handlers must return None to not replace the response
+        if context is not None:
+            context[start_time_context_key] = perf_counter()
+            context[region_context_key] = (
+                getattr(request_signer, "region_name", None) or "global"
+            )
+            context[attempts_context_key] = 0
+
+    def response_received(
+        self,
+        event_name,
+        response_dict=None,
+        parsed_response=None,
+        context=None,
+        exception=None,
+        **_,
+    ):
+        try:
+            if context is None or start_time_context_key not in context:
+                return
+            # Called once per attempt, including the retried ones
+            context[attempts_context_key] += 1
+            received_bytes = 0
+            if response_dict:
+                if isinstance(response_dict.get("body"), bytes):
+                    received_bytes = len(response_dict["body"])
+                else:
+                    received_bytes = int(
+                        response_dict.get("headers", {}).get("content-length", 0)
+                    )
+            error_code = (parsed_response or {}).get("Error", {}).get("Code")
+            service, operation = get_operation(event_name)
+            with self.lock:
+                metrics = self.get_operation_metrics(
+                    service, context[region_context_key], operation
+                )
+                metrics["received_bytes"] += received_bytes
+                if error_code in throttling_error_codes:
+                    metrics["throttles"] += 1
+        except Exception as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def after_call(
+        self, event_name, http_response=None, context=None, exception=None, **_
+    ):
+        try:
+            if context is None or start_time_context_key not in context:
+                return
+            latency = perf_counter() - context[start_time_context_key]
+            service, operation = get_operation(event_name)
+            with self.lock:
+                metrics = self.get_operation_metrics(
+                    service, context[region_context_key], operation
+                )
+                metrics["calls"] += 1
+                metrics["retries"] += max(context[attempts_context_key] - 1, 0)
+                # after-call-error is emitted with the exception that aborted the call
+                if exception is not None or (
+                    http_response is not None and http_response.status_code >= 300
+                ):
+                    metrics["errors"] += 1
+                metrics["latency_sum"] += latency
+                for index, upper_bound in enumerate(latency_buckets):
+                    if latency <= upper_bound:
+                        metrics["latency_buckets"][index] += 1
+                        break
+        except Exception as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def get_metrics(self) -> list:
+        """get_metrics returns the metrics of every operation, with the cumulative latency histogram as in Prometheus"""
+        metrics = []
+        with self.lock:
+            operations = sorted(self.operations.values(), key=lambda op: -op["calls"])
+            for operation in operations:
+                histogram = {}
+                cumulative_count = 0
+                for upper_bound, count in zip(
+                    latency_buckets, operation["latency_buckets"]
+                ):
+                    cumulative_count += count
+                    histogram[str(upper_bound)] = cumulative_count
+                histogram["+Inf"] = operation["calls"]
+                metrics.append(
+                    {
+                        **{
+                            key: value
+                            for key, value in operation.items()
+                            if key != "latency_buckets"
+                        },
+                        "latency_histogram": histogram,
+                    }
+                )
+        return metrics
+
+    def get_connections_metrics(self) -> list:
+        """get_connections_metrics returns the connection metrics of the clients of every service and region"""
+        with self.lock:
+            return sorted(
+                (dict(connection) for connection in self.connections.values()),
+                key=lambda connection: (connection["service"], connection["region"]),
+            )
+
+    def get_prometheus_metrics(self) -> str:
+        """get_prometheus_metrics returns the metrics in the Prometheus text exposition format"""
+        counters = {
+            "calls": "AWS API calls",
+            "errors": "AWS API calls that failed",
+            "retries": "Retried attempts of the AWS API calls",
+            "throttles": "Throttled attempts of the AWS API calls",
+            "received_bytes": "Bytes received from the AWS API",
+        }
+        operations = self.get_metrics()
+        lines = []
+        for counter, description in counters.items():
+            metric_name = f"prowler_aws_api_{counter}_total"
+            lines.append(f"# HELP {metric_name} {description}")
+            lines.append(f"# TYPE {metric_name} counter")
+            for operation in operations:
+                lines.append(
+                    f"{metric_name}{{{get_prometheus_labels(operation)}}} {operation[counter]}"
+                )
+        metric_name = "prowler_aws_api_call_duration_seconds"
+        lines.append(f"# HELP {metric_name} Latency of the AWS API calls")
+        lines.append(f"# TYPE {metric_name} histogram")
+        for operation in operations:
+            labels = get_prometheus_labels(operation)
+            for upper_bound, count in operation["latency_histogram"].items():
+                lines.append(
+                    f'{metric_name}_bucket{{{labels},le="{upper_bound}"}} {count}'
+                )
+            lines.append(f"{metric_name}_sum{{{labels}}} {operation['latency_sum']}")
+            lines.append(f"{metric_name}_count{{{labels}}} {operation['calls']}")
+        connection_counters = {
+            "connection_requests": "Connections taken from the pools of the AWS API clients",
+            "pool_wait_seconds": "Seconds waited for a connection of the pools of the AWS API clients",
+            "connections_opened": "Connections opened by the AWS API clients",
+            "connection_setup_seconds": "Seconds spent in the TCP and TLS handshakes of the connections opened",
+            "connections_discarded": "Connections closed because the pool of the AWS API client was full",
+        }
+        connections = self.get_connections_metrics()
+        for counter, description in connection_counters.items():
+            metric_name = f"prowler_aws_api_{counter}_total"
+            lines.append(f"# HELP {metric_name} {description}")
+            lines.append(f"# TYPE {metric_name} counter")
+            for connection in connections:
+                lines.append(
+                    f'{metric_name}{{service="{connection["service"]}",region="{connection["region"]}"}} {connection[counter]}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def write(self, output_directory: str, output_filename: str) -> list:
+        """write stores the metrics in JSON and Prometheus text format and returns the paths of the files"""
+        json_file_path = f"{output_directory}/{output_filename}_api_metrics.json"
+        connections_file_path = (
+            f"{output_directory}/{output_filename}_api_connections.json"
+        )
+        prometheus_file_path = f"{output_directory}/{output_filename}_api_metrics.prom"
+        with open(json_file_path, "w") as json_file:
+            json.dump(self.get_metrics(), json_file, indent=4)
+        with open(connections_file_path, "w") as connections_file:
+            json.dump(self.get_connections_metrics(), connections_file, indent=4)
+        with open(prometheus_file_path, "w") as prometheus_file:
+            prometheus_file.write(self.get_prometheus_metrics())
+        return [json_file_path, connections_file_path, prometheus_file_path]
+
+
+def get_prometheus_labels(operation: dict) -> str:
+    return f'service="{operation["service"]}",region="{operation["region"]}",operation="{operation["operation"]}"'
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from boto3 import session
-from botocore.config import Config
+# Boto3 is only imported when the AWS provider is used
+if TYPE_CHECKING:
+    from boto3 import session
+    from botocore.config import Config
 
 
 @dataclass
@@ -20,6 +22,8 @@ class AWS_Assume_Role:
     session_duration: int
     external_id: str
     mfa_enabled: bool
+    # Reuse the credentials of the role cached by previous executions
+    credentials_cache: bool = False
 
 
 @dataclass
@@ -33,10 +37,10 @@ class AWS_Organizations_Info:
 
 @dataclass
 class AWS_Audit_Info:
-    original_session: session.Session
-    audit_session: session.Session
+    original_session: "session.Session"
+    audit_session: "session.Session"
     # https://boto3.amazonaws.com/v1/documentation/api/latest/guide/retries.html
-    session_config: Config
+    session_config: "Config"
     audited_account: int
     audited_account_arn: str
     audited_identity_arn: str
@@ -51,3 +55,7 @@ class AWS_Audit_Info:
     audit_resources: list
     organizations_metadata: AWS_Organizations_Info
     audit_metadata: Optional[Any] = None
+    # Regions enabled in the account, None if every region is scanned
+    enabled_regions: Optional[set] = None
+    # Reuse the IAM credential report cached by a previous execution while it is valid
+    credential_report_cache: bool = False
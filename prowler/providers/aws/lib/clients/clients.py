@@ -0,0 +1,35 @@
+import threading
+import weakref
+
+# Boto3 sessions are not thread safe, so the clients creation must be serialised
+# since the services can be built concurrently
+client_creation_lock = threading.Lock()
+
+# Clients created from every session, per (service, region, config)
+clients_registry = weakref.WeakKeyDictionary()
+
+
+def get_client(audit_session, service: str, region_name: str = None, config=None):
+    """
+    get_client returns the client of the service in the region created from the session. Creating a client
+    loads the service model and builds its endpoint resolver, so it is only created once per
+    (service, region, config) and shared by all the services and integrations using the session.
+    """
+    with client_creation_lock:
+        session_clients = clients_registry.setdefault(audit_session, {})
+        client_key = (service, region_name, config)
+        if client_key not in session_clients:
+            session_clients[client_key] = audit_session.client(
+                service, region_name=region_name, config=config
+            )
+        return session_clients[client_key]
+
+
+def remove_session_clients(audit_session):
+    """
+    remove_session_clients forgets the clients created from the session, so the next get_client creates them again.
+    The clients copy the session events when they are created, so the handlers registered afterwards, e.g. by the
+    rate limiter, are only called by the clients created from then on.
+    """
+    with client_creation_lock:
+        clients_registry.pop(audit_session, None)
@@ -5,6 +5,7 @@ from colorama import Fore, Style
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.regions.regions import get_partition_regions
 
 AWS_STS_GLOBAL_ENDPOINT_REGION = "us-east-1"
 
@@ -55,5 +56,15 @@ Caller Identity ARN: {Fore.YELLOW}[{audit_info.audited_identity_arn}]{Style.RESE
     # If -A is set, print Assumed Role ARN
     if audit_info.assumed_role_info.role_arn is not None:
         report += f"""Assumed Role ARN: {Fore.YELLOW}[{audit_info.assumed_role_info.role_arn}]{Style.RESET_ALL}
+"""
+    # Print the opt-in regions not enabled in the account, which are not scanned
+    if audit_info.enabled_regions:
+        skipped_regions = [
+            region
+            for region in get_partition_regions(audit_info.audited_partition)
+            if region not in audit_info.enabled_regions
+        ]
+        if skipped_regions:
+            report += f"""AWS Skipped Regions (not enabled): {Fore.YELLOW}[{", ".join(skipped_regions)}]{Style.RESET_ALL}
 """
     print(report)
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from prowler.config.config import default_cache_directory
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import create_private_directory, open_private_file
+from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role
+
+# Seconds the cached credentials must still be valid to be reused. It is the time before the expiration in which
+# botocore refreshes the credentials, so the reused credentials are not refreshed right away.
+credentials_cache_expiration_margin = 15 * 60
+
+
+def get_credentials_cache_path(assumed_role_info: AWS_Assume_Role) -> str:
+    """get_credentials_cache_path returns the path of the cached credentials of the role, external ID and session duration"""
+    cache_key = hashlib.sha256(
+        json.dumps(
+            [
+                assumed_role_info.role_arn,
+                assumed_role_info.external_id,
+                assumed_role_info.session_duration,
+            ]
+        ).encode()
+    ).hexdigest()
+    return os.path.join(default_cache_directory, "assumed_roles", f"{cache_key}.json")
+
+
+def is_credentials_cache_enabled(assumed_role_info: AWS_Assume_Role) -> bool:
+    """is_credentials_cache_enabled returns if the credentials of the role can be cached"""
+    # The credentials of the roles requiring MFA are never stored
+    return bool(
+        assumed_role_info.credentials_cache and not assumed_role_info.mfa_enabled
+    )
+
+
+def load_cached_credentials(assumed_role_info: AWS_Assume_Role) -> Optional[dict]:
+    """
+    load_cached_credentials returns the cached credentials of the role, in the format of the sts:AssumeRole response,
+    if the cache is enabled and they are valid for more than credentials_cache_expiration_margin seconds
+    """
+    if not is_credentials_cache_enabled(assumed_role_info):
+        return None
+    try:
+        # The credentials are ignored if another user could have written them
+        with open_private_file(get_credentials_cache_path(assumed_role_info)) as f:
+            credentials = json.load(f)
+        credentials["Expiration"] = datetime.fromisoformat(credentials["Expiration"])
+        if credentials["Expiration"] - datetime.now(timezone.utc) > timedelta(
+            seconds=credentials_cache_expiration_margin
+        ):
+            logger.info(
+                f"Reusing the cached credentials of the role {assumed_role_info.role_arn}"
+            )
+            return {"Credentials": credentials}
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.warning(
+            f"Cached credentials could not be loaded -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return None
+
+
+def store_cached_credentials(
+    assumed_role_info: AWS_Assume_Role, assumed_credentials: dict
+):
+    """store_cached_credentials stores the credentials of the role, if the cache is enabled, only readable by the current user"""
+    if not is_credentials_cache_enabled(assumed_role_info):
+        return
+    try:
+        cache_path = get_credentials_cache_path(assumed_role_info)
+        create_private_directory(os.path.dirname(cache_path))
+        credentials = {
+            "AccessKeyId": assumed_credentials["Credentials"]["AccessKeyId"],
+            "SecretAccessKey": assumed_credentials["Credentials"]["SecretAccessKey"],
+            "SessionToken": assumed_credentials["Credentials"]["SessionToken"],
+            "Expiration": assumed_credentials["Credentials"]["Expiration"].isoformat(),
+        }
+        # The temporary file is created with 0600 permissions and then replaced atomically
+        cache_file = tempfile.NamedTemporaryFile(
+            mode="w",
+            dir=os.path.dirname(cache_path),
+            prefix=".credentials.",
+            delete=False,
+        )
+        try:
+            with cache_file:
+                json.dump(credentials, cache_file)
+            os.replace(cache_file.name, cache_path)
+        except Exception:
+            os.remove(cache_file.name)
+            raise
+    except Exception as error:
+        logger.warning(
+            f"Credentials could not be cached -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
@@ -0,0 +1,170 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Callable
+
+from colorama import Fore, Style
+
+from prowler.config.config import default_organization_concurrency
+from prowler.lib.check.check import remove_service_clients_modules
+from prowler.lib.logger import logger
+from prowler.providers.aws.aws_provider import get_assumed_role_session
+from prowler.providers.aws.lib.audit_info.models import (
+    AWS_Assume_Role,
+    AWS_Audit_Info,
+    AWS_Organizations_Info,
+)
+from prowler.providers.aws.lib.organizations.organizations import (
+    list_organization_accounts,
+)
+from prowler.providers.aws.lib.regions.regions import get_enabled_regions
+
+# Fields of the audit info that change from one account to another
+account_fields = (
+    "audit_session",
+    "audited_account",
+    "audited_account_arn",
+    "assumed_role_info",
+    "organizations_metadata",
+    "enabled_regions",
+)
+
+
+def get_account_role_arn(role: str, partition: str, account_id: str) -> str:
+    """get_account_role_arn returns the ARN of the role in the account, the role can be given by its name or by its ARN in any account"""
+    # Format: "arn:aws:iam::123456789012:role/path/name"
+    role_name = role.split(":role/")[-1]
+    return f"arn:{partition}:iam::{account_id}:role/{role_name}"
+
+
+class Organization_Scan:
+    """
+    Organization_Scan scans the accounts of an AWS Organization in a single Prowler process, assuming the same role
+    in every account, so the checks metadata, the allowlist and the outputs are loaded once and shared by all of them.
+
+    The roles of the next accounts are assumed and their enabled regions retrieved concurrently, with at most
+    concurrency accounts prepared ahead of the one being scanned. The accounts are scanned one after the other,
+    since the service clients are built once per account from the audit info, and every account makes its API
+    calls concurrently in the shared worker pool.
+    """
+
+    def __init__(
+        self,
+        audit_info: AWS_Audit_Info,
+        targets: list,
+        role: str,
+        session_duration: int,
+        external_id: str,
+        concurrency: int = default_organization_concurrency,
+        register_session: Callable = None,
+    ):
+        self.audit_info = audit_info
+        self.role = role
+        self.session_duration = session_duration
+        self.external_id = external_id
+        self.concurrency = concurrency
+        # Called with the session of every account before any client is created from it
+        self.register_session = register_session
+        self.failed_accounts = {}
+        # The accounts are listed with the original credentials, e.g. of the management account
+        self.accounts = list_organization_accounts(
+            audit_info.original_session, targets, audit_info.session_config
+        )
+        self.original_account = {
+            field: getattr(audit_info, field) for field in account_fields
+        }
+
+    def prepare_account(self, account: dict) -> AWS_Audit_Info:
+        """prepare_account assumes the role in the account and returns its audit info"""
+        assumed_role_info = AWS_Assume_Role(
+            role_arn=get_account_role_arn(
+                self.role, self.audit_info.audited_partition, account["Id"]
+            ),
+            session_duration=self.session_duration,
+            external_id=self.external_id,
+            mfa_enabled=False,
+            credentials_cache=self.audit_info.assumed_role_info.credentials_cache,
+        )
+        account_session = get_assumed_role_session(
+            self.audit_info.original_session,
+            assumed_role_info,
+            self.audit_info.profile_region,
+        )
+        if self.register_session:
+            self.register_session(account_session)
+        account_audit_info = replace(
+            self.audit_info,
+            audit_session=account_session,
+            audited_account=account["Id"],
+            audited_account_arn=f"arn:{self.audit_info.audited_partition}:iam::{account['Id']}:root",
+            assumed_role_info=assumed_role_info,
+            organizations_metadata=AWS_Organizations_Info(
+                account_details_email=account["Email"],
+                account_details_name=account["Name"],
+                account_details_arn=account["Arn"],
+                # Format: "arn:aws:organizations::123456789012:account/o-abcdefghij/123456789012"
+                account_details_org=account["Arn"].split("/")[1],
+                account_details_tags="",
+            ),
+            enabled_regions=None,
+            audit_metadata=None,
+        )
+        # The opt-in regions not enabled in the account are not scanned
+        if not account_audit_info.audited_regions:
+            account_audit_info.enabled_regions = get_enabled_regions(account_audit_info)
+        return account_audit_info
+
+    def set_account(self, account_audit_info: AWS_Audit_Info):
+        """set_account sets the account in the audit info shared by the service clients and the outputs"""
+        for field in account_fields:
+            setattr(self.audit_info, field, getattr(account_audit_info, field))
+        # The service clients are built again from the audit info of the account
+        remove_service_clients_modules("aws")
+
+    def scan(self, scan_account: Callable, print_progress: bool = True) -> list:
+        """
+        scan calls scan_account with the audit info of every account set and returns all the findings. If an
+        account cannot be prepared, e.g. the role cannot be assumed, it is logged and the scan continues.
+        """
+        findings = []
+        accounts = iter(self.accounts)
+        prepared_accounts = deque()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+
+            def prepare_next_account():
+                account = next(accounts, None)
+                if account:
+                    prepared_accounts.append(
+                        (account, executor.submit(self.prepare_account, account))
+                    )
+
+            for _ in range(self.concurrency):
+                prepare_next_account()
+            account_number = 0
+            while prepared_accounts:
+                account, prepared_account = prepared_accounts.popleft()
+                prepare_next_account()
+                account_number += 1
+                try:
+                    account_audit_info = prepared_account.result()
+                except Exception as error:
+                    logger.error(
+                        f"{account['Id']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+                    self.failed_accounts[account["Id"]] = str(error)
+                    continue
+                if print_progress:
+                    print(
+                        f"{Style.BRIGHT}Scanning account {Fore.YELLOW}{account['Id']}{Style.RESET_ALL}{Style.BRIGHT} ({account['Name']}), {account_number} of {len(self.accounts)}{Style.RESET_ALL}\n"
+                    )
+                self.set_account(account_audit_info)
+                findings.extend(scan_account())
+
+        # The outputs and the summary are completed with the original account
+        for field, value in self.original_account.items():
+            setattr(self.audit_info, field, value)
+        if self.failed_accounts and print_progress:
+            print(
+                f"{Fore.RED}The following accounts could not be scanned, please use --log-level ERROR: {', '.join(self.failed_accounts)}{Style.RESET_ALL}\n"
+            )
+        return findings
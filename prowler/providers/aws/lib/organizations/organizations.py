@@ -1,9 +1,11 @@
 import sys
 
-from boto3 import client
+from boto3 import client, session
+from botocore.config import Config
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.lib.audit_info.models import AWS_Organizations_Info
+from prowler.providers.aws.lib.clients.clients import get_client
 
 
 def get_organizations_metadata(
@@ -38,3 +40,46 @@ def get_organizations_metadata(
             account_details_tags=account_details_tags,
         )
         return organizations_info
+
+
+def list_organization_accounts(
+    audit_session: session.Session, targets: list, session_config: Config = None
+) -> list:
+    """
+    list_organization_accounts returns the active accounts of the organization, as returned by ListAccounts, in
+    the given targets: "all" for every account, the ID of the root (r-) or of an organizational unit (ou-) for the
+    accounts in it or in any of its nested organizational units, or an account ID.
+    """
+    organizations_client = get_client(
+        audit_session, "organizations", config=session_config
+    )
+    accounts = {}
+    if "all" in targets:
+        for page in organizations_client.get_paginator("list_accounts").paginate():
+            for account in page["Accounts"]:
+                accounts[account["Id"]] = account
+    else:
+        parents = [target for target in targets if target.startswith(("r-", "ou-"))]
+        while parents:
+            parent = parents.pop()
+            for page in organizations_client.get_paginator(
+                "list_accounts_for_parent"
+            ).paginate(ParentId=parent):
+                for account in page["Accounts"]:
+                    accounts[account["Id"]] = account
+            for page in organizations_client.get_paginator(
+                "list_organizational_units_for_parent"
+            ).paginate(ParentId=parent):
+                parents.extend(
+                    organizational_unit["Id"]
+                    for organizational_unit in page["OrganizationalUnits"]
+                )
+        for target in targets:
+            if target not in accounts and not target.startswith(("r-", "ou-")):
+                accounts[target] = organizations_client.describe_account(
+                    AccountId=target
+                )["Account"]
+    return sorted(
+        (account for account in accounts.values() if account["Status"] == "ACTIVE"),
+        key=lambda account: account["Id"],
+    )
@@ -0,0 +1,201 @@
+import json
+import re
+from functools import lru_cache
+from typing import Iterable, Optional
+
+# Number of compiled policy documents kept in memory, shared by all the checks
+compiled_policies_cache_size = 4096
+
+# Action names never contain these characters, so they are only matched by wildcards
+wildcard_samples = ("\x00", "\x00\x00")
+
+
+def compile_patterns(patterns: list) -> Optional[re.Pattern]:
+    """compile_patterns returns one regular expression matching any of the action patterns, with the * and ? wildcards"""
+    if not patterns:
+        return None
+    expressions = [
+        "".join(
+            ".*" if char == "*" else "." if char == "?" else re.escape(char)
+            for char in pattern
+        )
+        for pattern in patterns
+    ]
+    # The actions are case insensitive
+    return re.compile(f"(?:{'|'.join(expressions)})", re.IGNORECASE | re.DOTALL)
+
+
+def covers_prefix(patterns: Optional[re.Pattern], prefix: str) -> bool:
+    """covers_prefix returns if the patterns match every action starting with prefix, e.g. "*" and "kms:*" for "kms:" """
+    return bool(patterns) and all(
+        patterns.fullmatch(prefix + sample) for sample in wildcard_samples
+    )
+
+
+def intersects_prefix(patterns: list, prefix: str) -> bool:
+    """intersects_prefix returns if any of the action patterns can match an action starting with prefix"""
+    for pattern in patterns:
+        for position, char in enumerate(pattern):
+            # The rest of the action is matched by the wildcard, or it is any action after the prefix
+            if char == "*" or position >= len(prefix):
+                return True
+            if char != "?" and char.lower() != prefix[position].lower():
+                break
+    return False
+
+
+def is_public_principal(principal) -> bool:
+    """is_public_principal returns if the principal of the statement is anyone, e.g. "*" or {"AWS": ["*"]}"""
+    if principal == "*":
+        return True
+    if isinstance(principal, dict):
+        for principal_type in ("AWS", "CanonicalUser"):
+            principals = principal.get(principal_type, [])
+            if isinstance(principals, str):
+                principals = [principals]
+            if "*" in principals:
+                return True
+    return False
+
+
+class Policy_Statement:
+    """Policy_Statement is a statement of a policy document with its actions and resources compiled once"""
+
+    def __init__(self, statement: dict):
+        self.effect = statement.get("Effect")
+        self.action_patterns = self.__patterns__(statement.get("Action"))
+        self.not_action_patterns = self.__patterns__(statement.get("NotAction"))
+        self.actions = compile_patterns(self.action_patterns)
+        self.not_actions = compile_patterns(self.not_action_patterns)
+        # The statement applies to every resource only with "Resource": "*"
+        self.all_resources = "Resource" in statement and any(
+            pattern and set(pattern) == {"*"}
+            for pattern in self.__patterns__(statement.get("Resource"))
+        )
+        self.conditional = bool(statement.get("Condition"))
+        self.principal = statement.get("Principal")
+        self.public = is_public_principal(self.principal)
+
+    @staticmethod
+    def __patterns__(patterns) -> list:
+        if patterns is None:
+            return []
+        if isinstance(patterns, str):
+            return [patterns]
+        return [str(pattern) for pattern in patterns]
+
+    def matches_action(self, action: str) -> bool:
+        """matches_action returns if the statement applies to the action, through its Action or its NotAction"""
+        if self.actions:
+            return bool(self.actions.fullmatch(action))
+        if self.not_actions:
+            return not self.not_actions.fullmatch(action)
+        return False
+
+    def covers_actions(self, prefix: str) -> bool:
+        """covers_actions returns if the statement applies to every action starting with prefix"""
+        if self.actions:
+            return covers_prefix(self.actions, prefix)
+        if self.not_actions:
+            return not intersects_prefix(self.not_action_patterns, prefix)
+        return False
+
+
+class Compiled_Policy:
+    """
+    Compiled_Policy answers the queries of the checks about a policy document, whose statements are normalized and
+    compiled once, see compile_policy. The results of the queries are memoized.
+
+    An action is allowed if an Allow statement applies to it and no Deny statement without conditions applies to
+    it in every resource. Queried actions can end with a wildcard, e.g. "kms:*" or "*", and are allowed if an Allow
+    statement applies to every action they match, unless a Deny statement also does: denying some of them, e.g.
+    "kms:ScheduleKeyDeletion", still leaves the wildcard allowed. With all_resources, only the Allow statements
+    with "Resource": "*" count.
+    """
+
+    def __init__(self, document: Optional[dict]):
+        statements = (document or {}).get("Statement", [])
+        if isinstance(statements, dict):
+            statements = [statements]
+        self.statements = [
+            Policy_Statement(statement)
+            for statement in statements
+            if isinstance(statement, dict)
+        ]
+        self.allow_statements = [
+            statement for statement in self.statements if statement.effect == "Allow"
+        ]
+        # Deny statements with conditions or only for some resources do not deny the action everywhere
+        self.deny_statements = [
+            statement
+            for statement in self.statements
+            if statement.effect == "Deny"
+            and statement.all_resources
+            and not statement.conditional
+        ]
+        self.queries = {}
+
+    def is_action_allowed(self, action: str, all_resources: bool = False) -> bool:
+        """is_action_allowed returns if the policy allows the action, or every action matched by it if it ends with *"""
+        query = (action, all_resources)
+        if query not in self.queries:
+            allow_statements = [
+                statement
+                for statement in self.allow_statements
+                if statement.all_resources or not all_resources
+            ]
+            if action.endswith("*"):
+                prefix = action.rstrip("*")
+                self.queries[query] = any(
+                    statement.covers_actions(prefix) for statement in allow_statements
+                ) and not any(
+                    statement.covers_actions(prefix)
+                    for statement in self.deny_statements
+                )
+            else:
+                self.queries[query] = any(
+                    statement.matches_action(action) for statement in allow_statements
+                ) and not any(
+                    statement.matches_action(action)
+                    for statement in self.deny_statements
+                )
+        return self.queries[query]
+
+    def get_allowed_actions(
+        self, actions: Iterable[str], all_resources: bool = False
+    ) -> set:
+        """get_allowed_actions returns the actions allowed by the policy among the given ones"""
+        return {
+            action
+            for action in actions
+            if self.is_action_allowed(action, all_resources)
+        }
+
+    def is_public(
+        self, actions: Iterable[str] = None, include_conditional: bool = True
+    ) -> bool:
+        """
+        is_public returns if the resource-based policy allows anyone, i.e. "Principal": "*", any action or any of the
+        given ones. Without include_conditional, the statements with conditions are not considered public
+        """
+        for statement in self.allow_statements:
+            if statement.public and (include_conditional or not statement.conditional):
+                if actions is None or any(
+                    statement.matches_action(action) for action in actions
+                ):
+                    return True
+        return False
+
+
+@lru_cache(maxsize=compiled_policies_cache_size)
+def compile_policy_document(document: str) -> Compiled_Policy:
+    """compile_policy_document returns the compiled policy of the JSON document"""
+    return Compiled_Policy(json.loads(document))
+
+
+def compile_policy(document: Optional[dict]) -> Compiled_Policy:
+    """
+    compile_policy returns the compiled policy document, memoized by its content, so the policy is compiled once
+    and shared by all the checks evaluating it, e.g. the same AWS managed policy attached in several accounts
+    """
+    return compile_policy_document(json.dumps(document, sort_keys=True, default=str))
@@ -17,6 +17,7 @@ from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import send_to_s3_bucket
 from prowler.providers.aws.lib.arn.models import get_arn_resource_type
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.clients.clients import get_client
 
 
 def quick_inventory(audit_info: AWS_Audit_Info, args):
@@ -27,8 +28,11 @@ def quick_inventory(audit_info: AWS_Audit_Info, args):
     # If not inputed regions, check all of them
     if not audit_info.audited_regions:
         # EC2 client for describing all regions
-        ec2_client = audit_info.audit_session.client(
-            "ec2", region_name=audit_info.profile_region
+        ec2_client = get_client(
+            audit_info.audit_session,
+            "ec2",
+            audit_info.profile_region,
+            audit_info.session_config,
         )
         # Get all the available regions
         audit_info.audited_regions = [
@@ -59,8 +63,11 @@ def quick_inventory(audit_info: AWS_Audit_Info, args):
                 # Get regional S3 buckets since none-tagged buckets are not supported by the resourcegroupstaggingapi
                 resources_in_region.extend(get_regional_buckets(audit_info, region))
 
-                client = audit_info.audit_session.client(
-                    "resourcegroupstaggingapi", region_name=region
+                client = get_client(
+                    audit_info.audit_session,
+                    "resourcegroupstaggingapi",
+                    region,
+                    audit_info.session_config,
                 )
                 # Get all the resources
                 resources_count = 0
@@ -295,12 +302,15 @@ def create_output(resources: list, audit_info: AWS_Audit_Info, args):
                 mode,
                 output_bucket,
                 bucket_session,
+                audit_info.session_config,
             )
 
 
 def get_regional_buckets(audit_info: AWS_Audit_Info, region: str) -> list:
     regional_buckets = []
-    s3_client = audit_info.audit_session.client("s3", region_name=region)
+    s3_client = get_client(
+        audit_info.audit_session, "s3", region, audit_info.session_config
+    )
     try:
         buckets = s3_client.list_buckets()
         for bucket in buckets["Buckets"]:
@@ -335,7 +345,7 @@ def get_regional_buckets(audit_info: AWS_Audit_Info, region: str) -> list:
 
 def get_iam_resources(session) -> list:
     iam_resources = []
-    iam_client = session.client("iam")
+    iam_client = get_client(session, "iam")
     try:
         get_roles_paginator = iam_client.get_paginator("list_roles")
         for page in get_roles_paginator.paginate():
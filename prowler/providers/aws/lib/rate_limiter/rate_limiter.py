@@ -0,0 +1,183 @@
+import re
+import threading
+from fnmatch import fnmatchcase
+from time import monotonic, sleep
+from typing import Optional
+
+from boto3 import session
+
+from prowler.lib.logger import logger
+from prowler.providers.aws.lib.api_metrics.api_metrics import (
+    get_operation,
+    throttling_error_codes,
+)
+from prowler.providers.aws.lib.clients.clients import remove_session_clients
+
+# Lowest rate, in requests per second, a throttled operation family is slowed down to
+minimum_rate = 0.5
+# Seconds a throttled operation family takes to recover its quota if it is not throttled again
+recovery_seconds = 30
+# Seconds after a throttle in which the next throttles are considered part of the same one
+throttle_cooldown_seconds = 1
+
+# Key stored in the botocore request context
+region_context_key = "prowler_rate_limiter_region"
+
+
+class Token_Bucket:
+    """
+    Token_Bucket paces the requests of an operation family to rate requests per second, with a burst of
+    one second of requests. Every throttle halves the rate, which then grows back linearly up to the quota.
+
+    The families without a known quota are not paced until they are throttled, then their quota is the
+    rate of requests observed when they were throttled.
+    """
+
+    def __init__(self, quota: Optional[float] = None):
+        self.lock = threading.Lock()
+        self.quota = quota
+        self.rate = quota
+        self.tokens = max(quota, 1) if quota else 0
+        self.last_refill = monotonic()
+        self.last_throttle = None
+        # Requests of the current second, to learn the quota of the unknown families
+        self.window_start = self.last_refill
+        self.window_requests = 0
+        self.observed_rate = 0
+
+    def __refill__(self, now: float):
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        if self.rate:
+            self.rate = min(
+                self.quota, self.rate + elapsed * self.quota / recovery_seconds
+            )
+            self.tokens = min(self.tokens + elapsed * self.rate, max(self.rate, 1))
+        if now - self.window_start >= 1:
+            self.observed_rate = self.window_requests / (now - self.window_start)
+            self.window_start = now
+            self.window_requests = 0
+
+    def acquire(self) -> float:
+        """acquire takes a token, waiting until there is one, and returns the seconds waited"""
+        with self.lock:
+            now = monotonic()
+            self.__refill__(now)
+            self.window_requests += 1
+            if not self.rate:
+                return 0
+            # The token is reserved, so the waiting requests are sent in order
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            sleep(wait)
+        return wait
+
+    def throttled(self) -> bool:
+        """throttled halves the rate, once per throttle_cooldown_seconds, and returns if it was halved"""
+        with self.lock:
+            now = monotonic()
+            self.__refill__(now)
+            if (
+                self.last_throttle is not None
+                and now - self.last_throttle < throttle_cooldown_seconds
+            ):
+                return False
+            self.last_throttle = now
+            if not self.quota:
+                # The family was sent at least as fast as the requests of the last second
+                elapsed = now - self.window_start
+                self.quota = max(
+                    self.observed_rate,
+                    self.window_requests / elapsed if elapsed else 0,
+                    minimum_rate,
+                )
+                self.rate = self.quota
+            self.rate = max(self.rate / 2, minimum_rate)
+            # The requests already waiting are delayed as well
+            self.tokens = min(self.tokens, 0)
+            return True
+
+
+class Rate_Limiter:
+    """
+    Rate_Limiter paces the AWS API calls made by the clients of the sessions where it is registered with a
+    token bucket per service, region and operation family, including the retried attempts, and slows down
+    the families throttled by AWS.
+
+    The families are the operations matching the same pattern of the known quotas, e.g. {"s3:GetBucket*": 50},
+    otherwise the operations starting with the same verb, e.g. ec2 Describe.
+    """
+
+    def __init__(self, quotas: dict = None):
+        self.lock = threading.Lock()
+        self.quotas = quotas or {}
+        self.families = {}
+        self.buckets = {}
+
+    def register(self, audit_session: session.Session):
+        """register adds the handlers to the session events, so they are inherited by the clients created from then on"""
+        audit_session.events.register("before-call", self.before_call)
+        # Emitted for every attempt, before the request is signed
+        audit_session.events.register("request-created", self.request_created)
+        audit_session.events.register("response-received", self.response_received)
+        # The clients already created, e.g. to set up the audit info, are created again with the handlers
+        remove_session_clients(audit_session)
+
+    def get_operation_family(self, service: str, operation: str) -> tuple:
+        """get_operation_family returns the family of the operation and its quota, if it is known"""
+        family = self.families.get((service, operation))
+        if family is None:
+            family = (re.match("[A-Z][a-z]*", operation) or [operation])[0], None
+            for pattern, quota in self.quotas.items():
+                if fnmatchcase(f"{service}:{operation}", pattern):
+                    family = pattern, quota
+                    break
+            self.families[(service, operation)] = family
+        return family
+
+    def get_bucket(self, service: str, region: str, operation: str) -> Token_Bucket:
+        with self.lock:
+            family, quota = self.get_operation_family(service, operation)
+            bucket = self.buckets.get((service, region, family))
+            if bucket is None:
+                bucket = self.buckets[(service, region, family)] = Token_Bucket(quota)
+            return bucket
+
+    def before_call(self, request_signer=None, context=None, **_):
+        # The handlers must return None to not replace the response
+        if context is not None:
+            context[region_context_key] = (
+                getattr(request_signer, "region_name", None) or "global"
+            )
+
+    def request_created(self, event_name, request=None, **_):
+        try:
+            context = getattr(request, "context", None)
+            # The presigned URLs are not sent
+            if not context or region_context_key not in context:
+                return
+            service, operation = get_operation(event_name)
+            self.get_bucket(service, context[region_context_key], operation).acquire()
+        except Exception as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def response_received(self, event_name, parsed_response=None, context=None, **_):
+        try:
+            if context is None or region_context_key not in context:
+                return
+            error_code = (parsed_response or {}).get("Error", {}).get("Code")
+            if error_code in throttling_error_codes:
+                service, operation = get_operation(event_name)
+                region = context[region_context_key]
+                bucket = self.get_bucket(service, region, operation)
+                if bucket.throttled():
+                    logger.info(
+                        f"{region} -- {service} {operation} throttled, slowing down to {bucket.rate:.2f} requests per second"
+                    )
+        except Exception as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
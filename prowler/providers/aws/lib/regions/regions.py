@@ -0,0 +1,141 @@
+import json
+import os
+import pathlib
+import tempfile
+from functools import lru_cache
+from time import time
+from typing import Optional
+
+from prowler.config.config import aws_services_json_file, default_cache_directory
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import (
+    create_private_directory,
+    open_file,
+    open_private_file,
+    parse_json_file,
+)
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.clients.clients import get_client
+
+# The AWS services-regions matrix is in the AWS provider directory
+aws_provider_directory = pathlib.Path(
+    os.path.dirname(os.path.realpath(__file__))
+).parent.parent
+
+# Seconds the enabled regions of an account are cached, since opting in a region is rare
+enabled_regions_cache_ttl = 24 * 60 * 60
+
+
+@lru_cache(maxsize=None)
+def load_aws_regions_matrix() -> dict:
+    """load_aws_regions_matrix returns the regions of every AWS service per partition, the file is only read once"""
+    with open_file(f"{aws_provider_directory}/{aws_services_json_file}") as f:
+        return parse_json_file(f)
+
+
+def get_aws_available_regions():
+    try:
+        data = load_aws_regions_matrix()
+
+        regions = set()
+        for service in data["services"].values():
+            for partition in service["regions"]:
+                for item in service["regions"][partition]:
+                    regions.add(item)
+        return list(regions)
+    except Exception as error:
+        logger.error(f"{error.__class__.__name__}: {error}")
+        return []
+
+
+def get_service_regions(service: str, partition: str) -> list:
+    """get_service_regions returns the regions of the AWS service in the partition"""
+    return list(load_aws_regions_matrix()["services"][service]["regions"][partition])
+
+
+def get_partition_regions(partition: str) -> list:
+    """get_partition_regions returns the regions of any AWS service in the partition"""
+    regions = set()
+    for service in load_aws_regions_matrix()["services"].values():
+        regions.update(service["regions"].get(partition, []))
+    return sorted(regions)
+
+
+def get_enabled_regions_cache_path(audited_account: str) -> str:
+    """get_enabled_regions_cache_path returns the path of the cached enabled regions of the account"""
+    return os.path.join(
+        default_cache_directory, f"enabled_regions_{audited_account}.json"
+    )
+
+
+def write_enabled_regions_cache(audited_account: str, enabled_regions: set):
+    """write_enabled_regions_cache stores the enabled regions of the account, only readable by the current user"""
+    cache_path = get_enabled_regions_cache_path(audited_account)
+    create_private_directory(os.path.dirname(cache_path))
+    # The temporary file is created with 0600 permissions and then replaced atomically
+    cache_file = tempfile.NamedTemporaryFile(
+        mode="w",
+        dir=os.path.dirname(cache_path),
+        prefix=f".enabled_regions_{audited_account}.",
+        delete=False,
+    )
+    try:
+        with cache_file:
+            json.dump(
+                {"timestamp": time(), "regions": sorted(enabled_regions)}, cache_file
+            )
+        os.replace(cache_file.name, cache_path)
+    except Exception:
+        os.remove(cache_file.name)
+        raise
+
+
+def get_enabled_regions(audit_info: AWS_Audit_Info) -> Optional[set]:
+    """
+    get_enabled_regions returns the regions enabled in the audited account, so the opt-in regions which are not
+    enabled are not scanned. They are retrieved with ec2:DescribeRegions and cached in the Prowler cache directory
+    for enabled_regions_cache_ttl seconds. If they cannot be retrieved it returns None and every region is scanned.
+    """
+    try:
+        # The regions are ignored if another user could have written them, since they would not be scanned
+        with open_private_file(
+            get_enabled_regions_cache_path(audit_info.audited_account)
+        ) as f:
+            cache = json.load(f)
+        if time() - cache["timestamp"] < enabled_regions_cache_ttl:
+            logger.debug(
+                f"Enabled regions of the account {audit_info.audited_account} loaded from cache"
+            )
+            return set(cache["regions"])
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.warning(
+            f"Enabled regions cache could not be loaded -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    try:
+        ec2_client = get_client(
+            audit_info.audit_session,
+            "ec2",
+            audit_info.profile_region,
+            audit_info.session_config,
+        )
+        # Only the enabled regions and the ones which do not require opt-in are returned
+        enabled_regions = {
+            region["RegionName"]
+            for region in ec2_client.describe_regions(AllRegions=False)["Regions"]
+        }
+    except Exception as error:
+        logger.warning(
+            f"Enabled regions could not be retrieved, scanning all the regions -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+
+    try:
+        write_enabled_regions_cache(audit_info.audited_account, enabled_regions)
+    except Exception as error:
+        logger.warning(
+            f"Enabled regions could not be stored -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return enabled_regions
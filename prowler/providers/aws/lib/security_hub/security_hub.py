@@ -12,6 +12,7 @@ from prowler.config.config import (
 from prowler.lib.logger import logger
 from prowler.lib.outputs.models import Check_Output_JSON_ASFF
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.clients.clients import get_client
 
 
 def send_to_security_hub(
@@ -30,7 +31,7 @@ def send_to_security_hub(
         if not is_quiet or (is_quiet and finding_status == "FAIL"):
             logger.info("Sending findings to Security Hub.")
             # Check if security hub is enabled in current region
-            security_hub_client = session.client("securityhub", region_name=region)
+            security_hub_client = get_client(session, "securityhub", region)
             security_hub_client.describe_hub()
 
             # Check if Prowler integration is enabled in Security Hub
@@ -81,8 +82,8 @@ def resolve_security_hub_previous_findings(
         region = product_arn.split(":")[3]
         try:
             # Check if security hub is enabled in current region
-            security_hub_client = audit_info.audit_session.client(
-                "securityhub", region_name=region
+            security_hub_client = get_client(
+                audit_info.audit_session, "securityhub", region
             )
             security_hub_client.describe_hub()
             # Get current findings IDs
@@ -90,9 +91,6 @@ def resolve_security_hub_previous_findings(
             for finding in current_findings:
                 current_findings_ids.append(finding["Id"])
             # Get findings of that region
-            security_hub_client = audit_info.audit_session.client(
-                "securityhub", region_name=region
-            )
             findings_filter = {
                 "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
                 "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
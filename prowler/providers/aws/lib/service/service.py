@@ -0,0 +1,136 @@
+import threading
+from functools import update_wrapper
+
+from prowler.lib.worker_pool.worker_pool import worker_pool
+
+
+def get_collecting_attributes(service) -> frozenset:
+    """
+    get_collecting_attributes returns the names of the lazy attributes of the service the current thread is
+    retrieving, itself or running the calls of their __threading_call__
+    """
+    return service.__dict__.get("__collecting_threads__", {}).get(
+        threading.get_ident(), frozenset()
+    )
+
+
+def is_collecting(service) -> bool:
+    """is_collecting returns True if the current thread is retrieving any lazy attribute of the service"""
+    return bool(get_collecting_attributes(service))
+
+
+def set_collecting_attributes(service, collecting_attributes: frozenset) -> frozenset:
+    """set_collecting_attributes sets the lazy attributes the current thread is retrieving and returns the previous ones"""
+    collecting_threads = service.__dict__.setdefault("__collecting_threads__", {})
+    thread = threading.get_ident()
+    previous_attributes = collecting_threads.get(thread, frozenset())
+    if collecting_attributes:
+        collecting_threads[thread] = collecting_attributes
+    else:
+        collecting_threads.pop(thread, None)
+    return previous_attributes
+
+
+class lazy_attribute:
+    """
+    lazy_attribute decorates the service method that retrieves an attribute, so the attribute is only
+    retrieved from AWS the first time it is accessed, e.g.:
+
+        @lazy_attribute
+        def instances(self):
+            self.instances = []
+            self.__threading_call__(self.__describe_instances__)
+
+    While the attribute is being retrieved its partial value is only visible to the thread retrieving it
+    and to the threads running the calls of its __threading_call__, any other thread waits until it is complete.
+    """
+
+    def __init__(self, collector):
+        update_wrapper(self, collector)
+        self.collector = collector
+        self.name = collector.__name__
+        self.partial_name = f"__{self.name}_partial__"
+
+    def __get__(self, service, owner=None):
+        if service is None:
+            return self
+        attributes = service.__dict__
+        if self.name not in attributes:
+            collecting_attributes = get_collecting_attributes(service)
+            if self.name in collecting_attributes:
+                # The attribute is being retrieved by this thread or by the one fanning out its calls
+                return attributes[self.partial_name]
+            if collecting_attributes:
+                # It is needed to retrieve another attribute, so the threads retrieving it, already holding the
+                # service lock, wait only for this attribute while another of them retrieves it
+                lock = attributes.setdefault("__attribute_locks__", {}).setdefault(
+                    self.name, threading.RLock()
+                )
+            else:
+                lock = attributes.setdefault("__collecting_lock__", threading.RLock())
+            with lock:
+                if self.name not in attributes:
+                    self.__collect__(service)
+        return attributes[self.name]
+
+    def __set__(self, service, value):
+        if self.partial_name in service.__dict__ and self.name in (
+            get_collecting_attributes(service)
+        ):
+            service.__dict__[self.partial_name] = value
+        else:
+            service.__dict__[self.name] = value
+
+    def __collect__(self, service):
+        attributes = service.__dict__
+        attributes[self.partial_name] = None
+        previous_attributes = set_collecting_attributes(
+            service, get_collecting_attributes(service) | {self.name}
+        )
+        try:
+            self.collector(service)
+        except Exception:
+            # If it fails, the attribute will be retrieved again in the next access
+            attributes.pop(self.partial_name)
+            raise
+        else:
+            attributes[self.name] = attributes.pop(self.partial_name)
+        finally:
+            set_collecting_attributes(service, previous_attributes)
+
+
+class AWS_Service:
+    """AWS_Service contains the common logic of the AWS services"""
+
+    def __get_session__(self):
+        return self.session
+
+    def __start_collecting__(self, attributes):
+        """
+        __start_collecting__ starts in the background the retrieval of the given attributes that AWS takes long to
+        generate, before they are retrieved one by one. The services overriding it only start what is needed.
+        """
+
+    def __threading_call__(self, call, iterator=None):
+        """
+        __threading_call__ runs the call for every regional client, or for every item of the iterator, e.g. the
+        buckets, in the process-wide worker pool, waits until all of them are finished and returns their results
+        """
+        collecting_attributes = get_collecting_attributes(self)
+        return worker_pool.map(
+            lambda item: self.__collecting_call__(call, item, collecting_attributes),
+            self.regional_clients.values() if iterator is None else iterator,
+        )
+
+    def __collecting_call__(self, call, item, collecting_attributes):
+        # The threads running the calls while retrieving a lazy attribute can access its partial value
+        if not collecting_attributes:
+            return call(item)
+        # The thread fanning out the calls runs them too
+        previous_attributes = set_collecting_attributes(
+            self, get_collecting_attributes(self) | collecting_attributes
+        )
+        try:
+            return call(item)
+        finally:
+            set_collecting_attributes(self, previous_attributes)
@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime
 from typing import Optional
 
@@ -7,10 +6,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## ACM
-class ACM:
+class ACM(AWS_Service):
     def __init__(self, audit_info):
         self.service = "acm"
         self.session = audit_info.audit_session
@@ -22,18 +22,6 @@ class ACM:
         self.__describe_certificates__()
         self.__list_tags_for_certificate__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_certificates__(self, regional_client):
         logger.info("ACM - Listing Certificates...")
         try:
@@ -1,4 +1,3 @@
-import threading
 from typing import Optional
 
 from pydantic import BaseModel
@@ -6,10 +5,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## AppStream
-class AppStream:
+class AppStream(AWS_Service):
     def __init__(self, audit_info):
         self.service = "appstream"
         self.session = audit_info.audit_session
@@ -20,18 +20,6 @@ class AppStream:
         self.__threading_call__(self.__describe_fleets__)
         self.__list_tags_for_resource__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_fleets__(self, regional_client):
         logger.info("AppStream - Describing Fleets...")
         try:
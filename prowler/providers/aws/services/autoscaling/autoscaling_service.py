@@ -1,14 +1,13 @@
-import threading
-
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## AutoScaling
-class AutoScaling:
+class AutoScaling(AWS_Service):
     def __init__(self, audit_info):
         self.service = "autoscaling"
         self.session = audit_info.audit_session
@@ -20,18 +19,6 @@ class AutoScaling:
         self.groups = []
         self.__threading_call__(self.__describe_auto_scaling_groups__)
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_launch_configurations__(self, regional_client):
         logger.info("AutoScaling - Describing Launch Configurations...")
         try:
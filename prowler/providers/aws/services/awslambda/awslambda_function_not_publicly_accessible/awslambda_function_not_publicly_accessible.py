@@ -1,4 +1,5 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.providers.aws.lib.policy_engine.policy_engine import compile_policy
 from prowler.providers.aws.services.awslambda.awslambda_client import awslambda_client
 
 
@@ -15,24 +16,8 @@ class awslambda_function_not_publicly_accessible(Check):
             report.status = "PASS"
             report.status_extended = f"Lambda function {function.name} has a policy resource-based policy not public"
 
-            public_access = False
-            if function.policy:
-                for statement in function.policy["Statement"]:
-                    # Only check allow statements
-                    if statement["Effect"] == "Allow":
-                        if (
-                            "*" in statement["Principal"]
-                            or (
-                                "AWS" in statement["Principal"]
-                                and "*" in statement["Principal"]["AWS"]
-                            )
-                            or (
-                                "CanonicalUser" in statement["Principal"]
-                                and "*" in statement["Principal"]["CanonicalUser"]
-                            )
-                        ):
-                            public_access = True
-                            break
+            # Check if the resource-based policy allows anyone
+            public_access = compile_policy(function.policy).is_public()
 
             if public_access:
                 report.status = "FAIL"
@@ -1,6 +1,5 @@
 import io
 import json
-import threading
 import zipfile
 from enum import Enum
 from typing import Any, Optional
@@ -12,10 +11,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## Lambda
-class Lambda:
+class Lambda(AWS_Service):
     def __init__(self, audit_info):
         self.service = "lambda"
         self.session = audit_info.audit_session
@@ -37,18 +37,6 @@ class Lambda:
         self.__threading_call__(self.__get_policy__)
         self.__threading_call__(self.__get_function_url_config__)
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_functions__(self, regional_client):
         logger.info("Lambda - Listing Functions...")
         try:
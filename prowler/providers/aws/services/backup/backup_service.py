@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime
 from typing import Optional
 
@@ -7,10 +6,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## Backup
-class Backup:
+class Backup(AWS_Service):
     def __init__(self, audit_info):
         self.service = "backup"
         self.session = audit_info.audit_session
@@ -33,15 +33,6 @@ class Backup:
         self.backup_report_plans = []
         self.__threading_call__(self.__list_backup_report_plans__)
 
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_backup_vaults__(self, regional_client):
         logger.info("Backup - Listing Backup Vaults...")
         try:
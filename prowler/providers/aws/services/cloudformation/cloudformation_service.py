@@ -1,4 +1,3 @@
-import threading
 from typing import Optional
 
 from botocore.client import ClientError
@@ -7,10 +6,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## CloudFormation
-class CloudFormation:
+class CloudFormation(AWS_Service):
     def __init__(self, audit_info):
         self.service = "cloudformation"
         self.session = audit_info.audit_session
@@ -21,18 +21,6 @@ class CloudFormation:
         self.__threading_call__(self.__describe_stacks__)
         self.__describe_stack__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_stacks__(self, regional_client):
         """Get ALL CloudFormation Stacks"""
         logger.info("CloudFormation - Describing Stacks...")
@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime
 from typing import Optional
 
@@ -8,10 +7,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################### CLOUDTRAIL
-class Cloudtrail:
+class Cloudtrail(AWS_Service):
     def __init__(self, audit_info):
         self.service = "cloudtrail"
         self.session = audit_info.audit_session
@@ -34,18 +34,6 @@ class Cloudtrail:
         self.__get_event_selectors__()
         self.__list_tags_for_resource__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __get_trails__(self, regional_client):
         logger.info("Cloudtrail - Getting trails...")
         try:
@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -8,10 +7,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## CloudWatch
-class CloudWatch:
+class CloudWatch(AWS_Service):
     def __init__(self, audit_info):
         self.service = "cloudwatch"
         self.session = audit_info.audit_session
@@ -28,18 +28,6 @@ class CloudWatch:
         self.__threading_call__(self.__describe_alarms__)
         self.__list_tags_for_resource__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_alarms__(self, regional_client):
         logger.info("CloudWatch - Describing alarms...")
         try:
@@ -85,7 +73,7 @@ class CloudWatch:
 
 
 ################## CloudWatch Logs
-class Logs:
+class Logs(AWS_Service):
     def __init__(self, audit_info):
         self.service = "logs"
         self.session = audit_info.audit_session
@@ -107,18 +95,6 @@ class Logs:
             self.__threading_call__(self.__get_log_events__)
         self.__list_tags_for_resource__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_metric_filters__(self, regional_client):
         logger.info("CloudWatch Logs - Describing metric filters...")
         try:
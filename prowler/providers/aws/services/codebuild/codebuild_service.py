@@ -1,15 +1,15 @@
 import datetime
-import threading
 from dataclasses import dataclass
 from typing import Optional
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################### Codebuild
-class Codebuild:
+class Codebuild(AWS_Service):
     def __init__(self, audit_info):
         self.service = "codebuild"
         self.session = audit_info.audit_session
@@ -21,18 +21,6 @@ class Codebuild:
         self.__threading_call__(self.__list_projects__)
         self.__list_builds_for_project__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_projects__(self, regional_client):
         logger.info("Codebuild - listing projects")
         try:
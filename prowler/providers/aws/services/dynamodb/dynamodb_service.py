@@ -1,4 +1,3 @@
-import threading
 from typing import Optional
 
 from botocore.client import ClientError
@@ -7,10 +6,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## DynamoDB
-class DynamoDB:
+class DynamoDB(AWS_Service):
     def __init__(self, audit_info):
         self.service = "dynamodb"
         self.session = audit_info.audit_session
@@ -24,18 +24,6 @@ class DynamoDB:
         self.__describe_continuous_backups__()
         self.__list_tags_for_resource__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_tables__(self, regional_client):
         logger.info("DynamoDB - Listing tables...")
         try:
@@ -126,7 +114,7 @@ class DynamoDB:
 
 
 ################## DynamoDB DAX
-class DAX:
+class DAX(AWS_Service):
     def __init__(self, audit_info):
         self.service = "dax"
         self.session = audit_info.audit_session
@@ -137,18 +125,6 @@ class DAX:
         self.__threading_call__(self.__describe_clusters__)
         self.__list_tags_for_resource__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_clusters__(self, regional_client):
         logger.info("DynamoDB DAX - Describing clusters...")
         try:
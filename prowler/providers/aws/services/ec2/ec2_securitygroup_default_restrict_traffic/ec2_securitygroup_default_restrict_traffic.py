@@ -1,6 +1,5 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
 
 
 class ec2_securitygroup_default_restrict_traffic(Check):
@@ -16,11 +15,12 @@ class ec2_securitygroup_default_restrict_traffic(Check):
             if security_group.name == "default":
                 report.status = "PASS"
                 report.status_extended = f"Default Security Group ({security_group.id}) is not open to the Internet."
-                for ingress_rule in security_group.ingress_rules:
-                    if check_security_group(ingress_rule, "-1", any_address=True):
-                        report.status = "FAIL"
-                        report.status_extended = f"Default Security Group ({security_group.id}) is open to the Internet."
-                        break
+                # Look up the security group in the index of the ports open to the Internet
+                if ec2_client.security_groups_exposure[security_group.arn].is_exposed(
+                    "-1", any_address=True
+                ):
+                    report.status = "FAIL"
+                    report.status_extended = f"Default Security Group ({security_group.id}) is open to the Internet."
                 findings.append(report)
 
         return findings
@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime
 from typing import Optional
 
@@ -8,10 +7,14 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service, lazy_attribute
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    Security_Group_Exposure,
+)
 
 
 ################## EC2
-class EC2:
+class EC2(AWS_Service):
     def __init__(self, audit_info):
         self.service = "ec2"
         self.session = audit_info.audit_session
@@ -20,40 +23,64 @@ class EC2:
         self.audited_account_arn = audit_info.audited_account_arn
         self.audit_resources = audit_info.audit_resources
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+
+    # The resources are retrieved from AWS the first time each attribute is accessed
+    @lazy_attribute
+    def instances(self):
         self.instances = []
         self.__threading_call__(self.__describe_instances__)
         self.__get_instance_user_data__()
+
+    @lazy_attribute
+    def security_groups(self):
         self.security_groups = []
         self.__threading_call__(self.__describe_security_groups__)
+        self.__threading_call__(self.__describe_sg_network_interfaces__)
+
+    @lazy_attribute
+    def security_groups_exposure(self):
+        # The ingress rules open to the Internet of every security group are indexed once for all the checks
+        self.security_groups_exposure = {
+            security_group.arn: Security_Group_Exposure(security_group.ingress_rules)
+            for security_group in self.security_groups
+        }
+
+    @lazy_attribute
+    def network_acls(self):
         self.network_acls = []
         self.__threading_call__(self.__describe_network_acls__)
+
+    @lazy_attribute
+    def snapshots(self):
         self.snapshots = []
         self.__threading_call__(self.__describe_snapshots__)
         self.__get_snapshot_public__()
+
+    @lazy_attribute
+    def network_interfaces(self):
         self.network_interfaces = []
         self.__threading_call__(self.__describe_public_network_interfaces__)
-        self.__threading_call__(self.__describe_sg_network_interfaces__)
+
+    @lazy_attribute
+    def images(self):
         self.images = []
         self.__threading_call__(self.__describe_images__)
+
+    @lazy_attribute
+    def volumes(self):
         self.volumes = []
         self.__threading_call__(self.__describe_volumes__)
+
+    @lazy_attribute
+    def ebs_encryption_by_default(self):
         self.ebs_encryption_by_default = []
         self.__threading_call__(self.__get_ebs_encryption_by_default__)
+
+    @lazy_attribute
+    def elastic_ips(self):
         self.elastic_ips = []
         self.__threading_call__(self.__describe_addresses__)
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_instances__(self, regional_client):
         logger.info("EC2 - Describing EC2 Instances...")
         try:
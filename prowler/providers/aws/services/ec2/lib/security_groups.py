@@ -1,6 +1,11 @@
 import ipaddress
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Any
 
+# Number of ports of a rule open in every port, from 0 to 65535
+all_ports_count = 65536
+
 
 ################## Security Groups
 def check_security_group(
@@ -46,52 +51,35 @@ def check_security_group(
 
     # Check for specific ports in ingress rules
     if "FromPort" in ingress_rule:
-        # If there is a port range
-        if ingress_rule["FromPort"] != ingress_rule["ToPort"]:
-            # Calculate port range, adding 1
-            diff = (ingress_rule["ToPort"] - ingress_rule["FromPort"]) + 1
-            ingress_port_range = []
-            for x in range(diff):
-                ingress_port_range.append(int(ingress_rule["FromPort"]) + x)
-        # If FromPort and ToPort are the same
-        else:
-            ingress_port_range = []
-            ingress_port_range.append(int(ingress_rule["FromPort"]))
+        from_port = int(ingress_rule["FromPort"])
+        to_port = int(ingress_rule["ToPort"])
+
+        def is_port_range_open():
+            # If there are input ports to check
+            if ports and ingress_rule["IpProtocol"] == protocol:
+                for port in ports:
+                    if from_port <= port <= to_port:
+                        return True
+            # If no input ports check if all ports are open
+            return to_port - from_port + 1 == all_ports_count
 
         # Test Security Group
         # IPv4
         for ip_ingress_rule in ingress_rule["IpRanges"]:
             if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If no input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
+                if is_port_range_open():
                     return True
 
         # IPv6
         for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
             if _is_cidr_public(ip_ingress_rule["CidrIpv6"]):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If no input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
+                if is_port_range_open():
                     return True
 
     return False
 
 
+@lru_cache(maxsize=None)
 def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
     """
     Check if an input CIDR is public
@@ -109,3 +97,102 @@ def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
         return True
     if not any_address:
         return ipaddress.ip_network(cidr).is_global
+    return False
+
+
+def merge_port_ranges(port_ranges: list) -> tuple:
+    """merge_port_ranges returns the sorted starts and ends of the port ranges, merging the overlapping and adjacent ones"""
+    starts = []
+    ends = []
+    for from_port, to_port in sorted(port_ranges):
+        if ends and from_port <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], to_port)
+        else:
+            starts.append(from_port)
+            ends.append(to_port)
+    return starts, ends
+
+
+class Security_Group_Exposure:
+    """
+    Security_Group_Exposure indexes once the ingress rules of a security group open to the Internet, so the checks
+    look up if a protocol and ports are exposed without walking the rules again. The port ranges are merged per
+    protocol, IP version and source, which is any address (0.0.0.0/0 or ::/0) or any public address.
+
+    is_exposed gives the same result as check_security_group for any of the ingress rules of the security group.
+    """
+
+    def __init__(self, ingress_rules: list):
+        # Sources of the rules allowing all the traffic, e.g. ("ipv4", "any_address")
+        self.all_traffic = set()
+        # Sources of the rules allowing all the ports of any protocol
+        self.all_ports = set()
+        # (protocol, IP version, source) -> merged port ranges
+        self.port_ranges = {}
+        self.queries = {}
+        port_ranges = {}
+        for ingress_rule in ingress_rules:
+            sources = set()
+            for ip_ingress_rule in ingress_rule.get("IpRanges", []):
+                sources.update(
+                    ("ipv4", source)
+                    for source in self.__cidr_sources__(ip_ingress_rule["CidrIp"])
+                )
+            for ip_ingress_rule in ingress_rule.get("Ipv6Ranges", []):
+                sources.update(
+                    ("ipv6", source)
+                    for source in self.__cidr_sources__(ip_ingress_rule["CidrIpv6"])
+                )
+            if ingress_rule["IpProtocol"] == "-1":
+                self.all_traffic.update(sources)
+            if "FromPort" in ingress_rule:
+                from_port = int(ingress_rule["FromPort"])
+                to_port = int(ingress_rule["ToPort"])
+                for ip_version, source in sources:
+                    port_ranges.setdefault(
+                        (ingress_rule["IpProtocol"], ip_version, source), []
+                    ).append((from_port, to_port))
+                    if to_port - from_port + 1 == all_ports_count:
+                        self.all_ports.add((ip_version, source))
+        for key, ranges in port_ranges.items():
+            self.port_ranges[key] = merge_port_ranges(ranges)
+
+    @staticmethod
+    def __cidr_sources__(cidr: str) -> list:
+        sources = []
+        if _is_cidr_public(cidr, any_address=True):
+            sources.append("any_address")
+        if _is_cidr_public(cidr):
+            sources.append("public_address")
+        return sources
+
+    def __is_port_open__(self, protocol: str, source: tuple, port: int) -> bool:
+        if (protocol, *source) not in self.port_ranges:
+            return False
+        starts, ends = self.port_ranges[(protocol, *source)]
+        index = bisect_right(starts, port) - 1
+        return index >= 0 and port <= ends[index]
+
+    def is_exposed(
+        self, protocol: str, ports: list = [], any_address: bool = False
+    ) -> bool:
+        """
+        is_exposed returns if the security group allows all the traffic, all the ports, or any of the ports using the
+        protocol from the Internet. With any_address, only 0.0.0.0/0 and ::/0 are the Internet.
+        """
+        query = (protocol, tuple(ports), any_address)
+        if query not in self.queries:
+            source = "any_address" if any_address else "public_address"
+            # As check_security_group does, the IPv6 ports are exposed to any public address
+            port_sources = [("ipv4", source), ("ipv6", "public_address")]
+            self.queries[query] = (
+                ("ipv4", source) in self.all_traffic
+                or ("ipv6", source) in self.all_traffic
+                or any(port_source in self.all_ports for port_source in port_sources)
+                or any(
+                    self.__is_port_open__(protocol, port_source, port)
+                    for port_source in port_sources
+                    for port in ports
+                )
+            )
+        return self.queries[query]
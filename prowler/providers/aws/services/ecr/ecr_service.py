@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime
 from json import loads
 from typing import Optional
@@ -9,10 +8,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################################ ECR
-class ECR:
+class ECR(AWS_Service):
     def __init__(self, audit_info):
         self.service = "ecr"
         self.session = audit_info.audit_session
@@ -27,18 +27,6 @@ class ECR:
         self.__threading_call__(self.__get_registry_scanning_configuration__)
         self.__threading_call__(self.__list_tags_for_resource__)
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_registries_and_repositories__(self, regional_client):
         logger.info("ECR - Describing registries and repositories...")
         regional_registry_repositories = []
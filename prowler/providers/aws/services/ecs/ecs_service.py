@@ -1,4 +1,3 @@
-import threading
 from re import sub
 from typing import Optional
 
@@ -7,10 +6,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################################ ECS
-class ECS:
+class ECS(AWS_Service):
     def __init__(self, audit_info):
         self.service = "ecs"
         self.session = audit_info.audit_session
@@ -20,18 +20,6 @@ class ECS:
         self.__threading_call__(self.__list_task_definitions__)
         self.__describe_task_definition__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_task_definitions__(self, regional_client):
         logger.info("ECS - Listing Task Definitions...")
         try:
@@ -1,4 +1,3 @@
-import threading
 from typing import Optional
 
 from botocore.client import ClientError
@@ -7,10 +6,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################### ELBv2
-class ELBv2:
+class ELBv2(AWS_Service):
     def __init__(self, audit_info):
         self.service = "elbv2"
         self.session = audit_info.audit_session
@@ -24,18 +24,6 @@ class ELBv2:
         self.__threading_call__(self.__describe_rules__)
         self.__describe_tags__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_load_balancers__(self, regional_client):
         logger.info("ELBv2 - Describing load balancers...")
         try:
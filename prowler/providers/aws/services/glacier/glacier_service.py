@@ -1,5 +1,4 @@
 import json
-import threading
 from typing import Optional
 
 from botocore.client import ClientError
@@ -8,10 +7,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## Glacier
-class Glacier:
+class Glacier(AWS_Service):
     def __init__(self, audit_info):
         self.service = "glacier"
         self.session = audit_info.audit_session
@@ -23,18 +23,6 @@ class Glacier:
         self.__threading_call__(self.__get_vault_access_policy__)
         self.__list_tags_for_vault__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_vaults__(self, regional_client):
         logger.info("Glacier - Listing Vaults...")
         try:
@@ -1,4 +1,5 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.providers.aws.lib.policy_engine.policy_engine import compile_policy
 from prowler.providers.aws.services.iam.iam_client import iam_client
 
 
@@ -15,28 +16,11 @@ class iam_customer_attached_policy_no_administrative_privileges(Check):
                 report.resource_tags = policy.tags
                 report.status = "PASS"
                 report.status_extended = f"{policy.type} policy {policy.name} is attached but does not allow '*:*' administrative privileges"
-                if policy.document:
-                    # Check the statements, if one includes *:* stop iterating over the rest
-                    if type(policy.document["Statement"]) != list:
-                        policy_statements = [policy.document["Statement"]]
-                    else:
-                        policy_statements = policy.document["Statement"]
-                    for statement in policy_statements:
-                        # Check policies with "Effect": "Allow" with "Action": "*" over "Resource": "*".
-                        if (
-                            statement["Effect"] == "Allow"
-                            and "Action" in statement
-                            and (
-                                statement["Action"] == "*"
-                                or statement["Action"] == ["*"]
-                            )
-                            and (
-                                statement["Resource"] == "*"
-                                or statement["Resource"] == ["*"]
-                            )
-                        ):
-                            report.status = "FAIL"
-                            report.status_extended = f"{policy.type} policy {policy.name} is attached and allows '*:*' administrative privileges"
-                            break
+                # Check if the policy allows "Action": "*" over "Resource": "*"
+                if compile_policy(policy.document).is_action_allowed(
+                    "*", all_resources=True
+                ):
+                    report.status = "FAIL"
+                    report.status_extended = f"{policy.type} policy {policy.name} is attached and allows '*:*' administrative privileges"
                 findings.append(report)
         return findings
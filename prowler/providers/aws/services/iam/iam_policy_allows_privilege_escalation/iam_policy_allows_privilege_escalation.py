@@ -1,4 +1,8 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.providers.aws.lib.policy_engine.policy_engine import (
+    compile_patterns,
+    compile_policy,
+)
 from prowler.providers.aws.services.iam.iam_client import iam_client
 
 # Does the tool analyze both users and roles, or just one or the other? --> Everything using AttachementCount.
@@ -6,8 +10,9 @@ from prowler.providers.aws.services.iam.iam_client import iam_client
 # Does the tool handle resource constraints? --> We don't check if the policy affects all resources or not, we check everything.
 # Does the tool consider the permissions of service roles? --> Just checks policies.
 # Does the tool handle transitive privesc paths (i.e., attack chains)? --> Not yet.
-# Does the tool handle the DENY effect as expected? --> Yes, it checks DENY's statements with Action and NotAction.
+# Does the tool handle the DENY effect as expected? --> Yes, it checks DENY's statements with Action and NotAction over all the resources.
 # Does the tool handle NotAction as expected? --> Yes
+# Does the tool handle wildcards (e.g. iam:Put*) as expected? --> Yes
 # Does the tool handle Condition constraints? --> Not yet.
 # Does the tool handle service control policy (SCP) restrictions? --> No, SCP are within Organizations AWS API.
 
@@ -69,52 +74,25 @@ class iam_policy_allows_privilege_escalation(Check):
                 report.region = iam_client.region
                 report.resource_tags = policy.tags
 
-                # List of policy actions
-                allowed_actions = set()
-                denied_actions = set()
-                denied_not_actions = set()
-
-                # Recover all policy actions
-                if policy.document:
-                    if type(policy.document["Statement"]) != list:
-                        policy_statements = [policy.document["Statement"]]
-                    else:
-                        policy_statements = policy.document["Statement"]
-                    for statements in policy_statements:
-                        # Recover allowed actions
-                        if statements["Effect"] == "Allow":
-                            if "Action" in statements:
-                                if type(statements["Action"]) is str:
-                                    allowed_actions = {statements["Action"]}
-                                if type(statements["Action"]) is list:
-                                    allowed_actions = set(statements["Action"])
-
-                        # Recover denied actions
-                        if statements["Effect"] == "Deny":
-                            if "Action" in statements:
-                                if type(statements["Action"]) is str:
-                                    denied_actions = {statements["Action"]}
-                                if type(statements["Action"]) is list:
-                                    denied_actions = set(statements["Action"])
-
-                            if "NotAction" in statements:
-                                if type(statements["NotAction"]) is str:
-                                    denied_not_actions = {statements["NotAction"]}
-                                if type(statements["NotAction"]) is list:
-                                    denied_not_actions = set(statements["NotAction"])
-
-                # First, we need to perform a left join with ALLOWED_ACTIONS and DENIED_ACTIONS
-                left_actions = allowed_actions.difference(denied_actions)
-                # Then, we need to find the DENIED_NOT_ACTIONS in LEFT_ACTIONS
-                if denied_not_actions:
-                    privileged_actions = left_actions.intersection(denied_not_actions)
-                # If there is no Denied Not Actions
-                else:
-                    privileged_actions = left_actions
-                # Finally, check if there is a privilege escalation action within this policy
-                policy_privilege_escalation_actions = privileged_actions.intersection(
-                    privilege_escalation_iam_actions
+                # The service wildcards (e.g. iam:*) are only reported if the policy allows every action of the service
+                policy_privilege_escalation_actions = compile_policy(
+                    policy.document
+                ).get_allowed_actions(privilege_escalation_iam_actions)
+                # The actions already included in a reported wildcard are not reported
+                reported_wildcards = compile_patterns(
+                    [
+                        action
+                        for action in policy_privilege_escalation_actions
+                        if action.endswith("*")
+                    ]
                 )
+                if reported_wildcards:
+                    policy_privilege_escalation_actions = {
+                        action
+                        for action in policy_privilege_escalation_actions
+                        if action.endswith("*")
+                        or not reported_wildcards.fullmatch(action)
+                    }
 
                 if len(policy_privilege_escalation_actions) == 0:
                     report.status = "PASS"
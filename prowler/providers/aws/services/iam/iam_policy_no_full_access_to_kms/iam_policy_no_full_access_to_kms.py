@@ -1,4 +1,5 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.providers.aws.lib.policy_engine.policy_engine import compile_policy
 from prowler.providers.aws.services.iam.iam_client import iam_client
 
 critical_service = "kms"
@@ -17,25 +18,12 @@ class iam_policy_no_full_access_to_kms(Check):
                 report.resource_tags = policy.tags
                 report.status = "PASS"
                 report.status_extended = f"Custom Policy {policy.name} does not allow '{critical_service}:*' privileges"
-                if policy.document:
-                    if type(policy.document["Statement"]) != list:
-                        policy_statements = [policy.document["Statement"]]
-                    else:
-                        policy_statements = policy.document["Statement"]
-                    # Check the statements, if one includes kms:* stop iterating over the rest
-                    for statement in policy_statements:
-                        if (
-                            statement["Effect"] == "Allow"
-                            and "Action" in statement
-                            and critical_service + ":*" in statement["Action"]
-                            and (
-                                statement["Resource"] == "*"
-                                or statement["Resource"] == ["*"]
-                            )
-                        ):
-                            report.status = "FAIL"
-                            report.status_extended = f"Custom Policy {policy.name} allows '{critical_service}:*' privileges"
-                            break
+                # Check if the policy allows every action of the service over "Resource": "*"
+                if compile_policy(policy.document).is_action_allowed(
+                    f"{critical_service}:*", all_resources=True
+                ):
+                    report.status = "FAIL"
+                    report.status_extended = f"Custom Policy {policy.name} allows '{critical_service}:*' privileges"
 
                 findings.append(report)
         return findings
@@ -1,13 +1,92 @@
 import csv
-from datetime import datetime
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from time import monotonic, sleep
 from typing import Optional
 
 from botocore.client import ClientError
 from pydantic import BaseModel
 
+from prowler.config.config import default_cache_directory
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.utils.utils import create_private_directory, open_private_file
+from prowler.lib.worker_pool.worker_pool import worker_pool
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service, lazy_attribute
+
+# Seconds to wait for the credential report generation, polling it with an increasing interval
+credential_report_timeout = 300
+credential_report_max_poll_interval = 5
+# Seconds a credential report is valid, AWS does not generate a new one until the last one is older
+credential_report_validity = 4 * 60 * 60
+
+
+def get_credential_report_cache_path(audited_account: str) -> str:
+    """get_credential_report_cache_path returns the path of the cached credential report of the account"""
+    return os.path.join(
+        default_cache_directory, f"credential_report_{audited_account}.json"
+    )
+
+
+def load_cached_credential_report(audited_account: str) -> Optional[list]:
+    """
+    load_cached_credential_report returns the credential report of the account cached by a previous execution if
+    it was generated less than credential_report_validity seconds ago, since AWS would return the same report
+    """
+    try:
+        with open_private_file(get_credential_report_cache_path(audited_account)) as f:
+            cache = json.load(f)
+        generated_time = datetime.fromisoformat(cache["generated_time"])
+        if datetime.now(timezone.utc) - generated_time < timedelta(
+            seconds=credential_report_validity
+        ):
+            logger.debug(
+                f"Credential report of the account {audited_account} loaded from cache"
+            )
+            return cache["credential_report"]
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.warning(
+            f"Credential report cache could not be loaded -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return None
+
+
+def store_cached_credential_report(
+    audited_account: str, generated_time: datetime, credential_report: list
+):
+    """store_cached_credential_report stores the credential report of the account, only readable by the current user"""
+    try:
+        cache_path = get_credential_report_cache_path(audited_account)
+        create_private_directory(os.path.dirname(cache_path))
+        # The temporary file is created with 0600 permissions and then replaced atomically
+        cache_file = tempfile.NamedTemporaryFile(
+            mode="w",
+            dir=os.path.dirname(cache_path),
+            prefix=f".credential_report_{audited_account}.",
+            delete=False,
+        )
+        try:
+            with cache_file:
+                json.dump(
+                    {
+                        "generated_time": generated_time.isoformat(),
+                        "credential_report": credential_report,
+                    },
+                    cache_file,
+                )
+            os.replace(cache_file.name, cache_path)
+        except Exception:
+            os.remove(cache_file.name)
+            raise
+    except Exception as error:
+        logger.warning(
+            f"Credential report could not be stored -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
 
 
 def is_service_role(role):
@@ -47,7 +126,7 @@ def is_service_role(role):
 
 
 ################## IAM
-class IAM:
+class IAM(AWS_Service):
     def __init__(self, audit_info):
         self.service = "iam"
         self.session = audit_info.audit_session
@@ -55,49 +134,282 @@ class IAM:
         self.audit_resources = audit_info.audit_resources
         self.partition = audit_info.audited_partition
         self.account_arn = audit_info.audited_account_arn
-        self.client = self.session.client(self.service)
         global_client = generate_regional_clients(
             self.service, audit_info, global_service=True
         )
         self.client = list(global_client.values())[0]
         self.region = self.client.region
+        self.credential_report_cache = audit_info.credential_report_cache
+
+    def __start_collecting__(self, attributes):
+        # The credential report takes a few seconds to be generated, so if it is needed its generation is
+        # started in the background while the rest of the attributes are retrieved, unless the report cached
+        # by a previous execution is still valid
+        if "credential_report" in attributes and self.cached_credential_report is None:
+            self.credential_report_generation
+
+    # The resources are retrieved from AWS the first time each attribute is accessed
+    @lazy_attribute
+    def authorization_details(self):
+        self.authorization_details = self.__get_account_authorization_details__()
+
+    # The users, roles, groups and policies are built from the account authorization details, making
+    # per-entity calls only for the data not returned by it. If it cannot be retrieved, e.g. the
+    # iam:GetAccountAuthorizationDetails permission is missing, every entity is retrieved with its own calls.
+    @lazy_attribute
+    def users(self):
+        # The password last used date is only returned by iam:ListUsers
         self.users = self.__get_users__()
-        self.roles = self.__get_roles__()
+        if self.authorization_details:
+            self.__set_users_authorization_details__()
+        else:
+            self.__list_attached_user_policies__()
+            self.__list_inline_user_policies__()
+            self.__list_user_tags__()
+        self.__list_mfa_devices__()
+
+    @lazy_attribute
+    def roles(self):
+        if self.authorization_details:
+            self.roles = self.__get_authorization_details_roles__()
+        else:
+            self.roles = self.__get_roles__()
+            self.__list_attached_role_policies__()
+            self.__list_role_tags__()
+
+    @lazy_attribute
+    def account_summary(self):
         self.account_summary = self.__get_account_summary__()
+
+    @lazy_attribute
+    def virtual_mfa_devices(self):
         self.virtual_mfa_devices = self.__list_virtual_mfa_devices__()
-        self.credential_report = self.__get_credential_report__()
-        self.groups = self.__get_groups__()
-        self.__get_group_users__()
-        self.__list_attached_group_policies__()
-        self.__list_attached_user_policies__()
-        self.__list_attached_role_policies__()
-        self.__list_inline_user_policies__()
-        self.__list_mfa_devices__()
+
+    @lazy_attribute
+    def cached_credential_report(self):
+        self.cached_credential_report = None
+        if self.credential_report_cache:
+            self.cached_credential_report = load_cached_credential_report(self.account)
+
+    # Accessing it starts the credential report generation in the background
+    @lazy_attribute
+    def credential_report_generation(self):
+        self.credential_report_generation = worker_pool.submit(
+            self.__generate_credential_report__
+        )
+
+    @lazy_attribute
+    def credential_report(self):
+        if self.cached_credential_report is not None:
+            self.credential_report = self.cached_credential_report
+        else:
+            self.credential_report = self.__get_credential_report__()
+
+    @lazy_attribute
+    def groups(self):
+        if self.authorization_details:
+            self.groups = self.__get_authorization_details_groups__()
+        else:
+            self.groups = self.__get_groups__()
+            self.__get_group_users__()
+            self.__list_attached_group_policies__()
+
+    @lazy_attribute
+    def password_policy(self):
         self.password_policy = self.__get_password_policy__()
+
+    @lazy_attribute
+    def entities_role_attached_to_support_policy(self):
         support_policy_arn = (
             "arn:aws:iam::aws:policy/aws-service-role/AWSSupportServiceRolePolicy"
         )
         self.entities_role_attached_to_support_policy = (
             self.__list_entities_role_for_policy__(support_policy_arn)
         )
+
+    @lazy_attribute
+    def entities_role_attached_to_securityaudit_policy(self):
         securityaudit_policy_arn = "arn:aws:iam::aws:policy/SecurityAudit"
         self.entities_role_attached_to_securityaudit_policy = (
             self.__list_entities_role_for_policy__(securityaudit_policy_arn)
         )
+
+    @lazy_attribute
+    def policies(self):
         # List both Customer (attached and unattached) and AWS Managed (only attached) policies
-        self.policies = []
-        self.policies.extend(self.__list_policies__("AWS"))
-        self.policies.extend(self.__list_policies__("Local"))
-        self.__list_policies_version__(self.policies)
+        if self.authorization_details:
+            self.policies = self.__get_authorization_details_policies__()
+        else:
+            self.policies = []
+            self.policies.extend(self.__list_policies__("AWS"))
+            self.policies.extend(self.__list_policies__("Local"))
+            self.__list_policies_version__(self.policies)
+        # The policy tags are not returned in the account authorization details
+        self.__list_policy_tags__()
+
+    @lazy_attribute
+    def saml_providers(self):
         self.saml_providers = self.__list_saml_providers__()
+
+    @lazy_attribute
+    def server_certificates(self):
         self.server_certificates = self.__list_server_certificates__()
-        self.__list_tags_for_resource__()
 
     def __get_client__(self):
         return self.client
 
-    def __get_session__(self):
-        return self.session
+    def __get_account_authorization_details__(self):
+        logger.info("IAM - Get Account Authorization Details...")
+        try:
+            authorization_details = {
+                "UserDetailList": [],
+                "GroupDetailList": [],
+                "RoleDetailList": [],
+                "Policies": [],
+            }
+            get_account_authorization_details_paginator = self.client.get_paginator(
+                "get_account_authorization_details"
+            )
+            for page in get_account_authorization_details_paginator.paginate(
+                Filter=[
+                    "User",
+                    "Role",
+                    "Group",
+                    "LocalManagedPolicy",
+                    "AWSManagedPolicy",
+                ],
+                PaginationConfig={"PageSize": 1000},
+            ):
+                for details in authorization_details:
+                    authorization_details[details].extend(page.get(details, []))
+            # The entities are returned in no particular order, so they are sorted to report them always in the same order
+            for details in authorization_details.values():
+                details.sort(key=lambda entity: entity["Arn"])
+        except Exception as error:
+            logger.warning(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            authorization_details = None
+        finally:
+            return authorization_details
+
+    def __set_users_authorization_details__(self):
+        logger.info("IAM - Set Users Authorization Details...")
+        try:
+            users_details = {
+                user["Arn"]: user
+                for user in self.authorization_details["UserDetailList"]
+            }
+            for user in self.users:
+                # The users created after the authorization details were retrieved are skipped
+                if user.arn in users_details:
+                    user_details = users_details[user.arn]
+                    user.attached_policies = user_details.get(
+                        "AttachedManagedPolicies", []
+                    )
+                    user.inline_policies = [
+                        policy["PolicyName"]
+                        for policy in user_details.get("UserPolicyList", [])
+                    ]
+                    user.tags = user_details.get("Tags", [])
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __get_authorization_details_roles__(self):
+        logger.info("IAM - Get Roles Authorization Details...")
+        try:
+            roles = []
+            for role in self.authorization_details["RoleDetailList"]:
+                if not self.audit_resources or (
+                    is_resource_filtered(role["Arn"], self.audit_resources)
+                ):
+                    roles.append(
+                        Role(
+                            name=role["RoleName"],
+                            arn=role["Arn"],
+                            assume_role_policy=role["AssumeRolePolicyDocument"],
+                            is_service_role=is_service_role(role),
+                            attached_policies=role.get("AttachedManagedPolicies", []),
+                            tags=role.get("Tags", []),
+                        )
+                    )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        finally:
+            return roles
+
+    def __get_authorization_details_groups__(self):
+        logger.info("IAM - Get Groups Authorization Details...")
+        try:
+            groups = []
+            # The users of every group are taken from the groups of every user
+            group_users = {}
+            for user in self.authorization_details["UserDetailList"]:
+                for group_name in user.get("GroupList", []):
+                    group_users.setdefault(group_name, []).append(
+                        User(name=user["UserName"], arn=user["Arn"])
+                    )
+            for group in self.authorization_details["GroupDetailList"]:
+                if not self.audit_resources or (
+                    is_resource_filtered(group["Arn"], self.audit_resources)
+                ):
+                    groups.append(
+                        Group(
+                            name=group["GroupName"],
+                            arn=group["Arn"],
+                            attached_policies=group.get("AttachedManagedPolicies", []),
+                            users=group_users.get(group["GroupName"], []),
+                        )
+                    )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        finally:
+            return groups
+
+    def __get_authorization_details_policies__(self):
+        logger.info("IAM - Get Policies Authorization Details...")
+        try:
+            aws_policies = []
+            custom_policies = []
+            for policy in self.authorization_details["Policies"]:
+                if not self.audit_resources or (
+                    is_resource_filtered(policy["Arn"], self.audit_resources)
+                ):
+                    # Format: "arn:aws:iam::aws:policy/SecurityAudit" for the AWS Managed policies
+                    is_aws_policy = policy["Arn"].split(":")[4] == "aws"
+                    # Only the attached AWS Managed policies are listed
+                    if is_aws_policy and policy["AttachmentCount"] == 0:
+                        continue
+                    document = None
+                    for policy_version in policy.get("PolicyVersionList", []):
+                        if policy_version["IsDefaultVersion"]:
+                            document = policy_version["Document"]
+                    stored_policy = Policy(
+                        name=policy["PolicyName"],
+                        arn=policy["Arn"],
+                        version_id=policy["DefaultVersionId"],
+                        type="AWS" if is_aws_policy else "Custom",
+                        attached=True if policy["AttachmentCount"] > 0 else False,
+                        document=document,
+                    )
+                    if is_aws_policy:
+                        aws_policies.append(stored_policy)
+                    else:
+                        custom_policies.append(stored_policy)
+            policies = aws_policies + custom_policies
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            policies = []
+        finally:
+            return policies
 
     def __get_roles__(self):
         logger.info("IAM - List Roles...")
@@ -124,26 +436,62 @@ class IAM:
         finally:
             return roles
 
-    def __get_credential_report__(self):
-        logger.info("IAM - Get Credential Report...")
-        report_is_completed = False
-        credential_list = []
+    def __generate_credential_report__(self):
+        logger.info("IAM - Generate Credential Report...")
         try:
-            while not report_is_completed:
+            poll_interval = 0.1
+            deadline = monotonic() + credential_report_timeout
+            while True:
                 report_status = self.client.generate_credential_report()
                 if report_status["State"] == "COMPLETE":
-                    report_is_completed = True
-            # Convert credential report to list of dictionaries
-            credential = self.client.get_credential_report()["Content"].decode("utf-8")
-            credential_lines = credential.split("\n")
-            csv_reader = csv.DictReader(credential_lines, delimiter=",")
-            credential_list = list(csv_reader)
+                    return True
+                elif monotonic() + poll_interval > deadline:
+                    logger.error(
+                        f"{self.region} -- Credential report not generated in {credential_report_timeout} seconds"
+                    )
+                    return False
+                else:
+                    sleep(poll_interval)
+                    poll_interval = min(
+                        poll_interval * 2, credential_report_max_poll_interval
+                    )
 
         except ClientError as error:
             if error.response["Error"]["Code"] == "LimitExceededException":
                 logger.warning(
                     f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return False
+
+    def __get_credential_report__(self):
+        logger.info("IAM - Get Credential Report...")
+        credential_list = []
+        try:
+            # The generation is joined, or started if the service did not start it
+            if self.credential_report_generation.result():
+                credential_report = self.client.get_credential_report()
+                # Convert credential report to list of dictionaries
+                credential = credential_report["Content"].decode("utf-8")
+                credential_lines = credential.split("\n")
+                csv_reader = csv.DictReader(credential_lines, delimiter=",")
+                credential_list = list(csv_reader)
+                if self.credential_report_cache:
+                    store_cached_credential_report(
+                        self.account,
+                        credential_report.get(
+                            "GeneratedTime", datetime.now(timezone.utc)
+                        ),
+                        credential_list,
+                    )
 
         except Exception as error:
             logger.error(
@@ -495,8 +843,8 @@ class IAM:
         finally:
             return server_certificates
 
-    def __list_tags_for_resource__(self):
-        logger.info("IAM - List Tags...")
+    def __list_role_tags__(self):
+        logger.info("IAM - List Role Tags...")
         try:
             for role in self.roles:
                 try:
@@ -511,6 +859,8 @@ class IAM:
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def __list_user_tags__(self):
+        logger.info("IAM - List User Tags...")
         try:
             for user in self.users:
                 try:
@@ -525,6 +875,8 @@ class IAM:
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def __list_policy_tags__(self):
+        logger.info("IAM - List Policy Tags...")
         try:
             for policy in self.policies:
                 try:
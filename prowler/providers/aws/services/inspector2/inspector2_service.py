@@ -1,14 +1,13 @@
-import threading
-
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################################ Inspector2
-class Inspector2:
+class Inspector2(AWS_Service):
     def __init__(self, audit_info):
         self.service = "inspector2"
         self.session = audit_info.audit_session
@@ -28,18 +27,6 @@ class Inspector2:
         self.__threading_call__(self.__batch_get_account_status__)
         self.__list_findings__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __batch_get_account_status__(self, regional_client):
         # We use this function to check if inspector2 is enabled
         logger.info("Inspector2 - batch_get_account_status...")
@@ -1,5 +1,4 @@
 import json
-import threading
 from typing import Optional
 
 from pydantic import BaseModel
@@ -7,10 +6,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## KMS
-class KMS:
+class KMS(AWS_Service):
     def __init__(self, audit_info):
         self.service = "kms"
         self.session = audit_info.audit_session
@@ -25,18 +25,6 @@ class KMS:
             self.__get_key_policy__()
             self.__list_resource_tags__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_keys__(self, regional_client):
         logger.info("KMS - Listing Keys...")
         try:
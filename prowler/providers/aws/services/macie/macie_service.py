@@ -1,13 +1,12 @@
-import threading
-
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## Macie
-class Macie:
+class Macie(AWS_Service):
     def __init__(self, audit_info):
         self.service = "macie2"
         self.session = audit_info.audit_session
@@ -18,18 +17,6 @@ class Macie:
         self.sessions = []
         self.__threading_call__(self.__get_macie_session__)
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __get_macie_session__(self, regional_client):
         logger.info("Macie - Get Macie Session...")
         try:
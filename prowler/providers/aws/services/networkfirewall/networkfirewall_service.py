@@ -1,14 +1,13 @@
-import threading
-
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## NetworkFirewall
-class NetworkFirewall:
+class NetworkFirewall(AWS_Service):
     def __init__(self, audit_info):
         self.service = "network-firewall"
         self.session = audit_info.audit_session
@@ -27,18 +26,6 @@ class NetworkFirewall:
         self.__threading_call__(self.__list_firewalls__)
         self.__describe_firewall__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_firewalls__(self, regional_client):
         logger.info("Network Firewall - Listing Network Firewalls...")
         try:
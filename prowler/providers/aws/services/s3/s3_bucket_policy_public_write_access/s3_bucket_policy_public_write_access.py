@@ -1,4 +1,5 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.providers.aws.lib.policy_engine.policy_engine import compile_policy
 from prowler.providers.aws.services.s3.s3_client import s3_client
 
 
@@ -20,19 +21,12 @@ class s3_bucket_policy_public_write_access(Check):
             else:
                 report.status = "PASS"
                 report.status_extended = f"S3 Bucket {bucket.name} does not allow public write access in the bucket policy."
-                for statement in bucket.policy["Statement"]:
-                    if (
-                        statement["Effect"] == "Allow"
-                        and "Condition" not in statement
-                        and "*" in str(statement["Principal"])
-                        and (
-                            "s3:PutObject" in statement["Action"]
-                            or "*" in statement["Action"]
-                            or "s3:*" in statement["Action"]
-                        )
-                    ):
-                        report.status = "FAIL"
-                        report.status_extended = f"S3 Bucket {bucket.name} allows public write access in the bucket policy.."
+                # Check if the bucket policy allows anyone, without conditions, to write objects
+                if compile_policy(bucket.policy).is_public(
+                    actions=["s3:PutObject"], include_conditional=False
+                ):
+                    report.status = "FAIL"
+                    report.status_extended = f"S3 Bucket {bucket.name} allows public write access in the bucket policy.."
 
             findings.append(report)
         return findings
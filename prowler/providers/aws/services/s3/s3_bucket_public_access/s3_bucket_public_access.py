@@ -1,4 +1,5 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.providers.aws.lib.policy_engine.policy_engine import compile_policy
 from prowler.providers.aws.services.s3.s3_client import s3_client
 from prowler.providers.aws.services.s3.s3control_client import s3control_client
 
@@ -45,28 +46,8 @@ class s3_bucket_public_access(Check):
                                     report.status_extended = f"S3 Bucket {bucket.name} has public access due to bucket ACL."
 
                         # 4. Check bucket policy
-                        if bucket.policy:
-                            for statement in bucket.policy["Statement"]:
-                                if (
-                                    "Principal" in statement
-                                    and "*" == statement["Principal"]
-                                    and statement["Effect"] == "Allow"
-                                ):
-                                    report.status = "FAIL"
-                                    report.status_extended = f"S3 Bucket {bucket.name} has public access due to bucket policy."
-                                else:
-                                    if (
-                                        "Principal" in statement
-                                        and "AWS" in statement["Principal"]
-                                        and statement["Effect"] == "Allow"
-                                    ):
-                                        if type(statement["Principal"]["AWS"]) == str:
-                                            principals = [statement["Principal"]["AWS"]]
-                                        else:
-                                            principals = statement["Principal"]["AWS"]
-                                        for principal_arn in principals:
-                                            if principal_arn == "*":
-                                                report.status = "FAIL"
-                                                report.status_extended = f"S3 Bucket {bucket.name} has public access due to bucket policy."
+                        if bucket.policy and compile_policy(bucket.policy).is_public():
+                            report.status = "FAIL"
+                            report.status_extended = f"S3 Bucket {bucket.name} has public access due to bucket policy."
                     findings.append(report)
         return findings
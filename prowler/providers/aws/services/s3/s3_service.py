@@ -1,5 +1,4 @@
 import json
-import threading
 from typing import Optional
 
 from botocore.client import ClientError
@@ -8,87 +7,97 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.clients.clients import get_client
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## S3
-class S3:
+class S3(AWS_Service):
     def __init__(self, audit_info):
         self.service = "s3"
         self.session = audit_info.audit_session
-        self.client = self.session.client(self.service)
+        self.client = get_client(
+            self.session, self.service, config=audit_info.session_config
+        )
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
         self.audited_partition = audit_info.audited_partition
         self.audited_account_arn = audit_info.audited_account_arn
         self.regional_clients = generate_regional_clients(self.service, audit_info)
-        self.buckets = self.__list_buckets__(audit_info)
-        self.__threading_call__(self.__get_bucket_versioning__)
-        self.__threading_call__(self.__get_bucket_logging__)
-        self.__threading_call__(self.__get_bucket_policy__)
-        self.__threading_call__(self.__get_bucket_acl__)
-        self.__threading_call__(self.__get_public_access_block__)
-        self.__threading_call__(self.__get_bucket_encryption__)
-        self.__threading_call__(self.__get_bucket_ownership_controls__)
-        self.__threading_call__(self.__get_object_lock_configuration__)
-        self.__threading_call__(self.__get_bucket_tagging__)
-
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for bucket in self.buckets:
-            threads.append(threading.Thread(target=call, args=(bucket,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        self.audited_regions = audit_info.audited_regions
+        # Every bucket is retrieved in one worker, from its location to its attributes, so the buckets
+        # do not wait for the slowest one between the calls
+        self.buckets = [
+            bucket
+            for bucket in self.__threading_call__(
+                self.__get_bucket__, self.__list_buckets__()
+            )
+            if bucket
+        ]
 
-    def __list_buckets__(self, audit_info):
+    def __list_buckets__(self) -> list:
         logger.info("S3 - Listing buckets...")
-        buckets = []
+        bucket_names = []
         try:
-            list_buckets = self.client.list_buckets()
-            for bucket in list_buckets["Buckets"]:
-                bucket_region = self.client.get_bucket_location(Bucket=bucket["Name"])[
-                    "LocationConstraint"
-                ]
-                if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
-                    bucket_region = "eu-west-1"
-                if not bucket_region:  # If None, bucket_region is us-east-1
-                    bucket_region = "us-east-1"
-                # Arn
+            for bucket in self.client.list_buckets()["Buckets"]:
                 arn = f"arn:{self.audited_partition}:s3:::{bucket['Name']}"
                 if not self.audit_resources or (
                     is_resource_filtered(arn, self.audit_resources)
                 ):
-                    # Check if there are filter regions
-                    if audit_info.audited_regions:
-                        if bucket_region in audit_info.audited_regions:
-                            buckets.append(
-                                Bucket(
-                                    name=bucket["Name"], arn=arn, region=bucket_region
-                                )
-                            )
-                    else:
-                        buckets.append(
-                            Bucket(name=bucket["Name"], arn=arn, region=bucket_region)
-                        )
+                    bucket_names.append(bucket["Name"])
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return bucket_names
+
+    def __get_bucket__(self, bucket_name: str) -> Optional["Bucket"]:
+        """__get_bucket__ returns the bucket with all its attributes, or None if it is not in the audited regions"""
+        try:
+            bucket_region = self.client.get_bucket_location(Bucket=bucket_name)[
+                "LocationConstraint"
+            ]
+            if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
+                bucket_region = "eu-west-1"
+            if not bucket_region:  # If None, bucket_region is us-east-1
+                bucket_region = "us-east-1"
         except ClientError as error:
             if error.response["Error"]["Code"] == "NoSuchBucket":
                 logger.warning(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-        except Exception as error:
-            if bucket:
-                logger.error(
-                    f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    f"{bucket_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
             else:
                 logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    f"{bucket_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
-        return buckets
+            return None
+        except Exception as error:
+            logger.error(
+                f"{bucket_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+        # Check if there are filter regions
+        if self.audited_regions and bucket_region not in self.audited_regions:
+            return None
+        bucket = Bucket(
+            name=bucket_name,
+            arn=f"arn:{self.audited_partition}:s3:::{bucket_name}",
+            region=bucket_region,
+        )
+        # The attributes are set in the bucket as they are retrieved, with the client of its region
+        for get_bucket_attribute in (
+            self.__get_bucket_versioning__,
+            self.__get_bucket_logging__,
+            self.__get_bucket_policy__,
+            self.__get_bucket_acl__,
+            self.__get_public_access_block__,
+            self.__get_bucket_encryption__,
+            self.__get_bucket_ownership_controls__,
+            self.__get_object_lock_configuration__,
+            self.__get_bucket_tagging__,
+        ):
+            get_bucket_attribute(bucket)
+        return bucket
 
     def __get_bucket_versioning__(self, bucket):
         logger.info("S3 - Get buckets versioning...")
@@ -1,15 +1,14 @@
-import threading
-
 from botocore.client import ClientError
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## SecurityHub
-class SecurityHub:
+class SecurityHub(AWS_Service):
     def __init__(self, audit_info):
         self.service = "securityhub"
         self.session = audit_info.audit_session
@@ -19,18 +18,6 @@ class SecurityHub:
         self.securityhubs = []
         self.__threading_call__(self.__describe_hub__)
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_hub__(self, regional_client):
         logger.info("SecurityHub - Describing Hub...")
         try:
@@ -1,5 +1,4 @@
 import json
-import threading
 from enum import Enum
 from typing import Optional
 
@@ -9,10 +8,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## SSM
-class SSM:
+class SSM(AWS_Service):
     def __init__(self, audit_info):
         self.service = "ssm"
         self.session = audit_info.audit_session
@@ -29,18 +29,6 @@ class SSM:
         self.__threading_call__(self.__list_resource_compliance_summaries__)
         self.__threading_call__(self.__describe_instance_information__)
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_documents__(self, regional_client):
         logger.info("SSM - Listing Documents...")
         try:
@@ -1,11 +1,10 @@
-import threading
-
 from botocore.client import ClientError
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 # Note:
 # This service is a bit special because it creates a resource (Replication Set) in one region, but you can list it in from any region using list_replication_sets
@@ -15,7 +14,7 @@ from prowler.providers.aws.aws_provider import generate_regional_clients
 
 
 ################## SSMIncidents
-class SSMIncidents:
+class SSMIncidents(AWS_Service):
     def __init__(self, audit_info):
         self.service = "ssm-incidents"
         self.session = audit_info.audit_session
@@ -38,18 +37,6 @@ class SSMIncidents:
         self.__threading_call__(self.__list_response_plans__)
         self.__list_tags_for_resource__()
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_replication_sets__(self):
         logger.info("SSMIncidents - Listing Replication Sets...")
         try:
@@ -4,6 +4,7 @@ from botocore.client import ClientError
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
+from prowler.providers.aws.lib.clients.clients import get_client
 
 
 ################################ TrustedAdvisor
@@ -21,8 +22,11 @@ class TrustedAdvisor:
                 support_region = "us-east-1"
             else:
                 support_region = "us-gov-west-1"
-            self.client = audit_info.audit_session.client(
-                self.service, region_name=support_region
+            self.client = get_client(
+                audit_info.audit_session,
+                self.service,
+                support_region,
+                audit_info.session_config,
             )
             self.client.region = self.region = support_region
             self.__describe_trusted_advisor_checks__()
@@ -1,5 +1,4 @@
 import json
-import threading
 from typing import Optional
 
 from pydantic import BaseModel
@@ -7,10 +6,11 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################## VPC
-class VPC:
+class VPC(AWS_Service):
     def __init__(self, audit_info):
         self.service = "ec2"
         self.session = audit_info.audit_session
@@ -38,18 +38,6 @@ class VPC:
             else list(self.regional_clients.keys())[0]
         )
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __describe_vpcs__(self, regional_client):
         logger.info("VPC - Describing VPCs...")
         try:
@@ -1,14 +1,13 @@
-import threading
-
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service
 
 
 ################### WAF
-class WAF:
+class WAF(AWS_Service):
     def __init__(self, audit_info):
         self.service = "waf-regional"
         self.session = audit_info.audit_session
@@ -18,18 +17,6 @@ class WAF:
         self.__threading_call__(self.__list_web_acls__)
         self.__threading_call__(self.__list_resources_for_web_acl__)
 
-    def __get_session__(self):
-        return self.session
-
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
     def __list_web_acls__(self, regional_client):
         logger.info("WAF - Listing Regional Web ACLs...")
         try:
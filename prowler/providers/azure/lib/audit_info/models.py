@@ -1,9 +1,12 @@
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from azure.identity import DefaultAzureCredential
 from pydantic import BaseModel
 
+# The Azure SDK is only imported when the Azure provider is used
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
+
 
 class Azure_Identity_Info(BaseModel):
     identity_id: str = ""
@@ -15,7 +18,7 @@ class Azure_Identity_Info(BaseModel):
 
 @dataclass
 class Azure_Audit_Info:
-    credentials: DefaultAzureCredential
+    credentials: "DefaultAzureCredential"
     identity: Azure_Identity_Info
     audit_resources: Optional[Any]
     audit_metadata: Optional[Any]
@@ -5,10 +5,12 @@ from colorama import Fore, Style
 
 from prowler.config.config import boto3_user_agent_extra
 from prowler.lib.logger import logger
+from prowler.lib.worker_pool.worker_pool import default_max_workers
 from prowler.providers.aws.aws_provider import (
     AWS_Provider,
     assume_role,
     get_checks_from_input_arn,
+    get_connection_config,
     get_regions_from_audit_resources,
 )
 from prowler.providers.aws.lib.arn.arn import parse_iam_credentials_arn
@@ -21,13 +23,12 @@ from prowler.providers.aws.lib.credentials.credentials import (
 from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
 )
+from prowler.providers.aws.lib.regions.regions import get_enabled_regions
 from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
     get_tagged_resources,
 )
-from prowler.providers.azure.azure_provider import Azure_Provider
 from prowler.providers.azure.lib.audit_info.audit_info import azure_audit_info
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
-from prowler.providers.gcp.gcp_provider import GCP_Provider
 from prowler.providers.gcp.lib.audit_info.audit_info import gcp_audit_info
 from prowler.providers.gcp.lib.audit_info.models import GCP_Audit_Info
 
@@ -77,6 +78,10 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
 
         # Assume Role Options
         input_role = arguments.get("role")
+        # With --organization-accounts the role is assumed later in every account of the organization
+        organization_accounts = arguments.get("organization_accounts")
+        if organization_accounts:
+            input_role = None
         current_audit_info.assumed_role_info.role_arn = input_role
         input_session_duration = arguments.get("session_duration")
         input_external_id = arguments.get("external_id")
@@ -88,13 +93,18 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
         if (
             input_session_duration and input_session_duration != 3600
         ) or input_external_id:
-            if not input_role:
+            if not input_role and not organization_accounts:
                 raise Exception("To use -I/-T options -R option is needed")
 
         # MFA Configuration (false by default)
         input_mfa = arguments.get("mfa")
         current_audit_info.mfa_enabled = input_mfa
 
+        # Credentials cache of the assumed roles (false by default)
+        current_audit_info.assumed_role_info.credentials_cache = arguments.get(
+            "aws_credentials_cache", False
+        )
+
         input_profile = arguments.get("profile")
         input_regions = arguments.get("region")
         organizations_role_arn = arguments.get("organizations_role")
@@ -117,6 +127,24 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
             new_boto3_config = current_audit_info.session_config.merge(config)
             current_audit_info.session_config = new_boto3_config
 
+        # Size the connection pools of the clients to the threads making calls concurrently: the shared
+        # workers and the threads executing the checks or building the services
+        concurrency = (arguments.get("max_workers") or default_max_workers) + max(
+            arguments.get("parallel_checks") or 1,
+            arguments.get("warm_up_services") or 1,
+        )
+        connection_config = get_connection_config(
+            concurrency,
+            arguments.get("aws_max_pool_connections"),
+            arguments.get("aws_connect_timeout"),
+            arguments.get("aws_read_timeout"),
+        )
+        if current_audit_info.session_config:
+            connection_config = current_audit_info.session_config.merge(
+                connection_config
+            )
+        current_audit_info.session_config = connection_config
+
         # Setting session
         current_audit_info.profile = input_profile
         current_audit_info.audited_regions = input_regions
@@ -238,6 +266,15 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
         else:
             current_audit_info.profile_region = "us-east-1"
 
+        # The IAM credential report is reused by the next executions while it is valid (false by default)
+        current_audit_info.credential_report_cache = arguments.get(
+            "aws_credential_report_cache", False
+        )
+
+        # The opt-in regions not enabled in the account are not scanned
+        if not input_regions:
+            current_audit_info.enabled_regions = get_enabled_regions(current_audit_info)
+
         if not arguments.get("only_logs"):
             print_aws_credentials(current_audit_info)
 
@@ -295,6 +332,9 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
                 "Azure Tenant ID is required only for browser authentication mode"
             )
 
+        # The Azure SDK is only imported when the Azure provider is used
+        from prowler.providers.azure.azure_provider import Azure_Provider
+
         azure_provider = Azure_Provider(
             az_cli_auth,
             sp_env_auth,
@@ -321,6 +361,9 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
         logger.info("Checking if any credentials mode is set ...")
         credentials_file = arguments.get("credentials_file")
 
+        # The Google SDK is only imported when the GCP provider is used
+        from prowler.providers.gcp.gcp_provider import GCP_Provider
+
         gcp_provider = GCP_Provider(
             credentials_file,
             project_ids,
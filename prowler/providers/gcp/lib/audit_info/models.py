@@ -1,12 +1,14 @@
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from google.oauth2.credentials import Credentials
+# The Google SDK is only imported when the GCP provider is used
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 
 @dataclass
 class GCP_Audit_Info:
-    credentials: Credentials
+    credentials: "Credentials"
     default_project_id: str
     project_ids: list
     audit_resources: Optional[Any]
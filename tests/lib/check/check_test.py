@@ -1,16 +1,24 @@
 import os
 import pathlib
+import sys
+import threading
 from importlib.machinery import FileFinder
 from pkgutil import ModuleInfo
+from time import sleep, thread_time
 
+import pytest
 from boto3 import client, session
 from fixtures.bulk_checks_metadata import test_bulk_checks_metadata
-from mock import patch
+from mock import MagicMock, patch
 from moto import mock_s3
 
 from prowler.lib.check.check import (
+    build_service_client,
     exclude_checks_to_run,
     exclude_services_to_run,
+    execute,
+    execute_checks,
+    group_checks_by_service,
     list_categories,
     list_modules,
     list_services,
@@ -18,10 +26,16 @@ from prowler.lib.check.check import (
     parse_checks_from_folder,
     recover_checks_from_provider,
     recover_checks_from_service,
+    recover_service_clients_from_checks,
     remove_custom_checks_module,
+    remove_service_clients_modules,
+    run_check_with_deadlines,
     update_audit_metadata,
+    warm_up_services,
 )
+from prowler.lib.check.deadlines import Execution_Deadlines
 from prowler.lib.check.models import load_check_metadata
+from prowler.lib.scan_metrics.scan_metrics import Scan_Metrics
 from prowler.providers.aws.aws_provider import (
     get_checks_from_input_arn,
     get_regions_from_audit_resources,
@@ -58,31 +72,29 @@ def mock_walk_packages(*_):
     return expected_packages
 
 
-def mock_list_modules(*_):
-    modules = [
-        ModuleInfo(
-            module_finder=FileFinder(
-                "/root_dir/prowler/providers/azure/services/storage/storage_ensure_minimum_tls_version_12"
-            ),
-            name="prowler.providers.azure.services.storage.storage_ensure_minimum_tls_version_12.storage_ensure_minimum_tls_version_12",
-            ispkg=False,
-        ),
-        ModuleInfo(
-            module_finder=FileFinder(
-                "/root_dir/prowler/providers/azure/services/storage"
-            ),
-            name="prowler.providers.azure.services.storage.storage_ensure_encryption_with_customer_managed_keys",
-            ispkg=True,
-        ),
-        ModuleInfo(
-            module_finder=FileFinder(
-                "/root_dir/prowler/providers/azure/services/storage/storage_ensure_encryption_with_customer_managed_keys"
-            ),
-            name="prowler.providers.azure.services.storage.storage_ensure_encryption_with_customer_managed_keys.storage_ensure_encryption_with_customer_managed_keys",
-            ispkg=False,
-        ),
-    ]
-    return modules
+def mock_get_services_path(provider):
+    return f"/root_dir/prowler/providers/{provider}/services"
+
+
+def mock_load_checks_manifest(provider):
+    return {
+        "defender": {
+            "defender_ensure_defender_for_app_services_is_on": {
+                "module": f"prowler.providers.{provider}.services.defender.defender_ensure_defender_for_app_services_is_on.defender_ensure_defender_for_app_services_is_on",
+                "metadata": "defender/defender_ensure_defender_for_app_services_is_on/defender_ensure_defender_for_app_services_is_on.metadata.json",
+            },
+        },
+        "storage": {
+            "storage_ensure_minimum_tls_version_12": {
+                "module": f"prowler.providers.{provider}.services.storage.storage_ensure_minimum_tls_version_12.storage_ensure_minimum_tls_version_12",
+                "metadata": "storage/storage_ensure_minimum_tls_version_12/storage_ensure_minimum_tls_version_12.metadata.json",
+            },
+            "storage_ensure_encryption_with_customer_managed_keys": {
+                "module": f"prowler.providers.{provider}.services.storage.storage_ensure_encryption_with_customer_managed_keys.storage_ensure_encryption_with_customer_managed_keys",
+                "metadata": "storage/storage_ensure_encryption_with_customer_managed_keys/storage_ensure_encryption_with_customer_managed_keys.metadata.json",
+            },
+        },
+    }
 
 
 def mock_recover_checks_from_azure_provider(*_):
@@ -334,7 +346,14 @@ class Test_Check:
         listed_categories = list_categories(test_bulk_checks_metadata)
         assert listed_categories == expected_categories
 
-    @patch("prowler.lib.check.check.list_modules", new=mock_list_modules)
+    @patch(
+        "prowler.lib.check.check.load_checks_manifest",
+        new=mock_load_checks_manifest,
+    )
+    @patch(
+        "prowler.lib.check.check.get_services_path",
+        new=mock_get_services_path,
+    )
     def test_recover_checks_from_provider(self):
         provider = "azure"
         service = "storage"
@@ -351,6 +370,46 @@ class Test_Check:
         returned_checks = recover_checks_from_provider(provider, service)
         assert returned_checks == expected_checks
 
+    @patch(
+        "prowler.lib.check.check.load_checks_manifest",
+        new=mock_load_checks_manifest,
+    )
+    @patch(
+        "prowler.lib.check.check.get_services_path",
+        new=mock_get_services_path,
+    )
+    def test_recover_checks_from_provider_all_services(self):
+        provider = "azure"
+        expected_checks = [
+            (
+                "defender_ensure_defender_for_app_services_is_on",
+                "/root_dir/prowler/providers/azure/services/defender/defender_ensure_defender_for_app_services_is_on",
+            ),
+            (
+                "storage_ensure_minimum_tls_version_12",
+                "/root_dir/prowler/providers/azure/services/storage/storage_ensure_minimum_tls_version_12",
+            ),
+            (
+                "storage_ensure_encryption_with_customer_managed_keys",
+                "/root_dir/prowler/providers/azure/services/storage/storage_ensure_encryption_with_customer_managed_keys",
+            ),
+        ]
+        returned_checks = recover_checks_from_provider(provider)
+        assert returned_checks == expected_checks
+
+    @patch(
+        "prowler.lib.check.check.load_checks_manifest",
+        new=mock_load_checks_manifest,
+    )
+    @patch(
+        "prowler.lib.check.check.get_services_path",
+        new=mock_get_services_path,
+    )
+    def test_recover_checks_from_provider_service_not_found(self):
+        with pytest.raises(SystemExit) as error:
+            recover_checks_from_provider("azure", "not_found")
+        assert error.value.code == 1
+
     @patch("prowler.lib.check.check.walk_packages", new=mock_walk_packages)
     def test_list_modules(self):
         provider = "azure"
@@ -358,6 +417,26 @@ class Test_Check:
         expected_modules = list_modules(provider, service)
         assert expected_modules == expected_packages
 
+    def test_remove_service_clients_modules(self):
+        modules = {
+            "prowler.providers.aws.services.ec2": MagicMock(),
+            "prowler.providers.aws.services.ec2.ec2_service": MagicMock(),
+            "prowler.providers.aws.services.ec2.ec2_client": MagicMock(),
+            "prowler.providers.aws.services.ec2.ec2_instance_public_ip": MagicMock(),
+            "prowler.providers.aws.services.ec2.ec2_instance_public_ip.ec2_instance_public_ip": MagicMock(),
+            "prowler.providers.aws.services.ec2.lib.security_groups": MagicMock(),
+            "prowler.providers.azure.services.storage.storage_client": MagicMock(),
+        }
+        with patch.dict("sys.modules", modules):
+            remove_service_clients_modules("aws")
+            remaining_modules = set(modules).intersection(sys.modules)
+        assert remaining_modules == {
+            "prowler.providers.aws.services.ec2",
+            "prowler.providers.aws.services.ec2.ec2_service",
+            "prowler.providers.aws.services.ec2.lib.security_groups",
+            "prowler.providers.azure.services.storage.storage_client",
+        }
+
     @patch(
         "prowler.lib.check.check.recover_checks_from_provider",
         new=mock_recover_checks_from_aws_provider,
@@ -525,3 +604,351 @@ class Test_Check:
         assert audit_metadata.services_scanned == 1
         assert audit_metadata.expected_checks == expected_checks
         assert audit_metadata.completed_checks == 1
+
+    def test_group_checks_by_service(self):
+        checks_to_execute = [
+            "accessanalyzer_enabled_without_findings",
+            "ec2_ami_public",
+            "ec2_ebs_public_snapshot",
+            "iam_root_mfa_enabled",
+        ]
+        assert group_checks_by_service(checks_to_execute) == {
+            "accessanalyzer": ["accessanalyzer_enabled_without_findings"],
+            "ec2": ["ec2_ami_public", "ec2_ebs_public_snapshot"],
+            "iam": ["iam_root_mfa_enabled"],
+        }
+
+    def test_execute_checks_parallel(self):
+        checks_to_execute = [
+            "accessanalyzer_enabled_without_findings",
+            "ec2_ami_public",
+            "ec2_ebs_public_snapshot",
+            "iam_root_mfa_enabled",
+        ]
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = MagicMock()
+        audit_output_options.only_logs = True
+
+        def mock_execute(
+            service,
+            check_name,
+            provider,
+            audit_output_options,
+            audit_info,
+            services_executed,
+            checks_executed,
+            findings_aggregator=None,
+            scan_metrics=None,
+            deadlines=None,
+            checkpoint_journal=None,
+        ):
+            services_executed.add(service)
+            checks_executed.add(check_name)
+            return [check_name]
+
+        with patch("prowler.lib.check.check.execute", new=mock_execute):
+            findings = execute_checks(
+                checks_to_execute,
+                "aws",
+                audit_info,
+                audit_output_options,
+                parallel_checks=3,
+            )
+
+        # Findings keep the order of the sequential execution
+        assert findings == checks_to_execute
+        assert audit_info.audit_metadata.expected_checks == checks_to_execute
+
+    def test_execute_stream_findings(self):
+        from prowler.providers.common.models import Audit_Metadata
+
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audit_metadata = Audit_Metadata(
+            services_scanned=0,
+            expected_checks=["iam_root_mfa_enabled"],
+            completed_checks=0,
+            audit_progress=0,
+        )
+        audit_output_options = MagicMock()
+        findings_aggregator = MagicMock()
+        check_findings = [MagicMock(), MagicMock()]
+
+        with patch("prowler.lib.check.check.import_check"), patch(
+            "prowler.lib.check.check.run_check", return_value=check_findings
+        ), patch("prowler.lib.check.check.report") as mock_report:
+            findings = execute(
+                "iam",
+                "iam_root_mfa_enabled",
+                "aws",
+                audit_output_options,
+                audit_info,
+                set(),
+                set(),
+                findings_aggregator,
+            )
+
+        # The findings are reported and aggregated but not kept
+        assert findings == []
+        mock_report.assert_called_once_with(
+            check_findings, audit_output_options, audit_info
+        )
+        findings_aggregator.add_findings.assert_called_once_with(check_findings)
+        assert audit_info.audit_metadata.completed_checks == 1
+
+    def test_execute_checkpoint_journal(self):
+        from prowler.providers.common.models import Audit_Metadata
+
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audit_metadata = Audit_Metadata(
+            services_scanned=0,
+            expected_checks=["iam_root_mfa_enabled"],
+            completed_checks=0,
+            audit_progress=0,
+        )
+        checkpoint_journal = MagicMock()
+        check_findings = [MagicMock()]
+
+        with patch("prowler.lib.check.check.import_check"), patch(
+            "prowler.lib.check.check.run_check", return_value=check_findings
+        ), patch("prowler.lib.check.check.report"):
+            findings = execute(
+                "iam",
+                "iam_root_mfa_enabled",
+                "aws",
+                MagicMock(),
+                audit_info,
+                set(),
+                set(),
+                checkpoint_journal=checkpoint_journal,
+            )
+
+        assert findings == check_findings
+        checkpoint_journal.add_check.assert_called_once_with(
+            "iam_root_mfa_enabled", check_findings
+        )
+
+    def test_run_check_with_deadlines(self):
+        deadlines = Execution_Deadlines(check_timeout=5, service_timeout=5)
+        check_findings = [MagicMock()]
+
+        with patch(
+            "prowler.lib.check.check.build_service_client"
+        ) as mock_build_service_client, patch(
+            "prowler.lib.check.check.load_check"
+        ), patch(
+            "prowler.lib.check.check.run_check", return_value=check_findings
+        ):
+            findings = run_check_with_deadlines(
+                "ec2",
+                "ec2_instance_imdsv2_enabled",
+                "aws",
+                MagicMock(),
+                self.set_mocked_audit_info(),
+                deadlines,
+            )
+
+        assert findings == check_findings
+        mock_build_service_client.assert_called_once_with(
+            "prowler.providers.aws.services.ec2.ec2_client", ["instances"]
+        )
+
+    def test_run_check_with_deadlines_scan_metrics(self):
+        deadlines = Execution_Deadlines(check_timeout=5)
+        scan_metrics = Scan_Metrics()
+        check_findings = [MagicMock(region=AWS_REGION)]
+
+        def run_check(*_):
+            # The check uses CPU in the thread running it
+            start_cpu_time = thread_time()
+            while thread_time() - start_cpu_time < 0.05:
+                pass
+            return check_findings
+
+        with patch(
+            "prowler.lib.check.check.load_check", side_effect=lambda *_: sleep(0.5)
+        ), patch("prowler.lib.check.check.run_check", side_effect=run_check):
+            findings = run_check_with_deadlines(
+                "iam",
+                "iam_root_mfa_enabled",
+                "aws",
+                MagicMock(),
+                self.set_mocked_audit_info(),
+                deadlines,
+                scan_metrics,
+            )
+
+        assert findings == check_findings
+        check_metrics = scan_metrics.get_metrics()["checks"][0]
+        assert check_metrics["check"] == "iam_root_mfa_enabled"
+        assert check_metrics["findings"] == 1
+        # The usage is measured in the thread running the check, once it is loaded
+        assert check_metrics["cpu_time"] >= 0.05
+        assert check_metrics["wall_time"] < 0.5
+
+    def test_run_check_with_deadlines_check_timeout(self):
+        deadlines = Execution_Deadlines(check_timeout=0.1)
+        audit_output_options = MagicMock()
+        audit_output_options.bulk_checks_metadata = {
+            "iam_root_mfa_enabled": MagicMock()
+        }
+        release = threading.Event()
+
+        try:
+            with patch("prowler.lib.check.check.load_check"), patch(
+                "prowler.lib.check.check.run_check",
+                side_effect=lambda *_: release.wait(),
+            ), patch(
+                "prowler.lib.check.check.generate_timeout_finding"
+            ) as mock_generate_timeout_finding:
+                findings = run_check_with_deadlines(
+                    "iam",
+                    "iam_root_mfa_enabled",
+                    "aws",
+                    audit_output_options,
+                    self.set_mocked_audit_info(),
+                    deadlines,
+                )
+        finally:
+            release.set()
+
+        assert findings == [mock_generate_timeout_finding.return_value]
+        assert (
+            "exceeded its budget of 0.1 seconds"
+            in mock_generate_timeout_finding.call_args[0][2]
+        )
+
+    def test_run_check_with_deadlines_service_timeout(self):
+        deadlines = Execution_Deadlines(service_timeout=0.1)
+        audit_output_options = MagicMock()
+        audit_output_options.bulk_checks_metadata = {
+            "ec2_instance_imdsv2_enabled": MagicMock(),
+            "ec2_instance_public_ip": MagicMock(),
+        }
+        release = threading.Event()
+
+        try:
+            with patch(
+                "prowler.lib.check.check.build_service_client",
+                side_effect=lambda *_: release.wait(),
+            ) as mock_build_service_client, patch(
+                "prowler.lib.check.check.load_check"
+            ) as mock_load_check, patch(
+                "prowler.lib.check.check.generate_timeout_finding"
+            ) as mock_generate_timeout_finding:
+                for check_name in [
+                    "ec2_instance_imdsv2_enabled",
+                    "ec2_instance_public_ip",
+                ]:
+                    findings = run_check_with_deadlines(
+                        "ec2",
+                        check_name,
+                        "aws",
+                        audit_output_options,
+                        self.set_mocked_audit_info(),
+                        deadlines,
+                    )
+                    assert findings == [mock_generate_timeout_finding.return_value]
+        finally:
+            release.set()
+
+        # The service client is not built again once it has exceeded its budget
+        mock_build_service_client.assert_called_once()
+        mock_load_check.assert_not_called()
+        assert deadlines.is_service_client_timed_out(
+            "prowler.providers.aws.services.ec2.ec2_client"
+        )
+
+    def test_execute_checks_parallel_check_not_found(self):
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = MagicMock()
+        audit_output_options.only_logs = True
+
+        def mock_execute(*_):
+            raise ModuleNotFoundError
+
+        with patch("prowler.lib.check.check.execute", new=mock_execute):
+            with pytest.raises(SystemExit) as ex:
+                execute_checks(
+                    ["ec2_not_found_check"],
+                    "aws",
+                    audit_info,
+                    audit_output_options,
+                    parallel_checks=2,
+                )
+        assert ex.type == SystemExit
+
+    def test_recover_service_clients_from_checks(self):
+        checks_to_execute = [
+            "ec2_instance_imdsv2_enabled",
+            "cloudtrail_logs_s3_bucket_is_not_publicly_accessible",
+            "ec2_not_found_check",
+        ]
+        assert recover_service_clients_from_checks(checks_to_execute, "aws") == {
+            "prowler.providers.aws.services.cloudtrail.cloudtrail_client": ["trails"],
+            "prowler.providers.aws.services.ec2.ec2_client": ["instances"],
+            "prowler.providers.aws.services.s3.s3_client": ["buckets"],
+        }
+
+    def test_build_service_client(self):
+        calls = []
+
+        class Service:
+            def __start_collecting__(self, attributes):
+                calls.append(("__start_collecting__", attributes))
+
+            @property
+            def credential_report(self):
+                calls.append("credential_report")
+
+        service_client_module = MagicMock()
+        service_client_module.iam_client = Service()
+        with patch(
+            "prowler.lib.check.check.importlib.import_module",
+            return_value=service_client_module,
+        ):
+            build_service_client(
+                "prowler.providers.aws.services.iam.iam_client", ["credential_report"]
+            )
+        # The attributes AWS takes long to generate are started before retrieving them
+        assert calls == [
+            ("__start_collecting__", ["credential_report"]),
+            "credential_report",
+        ]
+
+    def test_warm_up_services(self):
+        checks_to_execute = [
+            "ec2_instance_imdsv2_enabled",
+            "cloudtrail_logs_s3_bucket_is_not_publicly_accessible",
+        ]
+        audit_output_options = MagicMock()
+        audit_output_options.only_logs = True
+        imported_modules = {}
+
+        def import_module(service_client):
+            imported_modules[service_client] = MagicMock()
+            return imported_modules[service_client]
+
+        with patch(
+            "prowler.lib.check.check.importlib.import_module",
+            new=import_module,
+        ):
+            services_timing = warm_up_services(
+                checks_to_execute, "aws", 2, audit_output_options
+            )
+
+        assert sorted(imported_modules) == [
+            "prowler.providers.aws.services.cloudtrail.cloudtrail_client",
+            "prowler.providers.aws.services.ec2.ec2_client",
+            "prowler.providers.aws.services.s3.s3_client",
+        ]
+        assert sorted(services_timing.keys()) == [
+            "cloudtrail_client",
+            "ec2_client",
+            "s3_client",
+        ]
+        # Only the attributes read by the checks are retrieved
+        ec2_client = imported_modules[
+            "prowler.providers.aws.services.ec2.ec2_client"
+        ].ec2_client
+        assert "instances" in dir(ec2_client)
+        assert "security_groups" not in dir(ec2_client)
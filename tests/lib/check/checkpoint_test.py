@@ -0,0 +1,166 @@
+import json
+from types import SimpleNamespace
+
+from fixtures.bulk_checks_metadata import test_bulk_checks_metadata
+
+from prowler.config.config import csv_file_suffix, json_file_suffix
+from prowler.lib.check.checkpoint import (
+    Checkpoint_Journal,
+    get_checkpoint_journal_path,
+    read_checkpoint_journal,
+    replay_completed_checks,
+    restore_output_files,
+)
+from prowler.lib.outputs.json import close_json
+from prowler.lib.outputs.outputs import Findings_Aggregator
+
+OUTPUT_FILENAME = "prowler-output-123456789012"
+
+
+def get_finding(status: str, resource_id: str):
+    return SimpleNamespace(status=status, resource_id=resource_id)
+
+
+class Test_Checkpoint:
+    def test_checkpoint_journal(self, tmp_path):
+        tmp_path = str(tmp_path)
+        journal_file_path = get_checkpoint_journal_path(tmp_path, OUTPUT_FILENAME)
+        json_file_path = f"{tmp_path}/{OUTPUT_FILENAME}{json_file_suffix}"
+
+        checkpoint_journal = Checkpoint_Journal(
+            journal_file_path, ["json"], tmp_path, OUTPUT_FILENAME
+        )
+        with open(json_file_path, "w") as json_file:
+            json_file.write('[{"Status": "PASS"},')
+        checkpoint_journal.add_check(
+            "vpc_subnet_different_az", [get_finding("PASS", "vpc-1")]
+        )
+        checkpoint_journal.close()
+
+        checkpoint, completed_checks, offsets = read_checkpoint_journal(
+            journal_file_path
+        )
+        assert checkpoint["output_directory"] == tmp_path
+        assert checkpoint["output_filename"] == OUTPUT_FILENAME
+        # The output file did not exist when the scan started
+        assert checkpoint["offsets"] == {json_file_path: 0}
+        assert completed_checks == {
+            "vpc_subnet_different_az": {
+                "check": "vpc_subnet_different_az",
+                "findings": [["PASS", "vpc-1"]],
+                "offsets": {json_file_path: 20},
+            }
+        }
+        assert offsets == {json_file_path: 20}
+
+    def test_checkpoint_journal_new_scan(self, tmp_path):
+        tmp_path = str(tmp_path)
+        journal_file_path = get_checkpoint_journal_path(tmp_path, OUTPUT_FILENAME)
+        checkpoint_journal = Checkpoint_Journal(
+            journal_file_path, [], tmp_path, OUTPUT_FILENAME
+        )
+        checkpoint_journal.add_check("vpc_subnet_different_az", [])
+        checkpoint_journal.close()
+
+        # A new scan with the same output filename starts a new journal
+        Checkpoint_Journal(journal_file_path, [], tmp_path, OUTPUT_FILENAME).close()
+        _, completed_checks, _ = read_checkpoint_journal(journal_file_path)
+        assert completed_checks == {}
+
+    def test_read_checkpoint_journal_incomplete_entry(self, tmp_path):
+        tmp_path = str(tmp_path)
+        journal_file_path = get_checkpoint_journal_path(tmp_path, OUTPUT_FILENAME)
+        checkpoint_journal = Checkpoint_Journal(
+            journal_file_path, [], tmp_path, OUTPUT_FILENAME
+        )
+        checkpoint_journal.add_check("vpc_subnet_different_az", [])
+        # The scan was interrupted while writing the next entry
+        checkpoint_journal.journal_file.write('{"check": "vpc_subnet_separate')
+        checkpoint_journal.close()
+
+        _, completed_checks, _ = read_checkpoint_journal(journal_file_path)
+        assert list(completed_checks) == ["vpc_subnet_different_az"]
+
+        # The entries of the resumed scan are appended after the last complete one
+        checkpoint_journal = Checkpoint_Journal(
+            journal_file_path, [], tmp_path, OUTPUT_FILENAME, resume=True
+        )
+        checkpoint_journal.add_check("vpc_subnet_separate_private_public", [])
+        checkpoint_journal.close()
+
+        _, completed_checks, _ = read_checkpoint_journal(journal_file_path)
+        assert list(completed_checks) == [
+            "vpc_subnet_different_az",
+            "vpc_subnet_separate_private_public",
+        ]
+
+    def test_resume_keeps_json_valid(self, tmp_path):
+        tmp_path = str(tmp_path)
+        journal_file_path = get_checkpoint_journal_path(tmp_path, OUTPUT_FILENAME)
+        json_file_path = f"{tmp_path}/{OUTPUT_FILENAME}{json_file_suffix}"
+        checkpoint_journal = Checkpoint_Journal(
+            journal_file_path, ["json"], tmp_path, OUTPUT_FILENAME
+        )
+        with open(json_file_path, "w") as json_file:
+            json_file.write('[{"CheckID": "vpc_subnet_different_az"},')
+        checkpoint_journal.add_check("vpc_subnet_different_az", [])
+        # The scan was interrupted while reporting the next check
+        with open(json_file_path, "a") as json_file:
+            json_file.write('{"CheckID": "vpc_subnet_sep')
+        checkpoint_journal.close()
+
+        _, _, offsets = read_checkpoint_journal(journal_file_path)
+        restore_output_files(offsets)
+        with open(json_file_path, "a") as json_file:
+            json_file.write('{"CheckID": "vpc_subnet_separate_private_public"},')
+        close_json(OUTPUT_FILENAME, tmp_path, "json")
+
+        with open(json_file_path) as json_file:
+            assert json.load(json_file) == [
+                {"CheckID": "vpc_subnet_different_az"},
+                {"CheckID": "vpc_subnet_separate_private_public"},
+            ]
+
+    def test_restore_output_files(self, tmp_path):
+        json_file_path = f"{tmp_path}/{OUTPUT_FILENAME}{json_file_suffix}"
+        csv_file_path = f"{tmp_path}/{OUTPUT_FILENAME}{csv_file_suffix}"
+        # The JSON file was closed after all the checks were completed
+        with open(json_file_path, "w") as json_file:
+            json_file.write('[{"Status": "PASS"}]')
+        # The CSV file was created by the check being executed
+        with open(csv_file_path, "w") as csv_file:
+            csv_file.write("ASSESSMENT_START_TIME;FINDING_UNIQUE_ID\n")
+
+        restore_output_files({json_file_path: 19, csv_file_path: 0})
+
+        with open(json_file_path) as json_file:
+            assert json_file.read() == '[{"Status": "PASS"}'
+        assert not (tmp_path / f"{OUTPUT_FILENAME}{csv_file_suffix}").exists()
+
+    def test_replay_completed_checks(self):
+        findings_aggregator = Findings_Aggregator(test_bulk_checks_metadata)
+        completed_checks = {
+            "vpc_subnet_different_az": {
+                "check": "vpc_subnet_different_az",
+                "findings": [["PASS", "vpc-1"], ["FAIL", "vpc-2"]],
+                "offsets": {},
+            },
+            "workspaces_volume_encryption_enabled": {
+                "check": "workspaces_volume_encryption_enabled",
+                "findings": [["FAIL", "workspace-1"]],
+                "offsets": {},
+            },
+        }
+
+        replay_completed_checks(
+            completed_checks, test_bulk_checks_metadata, findings_aggregator
+        )
+
+        assert findings_aggregator.statistics.get_statistics() == {
+            "total_pass": 1,
+            "total_fail": 2,
+            "resources_count": 3,
+            "findings_count": 3,
+        }
+        assert findings_aggregator.summary.services["vpc"]["Total"] == 2
+        assert findings_aggregator.summary.services["workspaces"]["Total"] == 1
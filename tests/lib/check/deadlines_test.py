@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+from mock import MagicMock
+
+from prowler.lib.check.deadlines import (
+    Execution_Deadlines,
+    generate_timeout_finding,
+    run_with_deadline,
+)
+from prowler.lib.check.models import Check_Metadata_Model
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+
+
+def get_check_metadata(provider: str, service: str) -> Check_Metadata_Model:
+    return Check_Metadata_Model(
+        Provider=provider,
+        CheckID=f"{service}_check",
+        CheckTitle="Check",
+        CheckType=[],
+        ServiceName=service,
+        SubServiceName="",
+        ResourceIdTemplate="",
+        Severity="low",
+        ResourceType="",
+        Description="",
+        Risk="",
+        RelatedUrl="",
+        Remediation={
+            "Code": {"CLI": "", "NativeIaC": "", "Other": "", "Terraform": ""},
+            "Recommendation": {"Text": "", "Url": ""},
+        },
+        Categories=[],
+        DependsOn=[],
+        RelatedTo=[],
+        Notes="",
+    )
+
+
+class Test_Deadlines:
+    def test_run_with_deadline(self):
+        assert run_with_deadline(sum, 1, [1, 2]) == (True, 3)
+
+    def test_run_with_deadline_no_timeout(self):
+        # Without timeout the function runs in the current thread
+        assert run_with_deadline(threading.get_ident, None) == (
+            True,
+            threading.get_ident(),
+        )
+
+    def test_run_with_deadline_exceeded(self):
+        release = threading.Event()
+        try:
+            assert run_with_deadline(release.wait, 0.1) == (False, None)
+        finally:
+            release.set()
+
+    def test_run_with_deadline_error(self):
+        def fail():
+            raise ModuleNotFoundError
+
+        with pytest.raises(ModuleNotFoundError):
+            run_with_deadline(fail, 1)
+
+    def test_execution_deadlines(self):
+        deadlines = Execution_Deadlines(check_timeout=60, service_timeout=300)
+        service_client = "prowler.providers.aws.services.iam.iam_client"
+        assert not deadlines.is_service_client_timed_out(service_client)
+
+        deadlines.add_timed_out_service_client(service_client)
+
+        assert deadlines.is_service_client_timed_out(service_client)
+        assert deadlines.check_timeout == 60
+        assert deadlines.service_timeout == 300
+
+    def test_generate_timeout_finding_aws(self):
+        audit_info = MagicMock()
+        audit_info.profile_region = "eu-west-1"
+        audit_info.audited_account_arn = f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root"
+
+        finding = generate_timeout_finding(
+            get_check_metadata("aws", "iam"), audit_info, "Timeout"
+        )
+
+        assert finding.status == "INFO"
+        assert finding.status_extended == "Timeout"
+        assert finding.check_metadata.CheckID == "iam_check"
+        assert finding.region == "eu-west-1"
+        assert finding.resource_id == "iam"
+        assert finding.resource_arn == f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root"
+
+    def test_generate_timeout_finding_azure(self):
+        finding = generate_timeout_finding(
+            get_check_metadata("azure", "storage"), MagicMock(), "Timeout"
+        )
+
+        assert finding.status == "INFO"
+        assert finding.resource_name == "storage"
+        assert finding.resource_id == "storage"
+        assert finding.subscription == ""
+
+    def test_generate_timeout_finding_gcp(self):
+        audit_info = MagicMock()
+        audit_info.default_project_id = "project"
+
+        finding = generate_timeout_finding(
+            get_check_metadata("gcp", "compute"), audit_info, "Timeout"
+        )
+
+        assert finding.status == "INFO"
+        assert finding.resource_id == "compute"
+        assert finding.project_id == "project"
+        assert finding.location == "global"
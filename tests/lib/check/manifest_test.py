@@ -0,0 +1,189 @@
+import json
+import os
+from contextlib import contextmanager
+
+from mock import patch
+
+from prowler.lib.check.manifest import (
+    discover_service_checks,
+    discover_services,
+    generate_checks_manifest,
+    get_cached_checks_manifest_path,
+    load_checks_manifest,
+    write_checks_manifest,
+)
+
+PROVIDER = "aws"
+
+
+def create_check(services_path, service, check_name):
+    check_path = services_path / service / check_name
+    check_path.mkdir(parents=True)
+    (check_path / "__init__.py").touch()
+    (check_path / f"{check_name}.py").touch()
+    (check_path / f"{check_name}.metadata.json").touch()
+
+
+def create_services(tmp_path):
+    services_path = tmp_path / "services"
+    for service in ["ec2", "iam"]:
+        (services_path / service).mkdir(parents=True)
+        (services_path / service / "__init__.py").touch()
+    create_check(services_path, "ec2", "ec2_ami_public")
+    create_check(services_path, "ec2", "ec2_ebs_public_snapshot")
+    create_check(services_path, "iam", "iam_root_mfa_enabled")
+    # Shared libraries and folders which are not packages are not checks
+    (services_path / "ec2" / "lib").mkdir()
+    (services_path / "ec2" / "lib" / "__init__.py").touch()
+    (services_path / "__pycache__").mkdir()
+    return services_path
+
+
+@contextmanager
+def patch_manifest_paths(tmp_path, services_path):
+    # The manifest of the patched services folder is not memoized beyond the test
+    load_checks_manifest.cache_clear()
+    with patch(
+        "prowler.lib.check.manifest.get_services_path",
+        return_value=str(services_path),
+    ), patch(
+        "prowler.lib.check.manifest.get_checks_manifest_path",
+        return_value=str(tmp_path / "checks_manifest.json"),
+    ), patch(
+        "prowler.lib.check.manifest.default_cache_directory", str(tmp_path / "cache")
+    ):
+        try:
+            yield
+        finally:
+            load_checks_manifest.cache_clear()
+
+
+@contextmanager
+def assert_not_discovered():
+    with patch(
+        "prowler.lib.check.manifest.discover_service_checks"
+    ) as discover_service_checks_mock, patch(
+        "prowler.lib.check.manifest.discover_services"
+    ) as discover_services_mock:
+        yield
+        discover_services_mock.assert_not_called()
+        discover_service_checks_mock.assert_not_called()
+
+
+class Test_Checks_Manifest:
+    def test_discover_services(self, tmp_path):
+        services_path = create_services(tmp_path)
+        with patch(
+            "prowler.lib.check.manifest.get_services_path",
+            return_value=str(services_path),
+        ):
+            assert discover_services(PROVIDER) == ["ec2", "iam"]
+
+    def test_discover_service_checks(self, tmp_path):
+        services_path = create_services(tmp_path)
+        with patch(
+            "prowler.lib.check.manifest.get_services_path",
+            return_value=str(services_path),
+        ):
+            assert discover_service_checks(PROVIDER, "ec2") == {
+                "ec2_ami_public": {
+                    "module": "prowler.providers.aws.services.ec2.ec2_ami_public.ec2_ami_public",
+                    "metadata": "ec2/ec2_ami_public/ec2_ami_public.metadata.json",
+                },
+                "ec2_ebs_public_snapshot": {
+                    "module": "prowler.providers.aws.services.ec2.ec2_ebs_public_snapshot.ec2_ebs_public_snapshot",
+                    "metadata": "ec2/ec2_ebs_public_snapshot/ec2_ebs_public_snapshot.metadata.json",
+                },
+            }
+
+    def test_load_checks_manifest(self, tmp_path):
+        services_path = create_services(tmp_path)
+        with patch_manifest_paths(tmp_path, services_path):
+            checks_manifest = load_checks_manifest(PROVIDER)
+            assert list(checks_manifest.keys()) == ["ec2", "iam"]
+            assert list(checks_manifest["ec2"].keys()) == [
+                "ec2_ami_public",
+                "ec2_ebs_public_snapshot",
+            ]
+            assert list(checks_manifest["iam"].keys()) == ["iam_root_mfa_enabled"]
+            # The manifest is stored in the cache for the next executions, never within the package
+            with open(get_cached_checks_manifest_path(PROVIDER)) as manifest_file:
+                assert json.load(manifest_file) == generate_checks_manifest(PROVIDER)
+            assert not os.path.exists(tmp_path / "checks_manifest.json")
+
+    def test_load_checks_manifest_valid(self, tmp_path):
+        services_path = create_services(tmp_path)
+        with patch_manifest_paths(tmp_path, services_path):
+            load_checks_manifest(PROVIDER)
+            load_checks_manifest.cache_clear()
+            # If the services have not changed they are not discovered again
+            with assert_not_discovered():
+                checks_manifest = load_checks_manifest(PROVIDER)
+            assert list(checks_manifest["ec2"].keys()) == [
+                "ec2_ami_public",
+                "ec2_ebs_public_snapshot",
+            ]
+
+    def test_load_checks_manifest_memoized(self, tmp_path):
+        services_path = create_services(tmp_path)
+        with patch_manifest_paths(tmp_path, services_path):
+            checks_manifest = load_checks_manifest(PROVIDER)
+            # It is loaded once per provider, without reading the files or scanning the folders again
+            with assert_not_discovered(), patch(
+                "prowler.lib.check.manifest.read_checks_manifest"
+            ) as read_checks_manifest_mock, patch(
+                "prowler.lib.check.manifest.get_folder_key"
+            ) as get_folder_key_mock:
+                assert load_checks_manifest(PROVIDER) is checks_manifest
+            read_checks_manifest_mock.assert_not_called()
+            get_folder_key_mock.assert_not_called()
+
+    def test_load_checks_manifest_shipped(self, tmp_path):
+        services_path = create_services(tmp_path)
+        with patch_manifest_paths(tmp_path, services_path):
+            write_checks_manifest(
+                str(tmp_path / "checks_manifest.json"),
+                generate_checks_manifest(PROVIDER),
+            )
+            # Installing the package changes the mtimes and compiles the modules
+            (services_path / "ec2" / "__pycache__").mkdir()
+            os.utime(services_path / "ec2", ns=(0, 0))
+            with assert_not_discovered():
+                checks_manifest = load_checks_manifest(PROVIDER)
+            assert list(checks_manifest.keys()) == ["ec2", "iam"]
+            assert not os.path.exists(get_cached_checks_manifest_path(PROVIDER))
+
+    def test_load_checks_manifest_shipped_other_version(self, tmp_path):
+        services_path = create_services(tmp_path)
+        with patch_manifest_paths(tmp_path, services_path):
+            checks_manifest = generate_checks_manifest(PROVIDER)
+            checks_manifest["version"] = "0.0.0"
+            checks_manifest["services"]["iam"]["checks"] = {}
+            write_checks_manifest(
+                str(tmp_path / "checks_manifest.json"), checks_manifest
+            )
+            assert list(load_checks_manifest(PROVIDER)["iam"].keys()) == [
+                "iam_root_mfa_enabled"
+            ]
+
+    def test_load_checks_manifest_custom_check(self, tmp_path):
+        services_path = create_services(tmp_path)
+        with patch_manifest_paths(tmp_path, services_path):
+            load_checks_manifest(PROVIDER)
+            create_check(services_path, "iam", "iam_custom_check")
+            load_checks_manifest.cache_clear()
+            checks_manifest = load_checks_manifest(PROVIDER)
+            assert list(checks_manifest["iam"].keys()) == [
+                "iam_custom_check",
+                "iam_root_mfa_enabled",
+            ]
+
+    def test_load_checks_manifest_invalid_file(self, tmp_path):
+        services_path = create_services(tmp_path)
+        with patch_manifest_paths(tmp_path, services_path):
+            cached_checks_manifest_path = get_cached_checks_manifest_path(PROVIDER)
+            os.makedirs(os.path.dirname(cached_checks_manifest_path), mode=0o700)
+            with open(cached_checks_manifest_path, "w") as manifest_file:
+                manifest_file.write("not a json")
+            checks_manifest = load_checks_manifest(PROVIDER)
+            assert list(checks_manifest.keys()) == ["ec2", "iam"]
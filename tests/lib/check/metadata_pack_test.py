@@ -0,0 +1,122 @@
+import os
+import pickle
+
+from mock import patch
+
+from prowler.lib.check.metadata_pack import (
+    Compliance_Frameworks,
+    build_metadata_pack,
+    load_metadata_pack,
+)
+
+PROVIDER = "aws"
+
+
+class Test_Metadata_Pack:
+    def test_compliance_frameworks_lazy_loading(self):
+        serialized_frameworks = {
+            "framework_a": pickle.dumps({"Framework": "A"}),
+            "framework_b": pickle.dumps({"Framework": "B"}),
+        }
+        compliance_frameworks = Compliance_Frameworks(serialized_frameworks)
+        assert list(compliance_frameworks.keys()) == ["framework_a", "framework_b"]
+        assert len(compliance_frameworks) == 2
+        assert "framework_a" in compliance_frameworks
+        # The frameworks are not deserialized until they are accessed
+        assert compliance_frameworks.frameworks == {}
+        assert compliance_frameworks["framework_b"] == {"Framework": "B"}
+        assert list(compliance_frameworks.frameworks.keys()) == ["framework_b"]
+
+    def test_load_metadata_pack(self, tmp_path):
+        with patch(
+            "prowler.lib.check.metadata_pack.default_cache_directory", str(tmp_path)
+        ):
+            bulk_checks_metadata, bulk_compliance_frameworks = load_metadata_pack(
+                PROVIDER
+            )
+            assert os.path.isfile(tmp_path / f"metadata_pack_{PROVIDER}.pickle")
+            assert (
+                os.stat(tmp_path / f"metadata_pack_{PROVIDER}.pickle").st_mode & 0o777
+                == 0o600
+            )
+
+            # The second time the metadata pack is loaded from the cache
+            with patch(
+                "prowler.lib.check.metadata_pack.build_metadata_pack"
+            ) as build_metadata_pack_mock:
+                (
+                    cached_bulk_checks_metadata,
+                    cached_bulk_compliance_frameworks,
+                ) = load_metadata_pack(PROVIDER)
+                build_metadata_pack_mock.assert_not_called()
+
+        assert isinstance(cached_bulk_compliance_frameworks, Compliance_Frameworks)
+        assert cached_bulk_checks_metadata == bulk_checks_metadata
+        assert list(cached_bulk_compliance_frameworks.keys()) == list(
+            bulk_compliance_frameworks.keys()
+        )
+        assert (
+            cached_bulk_compliance_frameworks["cis_1.5_aws"]
+            == bulk_compliance_frameworks["cis_1.5_aws"]
+        )
+        # The checks metadata includes the compliance frameworks
+        assert cached_bulk_checks_metadata["iam_root_mfa_enabled"].Compliance
+        assert "manual_check" in cached_bulk_checks_metadata
+
+    def test_load_metadata_pack_fingerprint_changed(self, tmp_path):
+        with patch(
+            "prowler.lib.check.metadata_pack.default_cache_directory", str(tmp_path)
+        ):
+            load_metadata_pack(PROVIDER)
+            with patch(
+                "prowler.lib.check.metadata_pack.get_metadata_pack_fingerprint",
+                return_value="new_fingerprint",
+            ), patch(
+                "prowler.lib.check.metadata_pack.build_metadata_pack",
+                wraps=build_metadata_pack,
+            ) as build_metadata_pack_mock:
+                load_metadata_pack(PROVIDER)
+                build_metadata_pack_mock.assert_called_once_with(PROVIDER)
+
+            with open(tmp_path / f"metadata_pack_{PROVIDER}.pickle", "rb") as pack:
+                assert pickle.load(pack)["fingerprint"] == "new_fingerprint"
+
+    def test_load_metadata_pack_corrupted(self, tmp_path):
+        (tmp_path / f"metadata_pack_{PROVIDER}.pickle").write_bytes(b"corrupted")
+        with patch(
+            "prowler.lib.check.metadata_pack.default_cache_directory", str(tmp_path)
+        ):
+            bulk_checks_metadata, _ = load_metadata_pack(PROVIDER)
+        assert "iam_root_mfa_enabled" in bulk_checks_metadata
+
+    def test_load_metadata_pack_cache_not_writable(self, tmp_path):
+        cache_file = tmp_path / "cache_file"
+        cache_file.touch()
+        with patch(
+            "prowler.lib.check.metadata_pack.default_cache_directory",
+            str(cache_file / "prowler"),
+        ):
+            bulk_checks_metadata, _ = load_metadata_pack(PROVIDER)
+        assert "iam_root_mfa_enabled" in bulk_checks_metadata
+
+    def test_load_metadata_pack_not_private(self, tmp_path):
+        with patch(
+            "prowler.lib.check.metadata_pack.default_cache_directory", str(tmp_path)
+        ):
+            load_metadata_pack(PROVIDER)
+            pack_path = tmp_path / f"metadata_pack_{PROVIDER}.pickle"
+            # A pack that other users could have replaced is never unpickled
+            pack_path.write_bytes(pickle.dumps({"fingerprint": None}))
+            os.chmod(tmp_path, 0o777)
+            with patch("prowler.lib.check.metadata_pack.pickle.load") as pickle_load:
+                bulk_checks_metadata, _ = load_metadata_pack(PROVIDER)
+            pickle_load.assert_not_called()
+            assert "iam_root_mfa_enabled" in bulk_checks_metadata
+            # Neither through a symlink
+            os.chmod(tmp_path, 0o700)
+            planted_path = tmp_path / "planted.pickle"
+            pack_path.rename(planted_path)
+            pack_path.symlink_to(planted_path)
+            with patch("prowler.lib.check.metadata_pack.pickle.load") as pickle_load:
+                load_metadata_pack(PROVIDER)
+            pickle_load.assert_not_called()
@@ -0,0 +1,87 @@
+import os
+import sys
+
+import pytest
+from mock import MagicMock, patch
+
+from prowler.lib.check.models import (
+    Check_Report_AWS,
+    Check_Report_Azure,
+    Check_Report_GCP,
+    Shared_Check_Metadata_Model,
+    load_check_metadata,
+)
+
+metadata_file = f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+
+
+def iam_root_mfa_enabled():
+    # The check is imported without building its service client
+    with patch.dict(
+        sys.modules,
+        {"prowler.providers.aws.services.iam.iam_client": MagicMock()},
+    ):
+        from prowler.providers.aws.services.iam.iam_root_mfa_enabled.iam_root_mfa_enabled import (
+            iam_root_mfa_enabled,
+        )
+
+        return iam_root_mfa_enabled()
+
+
+class Test_Check_Report:
+    def test_check_metadata_shared(self):
+        check = iam_root_mfa_enabled()
+        assert isinstance(check.metadata(), Shared_Check_Metadata_Model)
+        assert check.metadata() is check.metadata()
+        assert check.metadata().CheckID == "iam_root_mfa_enabled"
+
+        first_report = Check_Report_AWS(check.metadata())
+        second_report = Check_Report_AWS(check.metadata())
+        assert first_report.check_metadata is second_report.check_metadata
+
+    def test_check_metadata_immutable(self):
+        check = iam_root_mfa_enabled()
+        report = Check_Report_AWS(check.metadata())
+        with pytest.raises(TypeError):
+            report.check_metadata.Severity = "low"
+        assert check.metadata().Severity == check.Severity
+
+    def test_check_metadata_remediation_immutable(self):
+        check = iam_root_mfa_enabled()
+        report = Check_Report_AWS(check.metadata())
+        with pytest.raises(TypeError):
+            report.check_metadata.Remediation.Recommendation.Url = ""
+        with pytest.raises(TypeError):
+            report.check_metadata.Remediation.Code.CLI = ""
+        assert (
+            check.metadata().Remediation.Recommendation.Url
+            == check.Remediation.Recommendation.Url
+        )
+
+    def test_check_report_from_json_metadata(self):
+        metadata = load_check_metadata(metadata_file)
+        first_report = Check_Report_AWS(metadata.json())
+        second_report = Check_Report_AWS(metadata.json())
+        assert first_report.check_metadata == metadata
+        # The same metadata is only parsed once
+        assert first_report.check_metadata is second_report.check_metadata
+
+    def test_check_report_slots(self):
+        metadata = load_check_metadata(metadata_file)
+        for report_class in [Check_Report_AWS, Check_Report_Azure, Check_Report_GCP]:
+            report = report_class(metadata)
+            assert not hasattr(report, "__dict__")
+            with pytest.raises(AttributeError):
+                report.unknown_attribute = "value"
+
+    def test_check_report_aws(self):
+        metadata = load_check_metadata(metadata_file)
+        report = Check_Report_AWS(metadata)
+        report.status = "PASS"
+        report.resource_id = "test-resource"
+        assert report.status == "PASS"
+        assert report.status_extended == ""
+        assert report.resource_id == "test-resource"
+        assert report.resource_arn == ""
+        assert report.region == ""
+        assert report.resource_tags == []
@@ -0,0 +1,80 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import prowler
+
+# Modules that are only needed to scan with a provider or to write the outputs
+heavy_modules = [
+    "alive_progress",
+    "azure.identity",
+    "boto3",
+    "detect_secrets",
+    "googleapiclient",
+    "prowler.lib.outputs.outputs",
+    "prowler.providers.common.audit_info",
+    "requests",
+    "slack_sdk",
+    "tabulate",
+]
+
+# Modules imported by the commands that do not scan. The number of modules is used as budget instead
+# of the import time since it does not depend on the load of the machine running the tests
+imported_modules_budget = 250
+
+
+def get_import_times(arguments: list, cache_directory: str) -> dict:
+    """
+    get_import_times runs Prowler with the arguments and returns the cumulative import time, in seconds, of
+    every module imported by Prowler, including the modules imported lazily
+    """
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "from prowler.__main__ import prowler; prowler()",
+            *arguments,
+        ],
+        cwd=pathlib.Path(prowler.__file__).parent.parent,
+        env={**os.environ, "PROWLER_CACHE_DIR": cache_directory},
+        capture_output=True,
+        text=True,
+    )
+    assert process.returncode == 0, process.stderr
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative_time, module = line.split("|")
+            import_times[module.strip()] = int(cumulative_time) / 1000000
+    # The modules imported before are the ones of the interpreter startup
+    modules = list(import_times)
+    prowler_modules = modules[modules.index("site") + 1 :]
+    return {module: import_times[module] for module in prowler_modules}
+
+
+class Test_Import_Time:
+    def assert_command_import_time(self, arguments: list, cache_directory: str):
+        import_times = get_import_times([*arguments, "-b"], cache_directory)
+        for module in heavy_modules:
+            assert module not in import_times, f"{module} imported by {arguments}"
+        assert (
+            len(import_times) < imported_modules_budget
+        ), f"{len(import_times)} modules imported in {import_times['prowler.__main__']} seconds by {arguments}"
+
+    def test_aws_list_checks(self, tmp_path):
+        self.assert_command_import_time(["aws", "--list-checks"], str(tmp_path))
+
+    def test_aws_list_services(self, tmp_path):
+        self.assert_command_import_time(["aws", "--list-services"], str(tmp_path))
+
+    def test_aws_list_compliance(self, tmp_path):
+        self.assert_command_import_time(["aws", "--list-compliance"], str(tmp_path))
+
+    def test_azure_list_checks(self, tmp_path):
+        self.assert_command_import_time(["azure", "--list-checks"], str(tmp_path))
+
+    def test_gcp_list_categories(self, tmp_path):
+        self.assert_command_import_time(["gcp", "--list-categories"], str(tmp_path))
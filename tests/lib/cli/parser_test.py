@@ -635,6 +635,158 @@ class Test_Parser:
         assert len(parsed.list_compliance_requirements) == 1
         assert framework in parsed.list_compliance_requirements
 
+    def test_execution_parser_parallel_checks_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.parallel_checks
+
+    def test_execution_parser_parallel_checks(self):
+        argument = "--parallel-checks"
+        workers = "8"
+        command = [prowler_command, argument, workers]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == int(workers)
+
+    def test_execution_parser_parallel_checks_invalid(self):
+        argument = "--parallel-checks"
+        workers = "0"
+        command = [prowler_command, argument, workers]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_execution_parser_parallel_checks_without_value(self):
+        # A value is required, the flag alone does nothing
+        command = [prowler_command, "--parallel-checks"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_execution_parser_warm_up_services_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.warm_up_services
+
+    def test_execution_parser_warm_up_services_default_concurrency(self):
+        argument = "--warm-up-services"
+        command = [prowler_command, argument]
+        parsed = self.parser.parse(command)
+        assert parsed.warm_up_services == 10
+
+    def test_execution_parser_warm_up_services(self):
+        argument = "--warm-up-services"
+        concurrency = "4"
+        command = [prowler_command, argument, concurrency]
+        parsed = self.parser.parse(command)
+        assert parsed.warm_up_services == int(concurrency)
+
+    def test_execution_parser_max_workers_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.max_workers
+
+    def test_execution_parser_max_workers(self):
+        argument = "--max-workers"
+        workers = "16"
+        command = [prowler_command, argument, workers]
+        parsed = self.parser.parse(command)
+        assert parsed.max_workers == int(workers)
+
+    def test_execution_parser_max_workers_invalid(self):
+        argument = "--max-workers"
+        workers = "0"
+        command = [prowler_command, argument, workers]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_execution_parser_max_workers_without_value(self):
+        # A value is required, the flag alone does nothing
+        command = [prowler_command, "--max-workers"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_execution_parser_stream_findings_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.stream_findings
+
+    def test_execution_parser_stream_findings(self):
+        argument = "--stream-findings"
+        command = [prowler_command, argument]
+        parsed = self.parser.parse(command)
+        assert parsed.stream_findings
+
+    def test_execution_parser_scan_metrics_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.scan_metrics
+
+    def test_execution_parser_scan_metrics(self):
+        argument = "--scan-metrics"
+        metrics_file = "scan_metrics.json"
+        command = [prowler_command, argument, metrics_file]
+        parsed = self.parser.parse(command)
+        assert parsed.scan_metrics == metrics_file
+
+    def test_execution_parser_scan_metrics_without_value(self):
+        # A value is required, the flag alone does nothing
+        command = [prowler_command, "--scan-metrics"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_execution_parser_timeouts_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.check_timeout
+        assert not parsed.service_timeout
+
+    def test_execution_parser_timeouts(self):
+        command = [prowler_command, "--check-timeout", "60", "--service-timeout", "300"]
+        parsed = self.parser.parse(command)
+        assert parsed.check_timeout == 60
+        assert parsed.service_timeout == 300
+
+    def test_execution_parser_check_timeout_invalid(self):
+        command = [prowler_command, "--check-timeout", "0"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_execution_parser_check_timeout_without_value(self):
+        # A value is required, the flag alone does nothing
+        command = [prowler_command, "--check-timeout"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_execution_parser_service_timeout_without_value(self):
+        # A value is required, the flag alone does nothing
+        command = [prowler_command, "--service-timeout"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_execution_parser_resume_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.resume
+
+    def test_execution_parser_resume(self):
+        journal_file = "output/prowler-output_checkpoint.jsonl"
+        command = [prowler_command, "--resume", journal_file]
+        parsed = self.parser.parse(command)
+        assert parsed.resume == journal_file
+
+    def test_execution_parser_resume_without_value(self):
+        # A value is required, the flag alone does nothing
+        command = [prowler_command, "--resume"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
     def test_aws_parser_profile_no_profile_short(self):
         argument = "-p"
         profile = ""
@@ -795,6 +947,63 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.organizations_role == organizations_role
 
+    def test_aws_parser_organization_accounts(self):
+        command = [
+            prowler_command,
+            "--organization-accounts",
+            "all",
+            "-R",
+            "ProwlerRole",
+            "--organization-concurrency",
+            "8",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.organization_accounts == ["all"]
+        assert parsed.role == "ProwlerRole"
+        assert parsed.organization_concurrency == 8
+
+    def test_aws_parser_organization_accounts_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.organization_accounts
+        assert parsed.organization_concurrency == 4
+
+    def test_aws_parser_organization_concurrency_without_value(self):
+        # A value is required, the flag alone does nothing
+        command = [
+            prowler_command,
+            "--organization-accounts",
+            "all",
+            "-R",
+            "ProwlerRole",
+            "--organization-concurrency",
+        ]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_aws_parser_organization_accounts_without_role(self):
+        command = [prowler_command, "--organization-accounts", "ou-ab12-cdefgh34"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_organization_accounts_with_resume(self):
+        command = [
+            prowler_command,
+            "--organization-accounts",
+            "all",
+            "-R",
+            "ProwlerRole",
+            "--resume",
+            "checkpoint.jsonl",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
     def test_aws_parser_security_hub_short(self):
         argument = "-S"
         command = [prowler_command, argument]
@@ -881,6 +1090,26 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.allowlist_file == allowlist_file
 
+    def test_aws_parser_aws_credentials_cache(self):
+        command = [prowler_command, "--aws-credentials-cache"]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_credentials_cache
+
+    def test_aws_parser_aws_credentials_cache_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.aws_credentials_cache
+
+    def test_aws_parser_aws_credential_report_cache(self):
+        command = [prowler_command, "--aws-credential-report-cache"]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_credential_report_cache
+
+    def test_aws_parser_aws_credential_report_cache_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.aws_credential_report_cache
+
     def test_aws_parser_resource_tags(self):
         argument = "--resource-tags"
         scan_tag1 = "Key=Value"
@@ -916,6 +1145,69 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.aws_retries_max_attempts == int(max_retries)
 
+    def test_aws_parser_aws_api_metrics_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.aws_api_metrics
+
+    def test_aws_parser_aws_api_metrics(self):
+        argument = "--aws-api-metrics"
+        command = [prowler_command, argument]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_api_metrics
+
+    def test_aws_parser_connection_config(self):
+        command = [
+            prowler_command,
+            "--aws-max-pool-connections",
+            "64",
+            "--aws-connect-timeout",
+            "5",
+            "--aws-read-timeout",
+            "30",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_max_pool_connections == 64
+        assert parsed.aws_connect_timeout == 5
+        assert parsed.aws_read_timeout == 30
+
+    def test_aws_parser_connection_config_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.aws_max_pool_connections
+        assert not parsed.aws_connect_timeout
+        assert not parsed.aws_read_timeout
+
+    def test_aws_parser_connection_config_without_value(self):
+        # A value is required, the flag alone does nothing
+        for flag in [
+            "--aws-max-pool-connections",
+            "--aws-connect-timeout",
+            "--aws-read-timeout",
+        ]:
+            command = [prowler_command, flag]
+            with pytest.raises(SystemExit) as ex:
+                self.parser.parse(command)
+            assert ex.type == SystemExit
+
+    def test_aws_parser_aws_max_pool_connections_invalid(self):
+        command = [prowler_command, "--aws-max-pool-connections", "0"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_no_aws_rate_limiter_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.no_aws_rate_limiter
+
+    def test_aws_parser_no_aws_rate_limiter(self):
+        argument = "--no-aws-rate-limiter"
+        command = [prowler_command, argument]
+        parsed = self.parser.parse(command)
+        assert parsed.no_aws_rate_limiter
+
     def test_parser_azure_auth_sp(self):
         argument = "--sp-env-auth"
         command = [prowler_command, "azure", argument]
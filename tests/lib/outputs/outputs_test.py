@@ -1,3 +1,4 @@
+import json
 import os
 from os import getcwd, path, remove
 from unittest import mock
@@ -22,7 +23,11 @@ from prowler.lib.check.compliance_models import (
     Compliance_Base_Model,
     Compliance_Requirement,
 )
-from prowler.lib.check.models import Check_Report, load_check_metadata
+from prowler.lib.check.models import (
+    Check_Report_AWS,
+    Recommendation,
+    load_check_metadata,
+)
 from prowler.lib.outputs.file_descriptors import fill_file_descriptors
 from prowler.lib.outputs.json import fill_json_asff, generate_json_asff_status
 from prowler.lib.outputs.models import (
@@ -41,6 +46,7 @@ from prowler.lib.outputs.models import (
     unroll_tags,
 )
 from prowler.lib.outputs.outputs import (
+    Findings_Aggregator,
     extract_findings_statistics,
     send_to_s3_bucket,
     set_report_color,
@@ -368,7 +374,7 @@ class Test_Outputs:
     #         audited_regions=["eu-west-2", "eu-west-1"],
     #         organizations_metadata=None,
     #     )
-    #     finding = Check_Report(
+    #     finding = Check_Report_AWS(
     #         load_check_metadata(
     #             f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
     #         ).json()
@@ -416,7 +422,7 @@ class Test_Outputs:
             audit_resources=None,
             mfa_enabled=False,
         )
-        finding = Check_Report(
+        finding = Check_Report_AWS(
             load_check_metadata(
                 f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
             ).json()
@@ -487,14 +493,12 @@ class Test_Outputs:
             audit_resources=None,
             mfa_enabled=False,
         )
-        finding = Check_Report(
-            load_check_metadata(
-                f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
-            ).json()
-        )
-
         # Empty the Remediation.Recomendation.URL
-        finding.check_metadata.Remediation.Recommendation.Url = ""
+        metadata = load_check_metadata(
+            f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
+        ).dict()
+        metadata["Remediation"]["Recommendation"]["Url"] = ""
+        finding = Check_Report_AWS(json.dumps(metadata))
 
         finding.resource_details = "Test resource details"
         finding.resource_id = "test-resource"
@@ -535,23 +539,21 @@ class Test_Outputs:
 
         # Set the check's remediation
         expected.Remediation = {
-            "Recommendation": finding.check_metadata.Remediation.Recommendation,
+            "Recommendation": Recommendation(
+                Text=finding.check_metadata.Remediation.Recommendation.Text,
+                Url="https://docs.aws.amazon.com/securityhub/latest/userguide/what-is-securityhub.html",
+            ),
             # "Code": finding.check_metadata.Remediation.Code,
         }
 
-        expected.Remediation[
-            "Recommendation"
-        ].Text = finding.check_metadata.Remediation.Recommendation.Text
-        expected.Remediation[
-            "Recommendation"
-        ].Url = "https://docs.aws.amazon.com/securityhub/latest/userguide/what-is-securityhub.html"
-
         input = Check_Output_JSON_ASFF()
         output_options = mock.MagicMock()
 
         assert (
             fill_json_asff(input, input_audit_info, finding, output_options) == expected
         )
+        # The check's metadata, shared by all its findings, is not modified
+        assert finding.check_metadata.Remediation.Recommendation.Url == ""
 
     @mock_s3
     def test_send_to_s3_bucket(self):
@@ -772,6 +774,76 @@ class Test_Outputs:
         assert stats["resources_count"] == 0
         assert stats["findings_count"] == 0
 
+    def test_findings_aggregator(self):
+        cis_compliance = mock.MagicMock()
+        cis_compliance.Framework = "CIS"
+        cis_compliance.Version = "1.4"
+        cis_requirement = mock.MagicMock()
+        cis_requirement.Attributes = [
+            mock.MagicMock(Section="1 IAM", Profile="Level 1")
+        ]
+        cis_compliance.Requirements = [cis_requirement]
+        bulk_checks_metadata = {
+            "iam_root_mfa_enabled": mock.MagicMock(Compliance=[cis_compliance]),
+            "ec2_ami_public": mock.MagicMock(Compliance=[]),
+        }
+
+        findings = []
+        for check_id, service, status, resource_id in [
+            ("iam_root_mfa_enabled", "iam", "FAIL", "root"),
+            ("ec2_ami_public", "ec2", "PASS", "ami-1"),
+            ("iam_root_mfa_enabled", "iam", "PASS", "root"),
+            ("ec2_ami_public", "ec2", "INFO", "ami-2"),
+        ]:
+            finding = mock.MagicMock()
+            finding.status = status
+            finding.resource_id = resource_id
+            finding.check_metadata.CheckID = check_id
+            finding.check_metadata.ServiceName = service
+            finding.check_metadata.Provider = "aws"
+            finding.check_metadata.Severity = "critical"
+            findings.append(finding)
+
+        findings_aggregator = Findings_Aggregator(bulk_checks_metadata, ["cis_1.4_aws"])
+        # The findings can be aggregated as they are reported
+        for finding in findings:
+            findings_aggregator.add_findings([finding])
+
+        assert (
+            findings_aggregator.statistics.get_statistics()
+            == extract_findings_statistics(findings)
+        )
+        # One row per service, even if their findings are not consecutive
+        assert findings_aggregator.summary.services == {
+            "iam": {
+                "Service": "iam",
+                "Provider": "aws",
+                "Total": 2,
+                "Critical": 1,
+                "High": 0,
+                "Medium": 0,
+                "Low": 0,
+            },
+            "ec2": {
+                "Service": "ec2",
+                "Provider": "aws",
+                "Total": 2,
+                "Critical": 0,
+                "High": 0,
+                "Medium": 0,
+                "Low": 0,
+            },
+        }
+        assert findings_aggregator.summary.findings_count == 4
+        assert findings_aggregator.summary.pass_count == 2
+        assert findings_aggregator.summary.fail_count == 1
+        cis_summary = findings_aggregator.compliance_summaries["cis_1.4_aws"]
+        assert cis_summary.compliance_fm == "CIS"
+        assert cis_summary.compliance_version == "1.4"
+        assert cis_summary.pass_count == 1
+        assert cis_summary.fail_count == 1
+        assert cis_summary.requirements["1 IAM"]["Level 1"] == {"FAIL": 1, "PASS": 1}
+
     @mock.patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
     def test_send_to_security_hub(self):
         # Create mock session
@@ -796,7 +868,7 @@ class Test_Outputs:
             audit_resources=None,
             mfa_enabled=False,
         )
-        finding = Check_Report(
+        finding = Check_Report_AWS(
             load_check_metadata(
                 f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
             ).json()
@@ -892,7 +964,7 @@ class Test_Outputs:
             ),
         ]
 
-        finding = Check_Report(
+        finding = Check_Report_AWS(
             load_check_metadata(
                 f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
             ).json()
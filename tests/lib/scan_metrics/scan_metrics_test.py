@@ -0,0 +1,254 @@
+import json
+import sys
+
+from mock import MagicMock
+
+from prowler.lib.scan_metrics.scan_metrics import (
+    Scan_Metrics,
+    get_collector_region,
+    get_finding_region,
+    instrument_service_clients,
+    recover_service_classes,
+    restore_service_clients,
+)
+
+service_module = """
+class Fake:
+    def __init__(self, regional_clients):
+        self.regional_clients = regional_clients
+        self.resources = []
+        for regional_client in self.regional_clients:
+            self.__describe_resources__(regional_client)
+        self.__get_account_settings__()
+
+    def __get_session__(self):
+        return None
+
+    def __describe_resources__(self, regional_client):
+        self.resources.append(regional_client.region)
+
+    def __get_account_settings__(self):
+        return None
+
+    def __repr__(self):
+        return "Fake"
+"""
+
+client_module = """
+from prowler_fake_services.fake.fake_service import Fake
+
+fake_client = Fake(None)
+"""
+
+
+def create_fake_service(tmp_path):
+    service_path = tmp_path / "prowler_fake_services" / "fake"
+    service_path.mkdir(parents=True)
+    (tmp_path / "prowler_fake_services" / "__init__.py").touch()
+    (service_path / "__init__.py").touch()
+    (service_path / "fake_service.py").write_text(service_module)
+    (service_path / "fake_client.py").write_text(client_module)
+    sys.path.insert(0, str(tmp_path))
+
+
+def remove_fake_service(tmp_path):
+    sys.path.remove(str(tmp_path))
+    for module in list(sys.modules):
+        if module.startswith("prowler_fake_services"):
+            del sys.modules[module]
+
+
+def get_usage(wall_time: float) -> dict:
+    return {"wall_time": wall_time, "cpu_time": 0.1, "max_rss_increase": 1024}
+
+
+class Test_Scan_Metrics:
+    def test_get_finding_region(self):
+        aws_finding = MagicMock(spec=["region"])
+        aws_finding.region = "eu-west-1"
+        gcp_finding = MagicMock(spec=["location"])
+        gcp_finding.location = "europe-west1"
+        azure_finding = MagicMock(spec=["subscription"])
+        azure_finding.subscription = "subscription-1"
+        global_finding = MagicMock(spec=["region"])
+        global_finding.region = ""
+
+        assert get_finding_region(aws_finding) == "eu-west-1"
+        assert get_finding_region(gcp_finding) == "europe-west1"
+        assert get_finding_region(azure_finding) == "subscription-1"
+        assert get_finding_region(global_finding) == "global"
+
+    def test_get_collector_region(self):
+        regional_client = MagicMock()
+        regional_client.region = "eu-west-1"
+        service = MagicMock(spec=[])
+
+        assert get_collector_region(service, (regional_client,)) == "eu-west-1"
+        assert get_collector_region(service, ()) == "global"
+
+    def test_get_metrics(self):
+        scan_metrics = Scan_Metrics()
+        findings = []
+        for region in ["eu-west-1", "eu-west-1", "us-east-1"]:
+            finding = MagicMock(spec=["region"])
+            finding.region = region
+            findings.append(finding)
+        scan_metrics.record_check("ec2", "ec2_ami_public", get_usage(1), findings)
+        scan_metrics.record_collector(
+            "ec2", "__describe_images__", "eu-west-1", get_usage(2)
+        )
+        scan_metrics.record_collector(
+            "ec2", "__describe_images__", "eu-west-1", get_usage(3)
+        )
+        scan_metrics.record_collector("ec2", "__init__", "global", get_usage(6))
+
+        metrics = scan_metrics.get_metrics()
+        assert metrics["checks"] == [
+            {
+                "check": "ec2_ami_public",
+                "service": "ec2",
+                "wall_time": 1,
+                "cpu_time": 0.1,
+                "max_rss_increase": 1024,
+                "findings": 3,
+                "findings_by_region": {"eu-west-1": 2, "us-east-1": 1},
+            }
+        ]
+        assert metrics["collectors"] == [
+            {
+                "service": "ec2",
+                "collector": "__init__",
+                "region": "global",
+                "calls": 1,
+                "wall_time": 6,
+                "cpu_time": 0.1,
+                "max_rss_increase": 1024,
+            },
+            {
+                "service": "ec2",
+                "collector": "__describe_images__",
+                "region": "eu-west-1",
+                "calls": 2,
+                "wall_time": 5,
+                "cpu_time": 0.2,
+                "max_rss_increase": 1024,
+            },
+        ]
+        assert metrics["services"] == {
+            "ec2": {
+                "build_wall_time": 6,
+                "collectors_wall_time": 5,
+                "checks_wall_time": 1,
+                "findings": 3,
+            }
+        }
+        assert metrics["regions"] == {
+            "eu-west-1": {"collectors_wall_time": 5, "findings": 2},
+            "us-east-1": {"collectors_wall_time": 0, "findings": 1},
+        }
+
+    def test_get_slowest(self):
+        scan_metrics = Scan_Metrics()
+        scan_metrics.record_check("ec2", "ec2_ami_public", get_usage(1), [])
+        scan_metrics.record_check("iam", "iam_root_mfa_enabled", get_usage(4), [])
+        scan_metrics.record_collector(
+            "ec2", "__describe_images__", "eu-west-1", get_usage(2)
+        )
+
+        slowest = scan_metrics.get_slowest(2)
+        assert [metric["name"] for metric in slowest] == [
+            "iam_root_mfa_enabled",
+            "ec2.__describe_images__",
+        ]
+        assert slowest[1]["region"] == "eu-west-1"
+
+    def test_write(self, tmp_path):
+        scan_metrics = Scan_Metrics()
+        scan_metrics.record_check("ec2", "ec2_ami_public", get_usage(1), [])
+        metrics_file = tmp_path / "scan_metrics.json"
+
+        scan_metrics.write(str(metrics_file))
+
+        assert json.loads(metrics_file.read_text()) == scan_metrics.get_metrics()
+
+    def test_recover_service_classes(self, tmp_path):
+        create_fake_service(tmp_path)
+        try:
+            assert recover_service_classes(
+                "prowler_fake_services.fake.fake_client"
+            ) == [("prowler_fake_services.fake.fake_service", "Fake")]
+        finally:
+            remove_fake_service(tmp_path)
+
+    def test_instrument_service_clients(self, tmp_path):
+        create_fake_service(tmp_path)
+        try:
+            scan_metrics = Scan_Metrics()
+            instrument_service_clients(
+                ["prowler_fake_services.fake.fake_client"], scan_metrics
+            )
+            # Instrumenting it again does not record the calls twice
+            instrument_service_clients(
+                ["prowler_fake_services.fake.fake_client"], scan_metrics
+            )
+            from prowler_fake_services.fake.fake_service import Fake
+
+            regional_clients = [
+                MagicMock(region="eu-west-1"),
+                MagicMock(region="us-east-1"),
+            ]
+            service = Fake(regional_clients)
+
+            # The instrumented collectors keep their behaviour
+            assert service.resources == ["eu-west-1", "us-east-1"]
+            assert repr(service) == "Fake"
+            collectors = {
+                (collector["collector"], collector["region"]): collector["calls"]
+                for collector in scan_metrics.get_metrics()["collectors"]
+            }
+            assert collectors == {
+                ("__init__", "global"): 1,
+                ("__describe_resources__", "eu-west-1"): 1,
+                ("__describe_resources__", "us-east-1"): 1,
+                ("__get_account_settings__", "global"): 1,
+            }
+        finally:
+            remove_fake_service(tmp_path)
+
+    def test_restore_service_clients(self, tmp_path):
+        create_fake_service(tmp_path)
+        try:
+            from prowler_fake_services.fake.fake_service import Fake
+
+            original_methods = dict(vars(Fake))
+            regional_clients = [MagicMock(region="eu-west-1")]
+            first_scan_metrics = Scan_Metrics()
+            instrumented_methods = instrument_service_clients(
+                ["prowler_fake_services.fake.fake_client"], first_scan_metrics
+            )
+            assert len(instrumented_methods) == 3
+            Fake(regional_clients)
+            restore_service_clients(instrumented_methods)
+            assert dict(vars(Fake)) == original_methods
+
+            # The next scan records its calls only once and only in its own metrics
+            second_scan_metrics = Scan_Metrics()
+            instrumented_methods = instrument_service_clients(
+                ["prowler_fake_services.fake.fake_client"], second_scan_metrics
+            )
+            try:
+                Fake(regional_clients)
+            finally:
+                restore_service_clients(instrumented_methods)
+            for scan_metrics in (first_scan_metrics, second_scan_metrics):
+                collectors = {
+                    (collector["collector"], collector["region"]): collector["calls"]
+                    for collector in scan_metrics.get_metrics()["collectors"]
+                }
+                assert collectors == {
+                    ("__init__", "global"): 1,
+                    ("__describe_resources__", "eu-west-1"): 1,
+                    ("__get_account_settings__", "global"): 1,
+                }
+        finally:
+            remove_fake_service(tmp_path)
@@ -1,7 +1,47 @@
-from prowler.lib.utils.utils import validate_ip_address
+import os
+
+import pytest
+
+from prowler.lib.utils.utils import (
+    create_private_directory,
+    open_private_file,
+    validate_ip_address,
+)
 
 
 class Test_Validate_Ip_Address:
     def test_validate_ip_address(self):
         assert validate_ip_address("88.26.151.198")
         assert not validate_ip_address("Not an IP")
+
+
+class Test_Private_Files:
+    def test_create_private_directory(self, tmp_path):
+        directory = tmp_path / "cache" / "prowler"
+        create_private_directory(str(directory))
+        assert os.stat(directory).st_mode & 0o777 == 0o700
+        (directory / "file.json").write_text("{}")
+        with open_private_file(str(directory / "file.json")) as f:
+            assert f.read() == "{}"
+
+    def test_create_private_directory_writable_by_others(self, tmp_path):
+        directory = tmp_path / "prowler"
+        directory.mkdir(mode=0o700)
+        os.chmod(directory, 0o777)
+        with pytest.raises(PermissionError):
+            create_private_directory(str(directory))
+        (directory / "file.json").write_text("{}")
+        with pytest.raises(PermissionError):
+            open_private_file(str(directory / "file.json"))
+
+    def test_open_private_file_not_private(self, tmp_path):
+        file_path = tmp_path / "file.json"
+        file_path.write_text("{}")
+        os.chmod(file_path, 0o666)
+        with pytest.raises(PermissionError):
+            open_private_file(str(file_path))
+        os.chmod(file_path, 0o600)
+        # The symlinks are not followed
+        (tmp_path / "link.json").symlink_to(file_path)
+        with pytest.raises(OSError):
+            open_private_file(str(tmp_path / "link.json"))
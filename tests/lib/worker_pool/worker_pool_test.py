@@ -0,0 +1,126 @@
+import contextvars
+import threading
+from time import sleep
+from types import SimpleNamespace
+
+import pytest
+
+from prowler.lib.worker_pool.worker_pool import Worker_Pool
+
+scan_context = contextvars.ContextVar("scan_context", default=None)
+
+
+class Test_Worker_Pool:
+    def test_map_results_order(self):
+        pool = Worker_Pool(max_workers=4)
+        assert pool.map(lambda item: item * 2, range(10)) == [
+            item * 2 for item in range(10)
+        ]
+
+    def test_map_no_items(self):
+        pool = Worker_Pool(max_workers=4)
+        assert pool.map(lambda item: item, []) == []
+        assert pool.workers == 0
+
+    def test_map_max_workers(self):
+        pool = Worker_Pool(max_workers=2)
+        lock = threading.Lock()
+        running_calls = []
+        max_running_calls = []
+
+        def call(item):
+            with lock:
+                running_calls.append(item)
+                max_running_calls.append(len(running_calls))
+            sleep(0.01)
+            with lock:
+                running_calls.remove(item)
+
+        pool.map(call, range(20))
+        pool.map(call, range(20))
+        # The caller runs the calls along with the workers
+        assert max(max_running_calls) <= 3
+        # The workers are reused
+        assert pool.workers <= 2
+
+    def test_map_exception(self):
+        pool = Worker_Pool(max_workers=4)
+        calls = []
+
+        def call(item):
+            calls.append(item.region)
+            if item.region != "eu-west-1":
+                raise ValueError(item.region)
+
+        regional_clients = [
+            SimpleNamespace(region=region)
+            for region in ["eu-west-1", "us-east-1", "us-west-2"]
+        ]
+        with pytest.raises(ValueError) as error:
+            pool.map(call, regional_clients)
+        # The exception is raised once all the calls are finished
+        assert sorted(calls) == ["eu-west-1", "us-east-1", "us-west-2"]
+        assert str(error.value) == "us-east-1"
+
+    def test_map_nested(self):
+        pool = Worker_Pool(max_workers=1)
+        results = pool.map(
+            lambda item: sum(pool.map(lambda nested: item * nested, range(3))),
+            range(3),
+        )
+        assert results == [0, 3, 6]
+
+    def test_map_context(self):
+        pool = Worker_Pool(max_workers=4)
+        scan_context.set("ec2")
+        assert pool.map(lambda _: scan_context.get(), range(4)) == ["ec2"] * 4
+
+    def test_submit(self):
+        pool = Worker_Pool(max_workers=1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def call():
+            started.set()
+            release.wait(5)
+            return threading.current_thread().name
+
+        background_call = pool.submit(call)
+        assert started.wait(5)
+        release.set()
+        # The call is run by a worker
+        assert background_call.result() == "prowler-worker-1"
+
+    def test_submit_not_started(self):
+        pool = Worker_Pool(max_workers=1)
+        release = threading.Event()
+        # The only worker is busy, so the submitted call is not started
+        busy_call = pool.submit(lambda: release.wait(5))
+        background_call = pool.submit(lambda: threading.current_thread().name)
+        # The call is run by the thread waiting for it
+        assert background_call.result() == threading.current_thread().name
+        release.set()
+        assert busy_call.result()
+
+    def test_submit_result_twice(self):
+        pool = Worker_Pool(max_workers=1)
+        release = threading.Event()
+        calls = []
+        busy_call = pool.submit(lambda: release.wait(5))
+        background_call = pool.submit(lambda: calls.append(1) or len(calls))
+        # The call is run only once, even if it is run by the thread waiting for it
+        assert background_call.result() == 1
+        release.set()
+        assert busy_call.result()
+        assert background_call.result() == 1
+        assert calls == [1]
+
+    def test_submit_exception(self):
+        pool = Worker_Pool(max_workers=1)
+
+        def call():
+            raise ValueError("error")
+
+        background_call = pool.submit(call)
+        with pytest.raises(ValueError):
+            background_call.result()
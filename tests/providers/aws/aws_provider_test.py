@@ -7,6 +7,7 @@ from prowler.providers.aws.aws_provider import (
     AWS_Provider,
     assume_role,
     generate_regional_clients,
+    get_assumed_role_session,
 )
 from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
 
@@ -95,6 +96,34 @@ class Test_AWS_Provider:
             21 + 1 + len(sessionName)
         )
 
+    @mock_iam
+    @mock_sts
+    def test_get_assumed_role_session(self):
+        role_name = "test-role"
+        role_arn = f"arn:aws:iam::{ACCOUNT_ID}:role/{role_name}"
+        original_session = boto3.session.Session(region_name="us-east-1")
+        assumed_role_info = AWS_Assume_Role(
+            role_arn=role_arn,
+            session_duration=3600,
+            external_id="test-external-id",
+            mfa_enabled=False,
+        )
+
+        assumed_session = get_assumed_role_session(
+            original_session, assumed_role_info, "eu-west-1"
+        )
+
+        assert assumed_session.region_name == "eu-west-1"
+        credentials = assumed_session.get_credentials()
+        # The credentials are refreshed assuming the role again
+        assert credentials.method == "sts-assume-role"
+        assert credentials.refresh_needed() is False
+        assert credentials.access_key.startswith("ASIA")
+        assert (
+            assumed_session.client("sts").get_caller_identity()["Arn"]
+            == f"arn:aws:sts::{ACCOUNT_ID}:assumed-role/{role_name}/ProwlerAsessmentSession"
+        )
+
     @mock_iam
     @mock_sts
     def test_assume_role_with_mfa(self):
@@ -212,6 +241,38 @@ class Test_AWS_Provider:
 
         assert set(generate_regional_clients_response.keys()) == set(audited_regions)
 
+    def test_generate_regional_clients_enabled_regions(self):
+        # New Boto3 session with the previously create user
+        session = boto3.session.Session(
+            region_name="us-east-1",
+        )
+        enabled_regions = {"eu-west-1", "us-east-1", "ap-east-1"}
+        # Fulfil the input session object for Prowler
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=session,
+            audited_account=None,
+            audited_account_arn=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            audited_user_id=None,
+            profile=None,
+            profile_region=None,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=None,
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+            enabled_regions=enabled_regions,
+        )
+        generate_regional_clients_response = generate_regional_clients(
+            "ec2", audit_info
+        )
+
+        assert set(generate_regional_clients_response.keys()) == enabled_regions
+
     def test_generate_regional_clients_global_service(self):
         # New Boto3 session with the previously create user
         session = boto3.session.Session(
@@ -275,3 +336,37 @@ class Test_AWS_Provider:
 
         # Shield does not exist in China
         assert generate_regional_clients_response == {}
+
+    def test_generate_regional_clients_shared(self):
+        session = boto3.session.Session(
+            region_name="us-east-1",
+        )
+        audited_regions = ["eu-west-1", "us-east-1"]
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=session,
+            audited_account=None,
+            audited_account_arn=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            audited_user_id=None,
+            profile=None,
+            profile_region=None,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=audited_regions,
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+        )
+        with patch.object(session, "client", wraps=session.client) as session_client:
+            ec2_regional_clients = generate_regional_clients("ec2", audit_info)
+            # e.g. the VPC service uses the EC2 clients too
+            vpc_regional_clients = generate_regional_clients("ec2", audit_info)
+
+        # Only one client is created per service and region
+        assert session_client.call_count == len(audited_regions)
+        for region in audited_regions:
+            assert ec2_regional_clients[region] is vpc_regional_clients[region]
+            assert ec2_regional_clients[region].region == region
@@ -0,0 +1,183 @@
+import json
+
+import botocore
+from boto3 import session
+from botocore.awsrequest import AWSHTTPSConnectionPool
+from mock import MagicMock, patch
+from moto import mock_s3
+
+from prowler.providers.aws.lib.api_metrics.api_metrics import (
+    API_Metrics,
+    get_instrumented_pool_class,
+    latency_buckets,
+)
+
+AWS_REGION = "eu-west-1"
+
+
+def get_operation(api_metrics, operation: str) -> dict:
+    return next(
+        metrics
+        for metrics in api_metrics.get_metrics()
+        if metrics["operation"] == operation
+    )
+
+
+class Test_API_Metrics:
+    @mock_s3
+    def test_register(self):
+        audit_session = session.Session(region_name=AWS_REGION)
+        api_metrics = API_Metrics()
+        api_metrics.register(audit_session)
+        s3_client = audit_session.client("s3", region_name=AWS_REGION)
+        s3_client.create_bucket(
+            Bucket="bucket",
+            CreateBucketConfiguration={"LocationConstraint": AWS_REGION},
+        )
+        s3_client.list_buckets()
+        s3_client.list_buckets()
+        try:
+            s3_client.get_bucket_policy(Bucket="bucket")
+        except botocore.exceptions.ClientError:
+            pass
+
+        list_buckets = get_operation(api_metrics, "ListBuckets")
+        assert list_buckets["service"] == "s3"
+        assert list_buckets["region"] == AWS_REGION
+        assert list_buckets["calls"] == 2
+        assert list_buckets["errors"] == 0
+        assert list_buckets["retries"] == 0
+        assert list_buckets["received_bytes"] > 0
+        assert list_buckets["latency_histogram"]["+Inf"] == 2
+        assert list_buckets["latency_sum"] > 0
+        # The missing policy is a failed call
+        assert get_operation(api_metrics, "GetBucketPolicy")["errors"] == 1
+        assert api_metrics.get_metrics()[0]["operation"] == "ListBuckets"
+
+    def test_throttled_attempts(self):
+        api_metrics = API_Metrics()
+        context = {}
+        request_signer = MagicMock()
+        request_signer.region_name = AWS_REGION
+        api_metrics.before_call(request_signer=request_signer, context=context)
+        # Two throttled attempts before the successful one
+        for error_code in ["Throttling", "RequestLimitExceeded", None]:
+            api_metrics.response_received(
+                event_name="response-received.ec2.DescribeInstances",
+                response_dict={"headers": {}, "body": b"<xml/>"},
+                parsed_response={"Error": {"Code": error_code}} if error_code else {},
+                context=context,
+            )
+        http_response = MagicMock()
+        http_response.status_code = 200
+        api_metrics.after_call(
+            event_name="after-call.ec2.DescribeInstances",
+            http_response=http_response,
+            context=context,
+        )
+
+        describe_instances = get_operation(api_metrics, "DescribeInstances")
+        assert describe_instances["region"] == AWS_REGION
+        assert describe_instances["calls"] == 1
+        assert describe_instances["retries"] == 2
+        assert describe_instances["throttles"] == 2
+        assert describe_instances["errors"] == 0
+        assert describe_instances["received_bytes"] == 18
+
+    def test_latency_histogram(self):
+        api_metrics = API_Metrics()
+        metrics = api_metrics.get_operation_metrics("ec2", AWS_REGION, "DescribeVpcs")
+        metrics["calls"] = 3
+        metrics["latency_buckets"][0] = 1
+        metrics["latency_buckets"][len(latency_buckets) - 1] = 1
+
+        histogram = get_operation(api_metrics, "DescribeVpcs")["latency_histogram"]
+        assert histogram[str(latency_buckets[0])] == 1
+        assert histogram[str(latency_buckets[-2])] == 1
+        assert histogram[str(latency_buckets[-1])] == 2
+        # The calls slower than the last bucket are only counted in +Inf
+        assert histogram["+Inf"] == 3
+
+    def test_write(self, tmp_path):
+        api_metrics = API_Metrics()
+        metrics = api_metrics.get_operation_metrics("ec2", AWS_REGION, "DescribeVpcs")
+        metrics["calls"] = 1
+        metrics["throttles"] = 2
+        metrics["latency_sum"] = 0.2
+        metrics["latency_buckets"][5] = 1
+
+        connections = api_metrics.get_connection_metrics("ec2", AWS_REGION)
+        connections["connections_opened"] = 3
+
+        json_file, connections_file, prometheus_file = api_metrics.write(
+            str(tmp_path), "prowler"
+        )
+
+        assert json_file == f"{tmp_path}/prowler_api_metrics.json"
+        with open(json_file) as metrics_file:
+            assert json.load(metrics_file) == api_metrics.get_metrics()
+        with open(connections_file) as metrics_file:
+            assert json.load(metrics_file) == [connections]
+        with open(prometheus_file) as metrics_file:
+            prometheus_metrics = metrics_file.read()
+        labels = f'service="ec2",region="{AWS_REGION}",operation="DescribeVpcs"'
+        assert "# TYPE prowler_aws_api_throttles_total counter" in prometheus_metrics
+        assert f"prowler_aws_api_throttles_total{{{labels}}} 2" in prometheus_metrics
+        assert (
+            f'prowler_aws_api_call_duration_seconds_bucket{{{labels},le="0.25"}} 1'
+            in prometheus_metrics
+        )
+        assert (
+            f"prowler_aws_api_call_duration_seconds_count{{{labels}}} 1"
+            in prometheus_metrics
+        )
+        assert (
+            f'prowler_aws_api_connections_opened_total{{service="ec2",region="{AWS_REGION}"}} 3'
+            in prometheus_metrics
+        )
+
+    @mock_s3
+    def test_register_connections(self):
+        audit_session = session.Session(region_name=AWS_REGION)
+        api_metrics = API_Metrics()
+        api_metrics.register(audit_session)
+        s3_client = audit_session.client("s3", region_name=AWS_REGION)
+
+        http_session = s3_client._endpoint.http_session
+        assert issubclass(
+            http_session._manager.pool_classes_by_scheme["https"],
+            AWSHTTPSConnectionPool,
+        )
+        assert (
+            http_session._manager.pool_classes_by_scheme["https"].__name__
+            == "Instrumented_Connection_Pool"
+        )
+        assert api_metrics.get_connections_metrics()[0]["service"] == "s3"
+        assert api_metrics.get_connections_metrics()[0]["region"] == AWS_REGION
+
+    def test_instrumented_pool(self):
+        api_metrics = API_Metrics()
+        connections = api_metrics.get_connection_metrics("s3", AWS_REGION)
+        pool_class = get_instrumented_pool_class(
+            AWSHTTPSConnectionPool, connections, api_metrics.lock
+        )
+        pool = pool_class("s3.eu-west-1.amazonaws.com", maxsize=1)
+
+        first_connection = pool._get_conn()
+        second_connection = pool._get_conn()
+        first_connection.is_verified = True
+        with patch.object(first_connection, "connect") as connect:
+            pool._validate_conn(first_connection)
+            connect.assert_called_once()
+        # The connection is reused
+        first_connection.sock = MagicMock()
+        pool._validate_conn(first_connection)
+        pool._put_conn(first_connection)
+        # The pool is full, so the connection is closed
+        pool._put_conn(second_connection)
+
+        assert connections["connection_requests"] == 2
+        assert connections["connections_opened"] == 1
+        assert connections["connections_discarded"] == 1
+        assert connections["pool_wait_seconds"] >= 0
+        assert connections["connection_setup_seconds"] > 0
@@ -0,0 +1,48 @@
+import boto3
+from botocore.config import Config
+
+from prowler.providers.aws.lib.clients.clients import (
+    get_client,
+    remove_session_clients,
+)
+
+AWS_REGION = "eu-west-1"
+
+
+class Test_Clients:
+    def test_get_client_created_once(self):
+        session = boto3.session.Session(region_name="us-east-1")
+        client = get_client(session, "ec2", AWS_REGION)
+        assert client.meta.region_name == AWS_REGION
+        assert get_client(session, "ec2", AWS_REGION) is client
+
+    def test_get_client_per_service_region_and_config(self):
+        session = boto3.session.Session(region_name="us-east-1")
+        config = Config(retries={"max_attempts": 3, "mode": "standard"})
+        client = get_client(session, "ec2", AWS_REGION, config)
+        assert get_client(session, "ec2", AWS_REGION, config) is client
+        assert get_client(session, "ec2", AWS_REGION) is not client
+        assert get_client(session, "ec2", "us-east-1", config) is not client
+        assert get_client(session, "s3", AWS_REGION, config) is not client
+
+    def test_get_client_default_region(self):
+        session = boto3.session.Session(region_name="us-east-1")
+        assert get_client(session, "s3").meta.region_name == "us-east-1"
+
+    def test_get_client_per_session(self):
+        session = boto3.session.Session(region_name="us-east-1")
+        other_session = boto3.session.Session(region_name="us-east-1")
+        assert get_client(session, "ec2", AWS_REGION) is not get_client(
+            other_session, "ec2", AWS_REGION
+        )
+
+    def test_remove_session_clients(self):
+        session = boto3.session.Session(region_name="us-east-1")
+        other_session = boto3.session.Session(region_name="us-east-1")
+        client = get_client(session, "ec2", AWS_REGION)
+        other_client = get_client(other_session, "ec2", AWS_REGION)
+        remove_session_clients(session)
+        assert get_client(session, "ec2", AWS_REGION) is not client
+        assert get_client(other_session, "ec2", AWS_REGION) is other_client
+        # A session without clients is ignored
+        remove_session_clients(boto3.session.Session(region_name="us-east-1"))
@@ -6,7 +6,11 @@ from mock import patch
 from moto import mock_iam, mock_sts
 
 from prowler.providers.aws.lib.arn.arn import parse_iam_credentials_arn
-from prowler.providers.aws.lib.credentials.credentials import validate_aws_credentials
+from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
+from prowler.providers.aws.lib.credentials.credentials import (
+    print_aws_credentials,
+    validate_aws_credentials,
+)
 
 AWS_ACCOUNT_NUMBER = "123456789012"
 
@@ -310,3 +314,35 @@ class Test_AWS_Credentials:
         assert caller_identity_arn.resource_type == "user"
         assert re.match("[0-9a-zA-Z]{20}", get_caller_identity["UserId"])
         assert get_caller_identity["Account"] == AWS_ACCOUNT_NUMBER
+
+    def test_print_aws_credentials_skipped_regions(self, capsys):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=None,
+            audited_account=AWS_ACCOUNT_NUMBER,
+            audited_account_arn=None,
+            audited_user_id=None,
+            audited_partition="aws-cn",
+            audited_identity_arn=None,
+            profile=None,
+            profile_region=None,
+            credentials=None,
+            assumed_role_info=AWS_Assume_Role(
+                role_arn=None,
+                session_duration=None,
+                external_id=None,
+                mfa_enabled=None,
+            ),
+            audited_regions=None,
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+            enabled_regions={"cn-north-1"},
+        )
+        print_aws_credentials(audit_info)
+        assert "AWS Skipped Regions (not enabled)" in capsys.readouterr().out
+
+        audit_info.enabled_regions = {"cn-north-1", "cn-northwest-1"}
+        print_aws_credentials(audit_info)
+        assert "AWS Skipped Regions" not in capsys.readouterr().out
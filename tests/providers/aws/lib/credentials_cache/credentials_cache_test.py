@@ -0,0 +1,176 @@
+import os
+import stat
+from datetime import datetime, timedelta, timezone
+
+from boto3 import session
+from mock import patch
+from moto import mock_iam, mock_sts
+
+from prowler.providers.aws.aws_provider import assume_role, get_assumed_role_session
+from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role
+from prowler.providers.aws.lib.credentials_cache.credentials_cache import (
+    credentials_cache_expiration_margin,
+    get_credentials_cache_path,
+    load_cached_credentials,
+    store_cached_credentials,
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGION = "us-east-1"
+ROLE_ARN = f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/ProwlerRole"
+
+
+def set_assumed_role_info(
+    credentials_cache: bool = True,
+    external_id: str = None,
+    mfa_enabled: bool = False,
+):
+    return AWS_Assume_Role(
+        role_arn=ROLE_ARN,
+        session_duration=3600,
+        external_id=external_id,
+        mfa_enabled=mfa_enabled,
+        credentials_cache=credentials_cache,
+    )
+
+
+def set_assumed_credentials(expiration_seconds: int = 3600):
+    return {
+        "Credentials": {
+            "AccessKeyId": "ASIAEXAMPLE",
+            "SecretAccessKey": "secret",
+            "SessionToken": "token",
+            "Expiration": datetime.now(timezone.utc)
+            + timedelta(seconds=expiration_seconds),
+        }
+    }
+
+
+class Test_Credentials_Cache:
+    def test_store_and_load_cached_credentials(self, tmp_path):
+        with patch(
+            "prowler.providers.aws.lib.credentials_cache.credentials_cache.default_cache_directory",
+            str(tmp_path),
+        ):
+            assumed_role_info = set_assumed_role_info()
+            assumed_credentials = set_assumed_credentials()
+            store_cached_credentials(assumed_role_info, assumed_credentials)
+
+            cache_path = get_credentials_cache_path(assumed_role_info)
+            assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+            assert stat.S_IMODE(os.stat(os.path.dirname(cache_path)).st_mode) == 0o700
+            assert load_cached_credentials(assumed_role_info) == assumed_credentials
+            # The credentials are cached per role, external ID and session duration
+            assert not load_cached_credentials(
+                set_assumed_role_info(external_id="external-id")
+            )
+
+    def test_load_cached_credentials_about_to_expire(self, tmp_path):
+        with patch(
+            "prowler.providers.aws.lib.credentials_cache.credentials_cache.default_cache_directory",
+            str(tmp_path),
+        ):
+            assumed_role_info = set_assumed_role_info()
+            store_cached_credentials(
+                assumed_role_info,
+                set_assumed_credentials(credentials_cache_expiration_margin - 60),
+            )
+            assert not load_cached_credentials(assumed_role_info)
+
+    def test_credentials_cache_disabled(self, tmp_path):
+        with patch(
+            "prowler.providers.aws.lib.credentials_cache.credentials_cache.default_cache_directory",
+            str(tmp_path),
+        ):
+            for assumed_role_info in [
+                set_assumed_role_info(credentials_cache=False),
+                # The credentials of the roles requiring MFA are never stored
+                set_assumed_role_info(mfa_enabled=True),
+            ]:
+                store_cached_credentials(assumed_role_info, set_assumed_credentials())
+                assert not os.path.exists(get_credentials_cache_path(assumed_role_info))
+                assert not load_cached_credentials(assumed_role_info)
+
+    def test_load_cached_credentials_corrupted(self, tmp_path):
+        with patch(
+            "prowler.providers.aws.lib.credentials_cache.credentials_cache.default_cache_directory",
+            str(tmp_path),
+        ):
+            assumed_role_info = set_assumed_role_info()
+            cache_path = get_credentials_cache_path(assumed_role_info)
+            os.makedirs(os.path.dirname(cache_path))
+            with open(cache_path, "w") as f:
+                f.write("{")
+            assert not load_cached_credentials(assumed_role_info)
+
+    def test_load_cached_credentials_writable_by_other_users(self, tmp_path):
+        with patch(
+            "prowler.providers.aws.lib.credentials_cache.credentials_cache.default_cache_directory",
+            str(tmp_path),
+        ):
+            assumed_role_info = set_assumed_role_info()
+            store_cached_credentials(assumed_role_info, set_assumed_credentials())
+            cache_path = get_credentials_cache_path(assumed_role_info)
+            # Credentials planted in a file or directory other users can write to are ignored
+            os.chmod(cache_path, 0o666)
+            assert not load_cached_credentials(assumed_role_info)
+            os.chmod(cache_path, 0o600)
+            os.chmod(os.path.dirname(cache_path), 0o777)
+            assert not load_cached_credentials(assumed_role_info)
+            # And they are not stored in it
+            store_cached_credentials(
+                assumed_role_info, set_assumed_credentials(expiration_seconds=7200)
+            )
+            os.chmod(os.path.dirname(cache_path), 0o700)
+            assert (
+                load_cached_credentials(assumed_role_info)["Credentials"]["Expiration"]
+                - datetime.now(timezone.utc)
+            ) < timedelta(seconds=3600)
+
+    def test_load_cached_credentials_of_another_user(self, tmp_path):
+        with patch(
+            "prowler.providers.aws.lib.credentials_cache.credentials_cache.default_cache_directory",
+            str(tmp_path),
+        ):
+            assumed_role_info = set_assumed_role_info()
+            store_cached_credentials(assumed_role_info, set_assumed_credentials())
+            with patch(
+                "prowler.lib.utils.utils.os.getuid", return_value=os.getuid() + 1
+            ):
+                assert not load_cached_credentials(assumed_role_info)
+
+    @mock_iam
+    @mock_sts
+    def test_assume_role_cached(self, tmp_path):
+        with patch(
+            "prowler.providers.aws.lib.credentials_cache.credentials_cache.default_cache_directory",
+            str(tmp_path),
+        ):
+            original_session = session.Session(region_name=AWS_REGION)
+            assumed_role_info = set_assumed_role_info()
+            access_key_id = assume_role(original_session, assumed_role_info)[
+                "Credentials"
+            ]["AccessKeyId"]
+            # The role is not assumed again
+            assert (
+                assume_role(original_session, assumed_role_info)["Credentials"][
+                    "AccessKeyId"
+                ]
+                == access_key_id
+            )
+            assert (
+                get_assumed_role_session(
+                    original_session, assumed_role_info, AWS_REGION
+                )
+                .get_credentials()
+                .access_key
+                == access_key_id
+            )
+            # Without the cache the role is always assumed
+            assumed_role_info.credentials_cache = False
+            assert (
+                assume_role(original_session, assumed_role_info)["Credentials"][
+                    "AccessKeyId"
+                ]
+                != access_key_id
+            )
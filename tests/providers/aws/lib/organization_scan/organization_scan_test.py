@@ -0,0 +1,154 @@
+import boto3
+from boto3 import session
+from mock import MagicMock, patch
+from moto import mock_organizations, mock_sts
+
+from prowler.providers.aws.aws_provider import get_assumed_role_session
+from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
+from prowler.providers.aws.lib.organization_scan.organization_scan import (
+    Organization_Scan,
+    get_account_role_arn,
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGION = "us-east-1"
+ROLE_NAME = "ProwlerRole"
+
+
+def set_mocked_audit_info():
+    audit_session = session.Session(region_name=AWS_REGION)
+    return AWS_Audit_Info(
+        session_config=None,
+        original_session=audit_session,
+        audit_session=audit_session,
+        audited_account=AWS_ACCOUNT_NUMBER,
+        audited_account_arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root",
+        audited_user_id=None,
+        audited_partition="aws",
+        audited_identity_arn=None,
+        profile=None,
+        profile_region=AWS_REGION,
+        credentials=None,
+        assumed_role_info=AWS_Assume_Role(
+            role_arn=None,
+            session_duration=None,
+            external_id=None,
+            mfa_enabled=None,
+        ),
+        audited_regions=None,
+        organizations_metadata=None,
+        audit_resources=None,
+        mfa_enabled=False,
+    )
+
+
+def create_organization(account_names: list) -> list:
+    organizations_client = boto3.client("organizations", region_name=AWS_REGION)
+    organizations_client.create_organization(FeatureSet="ALL")
+    return [
+        organizations_client.create_account(
+            AccountName=name, Email=f"{name}@moto-example.org"
+        )["CreateAccountStatus"]["AccountId"]
+        for name in account_names
+    ]
+
+
+class Test_Organization_Scan:
+    def test_get_account_role_arn(self):
+        assert (
+            get_account_role_arn(ROLE_NAME, "aws", "111111111111")
+            == f"arn:aws:iam::111111111111:role/{ROLE_NAME}"
+        )
+        assert (
+            get_account_role_arn(
+                f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/path/{ROLE_NAME}",
+                "aws-cn",
+                "111111111111",
+            )
+            == f"arn:aws-cn:iam::111111111111:role/path/{ROLE_NAME}"
+        )
+
+    @mock_organizations
+    @mock_sts
+    def test_scan(self):
+        account_ids = create_organization(["account-1", "account-2"])
+        audit_info = set_mocked_audit_info()
+        original_session = audit_info.audit_session
+        register_session = MagicMock()
+
+        scanned_accounts = []
+
+        def scan_account():
+            scanned_accounts.append(
+                (
+                    audit_info.audited_account,
+                    audit_info.assumed_role_info.role_arn,
+                    audit_info.organizations_metadata.account_details_name,
+                    audit_info.enabled_regions,
+                )
+            )
+            return [audit_info.audited_account]
+
+        with patch(
+            "prowler.providers.aws.lib.organization_scan.organization_scan.get_enabled_regions",
+            return_value={AWS_REGION},
+        ), patch(
+            "prowler.providers.aws.lib.organization_scan.organization_scan.remove_service_clients_modules"
+        ) as remove_service_clients_modules:
+            organization_scan = Organization_Scan(
+                audit_info,
+                [account_ids[1], account_ids[0]],
+                ROLE_NAME,
+                3600,
+                None,
+                concurrency=1,
+                register_session=register_session,
+            )
+            findings = organization_scan.scan(scan_account, print_progress=False)
+
+        assert findings == sorted(account_ids)
+        assert [account[0] for account in scanned_accounts] == sorted(account_ids)
+        for account_id, role_arn, name, enabled_regions in scanned_accounts:
+            assert role_arn == f"arn:aws:iam::{account_id}:role/{ROLE_NAME}"
+            assert name == f"account-{account_ids.index(account_id) + 1}"
+            assert enabled_regions == {AWS_REGION}
+        assert register_session.call_count == 2
+        assert remove_service_clients_modules.call_count == 2
+        assert organization_scan.failed_accounts == {}
+        # The original account is restored
+        assert audit_info.audited_account == AWS_ACCOUNT_NUMBER
+        assert audit_info.audit_session is original_session
+        assert audit_info.organizations_metadata is None
+        assert audit_info.enabled_regions is None
+
+    @mock_organizations
+    @mock_sts
+    def test_scan_failed_account(self):
+        account_ids = create_organization(["account-1", "account-2", "account-3"])
+        audit_info = set_mocked_audit_info()
+
+        def assume_role(original_session, assumed_role_info, region):
+            if account_ids[1] in assumed_role_info.role_arn:
+                raise Exception("AccessDenied")
+            return get_assumed_role_session(original_session, assumed_role_info, region)
+
+        def scan_account():
+            return [audit_info.audited_account]
+
+        with patch(
+            "prowler.providers.aws.lib.organization_scan.organization_scan.get_assumed_role_session",
+            new=assume_role,
+        ), patch(
+            "prowler.providers.aws.lib.organization_scan.organization_scan.get_enabled_regions",
+            return_value=None,
+        ), patch(
+            "prowler.providers.aws.lib.organization_scan.organization_scan.remove_service_clients_modules"
+        ):
+            organization_scan = Organization_Scan(
+                audit_info, account_ids, ROLE_NAME, 3600, None, concurrency=2
+            )
+            findings = organization_scan.scan(scan_account, print_progress=False)
+
+        assert findings == sorted([account_ids[0], account_ids[2]])
+        assert list(organization_scan.failed_accounts) == [account_ids[1]]
+        assert audit_info.audited_account == AWS_ACCOUNT_NUMBER
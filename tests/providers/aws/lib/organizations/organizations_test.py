@@ -6,6 +6,7 @@ from moto import mock_iam, mock_organizations, mock_sts
 
 from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
+    list_organization_accounts,
 )
 
 AWS_ACCOUNT_NUMBER = "123456789012"
@@ -59,3 +60,53 @@ class Test_AWS_Organizations:
         )
         org.account_details_org.should.equal(org_id)
         org.account_details_tags.should.equal("key:value,")
+
+    @mock_organizations
+    def test_list_organization_accounts(self):
+        client = boto3.client("organizations", region_name="us-east-1")
+        client.create_organization(FeatureSet="ALL")
+        root_id = client.list_roots()["Roots"][0]["Id"]
+        organizational_unit_id = client.create_organizational_unit(
+            ParentId=root_id, Name="workloads"
+        )["OrganizationalUnit"]["Id"]
+        nested_organizational_unit_id = client.create_organizational_unit(
+            ParentId=organizational_unit_id, Name="production"
+        )["OrganizationalUnit"]["Id"]
+        account_ids = []
+        for name in ["account-1", "account-2", "account-3"]:
+            account_ids.append(
+                client.create_account(
+                    AccountName=name, Email=f"{name}@moto-example.org"
+                )["CreateAccountStatus"]["AccountId"]
+            )
+        client.move_account(
+            AccountId=account_ids[0],
+            SourceParentId=root_id,
+            DestinationParentId=organizational_unit_id,
+        )
+        client.move_account(
+            AccountId=account_ids[1],
+            SourceParentId=root_id,
+            DestinationParentId=nested_organizational_unit_id,
+        )
+        audit_session = boto3.session.Session(region_name="us-east-1")
+
+        # The management account is also in the organization
+        all_accounts = list_organization_accounts(audit_session, ["all"])
+        assert len(all_accounts) == 4
+        assert [account["Id"] for account in all_accounts] == sorted(
+            account["Id"] for account in all_accounts
+        )
+
+        organizational_unit_accounts = list_organization_accounts(
+            audit_session, [organizational_unit_id]
+        )
+        assert sorted(account["Id"] for account in organizational_unit_accounts) == (
+            sorted(account_ids[:2])
+        )
+
+        accounts = list_organization_accounts(
+            audit_session, [nested_organizational_unit_id, account_ids[2]]
+        )
+        assert sorted(account["Id"] for account in accounts) == sorted(account_ids[1:])
+        assert {account["Name"] for account in accounts} == {"account-2", "account-3"}
@@ -0,0 +1,225 @@
+from prowler.providers.aws.lib.policy_engine.policy_engine import (
+    compile_policy,
+    compile_policy_document,
+)
+
+
+class Test_Policy_Engine:
+    def test_compile_policy_memoized(self):
+        document = {
+            "Version": "2012-10-17",
+            "Statement": {"Effect": "Allow", "Action": "s3:*", "Resource": "*"},
+        }
+        compiled_policy = compile_policy(document)
+        # The same document, even with its keys in another order, is compiled once
+        assert (
+            compile_policy(
+                {
+                    "Statement": {"Resource": "*", "Action": "s3:*", "Effect": "Allow"},
+                    "Version": "2012-10-17",
+                }
+            )
+            is compiled_policy
+        )
+        assert compile_policy_document.cache_info().hits > 0
+
+    def test_is_action_allowed_wildcards(self):
+        compiled_policy = compile_policy(
+            {
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Action": ["iam:Put*", "ec2:describe*"],
+                        "Resource": "*",
+                    },
+                ]
+            }
+        )
+        assert compiled_policy.is_action_allowed("iam:PutUserPolicy")
+        # The actions are case insensitive
+        assert compiled_policy.is_action_allowed("EC2:DescribeInstances")
+        assert not compiled_policy.is_action_allowed("iam:PassRole")
+        # A wildcard is only allowed if all its actions are allowed
+        assert compiled_policy.is_action_allowed("iam:Put*")
+        assert not compiled_policy.is_action_allowed("iam:*")
+        assert not compiled_policy.is_action_allowed("*")
+
+    def test_is_action_allowed_all_resources(self):
+        compiled_policy = compile_policy(
+            {
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Action": "*",
+                        "Resource": "arn:aws:s3:::bucket/*",
+                    },
+                    {"Effect": "Allow", "Action": "kms:*", "Resource": ["*"]},
+                ]
+            }
+        )
+        assert compiled_policy.is_action_allowed("*")
+        assert not compiled_policy.is_action_allowed("*", all_resources=True)
+        assert compiled_policy.is_action_allowed("kms:*", all_resources=True)
+
+    def test_is_action_allowed_not_action(self):
+        compiled_policy = compile_policy(
+            {
+                "Statement": {
+                    "Effect": "Allow",
+                    "NotAction": ["iam:*", "organizations:*"],
+                    "Resource": "*",
+                }
+            }
+        )
+        assert compiled_policy.is_action_allowed("kms:*", all_resources=True)
+        assert compiled_policy.is_action_allowed("s3:PutObject")
+        assert not compiled_policy.is_action_allowed("iam:PassRole")
+        assert not compiled_policy.is_action_allowed("*")
+
+    def test_is_action_allowed_deny(self):
+        compiled_policy = compile_policy(
+            {
+                "Statement": [
+                    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+                    {"Effect": "Deny", "Action": "iam:Create*", "Resource": "*"},
+                    # Denied only with a condition or in some resources
+                    {
+                        "Effect": "Deny",
+                        "Action": "kms:*",
+                        "Resource": "*",
+                        "Condition": {"Bool": {"aws:MultiFactorAuthPresent": "false"}},
+                    },
+                    {
+                        "Effect": "Deny",
+                        "Action": "s3:*",
+                        "Resource": "arn:aws:s3:::bucket",
+                    },
+                ]
+            }
+        )
+        assert not compiled_policy.is_action_allowed("iam:CreateAccessKey")
+        assert not compiled_policy.is_action_allowed("iam:Create*")
+        # Denying some actions does not deny the wildcards matching them
+        assert compiled_policy.is_action_allowed("iam:*")
+        assert compiled_policy.is_action_allowed("*", all_resources=True)
+        assert compiled_policy.is_action_allowed("iam:PassRole")
+        assert compiled_policy.is_action_allowed("kms:*")
+        assert compiled_policy.is_action_allowed("s3:*")
+
+    def test_get_allowed_actions(self):
+        compiled_policy = compile_policy(
+            {
+                "Statement": [
+                    {"Effect": "Allow", "Action": "sts:AssumeRole", "Resource": "*"},
+                    {"Effect": "Allow", "Action": "lambda:*", "Resource": "*"},
+                    # Every statement is evaluated
+                    {
+                        "Effect": "Deny",
+                        "Action": "lambda:InvokeFunction",
+                        "Resource": "*",
+                    },
+                ]
+            }
+        )
+        assert compiled_policy.get_allowed_actions(
+            {
+                "sts:AssumeRole",
+                "sts:*",
+                "lambda:CreateFunction",
+                "lambda:InvokeFunction",
+                "lambda:*",
+            }
+        ) == {"sts:AssumeRole", "lambda:CreateFunction", "lambda:*"}
+
+    def test_is_action_allowed_deny_one_action(self):
+        # AdministratorAccess except one action is still administrative access
+        compiled_policy = compile_policy(
+            {
+                "Statement": [
+                    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+                    {
+                        "Effect": "Deny",
+                        "Action": "organizations:LeaveOrganization",
+                        "Resource": "*",
+                    },
+                ]
+            }
+        )
+        assert compiled_policy.is_action_allowed("*", all_resources=True)
+        assert not compiled_policy.is_action_allowed("organizations:LeaveOrganization")
+        compiled_policy = compile_policy(
+            {
+                "Statement": [
+                    {"Effect": "Allow", "Action": "kms:*", "Resource": "*"},
+                    {
+                        "Effect": "Deny",
+                        "Action": "kms:ScheduleKeyDeletion",
+                        "Resource": "*",
+                    },
+                ]
+            }
+        )
+        assert compiled_policy.is_action_allowed("kms:*", all_resources=True)
+
+    def test_is_action_allowed_deny_whole_prefix(self):
+        compiled_policy = compile_policy(
+            {
+                "Statement": [
+                    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+                    {"Effect": "Deny", "Action": ["kms:*"], "Resource": "*"},
+                    {"Effect": "Deny", "NotAction": "s3:*", "Resource": "*"},
+                ]
+            }
+        )
+        assert not compiled_policy.is_action_allowed("kms:*", all_resources=True)
+        # Everything but s3 is denied
+        assert not compiled_policy.is_action_allowed("ec2:*", all_resources=True)
+        assert compiled_policy.is_action_allowed("s3:*", all_resources=True)
+        assert not compile_policy(
+            {
+                "Statement": [
+                    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+                    {"Effect": "Deny", "Action": "*", "Resource": ["*"]},
+                ]
+            }
+        ).is_action_allowed("*", all_resources=True)
+
+    def test_is_public(self):
+        compiled_policy = compile_policy(
+            {
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Principal": {"AWS": ["123456789012", "*"]},
+                        "Action": "s3:GetObject",
+                        "Resource": "arn:aws:s3:::bucket/*",
+                    },
+                    {
+                        "Effect": "Allow",
+                        "Principal": "*",
+                        "Action": "s3:Put*",
+                        "Resource": "arn:aws:s3:::bucket/*",
+                        "Condition": {"Bool": {"aws:SecureTransport": "true"}},
+                    },
+                ]
+            }
+        )
+        assert compiled_policy.is_public()
+        assert compiled_policy.is_public(actions=["s3:PutObject"])
+        assert not compiled_policy.is_public(
+            actions=["s3:PutObject"], include_conditional=False
+        )
+        assert not compile_policy(
+            {
+                "Statement": {
+                    "Effect": "Allow",
+                    "Principal": {"Service": "s3.amazonaws.com"},
+                    "Action": "lambda:InvokeFunction",
+                    "Resource": "*",
+                }
+            }
+        ).is_public()
+
+    def test_compile_policy_empty(self):
+        assert not compile_policy(None).is_action_allowed("*")
+        assert not compile_policy({}).is_public()
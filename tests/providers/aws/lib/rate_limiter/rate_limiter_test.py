@@ -0,0 +1,153 @@
+from boto3 import session
+from mock import MagicMock, patch
+from moto import mock_s3
+
+from prowler.providers.aws.lib.clients.clients import get_client
+from prowler.providers.aws.lib.rate_limiter import rate_limiter
+from prowler.providers.aws.lib.rate_limiter.rate_limiter import (
+    Rate_Limiter,
+    Token_Bucket,
+    minimum_rate,
+    recovery_seconds,
+)
+
+AWS_REGION = "eu-west-1"
+
+
+class Fake_Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class Test_Rate_Limiter:
+    def test_token_bucket_paces_requests(self):
+        clock = Fake_Clock()
+        with patch.object(rate_limiter, "monotonic", clock.monotonic), patch.object(
+            rate_limiter, "sleep", clock.sleep
+        ):
+            bucket = Token_Bucket(10)
+            # Burst of one second of requests
+            waits = [bucket.acquire() for _ in range(10)]
+            assert waits == [0] * 10
+            assert bucket.acquire() == 0.1
+            assert round(bucket.acquire(), 6) == 0.1
+            clock.now += 1
+            assert bucket.acquire() == 0
+
+    def test_token_bucket_throttled(self):
+        clock = Fake_Clock()
+        with patch.object(rate_limiter, "monotonic", clock.monotonic), patch.object(
+            rate_limiter, "sleep", clock.sleep
+        ):
+            bucket = Token_Bucket(10)
+            assert bucket.throttled()
+            assert bucket.rate == 5
+            # The throttles of the same burst halve the rate once
+            assert not bucket.throttled()
+            assert bucket.rate == 5
+            # The requests already waiting are delayed
+            assert bucket.acquire() == 0.2
+            # The rate grows back to the quota
+            clock.now += recovery_seconds
+            bucket.acquire()
+            assert bucket.rate == 10
+
+    def test_token_bucket_unknown_quota(self):
+        clock = Fake_Clock()
+        with patch.object(rate_limiter, "monotonic", clock.monotonic), patch.object(
+            rate_limiter, "sleep", clock.sleep
+        ):
+            bucket = Token_Bucket()
+            # Not paced until it is throttled
+            assert [bucket.acquire() for _ in range(40)] == [0] * 40
+            clock.now += 0.5
+            assert bucket.throttled()
+            # The quota is the rate observed when it was throttled
+            assert bucket.quota == 80
+            assert bucket.rate == 40
+
+    def test_token_bucket_minimum_rate(self):
+        clock = Fake_Clock()
+        with patch.object(rate_limiter, "monotonic", clock.monotonic), patch.object(
+            rate_limiter, "sleep", clock.sleep
+        ):
+            bucket = Token_Bucket(1)
+            for _ in range(3):
+                bucket.throttled()
+                clock.now += 1
+            assert bucket.rate == minimum_rate
+
+    def test_get_operation_family(self):
+        limiter = Rate_Limiter({"s3:GetBucket*": 50, "iam:*": 20})
+        assert limiter.get_operation_family("s3", "GetBucketPolicy") == (
+            "s3:GetBucket*",
+            50,
+        )
+        assert limiter.get_operation_family("s3", "GetObject") == ("Get", None)
+        assert limiter.get_operation_family("iam", "ListRoles") == ("iam:*", 20)
+        assert limiter.get_operation_family("ec2", "DescribeInstances") == (
+            "Describe",
+            None,
+        )
+        assert limiter.get_bucket(
+            "s3", AWS_REGION, "GetBucketPolicy"
+        ) is limiter.get_bucket("s3", AWS_REGION, "GetBucketAcl")
+        assert limiter.get_bucket(
+            "s3", AWS_REGION, "GetBucketPolicy"
+        ) is not limiter.get_bucket("s3", "us-east-1", "GetBucketPolicy")
+
+    @mock_s3
+    def test_register(self):
+        audit_session = session.Session(region_name=AWS_REGION)
+        limiter = Rate_Limiter({"s3:ListBuckets": 50})
+        limiter.register(audit_session)
+        s3_client = audit_session.client("s3", region_name=AWS_REGION)
+        clock = Fake_Clock()
+        with patch.object(rate_limiter, "monotonic", clock.monotonic), patch.object(
+            rate_limiter, "sleep", clock.sleep
+        ):
+            s3_client.list_buckets()
+            s3_client.list_buckets()
+
+        bucket = limiter.buckets[("s3", AWS_REGION, "s3:ListBuckets")]
+        assert bucket.quota == 50
+        assert bucket.tokens == 48
+
+    @mock_s3
+    def test_register_clients_already_created(self):
+        audit_session = session.Session(region_name=AWS_REGION)
+        # The client is created before the handlers are registered, e.g. to set up the audit info
+        setup_client = get_client(audit_session, "s3", AWS_REGION)
+        limiter = Rate_Limiter({"s3:ListBuckets": 50})
+        limiter.register(audit_session)
+        s3_client = get_client(audit_session, "s3", AWS_REGION)
+        assert s3_client is not setup_client
+        s3_client.list_buckets()
+
+        assert limiter.buckets[("s3", AWS_REGION, "s3:ListBuckets")].tokens == 49
+
+    def test_throttled_response(self):
+        limiter = Rate_Limiter({"ec2:Describe*": 20})
+        context = {}
+        request_signer = MagicMock()
+        request_signer.region_name = AWS_REGION
+        limiter.before_call(request_signer=request_signer, context=context)
+        limiter.response_received(
+            "response-received.ec2.DescribeInstances",
+            parsed_response={"Error": {"Code": "RequestLimitExceeded"}},
+            context=context,
+        )
+        assert limiter.buckets[("ec2", AWS_REGION, "ec2:Describe*")].rate == 10
+
+        limiter.response_received(
+            "response-received.ec2.DescribeVpcs",
+            parsed_response={"Error": {"Code": "AccessDenied"}},
+            context=context,
+        )
+        assert limiter.buckets[("ec2", AWS_REGION, "ec2:Describe*")].rate == 10
@@ -0,0 +1,170 @@
+import json
+import os
+from time import time
+
+from boto3 import session
+from mock import patch
+from moto import mock_ec2
+
+from prowler.lib.utils.utils import open_file
+from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
+from prowler.providers.aws.lib.regions.regions import (
+    enabled_regions_cache_ttl,
+    get_enabled_regions,
+    get_partition_regions,
+    get_service_regions,
+    load_aws_regions_matrix,
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGION = "us-east-1"
+
+
+def set_mocked_audit_info():
+    return AWS_Audit_Info(
+        session_config=None,
+        original_session=None,
+        audit_session=session.Session(
+            profile_name=None,
+            botocore_session=None,
+            region_name=AWS_REGION,
+        ),
+        audited_account=AWS_ACCOUNT_NUMBER,
+        audited_account_arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root",
+        audited_user_id=None,
+        audited_partition="aws",
+        audited_identity_arn=None,
+        profile=None,
+        profile_region=AWS_REGION,
+        credentials=None,
+        assumed_role_info=AWS_Assume_Role(
+            role_arn=None,
+            session_duration=None,
+            external_id=None,
+            mfa_enabled=None,
+        ),
+        audited_regions=None,
+        organizations_metadata=None,
+        audit_resources=None,
+        mfa_enabled=False,
+    )
+
+
+class Test_Regions:
+    def test_get_service_regions(self):
+        regions = get_service_regions("ec2", "aws-cn")
+        assert sorted(regions) == ["cn-north-1", "cn-northwest-1"]
+
+    def test_load_aws_regions_matrix_once(self):
+        load_aws_regions_matrix.cache_clear()
+        with patch(
+            "prowler.providers.aws.lib.regions.regions.open_file", wraps=open_file
+        ) as regions_file:
+            get_service_regions("ec2", "aws")
+            get_service_regions("s3", "aws")
+            get_service_regions("iam", "aws")
+        assert regions_file.call_count == 1
+
+    def test_get_partition_regions(self):
+        assert get_partition_regions("aws-cn") == ["cn-north-1", "cn-northwest-1"]
+
+    @mock_ec2
+    def test_get_enabled_regions(self, tmp_path):
+        with patch(
+            "prowler.providers.aws.lib.regions.regions.default_cache_directory",
+            new=str(tmp_path),
+        ):
+            enabled_regions = get_enabled_regions(set_mocked_audit_info())
+            assert AWS_REGION in enabled_regions
+            cache_path = tmp_path / f"enabled_regions_{AWS_ACCOUNT_NUMBER}.json"
+            assert oct(os.stat(cache_path).st_mode & 0o777) == "0o600"
+            assert json.loads(cache_path.read_text())["regions"] == sorted(
+                enabled_regions
+            )
+
+    def test_get_enabled_regions_cached(self, tmp_path):
+        cache_path = tmp_path / f"enabled_regions_{AWS_ACCOUNT_NUMBER}.json"
+        cache_path.write_text(
+            json.dumps({"timestamp": time(), "regions": [AWS_REGION]})
+        )
+        with patch(
+            "prowler.providers.aws.lib.regions.regions.default_cache_directory",
+            new=str(tmp_path),
+        ), patch("prowler.providers.aws.lib.regions.regions.get_client") as client:
+            assert get_enabled_regions(set_mocked_audit_info()) == {AWS_REGION}
+            client.assert_not_called()
+
+    @mock_ec2
+    def test_get_enabled_regions_cache_writable_by_other_users(self, tmp_path):
+        cache_path = tmp_path / f"enabled_regions_{AWS_ACCOUNT_NUMBER}.json"
+        cache_path.write_text(
+            json.dumps({"timestamp": time(), "regions": ["us-west-2"]})
+        )
+        # A planted cache would silently shrink the scanned regions, so it is ignored
+        os.chmod(cache_path, 0o666)
+        with patch(
+            "prowler.providers.aws.lib.regions.regions.default_cache_directory",
+            new=str(tmp_path),
+        ):
+            enabled_regions = get_enabled_regions(set_mocked_audit_info())
+            assert AWS_REGION in enabled_regions
+            # It is replaced by the cache of the current user
+            assert oct(os.stat(cache_path).st_mode & 0o777) == "0o600"
+            assert json.loads(cache_path.read_text())["regions"] == sorted(
+                enabled_regions
+            )
+
+            # A cache in a directory other users can write to is neither read nor written
+            cache_path.write_text(
+                json.dumps({"timestamp": time(), "regions": ["us-west-2"]})
+            )
+            os.chmod(tmp_path, 0o777)
+            try:
+                assert get_enabled_regions(set_mocked_audit_info()) == enabled_regions
+                assert json.loads(cache_path.read_text())["regions"] == ["us-west-2"]
+            finally:
+                os.chmod(tmp_path, 0o700)
+
+    @mock_ec2
+    def test_get_enabled_regions_cache_of_another_user(self, tmp_path):
+        cache_path = tmp_path / f"enabled_regions_{AWS_ACCOUNT_NUMBER}.json"
+        cache_path.write_text(
+            json.dumps({"timestamp": time(), "regions": ["us-west-2"]})
+        )
+        with patch(
+            "prowler.providers.aws.lib.regions.regions.default_cache_directory",
+            new=str(tmp_path),
+        ), patch("prowler.lib.utils.utils.os.getuid", return_value=os.getuid() + 1):
+            enabled_regions = get_enabled_regions(set_mocked_audit_info())
+        assert AWS_REGION in enabled_regions
+        assert enabled_regions != {"us-west-2"}
+
+    @mock_ec2
+    def test_get_enabled_regions_cache_expired(self, tmp_path):
+        cache_path = tmp_path / f"enabled_regions_{AWS_ACCOUNT_NUMBER}.json"
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "timestamp": time() - enabled_regions_cache_ttl,
+                    "regions": ["eu-south-1"],
+                }
+            )
+        )
+        with patch(
+            "prowler.providers.aws.lib.regions.regions.default_cache_directory",
+            new=str(tmp_path),
+        ):
+            enabled_regions = get_enabled_regions(set_mocked_audit_info())
+            assert AWS_REGION in enabled_regions
+            assert json.loads(cache_path.read_text())["timestamp"] > time() - 60
+
+    def test_get_enabled_regions_error(self, tmp_path):
+        with patch(
+            "prowler.providers.aws.lib.regions.regions.default_cache_directory",
+            new=str(tmp_path),
+        ), patch(
+            "prowler.providers.aws.lib.regions.regions.get_client",
+            side_effect=Exception("AccessDenied"),
+        ):
+            assert get_enabled_regions(set_mocked_audit_info()) is None
+            assert not os.listdir(tmp_path)
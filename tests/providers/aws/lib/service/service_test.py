@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+from mock import MagicMock
+
+from prowler.providers.aws.lib.service.service import AWS_Service, lazy_attribute
+
+AWS_REGIONS = ["eu-west-1", "us-east-1"]
+
+
+class Fake_Service(AWS_Service):
+    def __init__(self):
+        self.regional_clients = {}
+        for region in AWS_REGIONS:
+            regional_client = MagicMock()
+            regional_client.region = region
+            self.regional_clients[region] = regional_client
+        self.calls = []
+
+    @lazy_attribute
+    def resources(self):
+        self.resources = []
+        self.__threading_call__(self.__list_resources__)
+
+    @lazy_attribute
+    def resources_count(self):
+        self.resources_count = len(self.resources)
+
+    @lazy_attribute
+    def tags(self):
+        self.tags = {}
+        self.__threading_call__(self.__list_tags__, self.resources)
+
+    @lazy_attribute
+    def failing(self):
+        self.calls.append("failing")
+        raise ValueError("failing")
+
+    @lazy_attribute
+    def slow_resources(self):
+        self.slow_resources = []
+        # The partial value must not be seen by the other threads meanwhile
+        time.sleep(0.1)
+        self.slow_resources.extend(AWS_REGIONS)
+
+    @lazy_attribute
+    def slow_resources_counts(self):
+        self.slow_resources_counts = {}
+        barrier = threading.Barrier(len(AWS_REGIONS), timeout=5)
+
+        def count_slow_resources(regional_client):
+            # Both calls read the attribute while it is not retrieved yet
+            barrier.wait()
+            self.slow_resources_counts[regional_client.region] = len(
+                self.slow_resources
+            )
+
+        self.__threading_call__(count_slow_resources)
+
+    def __list_resources__(self, regional_client):
+        self.calls.append(regional_client.region)
+        self.resources.append(regional_client.region)
+
+    def __list_tags__(self, resource):
+        self.calls.append(f"tags-{resource}")
+        self.tags[resource] = [{"Key": "Name", "Value": resource}]
+
+
+class Test_AWS_Service:
+    def test_lazy_attribute_not_retrieved(self):
+        service = Fake_Service()
+        assert service.calls == []
+        assert "resources" not in service.__dict__
+
+    def test_lazy_attribute_retrieved_once(self):
+        service = Fake_Service()
+        assert sorted(service.resources) == AWS_REGIONS
+        assert sorted(service.resources) == AWS_REGIONS
+        assert sorted(service.calls) == AWS_REGIONS
+
+    def test_lazy_attribute_depending_on_another(self):
+        service = Fake_Service()
+        assert service.resources_count == len(AWS_REGIONS)
+        assert sorted(service.resources) == AWS_REGIONS
+        assert sorted(service.calls) == AWS_REGIONS
+
+    def test_lazy_attribute_set(self):
+        service = Fake_Service()
+        service.resources = ["resource"]
+        assert service.resources == ["resource"]
+        assert service.calls == []
+
+    def test_lazy_attribute_retried_after_error(self):
+        service = Fake_Service()
+        with pytest.raises(ValueError):
+            service.failing
+        with pytest.raises(ValueError):
+            service.failing
+        assert service.calls == ["failing", "failing"]
+
+    def test_lazy_attribute_concurrent_access(self):
+        service = Fake_Service()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(sorted(service.resources)))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [AWS_REGIONS] * 10
+        assert sorted(service.calls) == AWS_REGIONS
+
+    def test_lazy_attribute_needed_by_concurrent_calls(self):
+        service = Fake_Service()
+        assert service.slow_resources_counts == {
+            region: len(AWS_REGIONS) for region in AWS_REGIONS
+        }
+
+    def test_threading_call_per_resource(self):
+        service = Fake_Service()
+        assert sorted(service.tags) == AWS_REGIONS
+        assert sorted(service.calls) == sorted(
+            AWS_REGIONS + [f"tags-{region}" for region in AWS_REGIONS]
+        )
+
+    def test_threading_call_results(self):
+        service = Fake_Service()
+        assert (
+            service.__threading_call__(lambda regional_client: regional_client.region)
+            == AWS_REGIONS
+        )
+        assert service.__threading_call__(str.upper, ["a", "b", "c"]) == [
+            "A",
+            "B",
+            "C",
+        ]
@@ -1,6 +1,29 @@
 import pytest
 
-from prowler.providers.aws.services.ec2.lib.security_groups import _is_cidr_public
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    Security_Group_Exposure,
+    _is_cidr_public,
+    check_security_group,
+    merge_port_ranges,
+)
+
+
+def set_ingress_rule(
+    protocol: str,
+    from_port: int = None,
+    to_port: int = None,
+    ipv4_cidrs: list = [],
+    ipv6_cidrs: list = [],
+) -> dict:
+    ingress_rule = {
+        "IpProtocol": protocol,
+        "IpRanges": [{"CidrIp": cidr} for cidr in ipv4_cidrs],
+        "Ipv6Ranges": [{"CidrIpv6": cidr} for cidr in ipv6_cidrs],
+    }
+    if from_port is not None:
+        ingress_rule["FromPort"] = from_port
+        ingress_rule["ToPort"] = to_port
+    return ingress_rule
 
 
 class Test_security_groups:
@@ -19,3 +42,89 @@ class Test_security_groups:
 
         assert ex.type == ValueError
         assert ex.match(f"{cidr} has host bits set")
+
+    def test_merge_port_ranges(self):
+        assert merge_port_ranges([(80, 80), (20, 22), (23, 25), (10, 21)]) == (
+            [10, 80],
+            [25, 80],
+        )
+        assert merge_port_ranges([]) == ([], [])
+
+    def test_security_group_exposure(self):
+        exposure = Security_Group_Exposure(
+            [
+                set_ingress_rule("tcp", 20, 25, ipv4_cidrs=["0.0.0.0/0"]),
+                set_ingress_rule("tcp", 3300, 3400, ipv4_cidrs=["8.8.8.0/24"]),
+                set_ingress_rule("udp", 53, 53, ipv6_cidrs=["::/0"]),
+                set_ingress_rule("tcp", 5432, 5432, ipv4_cidrs=["10.0.0.0/8"]),
+            ]
+        )
+        assert exposure.is_exposed("tcp", [22], any_address=True)
+        assert not exposure.is_exposed("tcp", [26, 80], any_address=True)
+        assert not exposure.is_exposed("udp", [22], any_address=True)
+        assert exposure.is_exposed("udp", [53], any_address=True)
+        # A public CIDR different from 0.0.0.0/0 is only exposed without any_address
+        assert not exposure.is_exposed("tcp", [3306], any_address=True)
+        assert exposure.is_exposed("tcp", [3306])
+        assert not exposure.is_exposed("tcp", [5432])
+        # There is no rule allowing all the traffic nor all the ports
+        assert not exposure.is_exposed("-1", any_address=True)
+        assert not exposure.is_exposed("-1")
+
+    def test_security_group_exposure_all_traffic(self):
+        exposure = Security_Group_Exposure(
+            [set_ingress_rule("-1", ipv6_cidrs=["::/0"])]
+        )
+        assert exposure.is_exposed("-1", any_address=True)
+        assert exposure.is_exposed("tcp", [22], any_address=True)
+        assert not Security_Group_Exposure(
+            [set_ingress_rule("-1", ipv4_cidrs=["10.0.0.0/8"])]
+        ).is_exposed("-1")
+
+    def test_security_group_exposure_all_ports(self):
+        exposure = Security_Group_Exposure(
+            [set_ingress_rule("udp", 0, 65535, ipv4_cidrs=["0.0.0.0/0"])]
+        )
+        # All the ports are open in any protocol
+        assert exposure.is_exposed("tcp", [22], any_address=True)
+        assert exposure.is_exposed("-1", any_address=True)
+        # The ports are not merged into all the ports
+        assert not Security_Group_Exposure(
+            [
+                set_ingress_rule("tcp", 0, 1000, ipv4_cidrs=["0.0.0.0/0"]),
+                set_ingress_rule("tcp", 1001, 65535, ipv4_cidrs=["0.0.0.0/0"]),
+            ]
+        ).is_exposed("-1", any_address=True)
+
+    def test_security_group_exposure_check_security_group(self):
+        ingress_rules = [
+            set_ingress_rule("-1", ipv4_cidrs=["0.0.0.0/0"]),
+            set_ingress_rule("-1", ipv4_cidrs=["8.8.8.8/32"]),
+            set_ingress_rule("-1", ipv6_cidrs=["2001:4860::/32"]),
+            set_ingress_rule("tcp", 0, 65535, ipv4_cidrs=["10.0.0.0/8"]),
+            set_ingress_rule("tcp", 0, 65535, ipv6_cidrs=["2001:4860::/32"]),
+            set_ingress_rule("tcp", 22, 22, ipv4_cidrs=["0.0.0.0/0"]),
+            set_ingress_rule("tcp", 1000, 2000, ipv4_cidrs=["8.8.8.8/32"]),
+            set_ingress_rule("tcp", 3306, 3306, ipv6_cidrs=["2001:4860::/32"]),
+            set_ingress_rule("udp", 3389, 3389, ipv6_cidrs=["::/0"]),
+            set_ingress_rule("icmp", -1, -1, ipv4_cidrs=["0.0.0.0/0"]),
+        ]
+        queries = [
+            ("-1", []),
+            ("tcp", [22]),
+            ("tcp", [1500, 3389]),
+            ("tcp", [3306]),
+            ("udp", [3389]),
+            ("tcp", [5432]),
+        ]
+        # Every ingress rule alone and all of them give the same result as check_security_group
+        for rules in [[ingress_rule] for ingress_rule in ingress_rules] + [
+            ingress_rules
+        ]:
+            exposure = Security_Group_Exposure(rules)
+            for protocol, ports in queries:
+                for any_address in (True, False):
+                    assert exposure.is_exposed(protocol, ports, any_address) == any(
+                        check_security_group(rule, protocol, ports, any_address)
+                        for rule in rules
+                    )
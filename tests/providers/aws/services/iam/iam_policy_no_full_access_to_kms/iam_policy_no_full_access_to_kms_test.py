@@ -73,6 +73,47 @@ class Test_iam_policy_no_full_access_to_kms:
                 assert result[0].resource_arn == arn
                 assert result[0].region == "us-east-1"
 
+    @mock_iam
+    def test_policy_full_access_to_kms_except_one_action(self):
+        audit_info = self.set_mocked_audit_info()
+        iam_client = client("iam")
+        policy_name = "policy_kms_full_except_deletion"
+        policy_document_full_access = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {"Effect": "Allow", "Action": "kms:*", "Resource": "*"},
+                {
+                    "Effect": "Deny",
+                    "Action": "kms:ScheduleKeyDeletion",
+                    "Resource": "*",
+                },
+            ],
+        }
+        iam_client.create_policy(
+            PolicyName=policy_name, PolicyDocument=dumps(policy_document_full_access)
+        )
+
+        with mock.patch(
+            "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
+            new=audit_info,
+        ):
+            with mock.patch(
+                "prowler.providers.aws.services.iam.iam_policy_no_full_access_to_kms.iam_policy_no_full_access_to_kms.iam_client",
+                new=IAM(audit_info),
+            ):
+                # Test Check
+                from prowler.providers.aws.services.iam.iam_policy_no_full_access_to_kms.iam_policy_no_full_access_to_kms import (
+                    iam_policy_no_full_access_to_kms,
+                )
+
+                check = iam_policy_no_full_access_to_kms()
+                result = check.execute()
+                assert result[0].status == "FAIL"
+                assert (
+                    result[0].status_extended
+                    == f"Custom Policy {policy_name} allows 'kms:*' privileges"
+                )
+
     @mock_iam
     def test_policy_no_full_access_to_kms(self):
         audit_info = self.set_mocked_audit_info()
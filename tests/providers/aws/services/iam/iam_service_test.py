@@ -1,11 +1,23 @@
+import os
+import stat
+from datetime import datetime, timedelta, timezone
 from json import dumps
 
+import mock
 from boto3 import client, session
 from freezegun import freeze_time
 from moto import mock_iam
 
+from prowler.lib.worker_pool.worker_pool import worker_pool
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
-from prowler.providers.aws.services.iam.iam_service import IAM, is_service_role
+from prowler.providers.aws.services.iam.iam_service import (
+    IAM,
+    credential_report_validity,
+    get_credential_report_cache_path,
+    is_service_role,
+    load_cached_credential_report,
+    store_cached_credential_report,
+)
 
 AWS_ACCOUNT_NUMBER = "123456789012"
 TEST_DATETIME = "2023-01-01T12:01:01+00:00"
@@ -220,6 +232,100 @@ class Test_IAM_Service:
             == expected_credential_report["cert_2_last_rotated"]
         )
 
+    # Test IAM Get Credential Report not generated in time
+    @mock_iam
+    def test__get_credential_report__timeout(self):
+        audit_info = self.set_mocked_audit_info()
+        iam = IAM(audit_info)
+        iam.client = mock.MagicMock()
+        iam.client.generate_credential_report.return_value = {"State": "STARTED"}
+        with mock.patch(
+            "prowler.providers.aws.services.iam.iam_service.credential_report_timeout",
+            0.5,
+        ):
+            assert not iam.__generate_credential_report__()
+            iam.credential_report_generation = worker_pool.submit(
+                iam.__generate_credential_report__
+            )
+            assert iam.__get_credential_report__() == []
+        # The report is polled with an increasing interval instead of a busy loop
+        assert iam.client.generate_credential_report.call_count < 20
+        iam.client.get_credential_report.assert_not_called()
+
+    # Test IAM Credential Report cached by a previous execution
+    # moto generates every credential report at 2015-02-02T20:02:02Z
+    @freeze_time("2015-02-02T21:00:00+00:00")
+    @mock_iam
+    def test__get_credential_report__cached(self, tmp_path):
+        iam_client = client("iam")
+        username = "user1"
+        iam_client.create_user(UserName=username)
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audited_account = AWS_ACCOUNT_NUMBER
+        audit_info.credential_report_cache = True
+        with mock.patch(
+            "prowler.providers.aws.services.iam.iam_service.default_cache_directory",
+            str(tmp_path),
+        ):
+            iam = IAM(audit_info)
+            assert iam.credential_report[0]["user"] == username
+            cache_path = get_credential_report_cache_path(AWS_ACCOUNT_NUMBER)
+            assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+
+            # The next execution reuses the cached report without generating it
+            iam_client.create_user(UserName="user2")
+            iam = IAM(audit_info)
+            iam.__start_collecting__(["credential_report"])
+            assert [user["user"] for user in iam.credential_report] == [username]
+            assert "credential_report_generation" not in vars(iam)
+
+            # The report is generated again once it is not valid
+            store_cached_credential_report(
+                AWS_ACCOUNT_NUMBER,
+                datetime.now(timezone.utc)
+                - timedelta(seconds=credential_report_validity),
+                iam.credential_report,
+            )
+            assert not load_cached_credential_report(AWS_ACCOUNT_NUMBER)
+            iam = IAM(audit_info)
+            assert [user["user"] for user in iam.credential_report] == [
+                username,
+                "user2",
+            ]
+            assert iam.credential_report_generation.result()
+
+    # Test IAM Credential Report only generated if it is needed
+    @mock_iam
+    def test__start_collecting__(self):
+        audit_info = self.set_mocked_audit_info()
+        iam = IAM(audit_info)
+        iam.client = mock.MagicMock()
+        iam.client.generate_credential_report.return_value = {"State": "COMPLETE"}
+        iam.__start_collecting__(["users", "password_policy"])
+        assert "credential_report_generation" not in vars(iam)
+        # The generation is started in the background when the checks read the report
+        iam.__start_collecting__(["credential_report", "users"])
+        assert iam.credential_report_generation.result()
+        iam.client.generate_credential_report.assert_called_once()
+
+    # Test IAM Credential Report generated on its first access
+    @mock_iam
+    def test__get_credential_report__not_started(self):
+        audit_info = self.set_mocked_audit_info()
+        iam = IAM(audit_info)
+        iam.client = mock.MagicMock()
+        iam.client.generate_credential_report.return_value = {"State": "COMPLETE"}
+        iam.client.get_credential_report.return_value = {
+            "Content": b"user,arn\nuser1,arn:aws:iam::123456789012:user/user1"
+        }
+        # Building the service does not generate the report
+        iam.client.generate_credential_report.assert_not_called()
+        assert iam.credential_report == [
+            {"user": "user1", "arn": "arn:aws:iam::123456789012:user/user1"}
+        ]
+        assert iam.credential_report_generation.result()
+        iam.client.generate_credential_report.assert_called_once()
+
     # Test IAM Get Roles
     @mock_iam
     def test__get_roles__(self):
@@ -703,6 +809,160 @@ class Test_IAM_Service:
                 assert policy.document["Statement"][0]["Resource"] == "*"
         assert custom_policies == 1
 
+    @mock_iam
+    def test__get_account_authorization_details__(self):
+        iam_client = client("iam")
+        username = "user1"
+        iam_client.create_user(UserName=username, Tags=[{"Key": "a", "Value": "b"}])
+        iam_client.put_user_policy(
+            UserName=username,
+            PolicyName="inline-policy",
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [{"Effect": "Allow", "Action": "*", "Resource": "*"}],
+                }
+            ),
+        )
+        group = "test-group"
+        iam_client.create_group(GroupName=group)
+        iam_client.add_user_to_group(GroupName=group, UserName=username)
+        iam_client.attach_group_policy(
+            GroupName=group, PolicyArn="arn:aws:iam::aws:policy/AdministratorAccess"
+        )
+        role_name = "test-role"
+        iam_client.create_role(
+            RoleName=role_name,
+            AssumeRolePolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Allow",
+                            "Principal": {"Service": "ec2.amazonaws.com"},
+                            "Action": "sts:AssumeRole",
+                        }
+                    ],
+                }
+            ),
+            Tags=[{"Key": "c", "Value": "d"}],
+        )
+        policy_arn = iam_client.create_policy(
+            PolicyName="policy1",
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {"Effect": "Allow", "Action": "s3:*", "Resource": "*"}
+                    ],
+                }
+            ),
+        )["Policy"]["Arn"]
+        iam_client.attach_role_policy(RoleName=role_name, PolicyArn=policy_arn)
+
+        audit_info = self.set_mocked_audit_info()
+        iam = IAM(audit_info)
+        # The per-entity calls returned in the account authorization details are not made
+        with mock.patch.object(
+            IAM, "__list_attached_user_policies__"
+        ) as list_attached_user_policies, mock.patch.object(
+            IAM, "__get_group_users__"
+        ) as get_group_users, mock.patch.object(
+            IAM, "__list_role_tags__"
+        ) as list_role_tags, mock.patch.object(
+            IAM, "__list_policies_version__"
+        ) as list_policies_version:
+            assert iam.users[0].inline_policies == ["inline-policy"]
+            assert iam.users[0].tags == [{"Key": "a", "Value": "b"}]
+            assert iam.groups[0].users[0].name == username
+            assert (
+                iam.groups[0].attached_policies[0]["PolicyArn"]
+                == "arn:aws:iam::aws:policy/AdministratorAccess"
+            )
+            assert iam.roles[0].is_service_role
+            assert iam.roles[0].tags == [{"Key": "c", "Value": "d"}]
+            assert iam.roles[0].attached_policies == [
+                {"PolicyName": "policy1", "PolicyArn": policy_arn}
+            ]
+            custom_policies = [
+                policy for policy in iam.policies if policy.type == "Custom"
+            ]
+            assert len(custom_policies) == 1
+            assert custom_policies[0].attached
+            assert custom_policies[0].document["Statement"][0]["Action"] == "s3:*"
+            # Only the attached AWS Managed policies are listed
+            assert "arn:aws:iam::aws:policy/AdministratorAccess" in [
+                policy.arn for policy in iam.policies if policy.type == "AWS"
+            ]
+        list_attached_user_policies.assert_not_called()
+        get_group_users.assert_not_called()
+        list_role_tags.assert_not_called()
+        list_policies_version.assert_not_called()
+
+    @mock_iam
+    def test__get_account_authorization_details__sorted(self):
+        iam_client = client("iam")
+        policy_names = ["policy3", "policy1", "policy2"]
+        for policy_name in policy_names:
+            iam_client.create_policy(
+                PolicyName=policy_name,
+                PolicyDocument=dumps(
+                    {
+                        "Version": "2012-10-17",
+                        "Statement": [
+                            {"Effect": "Allow", "Action": "s3:*", "Resource": "*"}
+                        ],
+                    }
+                ),
+            )
+            iam_client.create_role(
+                RoleName=f"role-{policy_name}", AssumeRolePolicyDocument="{}"
+            )
+        audit_info = self.set_mocked_audit_info()
+        iam = IAM(audit_info)
+        # The entities are always reported in the same order
+        assert [
+            policy.name for policy in iam.policies if policy.type == "Custom"
+        ] == sorted(policy_names)
+        assert [role.name for role in iam.roles] == sorted(
+            f"role-{policy_name}" for policy_name in policy_names
+        )
+
+    @mock_iam
+    def test__get_account_authorization_details__denied(self):
+        iam_client = client("iam")
+        username = "user1"
+        iam_client.create_user(UserName=username, Tags=[{"Key": "a", "Value": "b"}])
+        group = "test-group"
+        iam_client.create_group(GroupName=group)
+        iam_client.add_user_to_group(GroupName=group, UserName=username)
+        policy_name = "policy1"
+        iam_client.create_policy(
+            PolicyName=policy_name,
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [{"Effect": "Allow", "Action": "*", "Resource": "*"}],
+                }
+            ),
+        )
+
+        audit_info = self.set_mocked_audit_info()
+        iam = IAM(audit_info)
+        # Every entity is retrieved with its own calls
+        with mock.patch.object(
+            IAM, "__get_account_authorization_details__", return_value=None
+        ):
+            assert iam.authorization_details is None
+            assert iam.users[0].tags == [{"Key": "a", "Value": "b"}]
+            assert iam.groups[0].users[0].name == username
+            custom_policies = [
+                policy for policy in iam.policies if policy.type == "Custom"
+            ]
+            assert len(custom_policies) == 1
+            assert custom_policies[0].name == policy_name
+            assert custom_policies[0].document["Statement"][0]["Action"] == "*"
+
     # Test IAM List SAML Providers
     @mock_iam
     def test__list_saml_providers__(self):
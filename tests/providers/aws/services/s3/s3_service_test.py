@@ -1,6 +1,7 @@
 import json
 
 from boto3 import client, session
+from botocore.config import Config
 from moto import mock_s3, mock_s3control
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
@@ -53,6 +54,15 @@ class Test_S3_Service:
         s3 = S3(audit_info)
         assert s3.client.__class__.__name__ == "S3"
 
+    # Test S3 Client Config
+    @mock_s3
+    def test_client_session_config(self):
+        audit_info = self.set_mocked_audit_info()
+        audit_info.session_config = Config(max_pool_connections=64)
+        s3 = S3(audit_info)
+        # The buckets are retrieved concurrently, so the client is sized as the regional ones
+        assert s3.client.meta.config.max_pool_connections == 64
+
     # Test S3 Session
     @mock_s3
     def test__get_session__(self):
@@ -90,6 +100,37 @@ class Test_S3_Service:
         )
         assert not s3.buckets[0].object_lock
 
+    # Test S3 Get Bucket, from its location to its attributes
+    @mock_s3
+    def test__get_bucket__(self):
+        s3_client = client("s3")
+        s3_client.create_bucket(Bucket="bucket-b")
+        s3_client.create_bucket(
+            Bucket="bucket-a",
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+        )
+        s3_client.put_bucket_versioning(
+            Bucket="bucket-a",
+            VersioningConfiguration={"Status": "Enabled"},
+        )
+        s3_client.create_bucket(
+            Bucket="bucket-c",
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audited_regions = ["us-east-1", "eu-west-1"]
+        s3 = S3(audit_info)
+
+        # The buckets keep the order of ListBuckets and the ones outside the audited regions are excluded
+        assert [(bucket.name, bucket.region) for bucket in s3.buckets] == [
+            ("bucket-b", "us-east-1"),
+            ("bucket-a", "eu-west-1"),
+        ]
+        assert not s3.buckets[0].versioning
+        assert s3.buckets[0].public_access_block
+        assert s3.buckets[1].versioning
+
     # Test S3 Get Bucket Versioning
     @mock_s3
     def test__get_bucket_versioning__(self):
@@ -71,6 +71,10 @@ def mock_print_audit_credentials(*_):
     pass
 
 
+def mock_get_enabled_regions(*_):
+    return {"eu-west-1", "us-east-1"}
+
+
 def mock_set_identity_info(*_):
     return Azure_Identity_Info()
 
@@ -127,6 +131,10 @@ class Test_Set_Audit_Info:
         "prowler.providers.common.audit_info.print_aws_credentials",
         new=mock_print_audit_credentials,
     )
+    @patch(
+        "prowler.providers.common.audit_info.get_enabled_regions",
+        new=mock_get_enabled_regions,
+    )
     def test_set_audit_info_aws(self):
         with patch(
             "prowler.providers.common.audit_info.current_audit_info",
@@ -149,6 +157,49 @@ class Test_Set_Audit_Info:
 
             audit_info = set_provider_audit_info(provider, arguments)
             assert isinstance(audit_info, AWS_Audit_Info)
+            assert audit_info.enabled_regions == {"eu-west-1", "us-east-1"}
+            # A connection per thread making calls concurrently
+            assert audit_info.session_config.max_pool_connections == 33
+            assert audit_info.session_config.tcp_keepalive
+
+    @patch(
+        "prowler.providers.common.audit_info.validate_aws_credentials",
+        new=mock_validate_credentials,
+    )
+    @patch(
+        "prowler.providers.common.audit_info.print_aws_credentials",
+        new=mock_print_audit_credentials,
+    )
+    @patch(
+        "prowler.providers.common.audit_info.get_enabled_regions",
+        new=mock_get_enabled_regions,
+    )
+    def test_set_audit_info_aws_connection_config(self):
+        with patch(
+            "prowler.providers.common.audit_info.current_audit_info",
+            new=self.set_mocked_audit_info(),
+        ):
+            provider = "aws"
+            arguments = {
+                "profile": None,
+                "role": None,
+                "session_duration": None,
+                "external_id": None,
+                "regions": None,
+                "organizations_role": None,
+                "max_workers": 64,
+                "warm_up_services": 10,
+                "aws_connect_timeout": 5,
+            }
+
+            audit_info = set_provider_audit_info(provider, arguments)
+            assert audit_info.session_config.max_pool_connections == 74
+            assert audit_info.session_config.connect_timeout == 5
+            assert audit_info.session_config.read_timeout == 60
+
+            arguments["aws_max_pool_connections"] = 16
+            audit_info = set_provider_audit_info(provider, arguments)
+            assert audit_info.session_config.max_pool_connections == 16
 
     @patch(
         "prowler.providers.common.audit_info.azure_audit_info",
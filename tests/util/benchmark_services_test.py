@@ -0,0 +1,105 @@
+from util.benchmark_services import (
+    compare_with_baseline,
+    get_benchmark_services,
+    spread,
+)
+
+THRESHOLD = 0.25
+MIN_TIME = 0.1
+MIN_MEMORY = 1024 * 1024
+
+
+def set_results(service_time: float, service_memory: int, check_time: float) -> dict:
+    return {
+        "estate": {},
+        "services": {
+            "ec2_client": {"time": service_time, "peak_memory": service_memory}
+        },
+        "checks": {
+            "ec2_instance_public_ip": {
+                "time": check_time,
+                "peak_memory": 1024,
+                "findings": 10,
+            }
+        },
+    }
+
+
+class Test_Benchmark_Services:
+    def test_spread(self):
+        assert spread(10, ["us-east-1", "eu-west-1", "eu-west-2"]) == [
+            ("us-east-1", 4),
+            ("eu-west-1", 3),
+            ("eu-west-2", 3),
+        ]
+        assert spread(0, ["us-east-1"]) == [("us-east-1", 0)]
+
+    def test_compare_with_baseline_no_regressions(self):
+        baseline = set_results(10.0, 100 * MIN_MEMORY, 1.0)
+        # Within the threshold
+        results = set_results(12.0, 120 * MIN_MEMORY, 1.2)
+        assert not compare_with_baseline(
+            results, baseline, THRESHOLD, MIN_TIME, MIN_MEMORY
+        )
+        # The improvements are not regressions
+        results = set_results(5.0, 50 * MIN_MEMORY, 0.5)
+        assert not compare_with_baseline(
+            results, baseline, THRESHOLD, MIN_TIME, MIN_MEMORY
+        )
+
+    def test_compare_with_baseline_regressions(self):
+        baseline = set_results(10.0, 100 * MIN_MEMORY, 1.0)
+        results = set_results(13.0, 200 * MIN_MEMORY, 2.0)
+        assert compare_with_baseline(
+            results, baseline, THRESHOLD, MIN_TIME, MIN_MEMORY
+        ) == [
+            ["ec2_client", "time", 10.0, 13.0, "+30%"],
+            [
+                "ec2_client",
+                "peak_memory",
+                100 * MIN_MEMORY,
+                200 * MIN_MEMORY,
+                "+100%",
+            ],
+            ["ec2_instance_public_ip", "time", 1.0, 2.0, "+100%"],
+        ]
+        # A higher threshold allows them
+        assert not compare_with_baseline(results, baseline, 1.0, MIN_TIME, MIN_MEMORY)
+
+    def test_compare_with_baseline_noise(self):
+        # The increases below the minimum time or memory are ignored, even if they are relative regressions
+        baseline = set_results(0.01, 1024, 0.01)
+        results = set_results(0.05, 10 * 1024, 0.1)
+        assert not compare_with_baseline(
+            results, baseline, THRESHOLD, MIN_TIME, MIN_MEMORY
+        )
+        results = set_results(0.5, 10 * 1024, 0.1)
+        assert compare_with_baseline(
+            results, baseline, THRESHOLD, MIN_TIME, MIN_MEMORY
+        ) == [["ec2_client", "time", 0.01, 0.5, "+4900%"]]
+
+    def test_compare_with_baseline_new_results(self):
+        # The service clients and checks not in the baseline are not compared
+        baseline = set_results(10.0, 100 * MIN_MEMORY, 1.0)
+        results = set_results(10.0, 100 * MIN_MEMORY, 1.0)
+        results["checks"]["ec2_instance_imdsv2_enabled"] = {
+            "time": 100.0,
+            "peak_memory": 1000 * MIN_MEMORY,
+            "findings": 10,
+        }
+        assert not compare_with_baseline(
+            results, baseline, THRESHOLD, MIN_TIME, MIN_MEMORY
+        )
+
+    def test_get_benchmark_services(self):
+        # The services calling AWS services moto cannot mock are skipped, since the benchmark runs offline
+        assert get_benchmark_services(["ec2", "account", "s3"]) == (
+            ["ec2", "s3"],
+            ["account"],
+        )
+
+    def test_get_benchmark_services_all(self):
+        benchmark_services, skipped_services = get_benchmark_services()
+        assert {"ec2", "s3", "iam", "awslambda"} <= set(benchmark_services)
+        assert "account" in skipped_services
+        assert not set(benchmark_services) & set(skipped_services)
@@ -0,0 +1,107 @@
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from time import perf_counter
+
+from tabulate import tabulate
+
+from prowler.lib.check.models import (
+    Check_Metadata_Model,
+    Check_Report_AWS,
+    Shared_Check_Metadata_Model,
+)
+
+metadata_file = "prowler/providers/aws/services/ec2/ec2_securitygroup_allow_ingress_from_internet_to_any_port/ec2_securitygroup_allow_ingress_from_internet_to_any_port.metadata.json"
+
+
+@dataclass
+class Legacy_Check_Report_AWS:
+    """Check_Report_AWS before sharing the check's metadata, it parses it for every finding"""
+
+    status: str
+    status_extended: str
+    check_metadata: Check_Metadata_Model
+    resource_details: str
+    resource_tags: list
+    resource_id: str
+    resource_arn: str
+    region: str
+
+    def __init__(self, metadata):
+        self.status = ""
+        self.check_metadata = Check_Metadata_Model.parse_raw(metadata)
+        self.status_extended = ""
+        self.resource_details = ""
+        self.resource_tags = []
+        self.resource_id = ""
+        self.resource_arn = ""
+        self.region = ""
+
+
+def create_findings(report_class, metadata, findings_number: int) -> list:
+    findings = []
+    for index in range(findings_number):
+        # Checks call self.metadata() for every finding
+        report = report_class(metadata())
+        report.status = "PASS"
+        report.status_extended = f"Security group sg-{index:017x} is not open."
+        report.resource_id = f"sg-{index:017x}"
+        report.resource_arn = (
+            f"arn:aws:ec2:eu-west-1:123456789012:security-group/sg-{index:017x}"
+        )
+        report.region = "eu-west-1"
+        findings.append(report)
+    return findings
+
+
+def benchmark(report_class, metadata, findings_number: int) -> list:
+    # Time and memory are measured separately since tracing the allocations slows down the execution
+    gc.collect()
+    start_time = perf_counter()
+    findings = create_findings(report_class, metadata, findings_number)
+    elapsed_time = perf_counter() - start_time
+    del findings
+
+    gc.collect()
+    tracemalloc.start()
+    findings = create_findings(report_class, metadata, findings_number)
+    retained_memory, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del findings
+
+    return [
+        report_class.__name__,
+        f"{elapsed_time / findings_number * 1_000_000:.2f}",
+        f"{retained_memory / findings_number:.0f}",
+        f"{peak_memory / 1024 / 1024:.1f}",
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the time and memory needed to create the findings of a check"
+    )
+    parser.add_argument("--findings", type=int, default=20000)
+    args = parser.parse_args()
+
+    shared_metadata = Shared_Check_Metadata_Model.parse_file(metadata_file)
+    results = [
+        # Before: Check.metadata() returned the JSON representation of the metadata
+        benchmark(Legacy_Check_Report_AWS, shared_metadata.json, args.findings),
+        # After: Check.metadata() returns the metadata shared by all the findings
+        benchmark(Check_Report_AWS, lambda: shared_metadata, args.findings),
+    ]
+    print(f"{args.findings} findings of one check\n")
+    print(
+        tabulate(
+            results,
+            headers=[
+                "Finding",
+                "Time per finding (us)",
+                "Memory per finding (bytes)",
+                "Peak memory (MiB)",
+            ],
+            tablefmt="rounded_grid",
+        )
+    )
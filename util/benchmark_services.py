@@ -0,0 +1,631 @@
+import argparse
+import gc
+import io
+import json
+import os
+import pathlib
+import re
+import socket
+import sys
+import tracemalloc
+import zipfile
+from contextlib import ExitStack
+from time import perf_counter
+from types import SimpleNamespace
+
+import boto3
+import moto
+from moto.core import DEFAULT_ACCOUNT_ID
+from tabulate import tabulate
+
+import prowler
+from prowler.lib.check.check import (
+    build_service_client,
+    list_services,
+    load_check,
+    recover_checks_from_provider,
+    recover_service_clients_from_checks,
+    run_check,
+)
+from prowler.lib.logger import logger, logging_levels, set_logging_config
+from prowler.providers.aws.lib.audit_info.audit_info import current_audit_info
+from prowler.providers.common.models import Audit_Metadata
+
+# 17 regions where all the benchmarked services are available
+benchmark_regions = [
+    "us-east-1",
+    "us-east-2",
+    "us-west-1",
+    "us-west-2",
+    "ca-central-1",
+    "sa-east-1",
+    "eu-west-1",
+    "eu-west-2",
+    "eu-west-3",
+    "eu-central-1",
+    "eu-north-1",
+    "ap-south-1",
+    "ap-northeast-1",
+    "ap-northeast-2",
+    "ap-northeast-3",
+    "ap-southeast-1",
+    "ap-southeast-2",
+]
+
+# Ports of the security group rules, most of them checked by the ec2_securitygroup_allow_ingress_* checks
+security_group_ports = [22, 3389, 3306, 5432, 6379, 27017, 9200, 11211, 443, 80]
+lambda_runtimes = ["python3.9", "python3.7", "nodejs18.x", "nodejs12.x", "java11"]
+
+
+def spread(resources_number: int, regions: list) -> list[tuple[str, int]]:
+    """spread returns how many resources are created in every region to spread them evenly"""
+    quotient, remainder = divmod(resources_number, len(regions))
+    return [
+        (region, quotient + (1 if index < remainder else 0))
+        for index, region in enumerate(regions)
+    ]
+
+
+def create_roles(roles_number: int) -> list:
+    iam_client = boto3.client("iam")
+    trust_policy = {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"Service": "lambda.amazonaws.com"},
+                "Action": "sts:AssumeRole",
+            }
+        ],
+    }
+    wildcard_policy = {
+        "Version": "2012-10-17",
+        "Statement": [{"Effect": "Allow", "Action": "*", "Resource": "*"}],
+    }
+    role_arns = []
+    for index in range(roles_number):
+        role_name = f"benchmark-role-{index}"
+        role_arns.append(
+            iam_client.create_role(
+                RoleName=role_name, AssumeRolePolicyDocument=json.dumps(trust_policy)
+            )["Role"]["Arn"]
+        )
+        if index % 3 == 0:
+            iam_client.put_role_policy(
+                RoleName=role_name,
+                PolicyName="benchmark-inline-policy",
+                PolicyDocument=json.dumps(wildcard_policy),
+            )
+        if index % 5 == 0:
+            iam_client.attach_role_policy(
+                RoleName=role_name,
+                PolicyArn="arn:aws:iam::aws:policy/AdministratorAccess",
+            )
+    return role_arns
+
+
+def create_security_groups(region: str, security_groups_number: int) -> list:
+    ec2_client = boto3.client("ec2", region_name=region)
+    security_group_ids = []
+    for index in range(security_groups_number):
+        security_group_id = ec2_client.create_security_group(
+            GroupName=f"benchmark-sg-{index}", Description="Benchmark security group"
+        )["GroupId"]
+        port = security_group_ports[index % len(security_group_ports)]
+        ec2_client.authorize_security_group_ingress(
+            GroupId=security_group_id,
+            IpPermissions=[
+                {
+                    "IpProtocol": "tcp",
+                    "FromPort": port,
+                    "ToPort": port,
+                    "IpRanges": [
+                        {"CidrIp": "0.0.0.0/0" if index % 4 == 0 else "10.0.0.0/8"}
+                    ],
+                }
+            ],
+        )
+        security_group_ids.append(security_group_id)
+    return security_group_ids
+
+
+def create_instances(region: str, instances_number: int, security_group_ids: list):
+    ec2_client = boto3.client("ec2", region_name=region)
+    image_id = ec2_client.describe_images(Owners=["amazon"])["Images"][0]["ImageId"]
+    batch_size = 500
+    for batch, start in enumerate(range(0, instances_number, batch_size)):
+        instances_batch = min(batch_size, instances_number - start)
+        instances_arguments = {
+            "ImageId": image_id,
+            "InstanceType": "t3.micro",
+            "MinCount": instances_batch,
+            "MaxCount": instances_batch,
+            "MetadataOptions": {
+                "HttpTokens": "required" if batch % 2 == 0 else "optional"
+            },
+            "UserData": "#!/bin/bash\nyum update -y\n",
+        }
+        if security_group_ids:
+            instances_arguments["SecurityGroupIds"] = [
+                security_group_ids[batch % len(security_group_ids)]
+            ]
+        ec2_client.run_instances(**instances_arguments)
+
+
+def create_buckets(region: str, buckets_number: int, first_index: int):
+    s3_client = boto3.client("s3", region_name=region)
+    for index in range(first_index, first_index + buckets_number):
+        bucket_name = f"benchmark-bucket-{index}"
+        if region == "us-east-1":
+            s3_client.create_bucket(Bucket=bucket_name)
+        else:
+            s3_client.create_bucket(
+                Bucket=bucket_name,
+                CreateBucketConfiguration={"LocationConstraint": region},
+            )
+        if index % 2 == 0:
+            s3_client.put_bucket_encryption(
+                Bucket=bucket_name,
+                ServerSideEncryptionConfiguration={
+                    "Rules": [
+                        {
+                            "ApplyServerSideEncryptionByDefault": {
+                                "SSEAlgorithm": "AES256"
+                            }
+                        }
+                    ]
+                },
+            )
+        if index % 3 == 0:
+            s3_client.put_bucket_versioning(
+                Bucket=bucket_name, VersioningConfiguration={"Status": "Enabled"}
+            )
+        if index % 5 == 0:
+            s3_client.put_public_access_block(
+                Bucket=bucket_name,
+                PublicAccessBlockConfiguration={
+                    "BlockPublicAcls": True,
+                    "IgnorePublicAcls": True,
+                    "BlockPublicPolicy": True,
+                    "RestrictPublicBuckets": True,
+                },
+            )
+        if index % 7 == 0:
+            s3_client.put_bucket_policy(
+                Bucket=bucket_name,
+                Policy=json.dumps(
+                    {
+                        "Version": "2012-10-17",
+                        "Statement": [
+                            {
+                                "Effect": "Allow",
+                                "Principal": "*",
+                                "Action": "s3:GetObject",
+                                "Resource": f"arn:aws:s3:::{bucket_name}/*",
+                            }
+                        ],
+                    }
+                ),
+            )
+
+
+def create_functions(region: str, functions_number: int, role_arn: str):
+    lambda_client = boto3.client("lambda", region_name=region)
+    code = io.BytesIO()
+    with zipfile.ZipFile(code, "w") as code_zip:
+        code_zip.writestr(
+            "lambda_function.py", "def handler(event, context):\n    return event\n"
+        )
+    for index in range(functions_number):
+        function_name = f"benchmark-function-{index}"
+        lambda_client.create_function(
+            FunctionName=function_name,
+            Runtime=lambda_runtimes[index % len(lambda_runtimes)],
+            Role=role_arn,
+            Handler="lambda_function.handler",
+            Code={"ZipFile": code.getvalue()},
+            Environment={"Variables": {"STAGE": "benchmark"}},
+        )
+        if index % 4 == 0:
+            lambda_client.add_permission(
+                FunctionName=function_name,
+                StatementId="benchmark-public-invoke",
+                Action="lambda:InvokeFunction",
+                Principal="*",
+            )
+        if index % 5 == 0:
+            lambda_client.create_function_url_config(
+                FunctionName=function_name, AuthType="NONE"
+            )
+
+
+def create_estate(estate: dict):
+    """create_estate creates in moto the resources of the synthetic account, spread evenly across its regions"""
+    regions = benchmark_regions[: estate["regions"]]
+    role_arns = create_roles(estate["roles"])
+    if not role_arns and estate["functions"]:
+        role_arns = create_roles(1)
+    first_bucket = 0
+    for (
+        (region, security_groups_number),
+        (_, instances_number),
+        (_, buckets_number),
+        (_, functions_number),
+    ) in zip(
+        spread(estate["security_groups"], regions),
+        spread(estate["instances"], regions),
+        spread(estate["buckets"], regions),
+        spread(estate["functions"], regions),
+    ):
+        security_group_ids = create_security_groups(region, security_groups_number)
+        create_instances(region, instances_number, security_group_ids)
+        create_buckets(region, buckets_number, first_bucket)
+        first_bucket += buckets_number
+        create_functions(region, functions_number, role_arns[0] if role_arns else "")
+
+
+def set_audit_info(regions: list, checks: list):
+    """set_audit_info points the audit info used by the service clients to the synthetic account"""
+    current_audit_info.audit_session = boto3.session.Session()
+    current_audit_info.audited_account = DEFAULT_ACCOUNT_ID
+    current_audit_info.audited_account_arn = f"arn:aws:iam::{DEFAULT_ACCOUNT_ID}:root"
+    current_audit_info.audited_identity_arn = (
+        f"arn:aws:iam::{DEFAULT_ACCOUNT_ID}:user/benchmark"
+    )
+    current_audit_info.audited_user_id = "benchmark"
+    current_audit_info.audited_partition = "aws"
+    current_audit_info.profile_region = "us-east-1"
+    current_audit_info.audited_regions = regions
+    current_audit_info.audit_metadata = Audit_Metadata(
+        services_scanned=0,
+        expected_checks=checks,
+        completed_checks=0,
+        audit_progress=0,
+    )
+
+
+def get_aws_services(service_client: str) -> set:
+    """get_aws_services returns the AWS services called by the service client, e.g. {"lambda"} for awslambda_client"""
+    # Format: "prowler.providers.aws.services.{service}.{service}_client"
+    service_directory = pathlib.Path(prowler.__path__[0]).joinpath(
+        *service_client.split(".")[1:-1]
+    )
+    aws_services = set()
+    for service_file in service_directory.glob("*_service.py"):
+        aws_services.update(
+            re.findall(r'self\.service = "([\w-]+)"', service_file.read_text())
+        )
+    return aws_services
+
+
+def get_moto_mock(aws_service: str):
+    """get_moto_mock returns the moto mock of the AWS service, or None if moto does not support it"""
+    return getattr(moto, f"mock_{aws_service.replace('-', '')}", None)
+
+
+def get_benchmark_services(services: list = None) -> tuple[list, list]:
+    """
+    get_benchmark_services returns the services to benchmark, all the AWS services of Prowler if none are given,
+    and the ones skipped because moto cannot mock some of the AWS services their service clients call, since
+    the benchmark must run offline
+    """
+    benchmark_services = []
+    skipped_services = []
+    for service in services or list_services("aws"):
+        checks = [
+            check_name for check_name, _ in recover_checks_from_provider("aws", service)
+        ]
+        if all(
+            get_moto_mock(aws_service)
+            for service_client in recover_service_clients_from_checks(checks, "aws")
+            for aws_service in get_aws_services(service_client)
+        ):
+            benchmark_services.append(service)
+        else:
+            skipped_services.append(service)
+    return benchmark_services, skipped_services
+
+
+def get_moto_mocks(service_clients: dict) -> list:
+    """
+    get_moto_mocks returns the moto mocks of the AWS services called by the service clients and of the
+    services used to create the synthetic account. Only these services are mocked since every mocked
+    service slows down the dispatch of all the API calls.
+    """
+    aws_services = {"ec2", "iam", "lambda", "s3", "sts"}
+    for service_client in service_clients:
+        aws_services.update(get_aws_services(service_client))
+    return [
+        get_moto_mock(aws_service)
+        for aws_service in sorted(aws_services)
+        if get_moto_mock(aws_service)
+    ]
+
+
+def unload_services():
+    """unload_services removes the service clients and the checks already imported, so they are built again"""
+    for module in list(sys.modules):
+        if module.startswith("prowler.providers.aws.services."):
+            del sys.modules[module]
+    # The objects of the synthetic account are not collected again while measuring
+    gc.collect()
+    gc.freeze()
+
+
+def measure(function, traced: bool) -> tuple:
+    """measure returns the result of the function and the seconds, or the peak bytes if traced, it needed"""
+    if traced:
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        result = function()
+        return result, tracemalloc.get_traced_memory()[1] - start_memory
+    start_time = perf_counter()
+    result = function()
+    return result, perf_counter() - start_time
+
+
+def run_services(
+    checks: list, service_clients: dict, traced: bool
+) -> tuple[dict, dict]:
+    """
+    run_services builds the service clients needed by the checks and executes them, returning the seconds,
+    or the peak bytes if traced, spent on every service client and every check
+    """
+    unload_services()
+    output_options = SimpleNamespace(verbose=False, only_logs=True)
+    services = {}
+    for service_client, attributes in service_clients.items():
+        # A service client or check failing, e.g. an API call not implemented by moto, does not stop the benchmark
+        try:
+            _, services[service_client.split(".")[-1]] = measure(
+                lambda: build_service_client(service_client, attributes), traced
+            )
+        except Exception as error:
+            logger.error(
+                f"{service_client} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+    checks_results = {}
+    for check_name in checks:
+        try:
+            check = load_check(check_name.split("_")[0], check_name, "aws")
+            findings, measurement = measure(
+                lambda: run_check(check, output_options), traced
+            )
+            checks_results[check_name] = (measurement, len(findings))
+        except Exception as error:
+            logger.error(
+                f"{check_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+    return services, checks_results
+
+
+def run_benchmark(estate: dict, services: list) -> dict:
+    """run_benchmark creates the synthetic account and returns the time and peak memory of every service client and check"""
+    checks = sorted(
+        check_name
+        for service in services
+        for check_name, _ in recover_checks_from_provider("aws", service)
+    )
+    service_clients = recover_service_clients_from_checks(checks, "aws")
+    with ExitStack() as mocks:
+        for mock in get_moto_mocks(service_clients):
+            mocks.enter_context(mock())
+        start_time = perf_counter()
+        create_estate(estate)
+        print(f"Synthetic account created in {perf_counter() - start_time:.1f} seconds")
+        set_audit_info(benchmark_regions[: estate["regions"]], checks)
+
+        # Time and memory are measured separately since tracing the allocations slows down the execution
+        services_time, checks_time = run_services(checks, service_clients, traced=False)
+        tracemalloc.start()
+        services_memory, checks_memory = run_services(
+            checks, service_clients, traced=True
+        )
+        tracemalloc.stop()
+
+    return {
+        "estate": estate,
+        "services": {
+            service_client: {
+                "time": round(services_time[service_client], 4),
+                "peak_memory": services_memory[service_client],
+            }
+            for service_client in services_time
+            if service_client in services_memory
+        },
+        "checks": {
+            check_name: {
+                "time": round(checks_time[check_name][0], 4),
+                "peak_memory": checks_memory[check_name][0],
+                "findings": checks_time[check_name][1],
+            }
+            for check_name in checks
+            if check_name in checks_time and check_name in checks_memory
+        },
+    }
+
+
+def compare_with_baseline(
+    results: dict, baseline: dict, threshold: float, min_time: float, min_memory: int
+) -> list:
+    """
+    compare_with_baseline returns the service clients and checks whose time or peak memory grew more than
+    the threshold over the baseline, ignoring the increases below min_time seconds or min_memory bytes
+    """
+    regressions = []
+    for kind in ("services", "checks"):
+        for name, result in results[kind].items():
+            baseline_result = baseline[kind].get(name)
+            if not baseline_result:
+                continue
+            for metric, min_increase in (
+                ("time", min_time),
+                ("peak_memory", min_memory),
+            ):
+                increase = result[metric] - baseline_result[metric]
+                if increase > min_increase and result[metric] > baseline_result[
+                    metric
+                ] * (1 + threshold):
+                    regressions.append(
+                        [
+                            name,
+                            metric,
+                            baseline_result[metric],
+                            result[metric],
+                            f"+{increase / max(baseline_result[metric], 1e-9):.0%}",
+                        ]
+                    )
+    return regressions
+
+
+def set_offline_environment():
+    """set_offline_environment sets fake AWS credentials, so the benchmark never uses real ones"""
+    os.environ.update(
+        {
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "AWS_SECURITY_TOKEN": "testing",
+            "AWS_SESSION_TOKEN": "testing",
+            "AWS_DEFAULT_REGION": "us-east-1",
+        }
+    )
+    os.environ.pop("AWS_PROFILE", None)
+
+
+def block_network():
+    """block_network makes any connection fail, so the benchmark cannot reach AWS or any other endpoint"""
+
+    def refuse_connection(*args, **kwargs):
+        raise ConnectionRefusedError("The benchmark must run offline")
+
+    socket.socket.connect = refuse_connection
+    socket.socket.connect_ex = refuse_connection
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the time and peak memory of every service client and check against a synthetic AWS account mocked with moto"
+    )
+    parser.add_argument("--instances", type=int, default=10000)
+    parser.add_argument("--security-groups", type=int, default=5000)
+    parser.add_argument("--buckets", type=int, default=2000)
+    parser.add_argument("--roles", type=int, default=3000)
+    parser.add_argument("--functions", type=int, default=500)
+    parser.add_argument(
+        "--regions", type=int, default=len(benchmark_regions), choices=range(1, 18)
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Factor applied to the number of resources, e.g. 0.01 for a quick run",
+    )
+    parser.add_argument(
+        "--services",
+        nargs="+",
+        default=None,
+        help="Services whose service clients and checks are benchmarked (default: all the AWS services moto can mock)",
+    )
+    parser.add_argument(
+        "--output", help="Write the results to this JSON file, e.g. a new baseline"
+    )
+    parser.add_argument(
+        "--baseline", help="Fail if the results regress over this JSON baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed increase over the baseline (default: 0.25, 25%%)",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="Increases of time below these seconds are ignored (default: 0.1)",
+    )
+    parser.add_argument(
+        "--min-memory",
+        type=int,
+        default=1024 * 1024,
+        help="Increases of peak memory below these bytes are ignored (default: 1 MiB)",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=logging_levels.keys(),
+        default="CRITICAL",
+        help="Log level of the service clients and checks (default: CRITICAL)",
+    )
+    args = parser.parse_args()
+
+    set_logging_config(args.log_level)
+    # The benchmark never reaches AWS, the API calls are answered in-process by moto
+    set_offline_environment()
+    block_network()
+    services, skipped_services = get_benchmark_services(args.services)
+    if skipped_services:
+        print(
+            f"Services not benchmarked since moto cannot mock them: {', '.join(skipped_services)}"
+        )
+    estate = {
+        "instances": round(args.instances * args.scale),
+        "security_groups": round(args.security_groups * args.scale),
+        "buckets": round(args.buckets * args.scale),
+        "roles": round(args.roles * args.scale),
+        "functions": round(args.functions * args.scale),
+        "regions": args.regions,
+    }
+    print(
+        f"Synthetic account: {', '.join(f'{number} {resource}' for resource, number in estate.items())}"
+    )
+    results = run_benchmark(estate, services)
+
+    slowest = sorted(
+        [
+            [name, result["time"], f"{result['peak_memory'] / 1024 / 1024:.1f}"]
+            for kind in ("services", "checks")
+            for name, result in results[kind].items()
+        ],
+        key=lambda row: row[1],
+        reverse=True,
+    )
+    print(
+        tabulate(
+            slowest[:20],
+            headers=["Service client / Check", "Time (seconds)", "Peak memory (MiB)"],
+            tablefmt="rounded_grid",
+        )
+    )
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=4)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline["estate"] != estate:
+            print(
+                f"The baseline {args.baseline} was recorded with a different synthetic account: {baseline['estate']}"
+            )
+            sys.exit(1)
+        regressions = compare_with_baseline(
+            results, baseline, args.threshold, args.min_time, args.min_memory
+        )
+        if regressions:
+            print(f"\n{len(regressions)} regressions over {args.baseline}\n")
+            print(
+                tabulate(
+                    regressions,
+                    headers=[
+                        "Service client / Check",
+                        "Metric",
+                        "Baseline",
+                        "Current",
+                        "Increase",
+                    ],
+                    tablefmt="rounded_grid",
+                )
+            )
+            sys.exit(1)
+        print(f"\nNo regressions over {args.baseline}")
@@ -0,0 +1,27 @@
+import logging
+import sys
+
+from prowler.lib.check.manifest import (
+    generate_checks_manifest,
+    get_checks_manifest_path,
+    write_checks_manifest,
+)
+
+# Logging config
+logging.basicConfig(
+    stream=sys.stdout,
+    format="%(asctime)s [File: %(filename)s:%(lineno)d] \t[Module: %(module)s]\t %(levelname)s: %(message)s",
+    datefmt="%m/%d/%Y %I:%M:%S %p",
+    level=logging.INFO,
+)
+
+for provider in ["aws", "azure", "gcp"]:
+    logging.info(f"Generating the {provider} checks manifest")
+    checks_manifest = generate_checks_manifest(provider)
+    write_checks_manifest(get_checks_manifest_path(provider), checks_manifest)
+    checks = sum(
+        len(service["checks"]) for service in checks_manifest["services"].values()
+    )
+    logging.info(
+        f"{len(checks_manifest['services'])} services and {checks} checks stored in {get_checks_manifest_path(provider)}"
+    )